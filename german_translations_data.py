@@ -1,344 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-Complete German translations for all 595 remaining untranslated keys
-Professional formal German (Sie-form) with all placeholders preserved
-"""
-
-translations = {
-    # Brand names and technical terms (stay as-is)
-    "appTitle": "Team Build Pro",
-    "authLoginBiometricMethodFace": "Face ID",
-    "authLoginBiometricMethodTouch": "Touch ID",
-    "navTeam": "Team",
-    "messageCenterFilterTeam": "Team",
-    "notificationsFilterTeam": "Team",
-    "chatTitle": "Chat",
-    "companyContactEmail": "support@teambuildpro.com",
-    "companyContactWebsite": "www.teambuildpro.com",
-    "editProfileLabelBio": "Bio",
-    "memberDetailLabelName": "Name",
-    "memberDetailLabelSponsor": "Sponsor",
-
-    # Common buttons
-    "commonButtonCancel": "Abbrechen",
-    "commonButtonSave": "Speichern",
-    "commonButtonDelete": "Löschen",
-    "commonButtonEdit": "Bearbeiten",
-    "commonButtonClose": "Schließen",
-    "commonButtonOk": "OK",
-    "commonButtonYes": "Ja",
-    "commonButtonNo": "Nein",
-    "commonLoadingMessage": "Lädt...",
-    "commonErrorMessage": "Etwas ist schiefgelaufen. Bitte versuchen Sie es erneut.",
-    "commonSuccessMessage": "Erfolg!",
-    "commonNoDataMessage": "Keine Daten verfügbar",
-    "commonRetryButton": "Erneut versuchen",
-    "commonRefreshButton": "Aktualisieren",
-
-    # Auth errors
-    "authSignupErrorFirstName": "Vorname darf nicht leer sein",
-    "authSignupErrorLastName": "Nachname darf nicht leer sein",
-
-    # Add Link section
-    "addLinkHeading": "Ihren {business}-Link hinzufügen",
-    "addLinkImportantLabel": "WICHTIGE INFORMATIONEN",
-    "addLinkGrowthTitle": "Ihr Wachstumspotenzial freischalten",
-    "addLinkInstructionBullet1": "Ihr Empfehlungslink wird nur zu Tracking-Zwecken in Ihrem Team Build Pro-Profil gespeichert.",
-    "addLinkInstructionBullet2": "Wenn sich Ihre Teammitglieder qualifizieren und der {business}-Möglichkeit beitreten, werden sie automatisch in Ihrem offiziellen Team platziert",
-    "addLinkInstructionBullet3": "Dieser Link kann nur einmal festgelegt werden. Bitte überprüfen Sie, ob er korrekt ist, bevor Sie ihn speichern.",
-    "addLinkWarning": "Team Build Pro ist nur eine Empfehlungs-Tracking-Plattform. Wir unterstützen oder garantieren keine Geschäftsmöglichkeiten.",
-    "addLinkFinalStepTitle": "Letzter Schritt: Verknüpfen Sie Ihr Konto",
-    "addLinkFinalStepSubtitle": "Dies stellt sicher, dass Ihre neuen Teammitglieder automatisch in Ihrer {business}-Organisation platziert werden.",
-    "addLinkFieldInstruction": "Geben Sie unten Ihren {business}-Empfehlungslink ein. Dieser wird verwendet, um Empfehlungen von Ihrem Team zu verfolgen.",
-    "addLinkMustBeginWith": "Muss beginnen mit:\n{baseUrl}",
-    "addLinkFieldLabel": "Geben Sie Ihren Empfehlungslink ein",
-    "addLinkFieldHelper": "Muss mit {baseUrl} beginnen\nKann nach dem Festlegen nicht geändert werden",
-    "addLinkFieldError": "Bitte geben Sie Ihren {business}-Empfehlungslink ein.",
-    "addLinkPreviewLabel": "Empfehlungslink-Vorschau:",
-    "addLinkSaving": "Wird validiert und gespeichert...",
-
-    # Business Hero section
-    "businessHeroTitle": "Herzlichen Glückwunsch!\nSie sind qualifiziert!",
-    "businessHeroMessage": "Ihre harte Arbeit und Ihr Teamaufbau haben sich ausgezahlt. Sie sind jetzt berechtigt, der {business}-Möglichkeit beizutreten.",
-    "businessDisclaimerTitle": "Haftungsausschluss",
-    "businessDisclaimerMessage": "Ihr Teamwachstum hat Ihnen Zugang zu {business} ermöglicht. Diese Möglichkeit funktioniert als unabhängiges Geschäft und hat keine Verbindung zur Team Build Pro-Plattform.",
-    "businessDisclaimerInfo": "Die Team Build Pro App erleichtert lediglich den Zugang zu {business} über Ihren Upline-Sponsor. Sie unterstützt oder garantiert keine spezifischen Ergebnisse aus dieser Möglichkeit.",
-    "businessSponsorTitle": "Ihr Empfehlungskontakt",
-    "businessSponsorMessage": "Wenn Sie sich entscheiden, {business} zu erkunden, ist Ihr Empfehlungskontakt {sponsor}. Diese Person ist ein Mitglied Ihres Upline-Teams, das {business} bereits beigetreten ist.",
-    "businessInstructionsTitle": "{business} beitreten",
-    "businessInstructions": "1. Kopieren Sie den Empfehlungslink unten\n2. Öffnen Sie Ihren Webbrowser\n3. Fügen Sie den Link ein und schließen Sie die {business}-Registrierung ab\n4. Kehren Sie hierher zurück, um Ihren {business}-Empfehlungslink hinzuzufügen",
-    "businessNoUrlMessage": "Registrierungs-URL nicht verfügbar. Bitte kontaktieren Sie Ihren Sponsor.",
-    "businessUrlLabel": "Empfehlungslink Ihres Sponsors:",
-    "businessUrlCopyTooltip": "URL kopieren",
-    "businessUrlCopiedMessage": "Registrierungs-URL in die Zwischenablage kopiert!",
-    "businessUrlCopyError": "Fehler beim Kopieren der URL: {error}",
-    "businessFollowUpTitle": "Letzter Schritt: Verknüpfen Sie Ihr Konto",
-    "businessFollowUpMessage": "Nachdem Sie {business} erkundet haben, müssen Sie hierher zurückkehren und Ihren neuen {business}-Empfehlungslink zu Ihrem Team Build Pro-Profil hinzufügen. Dies stellt sicher, dass Ihre Teamverbindungen korrekt verfolgt werden.",
-    "businessCompleteButton1": "Registrierung abgeschlossen",
-    "businessCompleteButton2": "Meinen Empfehlungslink hinzufügen",
-    "businessConfirmDialogTitle": "Bevor Sie fortfahren",
-    "businessConfirmDialogMessage": "Dies ist der nächste Schritt in Ihrer Reise. Nachdem Sie {business} über den Link Ihres Sponsors beigetreten sind, müssen Sie hierher zurückkehren, um Ihren neuen {business}-Empfehlungslink zu Ihrem Profil hinzuzufügen. Dies ist ein kritischer Schritt, um sicherzustellen, dass Ihre neuen Teammitglieder korrekt platziert werden.",
-    "businessConfirmDialogButton": "Ich verstehe",
-    "businessVisitRequiredTitle": "Besuch zuerst erforderlich",
-    "businessVisitRequiredMessage": "Bevor Sie Ihr Profil aktualisieren, müssen Sie zuerst die Schaltfläche 'Registrierungslink kopieren' auf dieser Seite verwenden, um {business} zu besuchen und Ihre Registrierung abzuschließen.",
-    "businessVisitRequiredButton": "OK",
-
-    # Getting Started section
-    "gettingStartedHeading": "Erste Schritte mit Team Build Pro",
-    "gettingStartedSubheading": "Folgen Sie diesen einfachen Schritten, um Ihr Team aufzubauen",
-    "gettingStartedStep1Description": "Erstellen Sie eine Liste von Rekrutierungskandidaten und aktuellen {business}-Teammitgliedern, mit denen Sie Team Build Pro teilen möchten. Denken Sie darüber nach, wer von diesem Tool profitieren könnte, um ihren Teamaufbau zu beschleunigen.",
-    "gettingStartedStep2Description": "Verwenden Sie die Teilen-Funktion, um schnell und einfach gezielte Textnachrichten und E-Mails an Ihre Rekrutierungskandidaten und {business}-Teammitglieder zu senden.",
-    "gettingStartedStep2Button": "Teilen öffnen",
-    "gettingStartedProTipTitle": "Profi-Tipp",
-    "gettingStartedProTipMessage": "Konsequente Nachverfolgung und Engagement sind der Schlüssel zum Aufbau eines starken, aktiven Teams.",
-
-    # Eligibility Hero section
-    "eligibilityHeroTitleQualified": "HERZLICHEN GLÜCKWUNSCH!\nSie sind qualifiziert!",
-    "eligibilityHeroTitleNotQualified": "Bauen Sie Ihre Dynamik auf",
-    "eligibilityHeroMessageQualified": "Unglaubliche Arbeit! Sie haben Ihr Grundlagenteam aufgebaut und die {business}-Möglichkeit freigeschaltet. Erweitern Sie weiterhin Ihr Netzwerk, um anderen zu helfen, denselben Erfolg zu erzielen.",
-    "eligibilityHeroMessageNotQualified": "Sie sind auf dem Weg! Jeder Fachmann, mit dem Sie sich verbinden, baut Dynamik für Ihren zukünftigen Start in der {business}-Möglichkeit auf. Teilen Sie weiter, um Ihre Ziele zu erreichen!",
-    "eligibilityHeroButton": "Bewährte Wachstumsstrategien",
-    "eligibilityThresholdsTitle": "QUALIFIKATIONSSCHWELLEN",
-    "eligibilityLabelDirectSponsors": "Direkte Sponsoren",
-    "eligibilityLabelTotalTeam": "Gesamte Teammitglieder",
-    "eligibilityCurrentCountsTitle": "IHRE AKTUELLEN TEAMZAHLEN",
-    "eligibilityCurrentDirectSponsors": "Direkte Sponsoren",
-    "eligibilityCurrentTotalTeam": "Gesamte Teammitglieder",
-    "eligibilityProcessTitle": "DER PROZESS",
-    "eligibilityProcessStep1Title": "EINLADEN - Bauen Sie Ihr Fundament auf",
-    "eligibilityProcessStep1Description": "Verbinden Sie sich mit gleichgesinnten Fachleuten, die offen sind, {business} zu erkunden.",
-    "eligibilityProcessStep2Title": "KULTIVIEREN - Schaffen Sie Dynamik",
-    "eligibilityProcessStep2Description": "Fördern Sie authentische Beziehungen, während Ihr Team wächst, und schaffen Sie ein florierendes Team von Fachleuten, die sich gegenseitig beim Erfolg unterstützen.",
-    "eligibilityProcessStep3Title": "PARTNERSCHAFT - Starten Sie mit Erfolg",
-    "eligibilityProcessStep3Description": "Teammitglieder erhalten eine Einladung, {business} beizutreten, wenn sie wichtige Wachstumsziele erreichen.",
-
-    # Share section
-    "shareHeading": "Leistungsstarkes Empfehlungssystem",
-    "shareSubheading": "Teilen Sie Ihre Empfehlungslinks, um ein neues Team mit Rekrutierungskandidaten vorzubauen oder Ihr bestehendes Team zu erweitern.",
-    "shareStrategiesTitle": "Bewährte Wachstumsstrategien",
-    "shareProspectTitle": "Neue Rekrutierungskandidaten",
-    "shareProspectSubtitle": "Laden Sie Rekrutierungskandidaten ein, um einen Vorsprung zu erhalten.",
-    "shareProspectDescription": "Laden Sie Rekrutierungskandidaten ein, ihr {business}-Team mit dieser App vorzubauen. Sie können kraftvolle Dynamik aufbauen, bevor sie offiziell {business} beitreten, und so den Erfolg vom ersten Tag an sicherstellen.",
-    "shareProspectNotSalespersonTitle": "Sie können ein erfolgreiches Team aufbauen",
-    "shareProspectNotSalespersonSubject": "Sie müssen kein \"Verkäufer\" sein",
-    "shareProspectNotSalespersonDescription": "Team Build Pro wurde für Fachleute entwickelt, die ein Netzwerk aufbauen möchten, ohne aggressive Verkaufstaktiken anzuwenden. Unsere Plattform konzentriert sich auf authentische Beziehungen und organisches Wachstum.",
-    "sharePartnerTitle": "Aktuelle Geschäftspartner",
-    "sharePartnerSubtitle": "Großartig für Ihr bestehendes {business}-Team",
-    "sharePartnerDescription": "Stärken Sie Ihre bestehenden {business}-Partner mit demselben Tool, das Sie verwenden. Dies fördert die Duplikation und hilft, das Wachstum in Ihrer gesamten {business}-Organisation zu beschleunigen.",
-    "shareSelectMessageLabel": "Zu sendende Nachricht auswählen",
-    "shareButtonShare": "Teilen",
-    "shareLinkCopiedMessage": "Link in die Zwischenablage kopiert!",
-    "shareProTipsTitle": "Profi-Tipps für den Erfolg",
-    "shareProTip1": "💬 Personalisieren Sie Ihre Nachricht beim Teilen",
-    "shareProTip2": "📱 Teilen Sie konsequent auf allen Social-Media-Plattformen",
-    "shareProTip3": "🤝 Verfolgen Sie Kandidaten nach, die Interesse zeigen",
-    "shareProTip4": "📈 Verfolgen Sie Ihre Ergebnisse und passen Sie Ihren Ansatz an",
-    "shareProTip5": "🎯 Verwenden Sie beide Strategien für maximales Wachstumspotenzial",
-    "shareDemoTitle": "Demo-Modus",
-    "shareDemoMessage": "Teilen im Demo-Modus deaktiviert.",
-    "shareDemoButton": "Ich verstehe",
-
-    # Member Detail section
-    "memberDetailButtonSendMessage": "Nachricht senden",
-    "memberDetailLabelDirectSponsors": "Direkte Sponsoren",
-    "memberDetailLabelJoinedNetwork": "Netzwerk beigetreten",
-    "memberDetailLabelJoinedOrganization": "Organisation beigetreten",
-    "memberDetailLabelQualified": "Qualifiziert",
-    "memberDetailLabelQualifiedDate": "Qualifikationsdatum",
-    "memberDetailLabelTeamLeader": "Teamleiter",
-    "memberDetailLabelTotalTeam": "Gesamtes Team",
-    "memberDetailNotYet": "Noch nicht",
-    "memberDetailNotYetJoined": "Noch nicht beigetreten",
-    "memberDetailEligibilityTitle": "Berechtigungsanforderungen",
-    "memberDetailEligibilityDirectSponsors": "Direkte Sponsoren",
-    "memberDetailEligibilityTotalTeam": "Gesamtes Team",
-    "memberDetailEligibilityMessage": "Teammitglieder, die diese Anforderungen erfüllen, werden automatisch eingeladen, der {organization} beizutreten.",
-    "memberDetailEligibilityWaived": "Verzichtet",
-
-    # Message Thread section
-    "messageThreadHeading": "Nachrichtencenter",
-    "messageThreadEmptyMessage": "Starten Sie das Gespräch!",
-    "messageThreadUrlWarningTitle": "Warnung vor externem Link",
-    "messageThreadUrlWarningMessage": "Diese Nachricht enthält einen externen Link. Seien Sie vorsichtig beim Klicken auf Links von unbekannten Quellen.",
-    "messageThreadUrlWarningButton": "Verstanden",
-
-    # Chatbot section
-    "chatbotAssistantTitle": "KI-Assistent",
-    "chatbotAssistantSubtitle": "Fragen Sie mich alles über Team Build Pro",
-    "chatbotClearTooltip": "Unterhaltung löschen",
-    "chatbotSignInRequired": "Bitte melden Sie sich an, um den KI-Assistenten zu verwenden",
-
-    # Company section
-    "companyHeading": "Unternehmensdetails",
-    "companyLabelName": "Unternehmensname",
-    "companyLabelReferralLink": "Mein Unternehmens-Empfehlungslink",
-    "companyLinkedTitle": "Konto verknüpft!",
-    "companyLinkedMessage": "Großartige Neuigkeiten! Während Ihre Teammitglieder Dynamik gewinnen und sich qualifizieren, erhalten sie eine Einladung, Ihrer {business}-Organisation beizutreten.",
-    "companyNotAvailable": "Nicht verfügbar",
-
-    # Delete Account section
-    "deleteAccountHeading": "Kontolöschung",
-    "deleteAccountSubheading": "Es tut uns leid, Sie gehen zu sehen. Bitte lesen Sie die folgenden Informationen sorgfältig durch.",
-    "deleteAccountWarningTitle": "PERMANENTE KONTOLÖSCHUNG",
-    "deleteAccountWarningMessage": "Diese Aktion kann nicht rückgängig gemacht werden. Wenn Sie Ihr Konto löschen:",
-    "deleteAccountWarning1": "Werden Ihre persönlichen Daten dauerhaft gelöscht",
-    "deleteAccountWarning2": "Verlieren Sie den Zugang zu allen Premium-Funktionen",
-    "deleteAccountWarning3": "Kann Ihr Konto nicht wiederhergestellt oder reaktiviert werden",
-    "deleteAccountWarning4": "Werden Ihre Netzwerkbeziehungen zur Geschäftskontinuität erhalten",
-    "deleteAccountWarning5": "Werden Sie sofort von allen Geräten abgemeldet",
-    "deleteAccountInfoTitle": "Kontoinformationen",
-    "deleteAccountConfirmLabel": "Um die Löschung zu bestätigen, geben Sie bitte Ihre E-Mail-Adresse ein:",
-    "deleteAccountCheckbox1": "Ich verstehe, dass diese Aktion dauerhaft ist und nicht rückgängig gemacht werden kann",
-    "deleteAccountCheckbox2": "Ich verstehe, dass ich den Zugang zu allen Daten und Premium-Funktionen verlieren werde",
-    "deleteAccountCheckbox3": "Ich bestätige, dass meine Netzwerkbeziehungen für Geschäftszwecke erhalten bleiben",
-    "deleteAccountDeleting": "Wird gelöscht...",
-    "deleteAccountHelpTitle": "Benötigen Sie Hilfe?",
-    "deleteAccountHelpMessage": "Wenn Sie Probleme mit der App haben, kontaktieren Sie bitte unser Support-Team, bevor Sie Ihr Konto löschen.",
-    "deleteAccountHelpButton": "Support kontaktieren",
-    "deleteAccountDemoTitle": "Demo-Konto-Schutz",
-    "deleteAccountDemoMessage": "Dies ist ein geschütztes Demo-Konto und kann nicht gelöscht werden.\n\nDemo-Konten werden für App-Reviews und Demonstrationszwecke gepflegt.\n\nWenn Sie die App testen, erstellen Sie bitte ein neues Konto zum Testen der Kontolöschungsfunktionen.",
-    "deleteAccountDemoButton": "OK",
-
-    # Edit Profile section
-    "editProfileHeading": "Profil bearbeiten",
-    "editProfileHeadingFirstTime": "Vervollständigen Sie Ihr Profil",
-    "editProfileInstructionsFirstTime": "Bitte vervollständigen Sie Ihr Profil, um zu beginnen",
-    "editProfileBusinessQuestion": "Sind Sie derzeit ein ",
-    "editProfileBusinessQuestionSuffix": "-Vertreter?",
-    "editProfileYes": "Ja",
-    "editProfileNo": "Nein",
-    "editProfileDialogImportantTitle": "Sehr wichtig!",
-    "editProfileDialogImportantMessage": "Sie müssen den genauen Empfehlungslink eingeben, den Sie von Ihrem {business}-Sponsor erhalten haben.",
-    "editProfileDialogImportantButton": "Ich verstehe",
-    "editProfileReferralLinkField": "Geben Sie Ihren Empfehlungslink ein",
-    "editProfileReferralLinkLabel": "Ihr Empfehlungslink",
-    "editProfileReferralLinkHelper": "Geben Sie den Empfehlungslink von Ihrem {business}-Sponsor ein",
-    "editProfileConfirmReferralLink": "Empfehlungslink bestätigen",
-    "editProfileSelectCountry": "Wählen Sie Ihr Land",
-    "editProfileSelectState": "Wählen Sie Ihr Bundesland/Ihre Provinz",
-    "editProfileSelectStateDisabled": "Wählen Sie zuerst ein Land",
-    "editProfileErrorCity": "Bitte geben Sie Ihre Stadt ein",
-    "editProfileErrorState": "Bitte wählen Sie Ihr Bundesland/Ihre Provinz",
-    "editProfileErrorCountry": "Bitte wählen Sie Ihr Land",
-    "editProfilePhotoError": "Fehler beim Hochladen des Fotos. Bitte versuchen Sie es erneut.",
-    "editProfileDeletionTitle": "Konto löschen",
-    "editProfileDeletionMessage": "Löschen Sie Ihr Konto und alle zugehörigen Daten dauerhaft.",
-    "editProfileUnableToVerify": "Empfehlungslink kann nicht verifiziert werden",
-    "editProfileInvalidLinkMessage": "Der {businessName}-Empfehlungslink konnte nicht verifiziert werden. Der Link könnte falsch, inaktiv oder vorübergehend nicht verfügbar sein.",
-    "editProfileDuplicateLinkTitle": "Link bereits in Verwendung",
-    "editProfileDuplicateLinkMessage": "Dieser {businessName}-Empfehlungslink wird bereits von einem anderen Team Build Pro-Mitglied verwendet. Jeder Link kann nur einmal verwendet werden.",
-    "editProfileInvalidLinkTitle": "Ungültiger Link",
-    "editProfileInvalidLinkDescription": "Der eingegebene Link entspricht nicht dem erforderlichen Format für {businessName}-Empfehlungslinks.",
-    "editProfileSavingChanges": "Änderungen werden gespeichert...",
-    "editProfileVerifyingLink": "Link wird verifiziert...",
-
-    # Login section
-    "loginCreateAccount": "Konto erstellen",
-    "authLoginCheckEmailTitle": "Überprüfen Sie Ihre E-Mail",
-    "authLoginCheckEmailMessage": "Wir haben Ihnen einen Link zum Anmelden gesendet. Bitte überprüfen Sie Ihren Posteingang.",
-    "authLoginMagicLinkSent": "Magic Link gesendet!",
-    "authLoginSendMagicLink": "Magic Link senden",
-
-    # Subscription section
-    "subscriptionAutoRenewNotice": "Das Abonnement wird automatisch verlängert, es sei denn, es wird mindestens 24 Stunden vor dem Ende des aktuellen Zeitraums gekündigt. {platformText}",
-    "subscriptionAppleManage": "Verwalten Sie Ihr Abonnement in den iOS-Einstellungen",
-    "subscriptionGoogleManage": "Verwalten Sie Ihr Abonnement im Google Play Store",
-    "subscriptionFeature1": "Reichen Sie Ihren eindeutigen {businessName}-Empfehlungslink ein",
-    "subscriptionFeature2": "Verfolgen Sie Ihr Teamwachstum in Echtzeit",
-    "subscriptionFeature3": "Erhalten Sie Benachrichtigungen, wenn Sie Meilensteine erreichen",
-    "subscriptionFeature4": "Zugriff auf erweiterte Analysen und Einblicke",
-    "subscriptionCancelAnytime": "Jederzeit kündbar",
-    "subscriptionPricePerMonth": "{price}/Monat",
-    "subscriptionPricePerYear": "{price}/Jahr",
-    "subscriptionStartFreeTrial": "Kostenlose Testversion starten",
-    "subscriptionSubscribeNow": "Jetzt abonnieren",
-    "subscriptionRestorePurchases": "Käufe wiederherstellen",
-    "subscriptionTermsAndPrivacy": "Durch das Abonnieren stimmen Sie unseren Nutzungsbedingungen und Datenschutzrichtlinien zu",
-
-    # Profile Edit section
-    "profileEditUnableToVerify": "Empfehlungslink kann nicht verifiziert werden",
-    "profileEditLinkVerificationFailed": "Link-Verifizierung fehlgeschlagen",
-    "profileEditCheckLinkAndTryAgain": "Bitte überprüfen Sie Ihren Link und versuchen Sie es erneut",
-
-    # Navigation section
-    "navOnboarding": "Einführung",
-    "navEligibility": "Berechtigung",
-    "navShare": "Teilen",
-
-    # Terms of Service (comprehensive legal text)
-    "termsLastUpdated": "Zuletzt aktualisiert: {date}",
-    "termsIntroduction": "WICHTIGE RECHTLICHE INFORMATIONEN\n\nBitte lesen Sie diese Nutzungsbedingungen (\"Bedingungen\") sorgfältig durch, bevor Sie die Team Build Pro mobile Anwendung (die \"App\" oder \"Dienst\") nutzen.\n\nDurch den Zugriff auf oder die Nutzung der App erklären Sie sich mit diesen Bedingungen einverstanden. Wenn Sie nicht zustimmen, dürfen Sie die App nicht nutzen.",
-
-    "termsSection1Title": "1. AKZEPTANZ DER BEDINGUNGEN",
-    "termsSection1Content": "Durch die Erstellung eines Kontos oder die Nutzung der App bestätigen Sie, dass:\n\n• Sie mindestens 18 Jahre alt sind oder das Mindestalter in Ihrer Gerichtsbarkeit erreicht haben\n• Sie die Fähigkeit haben, einen rechtsverbindlichen Vertrag abzuschließen\n• Sie diese Bedingungen vollständig gelesen und verstanden haben\n• Sie sich verpflichten, diese Bedingungen einzuhalten\n\nWenn Sie die App im Namen einer Organisation nutzen, bestätigen Sie, dass Sie die Befugnis haben, diese Organisation an diese Bedingungen zu binden.",
-
-    "termsSection2Title": "2. BESCHREIBUNG DES DIENSTES",
-    "termsSection2Content": "Team Build Pro ist eine Software-as-a-Service (SaaS) Plattform, die Folgendes bietet:\n\nKERNFUNKTIONEN:\n• Empfehlungslink-Tracking und -Verwaltung\n• Team-Netzwerkvisualisierung und -Analysen\n• Kommunikationstools für Teammitglieder\n• Fortschrittsverfolgung für Geschäftsmöglichkeiten\n• Benachrichtigungen und Updates\n\nWICHTIGER DISCLAIMER:\n• Team Build Pro ist ein WERKZEUG, KEINE Geschäftsmöglichkeit\n• Wir sind NICHT verbunden mit Drittanbieter-Geschäftsmöglichkeiten\n• Wir VERKAUFEN KEINE Produkte oder Dienstleistungen\n• Wir GARANTIEREN KEINE Einnahmen oder Ergebnisse\n• Wir sind nur eine Softwareplattform für Tracking-Zwecke",
-
-    "termsSection3Title": "3. BENUTZERKONTEN UND VERANTWORTLICHKEITEN",
-    "termsSection3Content": "KONTOERSTELLUNG:\n• Sie müssen genaue, vollständige Informationen bereitstellen\n• Sie sind verantwortlich für die Vertraulichkeit Ihres Kontos\n• Sie sind verantwortlich für alle Aktivitäten unter Ihrem Konto\n• Sie müssen uns sofort über unbefugte Zugriffe informieren\n\nVERBOTENE AKTIVITÄTEN:\n✗ Bereitstellung falscher oder irreführender Informationen\n✗ Ausgeben als eine andere Person oder Entität\n✗ Zugriff auf Konten anderer ohne Erlaubnis\n✗ Störung oder Unterbrechung des Dienstes\n✗ Reverse Engineering oder Versuch, Quellcode zu extrahieren\n✗ Verwendung automatisierter Systeme zum Scraping von Daten\n✗ Übertragung von Viren, Malware oder schädlichem Code\n✗ Verstoß gegen Gesetze oder Vorschriften\n✗ Belästigung, Missbrauch oder Schädigung anderer Benutzer\n\nVERSTÖSSE:\nVerletzungen können zu Kontosperrung oder -kündigung führen.",
-
-    "termsSection4Title": "4. DRITTANBIETER-GESCHÄFTSMÖGLICHKEITEN",
-    "termsSection4Content": "KRITISCHER DISCLAIMER:\n\nTeam Build Pro ist eine UNABHÄNGIGE Softwareplattform. Wir:\n\n✗ BESITZEN KEINE Geschäftsmöglichkeiten\n✗ BETREIBEN KEINE Geschäftsmöglichkeiten\n✗ SIND NICHT VERBUNDEN MIT Geschäftsmöglichkeiten\n✗ UNTERSTÜTZEN KEINE Geschäftsmöglichkeiten\n✗ GARANTIEREN KEINE Ergebnisse von Geschäftsmöglichkeiten\n\nWenn Sie sich entscheiden, einer Geschäftsmöglichkeit beizutreten:\n\n• Sie tun dies UNABHÄNGIG von Team Build Pro\n• Sie unterliegen DEREN Bedingungen und Vereinbarungen\n• Team Build Pro ist NICHT verantwortlich für deren Handlungen\n• Team Build Pro GARANTIERT KEINE Einnahmen oder Ergebnisse\n• Sie erkennen an, dass es ein SEPARATES Geschäft ist\n\nREFERRAL LINK TRACKING:\n• Wir verfolgen nur Empfehlungslinks zu Tracking-Zwecken\n• Wir validieren oder garantieren keine Links\n• Wir sind nicht verantwortlich für Link-Funktionalität\n• Sie sind verantwortlich für die Genauigkeit Ihrer Links\n\nRISIKO-ANERKENNUNG:\n• Alle Geschäftsmöglichkeiten bergen finanzielle Risiken\n• Sie sollten Ihre eigene Due Diligence durchführen\n• Konsultieren Sie bei Bedarf Fachleute (Rechts-, Finanz-, etc.)\n• Team Build Pro bietet keine Geschäfts- oder Anlageberatung",
-
-    "termsSection5Title": "5. GEISTIGE EIGENTUMSRECHTE",
-    "termsSection5Content": "UNSERE RECHTE:\nTeam Build Pro besitzt alle Rechte an:\n• App-Quellcode und Software\n• Marken, Logos und Branding\n• Inhalte, Texte und Bilder\n• Design, Layout und Benutzeroberfläche\n• Datenbank-Struktur und Organisation\n\nIHRE RECHTE:\nSie behalten das Eigentum an:\n• Ihren persönlichen Informationen\n• Von Ihnen erstellten Inhalten\n• Ihrer Geschäftsinformationen\n\nLIZENZ FÜR UNS:\nDurch das Hochladen von Inhalten gewähren Sie uns das Recht:\n• Ihre Inhalte zu speichern und zu verarbeiten\n• Inhalte anzuzeigen, um den Dienst bereitzustellen\n• Backups für Datenschutzzwecke zu erstellen\n\nBESCHRÄNKUNGEN:\nSie dürfen NICHT:\n• Unsere Marken ohne Erlaubnis verwenden\n• Die App oder Teile davon kopieren\n• White-Label-Lösungen erstellen\n• Unseren Code oder unsere Designs stehlen",
-
-    "termsSection6Title": "6. ZAHLUNGSBEDINGUNGEN",
-    "termsSection6Content": "ABONNEMENTSTRUKTUR:\n• Abonnements werden monatlich oder jährlich abgerechnet\n• Zahlungen werden über App Store oder Google Play verarbeitet\n• Die Preisgestaltung wird in der App angezeigt\n• Alle Preise sind in USD, sofern nicht anders angegeben\n\nAUTOMATISCHE VERLÄNGERUNG:\n• Abonnements verlängern sich automatisch\n• Sie werden 24 Stunden vor der Verlängerung belastet\n• Stornieren Sie mindestens 24 Stunden im Voraus, um Gebühren zu vermeiden\n• Verwalten Sie Abonnements in den App Store-Einstellungen\n\nRÜCKERSTATTUNGSRICHTLINIE:\n• Rückerstattungen unterliegen den Richtlinien von Apple/Google\n• Kontaktieren Sie den Support für Rückerstattungsanfragen\n• Wir können nach eigenem Ermessen Rückerstattungen gewähren\n• Keine Rückerstattungen für teilweise genutzte Zeiträume\n\nKOSTENLOSE TESTVERSIONEN:\n• Kostenlose Testversionen können verfügbar sein\n• Kreditkarte kann für Testversionen erforderlich sein\n• Stornieren Sie vor Ende der Testversion, um Gebühren zu vermeiden\n• Nur eine kostenlose Testversion pro Benutzer",
-
-    "termsSection7Title": "7. DATENSCHUTZ UND SICHERHEIT",
-    "termsSection7Content": "DATENSAMMLUNG:\nWir sammeln:\n• Kontoinformationen (Name, E-Mail, etc.)\n• Teamnetzwerkdaten\n• Nutzungsstatistiken\n• Geräteinformationen\n• Standortdaten (wenn erlaubt)\n\nDATENNUTZUNG:\nIhre Daten werden verwendet für:\n• Bereitstellung und Verbesserung des Dienstes\n• Senden von Benachrichtigungen und Updates\n• Kundenservice und Support\n• Analysen und Erkenntnisse\n• Rechtliche Compliance\n\nDATENSICHERHEIT:\nWir implementieren:\n• Branchen-Standard-Verschlüsselung\n• Sichere Datenspeicherung\n• Zugangskontrollen\n• Regelmäßige Sicherheitsaudits\n\nVollständige Details finden Sie in unserer Datenschutzerklärung.",
-
-    "termsSection8Title": "8. HAFTUNGSAUSSCHLUSS UND HAFTUNGSBESCHRÄNKUNGEN",
-    "termsSection8Content": "DER DIENST WIRD \"WIE BESEHEN\" BEREITGESTELLT:\n• Wir garantieren keine ununterbrochene Verfügbarkeit\n• Wir garantieren keine fehlerfreie Bedienung\n• Wir garantieren keine spezifischen Ergebnisse\n• Wir garantieren keine Kompatibilität mit allen Geräten\n\nKEINE GESCHÄFTSGARANTIEN:\n• Wir garantieren KEINE Einnahmen oder Gewinne\n• Wir garantieren KEINEN Geschäftserfolg\n• Wir garantieren KEINE Empfehlungen oder Signups\n• Wir sind NICHT verantwortlich für Ihre Geschäftsentscheidungen\n\nHAFTUNGSBESCHRÄNKUNG:\nIn maximalem gesetzlich zulässigem Umfang:\n\n• Unsere Haftung ist auf die Gebühren beschränkt, die Sie bezahlt haben\n• Wir haften nicht für indirekte oder Folgeschäden\n• Wir haften nicht für entgangene Gewinne oder Daten\n• Wir haften nicht für Handlungen Dritter\n\nFREISPRUCH:\nSie verpflichten sich, Team Build Pro von Ansprüchen freizustellen, die sich ergeben aus:\n• Ihrer Nutzung der App\n• Ihrer Verletzung dieser Bedingungen\n• Ihrer Verletzung von Rechten Dritter\n• Ihren Geschäftsaktivitäten",
-
-    "termsSection9Title": "9. KÜNDIGUNG",
-    "termsSection9Content": "KÜNDIGUNG DURCH SIE:\n• Sie können Ihr Konto jederzeit schließen\n• Verwenden Sie die Funktion \"Konto löschen\" in der App\n• Stornieren Sie Abonnements über App Store-Einstellungen\n• Die Löschung ist dauerhaft und kann nicht rückgängig gemacht werden\n\nKÜNDIGUNG DURCH UNS:\nWir können Ihr Konto beenden, wenn:\n• Sie gegen diese Bedingungen verstoßen\n• Sie sich an verbotenen Aktivitäten beteiligen\n• Wir den Dienst einstellen\n• Gesetzlich erforderlich\n\nFOLGEN DER KÜNDIGUNG:\n• Sofortiger Verlust des Zugangs zur App\n• Löschen Sie Kontodaten gemäß unserer Richtlinie\n• Keine Rückerstattung für teilweise genutzte Zeiträume\n• Netzwerkbeziehungen können zur Geschäftskontinuität erhalten bleiben",
-
-    "termsSection10Title": "10. ÄNDERUNGEN DER BEDINGUNGEN",
-    "termsSection10Content": "Wir behalten uns das Recht vor, diese Bedingungen jederzeit zu ändern:\n\n• Änderungen treten beim Posten in Kraft\n• Wir werden Sie über wesentliche Änderungen informieren\n• Die fortgesetzte Nutzung bedeutet Akzeptanz der neuen Bedingungen\n• Wenn Sie nicht zustimmen, müssen Sie die Nutzung einstellen\n\nÜberprüfen Sie diese Bedingungen regelmäßig auf Updates.",
-
-    "termsSection11Title": "11. ANWENDBARES RECHT",
-    "termsSection11Content": "GERICHTSSTAND:\nDiese Bedingungen unterliegen den Gesetzen von [Gerichtsbarkeit], ohne Berücksichtigung von Kollisionsnormen.\n\nSTREITBEILEGUNG:\n• Versuchen Sie zunächst, Streitigkeiten informell beizulegen\n• Kontaktieren Sie support@teambuildpro.com\n• Bei Bedarf kann Mediation oder Schiedsverfahren erforderlich sein\n• Einige Gerichtsbarkeiten erlauben keine Beschränkung von Rechten\n\nKLASSENKLAGENVERZICHT:\nSie stimmen zu, Ansprüche nur auf individueller Basis geltend zu machen, nicht als Sammelklage.",
-
-    "termsSection12Title": "12. VERSCHIEDENES",
-    "termsSection12Content": "VOLLSTÄNDIGE VEREINBARUNG:\nDiese Bedingungen stellen die vollständige Vereinbarung zwischen Ihnen und Team Build Pro dar.\n\nTRENNBARKEIT:\nWenn eine Bestimmung für ungültig befunden wird, bleiben die übrigen Bestimmungen in Kraft.\n\nVERZICHT:\nDas Versäumnis, ein Recht durchzusetzen, stellt keinen Verzicht dar.\n\nABTRETUNG:\nSie dürfen diese Bedingungen nicht ohne unsere schriftliche Zustimmung abtreten.\n\nKONTAKT:\nFür Fragen zu diesen Bedingungen:\n• E-Mail: support@teambuildpro.com\n• Website: www.teambuildpro.com",
-
-    # Privacy Policy (comprehensive legal text)
-    "privacyLastUpdated": "Zuletzt aktualisiert: {date}",
-    "privacyIntroduction": "Diese Datenschutzerklärung beschreibt, wie Team Build Pro (\"wir\", \"uns\" oder \"unsere\") Ihre persönlichen Informationen sammelt, verwendet und schützt, wenn Sie unsere mobile Anwendung (die \"App\") nutzen.\n\nBitte lesen Sie diese Richtlinie sorgfältig durch, um unsere Praktiken in Bezug auf Ihre persönlichen Daten zu verstehen.",
-
-    "privacySection1Title": "1. VON UNS GESAMMELTE INFORMATIONEN",
-    "privacySection1Content": "Wir sammeln verschiedene Arten von Informationen:\n\nKONTOINFORMATIONEN:\n• Vollständiger Name\n• E-Mail-Adresse\n• Telefonnummer (optional)\n• Standortinformationen (Stadt, Bundesland, Land)\n• Profilbild (optional)\n• Bio und persönliche Beschreibung\n\nGESCHÄFTSINFORMATIONEN:\n• Empfehlungslinks zu Geschäftsmöglichkeiten\n• Teamnetzwerkbeziehungen\n• Sponsor-/Upline-Informationen\n• Fortschrittsmeilensteine und Leistungen\n\nNUTZUNGSDATEN:\n• App-Nutzungsstatistiken\n• Funktion-Interaktionen\n• Anmelde-/Abmeldeereignisse\n• Fehlerberichte und Absturzprotokolle\n• Gerätetyp und Betriebssystemversion\n\nKOMMUNIKATIONEN:\n• In-App-Nachrichten zwischen Benutzern\n• Kontaktaufnahmen mit dem Kundensupport\n• Feedback und Umfrageantworten\n\nAUTOMATISCH GESAMMELTE DATEN:\n• IP-Adresse\n• Gerät-Identifikatoren\n• Cookie-Daten\n• Standortdaten (mit Erlaubnis)\n• Analytics-Informationen",
-
-    "privacySection2Title": "2. WIE WIR IHRE INFORMATIONEN VERWENDEN",
-    "privacySection2Content": "Wir verwenden Ihre Informationen für:\n\nDIENSTBEREITSTELLUNG:\n• Erstellen und Verwalten Ihres Kontos\n• Bereitstellen von Teamnetzwerk-Tracking\n• Ermöglichen der Kommunikation zwischen Benutzern\n• Verarbeiten von Empfehlungslinks\n• Liefern von Benachrichtigungen und Updates\n\nVERBESSERUNG DES DIENSTES:\n• Analysieren der App-Nutzung\n• Identifizieren und Beheben technischer Probleme\n• Entwickeln neuer Funktionen\n• Verbessern der Benutzererfahrung\n• Durchführen von Forschung und Analyse\n\nKOMMUNIKATION:\n• Senden von transaktionalen E-Mails\n• Bereitstellen von Kundensupport\n• Senden von Marketing-Mitteilungen (mit Zustimmung)\n• Benachrichtigen über wichtige Updates\n\nRECHTLICHE COMPLIANCE:\n• Erfüllung rechtlicher Verpflichtungen\n• Durchsetzen unserer Nutzungsbedingungen\n• Schutz unserer Rechte und Sicherheit\n• Verhinderung von Betrug und Missbrauch",
-
-    "privacySection3Title": "3. DATENWEITERGABE UND OFFENLEGUNG",
-    "privacySection3Content": "Wir verkaufen Ihre persönlichen Daten NICHT. Wir können Daten teilen mit:\n\nDIENSTLEISTERN:\n• Cloud-Hosting-Anbieter (Firebase/Google Cloud)\n• Analytics-Anbieter\n• Zahlungsabwickler (Apple, Google)\n• Kundensupport-Tools\n• E-Mail-Dienstleister\n\nGESCHÄFTLICHE ÜBERTRAGUNGEN:\n• Im Falle von Fusion, Akquisition oder Vermögensverkauf\n• Mit ordnungsgemäßer Benachrichtigung an Benutzer\n\nRECHTLICHE ANFORDERUNGEN:\n• Wenn gesetzlich erforderlich\n• Zur Reaktion auf Vorladungen oder Gerichtsbeschlüsse\n• Zum Schutz unserer Rechte oder der Sicherheit anderer\n• Zur Verhinderung illegaler Aktivitäten\n\nMIT IHRER ZUSTIMMUNG:\n• Wenn Sie uns ausdrückliche Erlaubnis geben\n• Für spezifische Zwecke, die Sie autorisieren\n\nÖFFENTLICHE INFORMATIONEN:\n• Profilname und Bild (kontrollierbar in den Einstellungen)\n• Teamnetzwerkbeziehungen (sichtbar für verbundene Benutzer)\n• Öffentlich geteilte Inhalte",
-
-    "privacySection4Title": "4. DATENSICHERHEIT",
-    "privacySection4Content": "Wir implementieren Sicherheitsmaßnahmen gemäß Industriestandards:\n\nVERSCHLÜSSELUNG:\n• SSL/TLS-Verschlüsselung für die Datenübertragung\n• Verschlüsselung im Ruhezustand für gespeicherte Daten\n• End-to-End-Verschlüsselung für Nachrichten\n\nZUGANGSKONTROLLEN:\n• Sichere Authentifizierung\n• Rollenbasierte Zugangsberechtigungen\n• Regelmäßige Zugriffsaudits\n• Biometrische Authentifizierung (optional)\n\nINFRASTRUKTUR:\n• Sichere Cloud-Hosting (Google Cloud/Firebase)\n• Regelmäßige Sicherheitspatches und Updates\n• Firewalls und Eindringlingserkennung\n• Backup- und Wiederherstellungssysteme\n\nBESTE PRAKTIKEN:\n• Verwenden Sie sichere Passwörter\n• Aktivieren Sie biometrische Authentifizierung\n• Halten Sie die App auf dem neuesten Stand\n• Melden Sie verdächtige Aktivitäten sofort\n• Halten Sie Ihr Gerät und die App auf dem neuesten Stand\n\nEINSCHRÄNKUNGEN:\n• Kein System ist zu 100% sicher\n• Sie nutzen die App auf eigenes Risiko\n• Wir können absolute Sicherheit nicht garantieren\n• Melden Sie Sicherheitsbedenken an: support@teambuildpro.com",
-
-    "privacySection5Title": "5. IHRE DATENSCHUTZRECHTE",
-    "privacySection5Content": "Sie haben die folgenden Rechte in Bezug auf Ihre Daten:\n\nZUGANG UND PORTABILITÄT:\n• Fordern Sie eine Kopie Ihrer persönlichen Daten an\n• Exportieren Sie Ihre Daten in einem portablen Format\n• Überprüfen Sie, welche Informationen wir über Sie haben\n\nKORREKTUR:\n• Aktualisieren Sie ungenaue Informationen\n• Ändern Sie Ihre Profildetails\n• Korrigieren Sie Fehler in Ihrem Konto\n\nLÖSCHUNG:\n• Fordern Sie die Löschung Ihres Kontos und Ihrer Daten an\n• Verwenden Sie die Funktion \"Konto löschen\" in der App\n• Einige Daten können aus rechtlichen Compliance-Gründen aufbewahrt werden\n• Die Löschung ist dauerhaft und kann nicht rückgängig gemacht werden\n\nOPT-OUT:\n• Abmelden von Marketing-E-Mails\n• Deaktivieren von Push-Benachrichtigungen in den Geräteeinstellungen\n• Begrenzen der Analytics-Datenerfassung\n\nUM RECHTE AUSZUÜBEN:\n• Verwenden Sie In-App-Einstellungen, wo verfügbar\n• E-Mail: support@teambuildpro.com\n• Wir werden innerhalb von 30 Tagen antworten\n• Identitätsverifizierung kann erforderlich sein",
-
-    "privacySection6Title": "6. DATENAUFBEWAHRUNG",
-    "privacySection6Content": "WIE LANGE WIR DATEN AUFBEWAHREN:\n\nAKTIVE KONTEN:\n• Daten werden aufbewahrt, während Ihr Konto aktiv ist\n• Notwendig zur Bereitstellung fortlaufender Dienste\n• Sie können Daten oder Konto jederzeit löschen\n\nGELÖSCHTE KONTEN:\n• Die meisten Daten werden innerhalb von 30 Tagen gelöscht\n• Einige Daten werden aus rechtlichen Compliance-Gründen aufbewahrt\n• Backup-Systeme werden innerhalb von 90 Tagen gelöscht\n• Finanzunterlagen werden gemäß gesetzlichen Anforderungen aufbewahrt\n\nGESETZLICHE AUFBEWAHRUNG:\n• Transaktionsaufzeichnungen: Wie gesetzlich vorgeschrieben\n• Steuerunterlagen: Gemäß Steuergesetzen\n• Streitbeilegung: Bis zur Beilegung\n• Sicherheitsprotokolle: Wie für Sicherheitszwecke erforderlich",
-
-    "privacySection7Title": "7. KINDER-DATENSCHUTZ",
-    "privacySection7Content": "Die App ist NICHT für Kinder unter 18 Jahren bestimmt:\n\n• Wir sammeln wissentlich keine Daten von Kindern\n• Benutzer müssen 18+ sein oder das Mindestalter in ihrer Gerichtsbarkeit erreicht haben\n• Wenn wir von Minderjährigen-Daten erfahren, löschen wir diese\n• Eltern sollten die Internetnutzung von Kindern überwachen\n\nWenn Sie glauben, dass wir unbeabsichtigt Daten von einem Minderjährigen gesammelt haben, kontaktieren Sie uns sofort unter support@teambuildpro.com",
-
-    "privacySection8Title": "8. INTERNATIONALE DATENÜBERTRAGUNGEN",
-    "privacySection8Content": "Ihre Daten können verarbeitet werden in:\n\n• Vereinigte Staaten\n• Europäische Union\n• Andere Länder, in denen unsere Dienstleister tätig sind\n\nDATENSCHUTZSCHILDE:\nWir implementieren geeignete Sicherheitsvorkehrungen:\n• Standard-Vertragsklauseln\n• Angemessenheitsbeschlüsse\n• Zertifizierungen und Compliance-Programme\n\nGDPR COMPLIANCE:\nFür EU-Benutzer:\n• Rechtmäßige Grundlage für die Verarbeitung\n• Datenschutz-Folgenabschätzungen\n• Einhaltung der GDPR-Anforderungen\n• Rechte gemäß GDPR",
-
-    "privacySection9Title": "9. COOKIES UND TRACKING-TECHNOLOGIEN",
-    "privacySection9Content": "Wir verwenden:\n\nESSENTIELLE COOKIES:\n• Sitzungsverwaltung\n• Authentifizierung\n• Sicherheitsfunktionen\n\nANALYTICS:\n• Firebase Analytics\n• Nutzungsstatistiken\n• Leistungsüberwachung\n\nSie können Tracking in den Geräteeinstellungen steuern:\n• iOS: Einstellungen > Datenschutz > Tracking\n• Android: Einstellungen > Google > Anzeigen",
-
-    "privacySection10Title": "10. ÄNDERUNGEN DIESER RICHTLINIE",
-    "privacySection10Content": "Wir können diese Datenschutzerklärung aktualisieren:\n\n• Änderungen werden in der App gepostet\n• Das Datum \"Zuletzt aktualisiert\" wird aktualisiert\n• Wesentliche Änderungen werden per E-Mail mitgeteilt\n• Die fortgesetzte Nutzung bedeutet Akzeptanz der Änderungen\n\nÜberprüfen Sie diese Richtlinie regelmäßig auf Updates.",
-
-    "privacySection11Title": "11. KONTAKTIEREN SIE UNS",
-    "privacySection11Content": "Für Fragen zu dieser Datenschutzerklärung:\n\nE-MAIL:\nsupport@teambuildpro.com\n\nWEBSITE:\nwww.teambuildpro.com\n\nWir werden uns bemühen, auf alle Anfragen innerhalb von 30 Tagen zu antworten.",
-}
@@ -4,11 +4,23 @@ Team Build Pro - Google Analytics 4 Data Reporter
 
 Queries GA4 data via API to analyze download button performance and calculate conversion metrics.
 
+Reports read through ga4_query.py: the queries a report needs are sent
+together in batch_run_reports calls and cached in .site-cache/ga4/, so a
+closed date range is only ever fetched once and re-running a report within
+a few minutes makes no API calls.
+
+`--report sync` copies daily rows into a local SQLite warehouse
+(ga4_warehouse.py), fetching only days it does not have yet; with --local
+every report is then answered from the warehouse without calling GA4.
+
 Usage:
     python3 analytics_report.py --report ctr
     python3 analytics_report.py --report platform --days 7
     python3 analytics_report.py --report compare --start 2025-10-22 --end 2025-10-28
     python3 analytics_report.py --report export --output data.csv
+    python3 analytics_report.py --report all --fake      # fake client, no credentials
+    python3 analytics_report.py --report sync --since 2025-10-01
+    python3 analytics_report.py --report compare --start 2025-10-22 --end 2025-10-28 --local
 
 Requirements:
     pip3 install google-analytics-data
@@ -18,15 +30,9 @@ import os
 import sys
 import argparse
 from datetime import datetime, timedelta
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.analytics.data_v1beta.types import (
-    RunReportRequest,
-    DateRange,
-    Dimension,
-    Metric,
-    FilterExpression,
-    Filter,
-)
+
+from ga4_query import CACHE_DIR, DEFAULT_WORKERS, FakeClient, GA4Query, Ga4Client, Query, QueryCache
+from ga4_warehouse import DEFAULT_SYNC_DAYS, WAREHOUSE_FILE, Warehouse, WarehouseClient, WarehouseError, sync
 
 # ==========================================
 # CONFIGURATION
@@ -42,6 +48,9 @@ CREDENTIALS_PATH = "/Users/sscott/tbp/secrets/ga4-service-account.json"
 # Set environment variable for Google authentication
 os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = CREDENTIALS_PATH
 
+# Event sent by the download buttons on the site
+DOWNLOAD_EVENT = "download_button_click"
+
 
 # ==========================================
 # HELPER FUNCTIONS
@@ -50,7 +59,7 @@ os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = CREDENTIALS_PATH
 def initialize_client():
     """Initialize GA4 Data API client with credentials"""
     try:
-        client = BetaAnalyticsDataClient()
+        client = Ga4Client()
         return client
     except Exception as e:
         print(f"❌ Error initializing GA4 client: {e}")
@@ -78,11 +87,37 @@ def calculate_ctr(clicks, views):
     return (clicks / views) * 100
 
 
+# ==========================================
+# QUERIES
+# ==========================================
+
+def page_views_query(start_date, end_date, dimensions=()):
+    return Query(["screenPageViews"], dimensions, None, start_date, end_date)
+
+
+def download_clicks_query(start_date, end_date, dimensions=()):
+    return Query(["eventCount"], dimensions, DOWNLOAD_EVENT, start_date, end_date)
+
+
+def ctr_queries(start_date, end_date):
+    return [page_views_query(start_date, end_date), download_clicks_query(start_date, end_date)]
+
+
+def all_report_queries(start_date, end_date):
+    """Queries of each report in --report all, by report name."""
+    return {
+        'ctr': ctr_queries(start_date, end_date),
+        'platform': [download_clicks_query(start_date, end_date, ["customEvent:platform"])],
+        'device': [download_clicks_query(start_date, end_date, ["customEvent:device_type"])],
+        'country': [page_views_query(start_date, end_date, ["country"])],
+    }
+
+
 # ==========================================
 # REPORT FUNCTIONS
 # ==========================================
 
-def get_ctr_report(client, start_date='7daysAgo', end_date='today'):
+def get_ctr_report(ga, start_date='7daysAgo', end_date='today'):
     """
     Calculate download button click-through rate (CTR)
 
@@ -93,33 +128,11 @@ def get_ctr_report(client, start_date='7daysAgo', end_date='today'):
     print(f"Date Range: {start_date} to {end_date}")
     print("=" * 50)
 
-    # Query 1: Get page views
-    request_views = RunReportRequest(
-        property=f"properties/{PROPERTY_ID}",
-        dimensions=[],  # No dimensions, just total
-        metrics=[Metric(name="screenPageViews")],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-    )
-
-    response_views = client.run_report(request_views)
-    page_views = int(response_views.rows[0].metric_values[0].value) if response_views.rows else 0
-
-    # Query 2: Get download button clicks
-    request_clicks = RunReportRequest(
-        property=f"properties/{PROPERTY_ID}",
-        dimensions=[],
-        metrics=[Metric(name="eventCount")],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-        dimension_filter=FilterExpression(
-            filter=Filter(
-                field_name="eventName",
-                string_filter=Filter.StringFilter(value="download_button_click")
-            )
-        ),
-    )
-
-    response_clicks = client.run_report(request_clicks)
-    button_clicks = int(response_clicks.rows[0].metric_values[0].value) if response_clicks.rows else 0
+    # Page views and download button clicks, in one batch
+    views_query, clicks_query = ctr_queries(start_date, end_date)
+    ga.prefetch([views_query, clicks_query])
+    page_views = ga.total(views_query)
+    button_clicks = ga.total(clicks_query)
 
     # Calculate CTR
     ctr = calculate_ctr(button_clicks, page_views)
@@ -137,7 +150,7 @@ def get_ctr_report(client, start_date='7daysAgo', end_date='today'):
     }
 
 
-def get_platform_breakdown(client, start_date='7daysAgo', end_date='today'):
+def get_platform_breakdown(ga, start_date='7daysAgo', end_date='today'):
     """
     Breakdown of clicks by platform (App Store vs. Google Play)
 
@@ -149,29 +162,16 @@ def get_platform_breakdown(client, start_date='7daysAgo', end_date='today'):
     print("=" * 50)
 
     try:
-        # Query: Get clicks by platform dimension
-        request = RunReportRequest(
-            property=f"properties/{PROPERTY_ID}",
-            dimensions=[Dimension(name="customEvent:platform")],  # Custom parameter
-            metrics=[Metric(name="eventCount")],
-            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-            dimension_filter=FilterExpression(
-                filter=Filter(
-                    field_name="eventName",
-                    string_filter=Filter.StringFilter(value="download_button_click")
-                )
-            ),
-        )
-
-        response = client.run_report(request)
+        # Query: Get clicks by platform dimension (custom parameter)
+        response = ga.get(download_clicks_query(start_date, end_date, ["customEvent:platform"]))
 
         # Parse results
         platforms = {}
         total_clicks = 0
 
         for row in response.rows:
-            platform = row.dimension_values[0].value
-            count = int(row.metric_values[0].value)
+            platform = row.dimensions[0]
+            count = int(row.metrics[0])
             platforms[platform] = count
             total_clicks += count
 
@@ -198,7 +198,7 @@ def get_platform_breakdown(client, start_date='7daysAgo', end_date='today'):
             raise
 
 
-def get_device_breakdown(client, start_date='7daysAgo', end_date='today'):
+def get_device_breakdown(ga, start_date='7daysAgo', end_date='today'):
     """
     Breakdown of clicks by device type (Mobile vs. Desktop)
 
@@ -210,29 +210,16 @@ def get_device_breakdown(client, start_date='7daysAgo', end_date='today'):
     print("=" * 50)
 
     try:
-        # Query: Get clicks by device_type dimension
-        request = RunReportRequest(
-            property=f"properties/{PROPERTY_ID}",
-            dimensions=[Dimension(name="customEvent:device_type")],  # Custom parameter
-            metrics=[Metric(name="eventCount")],
-            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-            dimension_filter=FilterExpression(
-                filter=Filter(
-                    field_name="eventName",
-                    string_filter=Filter.StringFilter(value="download_button_click")
-                )
-            ),
-        )
-
-        response = client.run_report(request)
+        # Query: Get clicks by device_type dimension (custom parameter)
+        response = ga.get(download_clicks_query(start_date, end_date, ["customEvent:device_type"]))
 
         # Parse results
         devices = {}
         total_clicks = 0
 
         for row in response.rows:
-            device = row.dimension_values[0].value
-            count = int(row.metric_values[0].value)
+            device = row.dimensions[0]
+            count = int(row.metrics[0])
             devices[device] = count
             total_clicks += count
 
@@ -259,7 +246,7 @@ def get_device_breakdown(client, start_date='7daysAgo', end_date='today'):
             raise
 
 
-def get_country_breakdown(client, start_date='7daysAgo', end_date='today'):
+def get_country_breakdown(ga, start_date='7daysAgo', end_date='today'):
     """
     Breakdown of page views by country
 
@@ -271,22 +258,15 @@ def get_country_breakdown(client, start_date='7daysAgo', end_date='today'):
     print("=" * 50)
 
     # Query: Get page views by country
-    request = RunReportRequest(
-        property=f"properties/{PROPERTY_ID}",
-        dimensions=[Dimension(name="country")],
-        metrics=[Metric(name="screenPageViews")],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-    )
-
-    response = client.run_report(request)
+    response = ga.get(page_views_query(start_date, end_date, ["country"]))
 
     # Parse results
     countries = {}
     total_views = 0
 
     for row in response.rows:
-        country = row.dimension_values[0].value
-        count = int(row.metric_values[0].value)
+        country = row.dimensions[0]
+        count = int(row.metrics[0])
         countries[country] = count
         total_views += count
 
@@ -304,7 +284,7 @@ def get_country_breakdown(client, start_date='7daysAgo', end_date='today'):
     return countries
 
 
-def compare_periods(client, baseline_start, baseline_end, test_start, test_end):
+def compare_periods(ga, baseline_start, baseline_end, test_start, test_end):
     """
     Compare CTR between two time periods (before vs. after change)
 
@@ -317,13 +297,16 @@ def compare_periods(client, baseline_start, baseline_end, test_start, test_end):
     print(f"\n🔄 Before/After Comparison Report")
     print("=" * 50)
 
+    # Both periods in one batch; past periods come from the cache after the first run
+    ga.prefetch(ctr_queries(baseline_start, baseline_end) + ctr_queries(test_start, test_end))
+
     # Get baseline period data
     print(f"\n📊 Baseline Period: {baseline_start} to {baseline_end}")
-    baseline = get_ctr_report(client, baseline_start, baseline_end)
+    baseline = get_ctr_report(ga, baseline_start, baseline_end)
 
     # Get test period data
     print(f"\n📊 Test Period: {test_start} to {test_end}")
-    test = get_ctr_report(client, test_start, test_end)
+    test = get_ctr_report(ga, test_start, test_end)
 
     # Calculate changes
     print(f"\n📈 Comparison Summary:")
@@ -364,7 +347,7 @@ def compare_periods(client, baseline_start, baseline_end, test_start, test_end):
     }
 
 
-def export_to_csv(client, start_date='30daysAgo', end_date='today', output_file='ga4_data.csv'):
+def export_to_csv(ga, start_date='30daysAgo', end_date='today', output_file='ga4_data.csv'):
     """
     Export GA4 data to CSV file for further analysis
 
@@ -377,24 +360,8 @@ def export_to_csv(client, start_date='30daysAgo', end_date='today', output_file=
     print("=" * 50)
 
     # Query: Get daily metrics
-    request = RunReportRequest(
-        property=f"properties/{PROPERTY_ID}",
-        dimensions=[
-            Dimension(name="date"),
-            Dimension(name="customEvent:platform"),
-            Dimension(name="customEvent:device_type"),
-        ],
-        metrics=[Metric(name="eventCount")],
-        date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-        dimension_filter=FilterExpression(
-            filter=Filter(
-                field_name="eventName",
-                string_filter=Filter.StringFilter(value="download_button_click")
-            )
-        ),
-    )
-
-    response = client.run_report(request)
+    response = ga.get(download_clicks_query(
+        start_date, end_date, ["date", "customEvent:platform", "customEvent:device_type"]))
 
     # Write to CSV
     import csv
@@ -405,10 +372,8 @@ def export_to_csv(client, start_date='30daysAgo', end_date='today', output_file=
 
         # Data rows
         for row in response.rows:
-            date = row.dimension_values[0].value
-            platform = row.dimension_values[1].value
-            device = row.dimension_values[2].value
-            count = row.metric_values[0].value
+            date, platform, device = row.dimensions
+            count = row.metrics[0]
 
             writer.writerow([date, platform, device, count])
 
@@ -416,6 +381,56 @@ def export_to_csv(client, start_date='30daysAgo', end_date='today', output_file=
     return output_file
 
 
+def run_all_reports(ga, start_date='7daysAgo', end_date='today'):
+    """
+    Run the ctr, platform, device and country reports from one concurrent fetch
+
+    Each report's queries go out as their own batch, all at the same time,
+    so the fetch takes as long as the slowest report. A report that fails
+    is recorded under 'errors' and the others still complete.
+
+    Returns:
+        dict with the date range, each report's result and any errors
+    """
+    builders = {
+        'ctr': get_ctr_report,
+        'platform': get_platform_breakdown,
+        'device': get_device_breakdown,
+        'country': get_country_breakdown,
+    }
+    ga.prefetch_groups(all_report_queries(start_date, end_date).values())
+
+    combined = {'start_date': start_date, 'end_date': end_date, 'reports': {}, 'errors': {}}
+    for name, builder in builders.items():
+        try:
+            combined['reports'][name] = builder(ga, start_date, end_date)
+        except Exception as e:
+            print(f"\n❌ {name} report failed: {e}")
+            combined['errors'][name] = f"{type(e).__name__}: {e}"
+    return combined
+
+
+def write_combined(combined, json_file=None, csv_file=None):
+    """Write run_all_reports() output as JSON and/or CSV (report, key, value rows)"""
+    if json_file:
+        import json
+        with open(json_file, 'w') as f:
+            json.dump(combined, f, indent=2)
+            f.write('\n')
+        print(f"✅ Wrote {json_file}")
+    if csv_file:
+        import csv
+        with open(csv_file, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Report', 'Key', 'Value', 'Start', 'End'])
+            for report, values in combined['reports'].items():
+                for key, value in values.items():
+                    writer.writerow([report, key, value, combined['start_date'], combined['end_date']])
+            for report, error in combined['errors'].items():
+                writer.writerow([report, 'error', error, combined['start_date'], combined['end_date']])
+        print(f"✅ Wrote {csv_file}")
+
+
 # ==========================================
 # COMMAND-LINE INTERFACE
 # ==========================================
@@ -440,11 +455,18 @@ Examples:
 
   # Export data to CSV
   python3 analytics_report.py --report export --output data.csv
+
+  # All reports at once, fetched concurrently, saved as JSON and CSV
+  python3 analytics_report.py --report all --json weekly.json --csv weekly.csv
+
+  # Copy daily rows into the local warehouse, then report from it
+  python3 analytics_report.py --report sync
+  python3 analytics_report.py --report platform --days 90 --local
         """
     )
 
     parser.add_argument('--report',
-                        choices=['ctr', 'platform', 'device', 'country', 'compare', 'export', 'all'],
+                        choices=['ctr', 'platform', 'device', 'country', 'compare', 'export', 'all', 'sync'],
                         required=True,
                         help='Type of report to generate')
 
@@ -466,6 +488,39 @@ Examples:
                         default='ga4_data.csv',
                         help='Output CSV filename (default: ga4_data.csv)')
 
+    parser.add_argument('--json',
+                        type=str,
+                        help='--report all: also write the combined results as JSON')
+
+    parser.add_argument('--csv',
+                        type=str,
+                        help='--report all: also write the combined results as CSV')
+
+    parser.add_argument('--workers',
+                        type=int,
+                        default=DEFAULT_WORKERS,
+                        help=f'Concurrent GA4 API calls (default: {DEFAULT_WORKERS})')
+
+    parser.add_argument('--fake',
+                        action='store_true',
+                        help='Use the fake GA4 client (no credentials, deterministic numbers)')
+
+    parser.add_argument('--refresh',
+                        action='store_true',
+                        help='Re-fetch open date ranges even if cached (closed ranges are always cached)')
+
+    parser.add_argument('--local',
+                        action='store_true',
+                        help=f'Answer reports from the local warehouse ({WAREHOUSE_FILE}); run --report sync first')
+
+    parser.add_argument('--since',
+                        type=str,
+                        help=f'First day to sync (YYYY-MM-DD, default: {DEFAULT_SYNC_DAYS} days ago)')
+
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help=f'Do not read or write the result cache ({CACHE_DIR})')
+
     args = parser.parse_args()
 
     # Validate Property ID is set
@@ -475,27 +530,67 @@ Examples:
         print("Find it in: Google Analytics → Admin → Property Settings → Property ID")
         sys.exit(1)
 
+    # Fake data is kept apart from the real property's in the warehouse
+    property_id = 'fake' if args.fake else PROPERTY_ID
+
     # Initialize client
-    print(f"\n🔐 Authenticating with Google Analytics...")
-    client = initialize_client()
-    print(f"✅ Connected to GA4 Property: {PROPERTY_ID}")
+    if args.local and args.report != 'sync':
+        print(f"\n🗄️  Using local warehouse: {WAREHOUSE_FILE}")
+        warehouse = Warehouse()
+        client = WarehouseClient(warehouse)
+    elif args.fake:
+        print(f"\n🧪 Using fake GA4 client")
+        client = FakeClient()
+    else:
+        print(f"\n🔐 Authenticating with Google Analytics...")
+        client = initialize_client()
+        print(f"✅ Connected to GA4 Property: {PROPERTY_ID}")
+    cache = None if args.no_cache or args.fake or args.local else QueryCache()
+    ga = GA4Query(client, property_id, cache=cache, refresh=args.refresh, workers=args.workers)
+
+    if args.report == 'sync':
+        since = (datetime.strptime(args.since, '%Y-%m-%d').date() if args.since
+                 else datetime.now().date() - timedelta(days=DEFAULT_SYNC_DAYS))
+        print(f"\n🔄 Syncing daily GA4 rows into {WAREHOUSE_FILE}")
+        with Warehouse() as warehouse:
+            sync(warehouse, client, property_id, since)
+            days, first, last, closed = warehouse.stats(property_id)
+        print(f"   Warehouse: {days} day(s), {first} to {last} ({closed or 0} settled)")
+        print(f"\n✅ Sync Complete!\n")
+        return
+
+    try:
+        failed = run_report(ga, args)
+    except WarehouseError as e:
+        print(f"\n❌ Local warehouse: {e}")
+        sys.exit(1)
 
+    source = "Warehouse batches" if args.local else "GA4 API calls"
+    print(f"\n📡 {source}: {ga.api_calls} ({len(ga.results)} queries answered)")
+    if failed:
+        print(f"\n⚠️  Report finished with errors in: {', '.join(failed)}\n")
+        sys.exit(1)
+    print(f"\n✅ Report Complete!\n")
+
+
+def run_report(ga, args):
+    """Run the report selected on the command line; returns the names of failed reports."""
     # Calculate date range
     end_date = 'today'
     start_date = f'{args.days}daysAgo'
 
     # Run requested report
     if args.report == 'ctr':
-        get_ctr_report(client, start_date, end_date)
+        get_ctr_report(ga, start_date, end_date)
 
     elif args.report == 'platform':
-        get_platform_breakdown(client, start_date, end_date)
+        get_platform_breakdown(ga, start_date, end_date)
 
     elif args.report == 'device':
-        get_device_breakdown(client, start_date, end_date)
+        get_device_breakdown(ga, start_date, end_date)
 
     elif args.report == 'country':
-        get_country_breakdown(client, start_date, end_date)
+        get_country_breakdown(ga, start_date, end_date)
 
     elif args.report == 'compare':
         # Require start and end dates for baseline
@@ -518,19 +613,18 @@ Examples:
         test_end_dt = test_start_dt + timedelta(days=baseline_days - 1)
         test_end = test_end_dt.strftime('%Y-%m-%d')
 
-        compare_periods(client, baseline_start, baseline_end, test_start, test_end)
+        compare_periods(ga, baseline_start, baseline_end, test_start, test_end)
 
     elif args.report == 'export':
-        export_to_csv(client, start_date, end_date, args.output)
+        export_to_csv(ga, start_date, end_date, args.output)
 
     elif args.report == 'all':
-        # Run all reports
-        get_ctr_report(client, start_date, end_date)
-        get_platform_breakdown(client, start_date, end_date)
-        get_device_breakdown(client, start_date, end_date)
-        get_country_breakdown(client, start_date, end_date)
+        # Run all reports; their queries are fetched concurrently
+        combined = run_all_reports(ga, start_date, end_date)
+        write_combined(combined, args.json, args.csv)
+        return list(combined['errors'])
 
-    print(f"\n✅ Report Complete!\n")
+    return []
 
 
 if __name__ == '__main__':
@@ -0,0 +1,297 @@
+"""
+Query layer for the GA4 Data API: batched requests and an on-disk result cache.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / '.site-cache' / 'ga4'
+CACHE_VERSION = 1
+MAX_BATCH = 5
+# GA4 may still revise the last two days; ranges ending earlier are final
+DATA_SETTLE_DAYS = 2
+OPEN_TTL = 15 * 60
+DEFAULT_WORKERS = 4
+
+_DAYS_AGO_RE = re.compile(r'^(\d+)daysAgo$')
+
+Row = namedtuple('Row', 'dimensions metrics')
+Result = namedtuple('Result', 'rows')
+
+
+class RequestError(ValueError):
+    """One request of a batch was rejected (GA4 INVALID_ARGUMENT); the others may be fine."""
+
+
+class Query(namedtuple('Query', 'metrics dimensions event start end')):
+    """One report: metric and dimension names, an optional eventName filter, a date range."""
+
+    def __new__(cls, metrics, dimensions=(), event=None, start='7daysAgo', end='today'):
+        return super().__new__(cls, tuple(metrics), tuple(dimensions), event, start, end)
+
+
+def resolve_date(value, today=None):
+    """Calendar date for a GA4 date string ('today', 'yesterday', 'NdaysAgo', 'YYYY-MM-DD')."""
+    today = today or date.today()
+    if value == 'today':
+        return today
+    if value == 'yesterday':
+        return today - timedelta(days=1)
+    m = _DAYS_AGO_RE.match(value)
+    if m:
+        return today - timedelta(days=int(m.group(1)))
+    return date.fromisoformat(value)
+
+
+def is_closed(query, today=None):
+    today = today or date.today()
+    return resolve_date(query.end, today) <= today - timedelta(days=DATA_SETTLE_DAYS)
+
+
+def cache_key(property_id, query, today=None):
+    """Stable key for a query: relative dates are resolved, so '7daysAgo' today and tomorrow differ."""
+    normalised = {
+        'property': str(property_id),
+        'metrics': list(query.metrics),
+        'dimensions': list(query.dimensions),
+        'event': query.event,
+        'start': resolve_date(query.start, today).isoformat(),
+        'end': resolve_date(query.end, today).isoformat(),
+    }
+    return hashlib.sha256(json.dumps(normalised, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class QueryCache:
+    """One JSON file per cache key."""
+
+    def __init__(self, directory=CACHE_DIR, open_ttl=OPEN_TTL):
+        self.directory = Path(directory)
+        self.open_ttl = open_ttl
+
+    def _path(self, key):
+        return self.directory / f"{key}.json"
+
+    def get(self, key):
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with open(path, encoding='utf-8') as f:
+            entry = json.load(f)
+        if entry.get('version') != CACHE_VERSION:
+            return None
+        if not entry['closed'] and time.time() - entry['fetched'] > self.open_ttl:
+            return None
+        return Result([Row(tuple(d), tuple(m)) for d, m in entry['rows']])
+
+    def put(self, key, query, result, closed):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {'version': CACHE_VERSION, 'query': query._asdict(), 'closed': closed,
+                 'fetched': time.time(), 'rows': [[list(r.dimensions), list(r.metrics)] for r in result.rows]}
+        path = self._path(key)
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+
+class GA4Query:
+    """Results for Query values, from memory, the disk cache or batched API calls."""
+
+    def __init__(self, client, property_id, cache=None, refresh=False, workers=DEFAULT_WORKERS):
+        self.client = client
+        self.property_id = property_id
+        self.cache = cache
+        self.refresh = refresh
+        # A client with `concurrent = False` is only called from this thread
+        self.workers = workers if getattr(client, 'concurrent', True) else 1
+        self.results = {}
+        self.errors = {}
+        self.api_calls = 0
+
+    def _missing(self, queries, today):
+        """(query, cache key, closed) for queries neither answered nor cached."""
+        missing = []
+        for query in dict.fromkeys(queries):
+            if query in self.results or query in self.errors:
+                continue
+            key = cache_key(self.property_id, query, today)
+            closed = is_closed(query, today)
+            cached = None
+            if self.cache is not None and (closed or not self.refresh):
+                cached = self.cache.get(key)
+            if cached is not None:
+                self.results[query] = cached
+            else:
+                missing.append((query, key, closed))
+        return missing
+
+    def prefetch(self, queries, split=True):
+        """Fetch every query not answered yet, in batches of MAX_BATCH.
+
+        With `split` False a rejected batch is not retried query by query:
+        the error is recorded for all of its queries (probes whose queries
+        would all fail the same way).
+        """
+        missing = self._missing(queries, date.today())
+        self._run([missing[i:i + MAX_BATCH] for i in range(0, len(missing), MAX_BATCH)], split)
+
+    def prefetch_groups(self, groups):
+        """Like prefetch(), but each group of queries gets batches of its own.
+
+        All batches still run concurrently; a group the API rejects costs
+        no other group its result or an extra round trip.
+        """
+        today = date.today()
+        batches = []
+        for queries in groups:
+            missing = self._missing(queries, today)
+            batches += [missing[i:i + MAX_BATCH] for i in range(0, len(missing), MAX_BATCH)]
+        self._run(batches)
+
+    def _call(self, batch):
+        try:
+            return batch, self.client.run_batch(self.property_id, [query for query, _, _ in batch]), None
+        except Exception as e:
+            return batch, None, e
+
+    def _run(self, batches, split=True):
+        if not batches:
+            return
+        self.api_calls += len(batches)
+        if self.workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as pool:
+                outcomes = list(pool.map(self._call, batches))
+        else:
+            outcomes = [self._call(batch) for batch in batches]
+        retry = []
+        for batch, results, error in outcomes:
+            if error is None:
+                for (query, key, closed), result in zip(batch, results):
+                    self.results[query] = result
+                    if self.cache is not None:
+                        self.cache.put(key, query, result, closed)
+            elif split and len(batch) > 1 and isinstance(error, RequestError):
+                # Find the query the API rejected; the others still get their results
+                retry.extend([item] for item in batch)
+            else:
+                for query, _, _ in batch:
+                    self.errors[query] = error
+        self._run(retry)
+
+    def get(self, query):
+        """Result for one query; raises the API error if it was rejected."""
+        self.prefetch([query])
+        if query in self.errors:
+            raise self.errors[query]
+        return self.results[query]
+
+    def total(self, query):
+        """First metric of the first row as an int (0 when there are no rows)."""
+        rows = self.get(query).rows
+        return int(rows[0].metrics[0]) if rows else 0
+
+
+# ---------- clients ----------
+class Ga4Client:
+    """BetaAnalyticsDataClient behind run_batch(); one batch_run_reports call per batch."""
+
+    def __init__(self, client=None):
+        if client is None:
+            from google.analytics.data_v1beta import BetaAnalyticsDataClient
+            client = BetaAnalyticsDataClient()
+        self.client = client
+
+    def run_batch(self, property_id, queries):
+        from google.analytics.data_v1beta.types import (
+            BatchRunReportsRequest, DateRange, Dimension, Filter, FilterExpression, Metric, RunReportRequest)
+        requests = []
+        for query in queries:
+            request = RunReportRequest(
+                dimensions=[Dimension(name=name) for name in query.dimensions],
+                metrics=[Metric(name=name) for name in query.metrics],
+                date_ranges=[DateRange(start_date=query.start, end_date=query.end)],
+            )
+            if query.event:
+                request.dimension_filter = FilterExpression(
+                    filter=Filter(field_name="eventName", string_filter=Filter.StringFilter(value=query.event)))
+            requests.append(request)
+        try:
+            response = self.client.batch_run_reports(
+                BatchRunReportsRequest(property=f"properties/{property_id}", requests=requests))
+        except Exception as e:
+            # google.api_core.exceptions.InvalidArgument, without importing google-api-core
+            if type(e).__name__ == 'InvalidArgument':
+                raise RequestError(str(e)) from e
+            raise
+        return [Result([Row(tuple(v.value for v in row.dimension_values),
+                            tuple(v.value for v in row.metric_values)) for row in report.rows])
+                for report in response.reports]
+
+
+class FakeClient:
+    """Deterministic stand-in for Ga4Client: no network, no credentials.
+
+    `calls` records the queries of every run_batch() call. Dimensions named
+    in `invalid_dimensions` make a batch fail like an unregistered custom
+    dimension does; `error`, if given, is raised by every call (like an
+    auth or quota failure); `latency` (seconds) is added to every call.
+    """
+
+    VALUES = {
+        'country': ('United States', 'Brazil', 'Germany', 'Mexico'),
+        'customEvent:platform': ('app_store', 'google_play'),
+        'customEvent:device_type': ('mobile', 'desktop'),
+        'eventName': ('page_view', 'download_button_click'),
+    }
+    # Page views outnumber clicks, so fake CTRs look plausible
+    METRIC_SCALE = {'screenPageViews': 50}
+
+    def __init__(self, invalid_dimensions=(), latency=0.0, error=None):
+        self.invalid_dimensions = set(invalid_dimensions)
+        self.latency = latency
+        self.error = error
+        self.calls = []
+
+    def _value(self, property_id, query, key, metric):
+        events = dict(zip(query.dimensions, key)).get('eventName')
+        if metric == 'screenPageViews' and events not in (None, 'page_view'):
+            return 0
+        return self._count(property_id, query, key, metric) * self.METRIC_SCALE.get(metric, 1)
+
+    def _count(self, *parts):
+        digest = hashlib.sha256(json.dumps(parts).encode('utf-8')).digest()
+        return 1 + int.from_bytes(digest[:2], 'big') % 500
+
+    def _dimension_values(self, name, query):
+        if name == 'date':
+            start, end = resolve_date(query.start), resolve_date(query.end)
+            return tuple((start + timedelta(days=i)).strftime('%Y%m%d') for i in range((end - start).days + 1))
+        return self.VALUES.get(name, ('(not set)',))
+
+    def run_batch(self, property_id, queries):
+        if len(queries) > MAX_BATCH:
+            raise ValueError(f"batch of {len(queries)} requests exceeds {MAX_BATCH}")
+        self.calls.append(list(queries))
+        time.sleep(self.latency)
+        if self.error is not None:
+            raise self.error
+        for query in queries:
+            for name in query.dimensions:
+                if name in self.invalid_dimensions:
+                    raise RequestError(f"Field {name} is not a valid dimension")
+        results = []
+        for query in queries:
+            keys = [()]
+            for name in query.dimensions:
+                keys = [k + (v,) for k in keys for v in self._dimension_values(name, query)]
+            rows = [Row(k, tuple(str(self._value(property_id, query, k, m)) for m in query.metrics))
+                    for k in keys]
+            results.append(Result(rows))
+        return results
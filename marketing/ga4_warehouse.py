@@ -0,0 +1,195 @@
+"""
+Local GA4 warehouse: daily rows in SQLite, synced incrementally.
+"""
+import sqlite3
+from datetime import date, timedelta
+
+from ga4_query import DATA_SETTLE_DAYS, MAX_BATCH, REPO_ROOT, GA4Query, Query, RequestError, Result, Row, resolve_date
+
+WAREHOUSE_FILE = REPO_ROOT / '.site-cache' / 'ga4-warehouse.db'
+DEFAULT_SYNC_DAYS = 90
+
+# GA4 name -> column
+DIMENSIONS = {
+    'date': 'date',
+    'eventName': 'event',
+    'customEvent:platform': 'platform',
+    'customEvent:device_type': 'device',
+    'country': 'country',
+}
+METRICS = {'eventCount': 'event_count', 'screenPageViews': 'page_views'}
+CUSTOM_DIMENSIONS = ('customEvent:platform', 'customEvent:device_type')
+NOT_SET = '(not set)'
+
+
+class WarehouseError(RequestError):
+    """A query the warehouse cannot answer (unknown field or days not synced)."""
+
+
+def _ga_date(day):
+    return day.strftime('%Y%m%d')
+
+
+class Warehouse:
+    """Daily GA4 rows per property."""
+
+    def __init__(self, path=WAREHOUSE_FILE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS daily (
+                property TEXT NOT NULL, date TEXT NOT NULL, event TEXT NOT NULL,
+                platform TEXT NOT NULL, device TEXT NOT NULL, country TEXT NOT NULL,
+                event_count INTEGER NOT NULL, page_views INTEGER NOT NULL);
+            CREATE INDEX IF NOT EXISTS daily_date ON daily (property, date);
+            CREATE TABLE IF NOT EXISTS synced_days (
+                property TEXT NOT NULL, date TEXT NOT NULL, closed INTEGER NOT NULL,
+                synced_at TEXT NOT NULL, custom INTEGER NOT NULL DEFAULT 1, PRIMARY KEY (property, date));
+        ''')
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(synced_days)')]
+        if 'custom' not in columns:
+            # Older warehouses: a day has the custom dimensions if any of its rows has one set
+            with self.db:
+                self.db.execute('ALTER TABLE synced_days ADD COLUMN custom INTEGER NOT NULL DEFAULT 1')
+                self.db.execute('''
+                    UPDATE synced_days SET custom = 0 WHERE NOT EXISTS (
+                        SELECT 1 FROM daily d WHERE d.property = synced_days.property
+                        AND d.date = synced_days.date AND (d.platform != ? OR d.device != ?))''',
+                    (NOT_SET, NOT_SET))
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def closed_days(self, property_id, custom=None):
+        """Settled days; with `custom` only those stored with (True) or without (False) the custom dimensions."""
+        sql = 'SELECT date FROM synced_days WHERE property = ? AND closed = 1'
+        params = [str(property_id)]
+        if custom is not None:
+            sql += ' AND custom = ?'
+            params.append(int(custom))
+        return {row[0] for row in self.db.execute(sql, params)}
+
+    def missing_days(self, property_id, start, end):
+        """Days in [start, end] (dates) that were never synced."""
+        synced = {row[0] for row in self.db.execute(
+            'SELECT date FROM synced_days WHERE property = ? AND date BETWEEN ? AND ?',
+            (str(property_id), _ga_date(start), _ga_date(end)))}
+        days = (start + timedelta(days=i) for i in range((end - start).days + 1))
+        return [day for day in days if _ga_date(day) not in synced]
+
+    def store_day(self, property_id, day, rows, closed, custom=True):
+        """Replace one day's rows: [(event, platform, device, country, event_count, page_views)]."""
+        property_id, key = str(property_id), _ga_date(day)
+        with self.db:
+            self.db.execute('DELETE FROM daily WHERE property = ? AND date = ?', (property_id, key))
+            self.db.executemany('INSERT INTO daily VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                [(property_id, key) + tuple(row) for row in rows])
+            self.db.execute('INSERT OR REPLACE INTO synced_days VALUES (?, ?, ?, ?, ?)',
+                            (property_id, key, int(closed), date.today().isoformat(), int(custom)))
+
+    def stats(self, property_id):
+        return self.db.execute(
+            'SELECT COUNT(*), MIN(date), MAX(date), SUM(closed) FROM synced_days WHERE property = ?',
+            (str(property_id),)).fetchone()
+
+
+def day_query(day, custom_dimensions=True):
+    dimensions = ['eventName'] + (list(CUSTOM_DIMENSIONS) if custom_dimensions else []) + ['country']
+    return Query(list(METRICS), dimensions, None, day.isoformat(), day.isoformat())
+
+
+def sync(warehouse, client, property_id, since, until=None, log=print):
+    """Fetch the days in [since, until] that are not stored as settled. Returns the days fetched.
+
+    Settled days stored without the custom dimensions are fetched again
+    when the dimensions turn out to be registered.
+    """
+    today = date.today()
+    until = until or today
+    settled = today - timedelta(days=DATA_SETTLE_DAYS)
+    have = warehouse.closed_days(property_id, custom=True)
+    without = warehouse.closed_days(property_id, custom=False)
+    days = [since + timedelta(days=i) for i in range((until - since).days + 1)]
+    needed = [day for day in days if _ga_date(day) not in have | without]
+    upgrade = [day for day in days if _ga_date(day) in without]
+    log(f"   {len(days)} day(s) from {since} to {until}: {len(days) - len(needed)} stored, "
+        f"{len(needed)} to fetch, {len(upgrade)} stored without platform/device")
+    if not needed and not upgrade:
+        return []
+
+    ga = GA4Query(client, property_id)
+    todo = needed + upgrade
+    # The first batch is the probe: if the custom dimensions are not registered,
+    # all of its queries are rejected, and retrying them one by one would not help
+    probe = [day_query(day) for day in todo[:MAX_BATCH]]
+    ga.prefetch(probe, split=False)
+    custom = True
+    error = ga.errors.get(probe[0])
+    if error is not None:
+        if 'not a valid dimension' not in str(error):
+            raise error
+        custom = False
+        todo = needed
+        log("   ⚠️  Custom dimensions platform/device_type not registered; storing days without them")
+    ga.prefetch([day_query(day, custom) for day in todo])
+
+    fetched = []
+    for day in todo:
+        query = day_query(day, custom)
+        if query in ga.errors:
+            log(f"   ❌ {day}: {ga.errors[query]}")
+            continue
+        rows = []
+        for row in ga.get(query).rows:
+            values = dict(zip(query.dimensions, row.dimensions))
+            metrics = dict(zip(query.metrics, row.metrics))
+            rows.append((values['eventName'], values.get('customEvent:platform', NOT_SET),
+                         values.get('customEvent:device_type', NOT_SET), values['country'],
+                         int(metrics['eventCount']), int(metrics['screenPageViews'])))
+        warehouse.store_day(property_id, day, rows, closed=day <= settled, custom=custom)
+        fetched.append(day)
+    log(f"   ✅ {len(fetched)} day(s) stored in {ga.api_calls} API call(s)")
+    return fetched
+
+
+class WarehouseClient:
+    """run_batch() from the warehouse: each Query becomes one SQL aggregate."""
+
+    # The SQLite connection belongs to the thread that opened it
+    concurrent = False
+
+    def __init__(self, warehouse):
+        self.warehouse = warehouse
+
+    def run_batch(self, property_id, queries):
+        return [self.run_query(property_id, query) for query in queries]
+
+    def run_query(self, property_id, query):
+        unknown = [n for n in query.dimensions if n not in DIMENSIONS] + [m for m in query.metrics if m not in METRICS]
+        if unknown:
+            raise WarehouseError(f"not stored in the warehouse: {', '.join(unknown)}")
+        start, end = resolve_date(query.start), resolve_date(query.end)
+        missing = self.warehouse.missing_days(property_id, start, end)
+        if missing:
+            raise WarehouseError(f"{len(missing)} day(s) between {start} and {end} not synced "
+                                 f"(first: {missing[0]}); run --report sync")
+        columns = [DIMENSIONS[n] for n in query.dimensions]
+        sums = [f"SUM({METRICS[m]})" for m in query.metrics]
+        sql = f"SELECT {', '.join(columns + sums)} FROM daily WHERE property = ? AND date BETWEEN ? AND ?"
+        params = [str(property_id), _ga_date(start), _ga_date(end)]
+        if query.event:
+            sql += " AND event = ?"
+            params.append(query.event)
+        if columns:
+            sql += f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}"
+        n = len(columns)
+        # Like GA4, no rows whose metrics are all zero
+        return Result([Row(tuple(r[:n]), tuple(str(v) for v in r[n:]))
+                       for r in self.warehouse.db.execute(sql, params) if any(r[n:])])
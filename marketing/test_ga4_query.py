@@ -0,0 +1,78 @@
+"""
+Tests for the GA4 query layer (ga4_query.py), run against FakeClient.
+
+Usage:
+    python3 -m pytest marketing/test_ga4_query.py -q
+"""
+import time
+from datetime import date, timedelta
+
+import ga4_query
+from analytics_report import all_report_queries, get_ctr_report
+from ga4_query import DATA_SETTLE_DAYS, OPEN_TTL, FakeClient, GA4Query, Query, QueryCache
+
+PROPERTY_ID = '123'
+
+
+def _days_ago(n):
+    return (date.today() - timedelta(days=n)).isoformat()
+
+
+def test_ctr_report_is_one_batch():
+    client = FakeClient()
+    ga = GA4Query(client, PROPERTY_ID)
+    report = get_ctr_report(ga)
+    assert ga.api_calls == 1
+    assert len(client.calls) == 1 and len(client.calls[0]) == 2
+    assert report['page_views'] > report['button_clicks'] > 0
+
+
+def test_closed_range_is_never_fetched_again(tmp_path):
+    query = Query(['screenPageViews'], (), None, _days_ago(30), _days_ago(DATA_SETTLE_DAYS))
+    cache = QueryCache(tmp_path)
+    first = GA4Query(FakeClient(), PROPERTY_ID, cache)
+    expected = first.get(query)
+
+    client = FakeClient()
+    again = GA4Query(client, PROPERTY_ID, cache, refresh=True)
+    assert again.get(query) == expected
+    assert client.calls == [] and again.api_calls == 0
+
+
+def test_open_range_is_fetched_again_after_ttl(tmp_path, monkeypatch):
+    query = Query(['eventCount'], (), None, '7daysAgo', 'today')
+    cache = QueryCache(tmp_path)
+    GA4Query(FakeClient(), PROPERTY_ID, cache).get(query)
+
+    client = FakeClient()
+    GA4Query(client, PROPERTY_ID, cache).get(query)
+    assert client.calls == []
+
+    now = time.time()
+    monkeypatch.setattr(ga4_query.time, 'time', lambda: now + OPEN_TTL + 1)
+    GA4Query(client, PROPERTY_ID, cache).get(query)
+    assert client.calls == [[query]]
+
+
+def test_rejected_batch_fails_only_the_bad_query():
+    queries = [q for group in all_report_queries('7daysAgo', 'today').values() for q in group]
+    client = FakeClient(invalid_dimensions={'customEvent:platform'})
+    ga = GA4Query(client, PROPERTY_ID)
+    ga.prefetch(queries)
+
+    bad = [q for q in queries if 'customEvent:platform' in q.dimensions]
+    assert list(ga.errors) == bad
+    assert set(ga.results) == set(queries) - set(bad)
+    # The whole batch once, then each query on its own
+    assert len(client.calls) == 1 + len(queries)
+
+
+def test_other_errors_fail_the_batch_without_retries():
+    queries = [q for group in all_report_queries('7daysAgo', 'today').values() for q in group]
+    quota = RuntimeError('429 Quota exceeded')
+    client = FakeClient(error=quota)
+    ga = GA4Query(client, PROPERTY_ID)
+    ga.prefetch(queries)
+
+    assert len(client.calls) == 1
+    assert ga.errors == {query: quota for query in queries}
@@ -0,0 +1,48 @@
+"""
+Tests for the GA4 warehouse sync (ga4_warehouse.py), run against FakeClient.
+
+Usage:
+    python3 -m pytest marketing/test_ga4_warehouse.py -q
+"""
+from datetime import date, timedelta
+
+import pytest
+
+from ga4_query import FakeClient
+from ga4_warehouse import CUSTOM_DIMENSIONS, NOT_SET, Warehouse, sync
+
+PROPERTY_ID = '123'
+
+
+def _quiet(message):
+    pass
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    with Warehouse(tmp_path / 'warehouse.db') as store:
+        yield store
+
+
+def _platforms(warehouse):
+    return {row[0] for row in warehouse.db.execute('SELECT DISTINCT platform FROM daily')}
+
+
+def test_probe_is_part_of_the_first_batch(warehouse):
+    client = FakeClient()
+    since = date.today() - timedelta(days=1)
+    assert len(sync(warehouse, client, PROPERTY_ID, since, log=_quiet)) == 2
+    assert len(client.calls) == 1
+
+
+def test_days_without_custom_dimensions_are_fetched_again(warehouse):
+    since = date.today() - timedelta(days=9)
+    unregistered = FakeClient(invalid_dimensions=CUSTOM_DIMENSIONS)
+    assert len(sync(warehouse, unregistered, PROPERTY_ID, since, log=_quiet)) == 10
+    assert _platforms(warehouse) == {NOT_SET}
+    # Still unregistered: settled days are not fetched again
+    assert len(sync(warehouse, unregistered, PROPERTY_ID, since, log=_quiet)) == 2
+
+    assert len(sync(warehouse, FakeClient(), PROPERTY_ID, since, log=_quiet)) == 10
+    assert NOT_SET not in _platforms(warehouse)
+    assert sync(warehouse, FakeClient(), PROPERTY_ID, since, log=_quiet) == [date.today() - timedelta(days=1), date.today()]
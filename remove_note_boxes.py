@@ -3,17 +3,26 @@
 Remove redundant note boxes from company pages
 """
 
-import re
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+import site_patterns as patterns
+from site_txn import Transaction, write_text
+
 COMPANIES_DIR = Path("/Users/sscott/tbp/web/companies")
 
 def remove_note_box(content):
     """Remove the note box section"""
-    # Pattern to match the entire note div
-    pattern = r'\s*<div class="note">.*?</div>\s*\n'
-    content = re.sub(pattern, '\n', content, flags=re.DOTALL)
-    return content
+    # Match the entire note div, plus the whitespace before it
+    parts = []
+    pos = 0
+    for match in patterns.NOTE_BOX.finditer(content):
+        parts.append(content[pos:max(pos, patterns.extend_left(content, match.start()))])
+        parts.append('\n')
+        pos = match.end()
+    parts.append(content[pos:])
+    return ''.join(parts)
 
 def process_file(file_path):
     """Process a single file"""
@@ -23,8 +32,7 @@ def process_file(file_path):
     if '<div class="note">' in content:
         content = remove_note_box(content)
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text(file_path, content)
 
         print(f"✅ Removed note box from: {file_path.name}")
         return True
@@ -42,12 +50,15 @@ def main():
     print(f"\n📊 Found {len(company_files)} company pages\n")
 
     removed_count = 0
-    for file_path in company_files:
-        if process_file(file_path):
-            removed_count += 1
+    with Transaction('remove_note_boxes') as txn:
+        for file_path in company_files:
+            if process_file(file_path):
+                removed_count += 1
 
     print("\n" + "=" * 60)
     print(f"✅ Removed note boxes from {removed_count}/{len(company_files)} files")
+    if txn.snapshot_id:
+        print(f"💾 Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
     print("=" * 60)
 
 if __name__ == "__main__":
@@ -1,34 +1,42 @@
 #!/usr/bin/env python3
 """
-Add hreflang link tags to all TBP HTML files for multilingual SEO.
-Also adds keywords meta tag to homepages.
+Generate hreflang clusters for every TBP page and add keywords meta tags to homepages.
+
+Clusters come from the cross-locale page index (site_index.py): every page
+gets one <link rel="alternate"> per locale its slug exists in, plus
+x-default. Pages that are noindex or whose
+canonical points elsewhere are neither rewritten nor listed as alternates.
+Existing blocks are compared with the expected cluster and only rewritten
+when they differ, so stale tags (alternates for pages that were removed,
+duplicated blocks) are fixed in place and adding a translation updates its
+siblings on the next run.
+
+The index also records the tags each page currently carries, so only pages
+whose tags differ from their cluster are opened. Use --all to recheck every
+page.
+
+Usage:
+    python3 add-seo-hreflang.py [--jobs N] [--all] [--dry-run]
 """
 
-import os
+import argparse
 import re
-from pathlib import Path
-
-BASE_DIR = Path('/Users/sscott/tbp')
-
-# Pages that exist in all 4 languages (must have matching paths)
-MULTILINGUAL_PAGES = [
-    '',  # index.html -> /
-    'faq.html',
-    'blog.html',
-    'books.html',
-    'contact_us.html',
-    'privacy_policy.html',
-    'terms_of_service.html',
-    # Blog posts (same slugs across languages)
-    'blog/ai-automation-transforms-direct-sales.html',
-    'blog/ai-recruiting-best-practices-2025.html',
-    'blog/ai-recruiting-platforms-failing-direct-sales.html',
-    'blog/qualify-new-recruits-30-days.html',
-    'blog/team-build-pro-november-2025-update.html',
-    'blog/young-living-recruiting-strategies.html',
-    'blog/ai-network-marketing-corporate-field-leaders-use.html',
-    'blog/use-ai-mlm-recruiting-without-losing-human-touch.html',
-]
+
+from script_loader import REPO_ROOT
+from site_index import PageIndex
+from site_pages import SITE_DIRS
+from site_parallel import add_jobs_argument, print_results, run_files
+from site_txn import Transaction, write_text
+
+BASE_DIR = REPO_ROOT
+
+HREFLANG_COMMENT = '<!-- Hreflang tags for international SEO -->'
+
+# One alternate per line; a block is a run of consecutive lines
+HREFLANG_LINE = re.compile(
+    r'^([ \t]*)<link rel="alternate" hreflang="([^"]+)" href="([^"]*)" />[ \t]*\n', re.MULTILINE)
+HREFLANG_COMMENT_LINE = re.compile(r'^[ \t]*<!-- Hreflang [^>]*-->[ \t]*\n', re.MULTILINE | re.IGNORECASE)
+CANONICAL_LINE = re.compile(r'^([ \t]*)<link rel="canonical"[^>]*>[ \t]*\n', re.MULTILINE)
 
 # Keywords for homepages
 KEYWORDS = {
@@ -38,49 +46,70 @@ KEYWORDS = {
     'de': 'KI Recruiting, Direktvertrieb App, MLM Software, Netzwerk-Builder, Network Marketing KI, Team Building App',
 }
 
-def get_hreflang_tags(page_path):
-    """Generate hreflang link tags for a page."""
-    # Normalize path
-    if page_path == '' or page_path == 'index.html':
-        en_path = '/'
-        other_path = '/'
+
+def render_cluster(cluster, indent):
+    return ''.join(f'{indent}<link rel="alternate" hreflang="{lang}" href="{url}" />\n'
+                   for lang, url in cluster)
+
+
+def hreflang_blocks(content):
+    """[(start, end, indent, [(lang, url), ...]), ...] for runs of consecutive alternate lines."""
+    blocks = []
+    for m in HREFLANG_LINE.finditer(content):
+        if blocks and blocks[-1][1] == m.start():
+            start, _, indent, tags = blocks[-1]
+            blocks[-1] = (start, m.end(), indent, tags + [(m.group(2), m.group(3))])
+        else:
+            blocks.append((m.start(), m.end(), m.group(1), [(m.group(2), m.group(3))]))
+    return blocks
+
+
+def apply_cluster(content, cluster):
+    """Content with exactly one hreflang block matching `cluster` (None if unchanged or no anchor)."""
+    blocks = hreflang_blocks(content)
+    if len(blocks) == 1 and blocks[0][3] == cluster:
+        return None
+
+    if blocks:
+        start, end, indent, _ = blocks[0]
+        new_block = render_cluster(cluster, indent)
+        edits = [(start, end, new_block)]
+        for start, end, _, _ in blocks[1:]:
+            # Drop duplicated blocks along with their own comment line
+            comment = None
+            for comment in HREFLANG_COMMENT_LINE.finditer(content, 0, start):
+                pass
+            if comment and comment.end() == start:
+                start = comment.start()
+            if content.startswith('\n', end) and content.endswith('\n\n', 0, start):
+                end += 1  # don't leave a double blank line behind
+            edits.append((start, end, ''))
     else:
-        en_path = f'/{page_path}'
-        other_path = f'/{page_path}'
-
-    return f'''    <!-- Hreflang tags for multilingual SEO -->
-    <link rel="alternate" hreflang="en" href="https://teambuildpro.com{en_path}" />
-    <link rel="alternate" hreflang="es" href="https://es.teambuildpro.com{other_path}" />
-    <link rel="alternate" hreflang="pt" href="https://pt.teambuildpro.com{other_path}" />
-    <link rel="alternate" hreflang="de" href="https://de.teambuildpro.com{other_path}" />
-    <link rel="alternate" hreflang="x-default" href="https://teambuildpro.com{en_path}" />'''
-
-def add_hreflang_to_file(file_path, page_path):
-    """Add hreflang tags to an HTML file after the canonical tag."""
-    content = file_path.read_text(encoding='utf-8')
+        canonical = CANONICAL_LINE.search(content)
+        if not canonical:
+            return None
+        indent = canonical.group(1)
+        new_block = f'{indent}{HREFLANG_COMMENT}\n' + render_cluster(cluster, indent)
+        edits = [(canonical.end(), canonical.end(), new_block)]
 
-    # Check if hreflang already exists
-    if 'hreflang="en"' in content and '<link rel="alternate"' in content:
-        print(f"  Skipping (already has hreflang): {file_path.name}")
-        return False
+    for start, end, text in reversed(edits):
+        content = content[:start] + text + content[end:]
+    return content
 
-    hreflang_tags = get_hreflang_tags(page_path)
 
-    # Insert after canonical tag
-    canonical_pattern = r'(<link rel="canonical"[^>]*>)'
-    if re.search(canonical_pattern, content):
-        new_content = re.sub(
-            canonical_pattern,
-            r'\1\n' + hreflang_tags,
-            content,
-            count=1
-        )
-        file_path.write_text(new_content, encoding='utf-8')
-        print(f"  Added hreflang: {file_path.name}")
-        return True
-    else:
-        print(f"  WARNING: No canonical tag found in {file_path.name}")
+def update_hreflang(file_path, cluster, dry_run=False):
+    """Rewrite a page's hreflang block if it differs from its cluster. Returns True if changed."""
+    content = file_path.read_text(encoding='utf-8')
+    new_content = apply_cluster(content, cluster)
+    if new_content is None:
+        if not CANONICAL_LINE.search(content):
+            print(f"  WARNING: No canonical tag found in {file_path}")
         return False
+    if not dry_run:
+        write_text(file_path, new_content)
+    print(f"  {'Would update' if dry_run else 'Updated'} hreflang: {file_path.relative_to(BASE_DIR)}")
+    return True
+
 
 def add_keywords_to_homepage(site_dir, lang):
     """Add keywords meta tag to homepage."""
@@ -106,46 +135,52 @@ def add_keywords_to_homepage(site_dir, lang):
             content,
             count=1
         )
-        index_file.write_text(new_content, encoding='utf-8')
+        write_text(index_file, new_content)
         print(f"  Added keywords: {index_file.name}")
         return True
     return False
 
 def main():
-    sites = [
-        ('web', 'en'),
-        ('web-es', 'es'),
-        ('web-pt', 'pt'),
-        ('web-de', 'de'),
-    ]
-
-    total_hreflang = 0
+    parser = argparse.ArgumentParser(description='Generate hreflang clusters and homepage keywords')
+    parser.add_argument('--all', action='store_true', help='Recheck every page, ignoring the index')
+    parser.add_argument('--dry-run', action='store_true', help='Report pages that would change without writing')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    index = PageIndex.load(BASE_DIR)
+    print(f"Page index: {len(index)} pages, {len(index.slugs)} slugs ({index.reparsed} re-parsed)")
+
+    items = []
+    total_unchanged = 0
+    total_skipped = 0
+    for entry in index.entries():
+        if not entry.indexable:
+            total_skipped += 1
+            continue
+        cluster = index.cluster(entry.slug)
+        if args.all or [tuple(tag) for tag in entry.hreflang] != cluster:
+            items.append((entry.path, cluster, args.dry_run))
+        else:
+            total_unchanged += 1
+
+    print(f"\n=== Checking {len(items)} pages ===")
     total_keywords = 0
-
-    for site_name, lang in sites:
-        site_dir = BASE_DIR / site_name
-        print(f"\n=== Processing {site_name} ({lang}) ===")
-
-        # Add hreflang to multilingual pages
-        for page_path in MULTILINGUAL_PAGES:
-            if page_path == '':
-                file_path = site_dir / 'index.html'
-            else:
-                file_path = site_dir / page_path
-
-            if file_path.exists():
-                if add_hreflang_to_file(file_path, page_path):
-                    total_hreflang += 1
-            else:
-                print(f"  File not found: {file_path}")
-
-        # Add keywords to homepage
-        if add_keywords_to_homepage(site_dir, lang):
-            total_keywords += 1
+    with Transaction('add-seo-hreflang') as txn:
+        results = run_files(update_hreflang, items, args.jobs, star=True)
+        print_results(results, label=lambda item: item[0])
+        if not args.dry_run:
+            for site_name, lang in SITE_DIRS.items():
+                if add_keywords_to_homepage(BASE_DIR / site_name, lang):
+                    total_keywords += 1
+    total_hreflang = sum(1 for r in results if r.value)
 
     print(f"\n=== Summary ===")
-    print(f"Hreflang tags added: {total_hreflang}")
+    print(f"Hreflang clusters {'to update' if args.dry_run else 'updated'}: {total_hreflang}")
     print(f"Keywords tags added: {total_keywords}")
+    print(f"Already up to date (not opened): {total_unchanged}")
+    print(f"Skipped (noindex or canonical elsewhere): {total_skipped}")
+    if txn.snapshot_id:
+        print(f"Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
 if __name__ == '__main__':
     main()
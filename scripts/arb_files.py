@@ -0,0 +1,207 @@
+"""
+Shared loading and writing of the Flutter ARB files (lib/l10n/app_*.arb).
+"""
+import itertools
+import json
+from json.decoder import scanstring
+from collections import namedtuple
+from pathlib import Path
+
+from script_loader import REPO_ROOT
+from site_txn import write_text
+
+L10N_CONFIG = REPO_ROOT / 'l10n.yaml'
+
+Arb = namedtuple('Arb', 'path locale data duplicates')
+
+
+def _l10n_config():
+    """The flat 'key: value' settings from l10n.yaml."""
+    config = {}
+    if L10N_CONFIG.exists():
+        for line in L10N_CONFIG.read_text(encoding='utf-8').splitlines():
+            key, sep, value = line.partition(':')
+            if sep and not line.startswith((' ', '#')):
+                config[key.strip()] = value.strip()
+    return config
+
+
+L10N_SETTINGS = _l10n_config()
+ARB_DIR = REPO_ROOT / L10N_SETTINGS.get('arb-dir', 'lib/l10n')
+TEMPLATE_FILE = ARB_DIR / L10N_SETTINGS.get('template-arb-file', 'app_en.arb')
+TEMPLATE_LOCALE = TEMPLATE_FILE.stem.split('_', 1)[1]
+
+
+def arb_path(locale):
+    return ARB_DIR / f"app_{locale}.arb"
+
+
+def arb_locales():
+    """Locales with an ARB file, template first."""
+    found = sorted(p.stem.split('_', 1)[1] for p in ARB_DIR.glob('app_*.arb'))
+    return sorted(found, key=lambda loc: loc != TEMPLATE_LOCALE)
+
+
+def is_message(key):
+    return not key.startswith('@')
+
+
+def messages(data):
+    """Message keys (no '@' metadata or '@@' globals), in file order."""
+    return [k for k in data if is_message(k)]
+
+
+def parse_arb(text, path=None):
+    """Arb for ARB text; `duplicates` lists keys that occur more than once."""
+    duplicates = []
+
+    def pairs(items):
+        data = {}
+        for key, value in items:
+            if key in data:
+                duplicates.append(key)
+                # Move it to where it last occurred, like a re-assignment would
+                del data[key]
+            data[key] = value
+        return data
+
+    data = json.loads(text, object_pairs_hook=pairs)
+    locale = data.get('@@locale') or (Path(path).stem.split('_', 1)[1] if path else None)
+    return Arb(path, locale, data, duplicates)
+
+
+def load_arb(locale_or_path):
+    path = Path(locale_or_path) if str(locale_or_path).endswith('.arb') else arb_path(locale_or_path)
+    return parse_arb(path.read_text(encoding='utf-8'), path)
+
+
+def load_template():
+    return load_arb(TEMPLATE_FILE)
+
+
+def order_arb(data, template, prune=False):
+    """`data` laid out in template order.
+
+    '@@' globals come first, then every template key the locale has with
+    its '@key' metadata right after it. Keys the template does not have are
+    kept at the end in their current order, unless `prune`.
+    """
+    ordered = {k: v for k, v in data.items() if k.startswith('@@')}
+    placed = set(ordered)
+    for key in messages(template):
+        if key in data:
+            ordered[key] = data[key]
+            placed.add(key)
+            meta = '@' + key
+            if meta in data:
+                ordered[meta] = data[meta]
+                placed.add(meta)
+    if not prune:
+        for key, value in data.items():
+            if key not in placed:
+                ordered[key] = value
+    return ordered
+
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _skip_space(text, pos):
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def scan_entries(text):
+    """(key, value, raw) for each top-level entry of ARB text, in file order.
+
+    `raw` is the entry's source text from the opening quote of the key to the
+    end of the value. Raises ValueError for anything but a JSON object.
+    """
+    pos = _skip_space(text, 0)
+    if not text.startswith('{', pos):
+        raise ValueError('ARB file is not a JSON object')
+    pos = _skip_space(text, pos + 1)
+    if text.startswith('}', pos):
+        return
+    while True:
+        start = pos
+        if not text.startswith('"', pos):
+            raise ValueError(f"expected a key at offset {pos}")
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip_space(text, pos)
+        if not text.startswith(':', pos):
+            raise ValueError(f"expected ':' at offset {pos}")
+        value, pos = _DECODER.raw_decode(text, _skip_space(text, pos + 1))
+        yield key, value, text[start:pos]
+        pos = _skip_space(text, pos)
+        if text.startswith('}', pos):
+            return
+        if not text.startswith(',', pos):
+            raise ValueError(f"expected ',' or '}}' at offset {pos}")
+        pos = _skip_space(text, pos + 1)
+
+
+def render_entry(key, value):
+    """One top-level entry, indented as in locales/generators/sync_keys.js."""
+    rendered = json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+    return f"{json.dumps(key, ensure_ascii=False)}: {rendered}"
+
+
+def iter_arb(data, original=None):
+    """Chunks of the ARB text for `data`, in its key order.
+
+    `original` maps keys to (value, raw) from the file being replaced; an
+    entry whose value is unchanged is emitted as its raw text.
+    """
+    original = original or {}
+    if not data:
+        yield '{}\n'
+        return
+    yield '{\n'
+    last = len(data) - 1
+    for i, (key, value) in enumerate(data.items()):
+        previous = original.get(key)
+        entry = previous[1] if previous is not None and previous[0] == value else render_entry(key, value)
+        yield f"  {entry}{',' if i < last else ''}\n"
+    yield '}\n'
+
+
+def render_arb(data, original=None):
+    """ARB text in the layout of locales/generators/sync_keys.js."""
+    return ''.join(iter_arb(data, original))
+
+
+def _original_entries(text):
+    """{key: (value, raw)} of the file being replaced; empty if it does not scan."""
+    try:
+        # Later duplicates win, as in parse_arb
+        return {key: (value, raw) for key, value, raw in scan_entries(text)}
+    except ValueError:
+        return {}
+
+
+def write_arb(path, data):
+    """Write `data` unless the file already holds exactly these bytes. Returns True if written.
+
+    Unchanged entries keep their bytes from the current file (see iter_arb).
+    """
+    path = Path(path)
+    current = path.read_text(encoding='utf-8') if path.exists() else None
+    chunks = iter_arb(data, _original_entries(current) if current else None)
+    if current is not None:
+        # Compare while rendering: the first differing chunk decides
+        pos = 0
+        done = []
+        for chunk in chunks:
+            done.append(chunk)
+            if not current.startswith(chunk, pos):
+                break
+            pos += len(chunk)
+        else:
+            if pos == len(current):
+                return False
+        chunks = itertools.chain(done, chunks)
+    write_text(path, ''.join(chunks))
+    return True
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Source-string fingerprints for the ARB translations.
+
+Usage:
+    python3 arb_fingerprints.py update                  # record translations, report
+    python3 arb_fingerprints.py report de --verbose     # read-only; list the keys
+    python3 arb_fingerprints.py report --json
+    python3 arb_fingerprints.py accept de appTitle navTeam    # intentionally identical
+    python3 arb_fingerprints.py touch de chatbotWelcome       # reviewed, still correct
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from arb_files import (L10N_SETTINGS, TEMPLATE_FILE, TEMPLATE_LOCALE, arb_locales, arb_path,
+                       load_arb, load_template, messages)
+from script_loader import REPO_ROOT
+from site_txn import atomic_write
+
+FINGERPRINT_FILE = REPO_ROOT / 'scripts' / 'data' / 'arb-fingerprints.json'
+# Per-file digests and the last status, derived from the files; local, not committed
+FINGERPRINT_CACHE_FILE = REPO_ROOT / '.site-cache' / 'arb-fingerprint-cache.json'
+UNTRANSLATED_FILE = REPO_ROOT / L10N_SETTINGS.get('untranslated-messages-file', 'build/l10n_missing.txt')
+FINGERPRINT_VERSION = 1
+
+# Values with nothing to translate once placeholders are removed
+PLACEHOLDER_RE = re.compile(r'\{[^{}]*\}')
+NOTHING_TO_TRANSLATE = re.compile(r'^(?:[\W\d_]*|\S+@\S+\.\w+|(?:https?://|www\.)\S+)$')
+
+STATES = ('missing', 'stale', 'untranslated', 'identical', 'translated')
+Status = namedtuple('Status', STATES)
+
+
+def text_hash(value):
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def nothing_to_translate(value):
+    return isinstance(value, str) and bool(NOTHING_TO_TRANSLATE.match(PLACEHOLDER_RE.sub('', value).strip()))
+
+
+class FingerprintStore:
+    """locale -> key -> {'source': en hash, 'target': translation hash[, 'identical': True]}."""
+
+    def __init__(self, path=FINGERPRINT_FILE, cache_path=FINGERPRINT_CACHE_FILE):
+        self.path = path
+        self.cache_path = cache_path
+        self.locales = {}
+        self.source = {}
+        self.files = {}
+        self.status = {}
+        self.dirty = False
+        if path.exists():
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == FINGERPRINT_VERSION:
+                self.locales = data['locales']
+                self.source = data['source']
+        if cache_path.exists():
+            with open(cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+            # Only valid for the store it was written with (a pull may bring new decisions)
+            if cache.get('version') == FINGERPRINT_VERSION and cache.get('store') == self._store_hash():
+                self.files = cache['files']
+                self.status = cache['status']
+
+    def _store_bytes(self):
+        data = {'version': FINGERPRINT_VERSION, 'source': self.source, 'locales': self.locales}
+        return (json.dumps(data, indent=1, ensure_ascii=False) + '\n').encode('utf-8')
+
+    def _store_hash(self):
+        return hashlib.sha256(self._store_bytes()).hexdigest()
+
+    def save(self):
+        if not self.dirty:
+            return
+        store = self._store_bytes()
+        if not self.path.exists() or self.path.read_bytes() != store:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.path, store)
+        cache = {'version': FINGERPRINT_VERSION, 'store': hashlib.sha256(store).hexdigest(),
+                 'files': self.files, 'status': self.status}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.cache_path, (json.dumps(cache, ensure_ascii=False) + '\n').encode('utf-8'))
+        self.dirty = False
+
+    def _set(self, mapping, key, value):
+        if mapping.get(key) != value:
+            mapping[key] = value
+            self.dirty = True
+
+    def refresh(self, locales, record=True):
+        """{locale: Status} -- only keys whose English or translation changed are re-examined.
+
+        With `record`, changed translations are recorded against the current
+        English text; without it the store is left as it was.
+        """
+        template_digest = file_hash(TEMPLATE_FILE)
+        template = None
+        source = self.source
+        if self.files.get(TEMPLATE_LOCALE) != template_digest:
+            template = load_template().data
+            source = {k: text_hash(template[k]) for k in messages(template)}
+        changed_source = {k for k, h in source.items() if self.source.get(k) != h} | (self.source.keys() - source.keys())
+
+        results = {}
+        for locale in locales:
+            path = arb_path(locale)
+            digest = file_hash(path)
+            cached = self.status.get(locale)
+            if not changed_source and self.files.get(locale) == digest and cached:
+                results[locale] = Status(**cached)
+                continue
+            if template is None:
+                template = load_template().data
+            data = load_arb(locale).data
+            fingerprints = dict(self.locales.get(locale, {}))
+            previous = cached or {state: [] for state in STATES}
+            # Keys that need a fresh look: English or translation changed, or status unknown
+            check = set(changed_source) if cached else set(source)
+            if cached and self.files.get(locale) != digest:
+                for key in source:
+                    entry = fingerprints.get(key)
+                    if entry is None or key not in data or entry['target'] != text_hash(data[key]):
+                        check.add(key)
+            state_of = {key: state for state in STATES for key in previous[state] if key not in check}
+            for key in check:
+                if key not in source:
+                    fingerprints.pop(key, None)
+                    continue
+                if key not in data:
+                    fingerprints.pop(key, None)
+                    state_of[key] = 'missing'
+                    continue
+                target = text_hash(data[key])
+                entry = fingerprints.get(key)
+                if entry is None or entry['target'] != target:
+                    # New or edited translation: made from the current English
+                    entry = {'source': source[key], 'target': target}
+                    fingerprints[key] = entry
+                if data[key] == template[key]:
+                    ok = entry.get('identical') or nothing_to_translate(data[key])
+                    state_of[key] = 'identical' if ok else 'untranslated'
+                else:
+                    state_of[key] = 'translated' if entry['source'] == source[key] else 'stale'
+            status = Status(*([k for k in source if state_of.get(k) == state] for state in STATES))
+            results[locale] = status
+            if record:
+                self._set(self.locales, locale, fingerprints)
+                self._set(self.files, locale, digest)
+                self._set(self.status, locale, status._asdict())
+        if record:
+            self._set(self.files, TEMPLATE_LOCALE, template_digest)
+            if self.source != source:
+                self.source = source
+                self.dirty = True
+        return results
+
+    def mark(self, locale, keys, identical=False):
+        """Record keys as reviewed against the current English; optionally as intentionally identical."""
+        template = load_template().data
+        data = load_arb(locale).data
+        fingerprints = self.locales.setdefault(locale, {})
+        unknown = [k for k in keys if k not in template or k not in data]
+        for key in keys:
+            if key in unknown:
+                continue
+            entry = {'source': text_hash(template[key]), 'target': text_hash(data[key])}
+            if identical or fingerprints.get(key, {}).get('identical'):
+                entry['identical'] = True
+            fingerprints[key] = entry
+        # Cached status no longer matches
+        self.status.pop(locale, None)
+        self.dirty = True
+        return unknown
+
+
+def write_untranslated(results, path=UNTRANSLATED_FILE):
+    """Open keys per locale, in the layout of gen-l10n's untranslated-messages-file."""
+    report = {locale: s.missing + s.stale + s.untranslated for locale, s in results.items()}
+    report = {locale: keys for locale, keys in report.items() if keys}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Track ARB translations against their English source')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name, help_text in (('update', 'Record translations and report open keys'),
+                            ('report', 'Report open keys without recording anything')):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('locales', nargs='*', help='Locales (default: all but the template)')
+        p.add_argument('--verbose', '-v', action='store_true', help='List the keys')
+        p.add_argument('--json', action='store_true', help='Print the status as JSON')
+    p_update = sub.choices['update']
+    p_update.add_argument('--untranslated-file', default=str(UNTRANSLATED_FILE),
+                          help='Where to write the open keys (default: from l10n.yaml)')
+    for name, help_text in (('accept', 'Mark keys as intentionally identical to English'),
+                            ('touch', 'Mark stale keys as reviewed against the current English')):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('locale')
+        p.add_argument('keys', nargs='+')
+    args = parser.parse_args()
+
+    store = FingerprintStore()
+    if args.command in ('accept', 'touch'):
+        unknown = store.mark(args.locale, args.keys, identical=args.command == 'accept')
+        store.save()
+        for key in unknown:
+            print(f"⚠️  {key}: not in both app_{TEMPLATE_LOCALE}.arb and app_{args.locale}.arb")
+        print(f"✅ {len(args.keys) - len(unknown)} key(s) marked for {args.locale}")
+        return 0
+
+    locales = args.locales or [loc for loc in arb_locales() if loc != TEMPLATE_LOCALE]
+    results = store.refresh(locales, record=args.command == 'update')
+    if args.command == 'update':
+        store.save()
+        write_untranslated(results, Path(args.untranslated_file))
+
+    if args.json:
+        json.dump({locale: s._asdict() for locale, s in results.items()}, sys.stdout, indent=1)
+        print()
+        return 0
+    open_keys = 0
+    for locale, s in results.items():
+        open_keys += len(s.missing) + len(s.stale) + len(s.untranslated)
+        print(f"{locale}: {len(s.translated)} translated, {len(s.identical)} identical, "
+              f"{len(s.untranslated)} untranslated, {len(s.stale)} stale, {len(s.missing)} missing")
+        if args.verbose:
+            for state in ('missing', 'stale', 'untranslated'):
+                for key in getattr(s, state):
+                    print(f"   {state:<12} {key}")
+    return 1 if open_keys else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
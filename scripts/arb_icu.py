@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+ICU MessageFormat validation for the ARB files, against app_en.arb.
+
+Usage:
+    python3 arb_icu.py                  # validate every locale
+    python3 arb_icu.py de es            # only these locales (and the template)
+    python3 arb_icu.py --json
+"""
+import argparse
+import json
+import sys
+import time
+from collections import namedtuple
+
+from arb_files import TEMPLATE_LOCALE, arb_locales, load_arb, load_template, messages
+
+Argument = namedtuple('Argument', 'name')
+Choice = namedtuple('Choice', 'name kind offset cases')
+Issue = namedtuple('Issue', 'locale key severity message')
+
+CHOICE_KINDS = ('plural', 'select', 'selectordinal')
+FORMAT_KINDS = ('number', 'date', 'time')
+PLURAL_CATEGORIES = {'zero', 'one', 'two', 'few', 'many', 'other'}
+NUMBER_TYPES = {'int', 'num', 'double'}
+
+
+class IcuError(ValueError):
+    def __init__(self, message, pos):
+        super().__init__(f"{message} at offset {pos}")
+        self.pos = pos
+
+
+class _Parser:
+    """Recursive-descent parser over one message string."""
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def parse(self):
+        nodes = self.message(top=True)
+        return nodes
+
+    def message(self, top=False):
+        nodes = []
+        text = self.text
+        start = self.pos
+        while self.pos < len(text):
+            ch = text[self.pos]
+            if ch == '{':
+                if self.pos > start:
+                    nodes.append(text[start:self.pos])
+                nodes.append(self.argument())
+                start = self.pos
+            elif ch == '}':
+                if top:
+                    raise IcuError("unmatched '}'", self.pos)
+                break
+            else:
+                self.pos += 1
+        if self.pos > start:
+            nodes.append(text[start:self.pos])
+        return nodes
+
+    def skip_space(self):
+        while self.pos < len(self.text) and self.text[self.pos].isspace():
+            self.pos += 1
+
+    def word(self, what):
+        self.skip_space()
+        start = self.pos
+        text = self.text
+        while self.pos < len(text) and (text[self.pos].isalnum() or text[self.pos] in '_=-'):
+            self.pos += 1
+        if self.pos == start:
+            raise IcuError(f"expected {what}", self.pos)
+        return text[start:self.pos]
+
+    def expect(self, ch):
+        self.skip_space()
+        if self.pos >= len(self.text):
+            raise IcuError(f"expected '{ch}' before end of message", self.pos)
+        if self.text[self.pos] != ch:
+            raise IcuError(f"expected '{ch}', found '{self.text[self.pos]}'", self.pos)
+        self.pos += 1
+
+    def argument(self):
+        open_pos = self.pos
+        self.pos += 1  # '{'
+        name = self.word('placeholder name')
+        if not (name[0].isalpha() or name[0] == '_'):
+            raise IcuError(f"invalid placeholder name '{name}'", open_pos)
+        self.skip_space()
+        if self.pos < len(self.text) and self.text[self.pos] == '}':
+            self.pos += 1
+            return Argument(name)
+        self.expect(',')
+        kind = self.word('argument type')
+        if kind in FORMAT_KINDS:
+            # {n, number} / {d, date, short}: the style runs to the closing brace
+            end = self.text.find('}', self.pos)
+            if end == -1:
+                raise IcuError(f"unclosed '{{{name}, {kind}'", open_pos)
+            self.pos = end + 1
+            return Argument(name)
+        if kind not in CHOICE_KINDS:
+            raise IcuError(f"unknown argument type '{kind}'", open_pos)
+        self.expect(',')
+        offset = 0
+        cases = {}
+        while True:
+            self.skip_space()
+            if self.pos >= len(self.text):
+                raise IcuError(f"unclosed '{{{name}, {kind}'", open_pos)
+            if self.text[self.pos] == '}':
+                self.pos += 1
+                break
+            selector = self.word('case selector')
+            if selector == 'offset' and self.text.startswith(':', self.pos) and kind != 'select':
+                self.pos += 1
+                offset = int(self.word('offset'))
+                continue
+            if selector in cases:
+                raise IcuError(f"duplicate case '{selector}' in '{name}'", self.pos)
+            self.expect('{')
+            cases[selector] = self.message()
+            self.expect('}')
+        if not cases:
+            raise IcuError(f"'{name}, {kind}' has no cases", open_pos)
+        return Choice(name, kind, offset, cases)
+
+
+def parse_message(text):
+    """Nodes of an ICU message: str, Argument and Choice. Raises IcuError."""
+    return _Parser(text).parse()
+
+
+def arguments(nodes, found=None):
+    """{name: kind} for every placeholder in the parsed message ('arg' for plain ones)."""
+    found = {} if found is None else found
+    for node in nodes:
+        if isinstance(node, Argument):
+            found.setdefault(node.name, 'arg')
+        elif isinstance(node, Choice):
+            found[node.name] = node.kind
+            for case in node.cases.values():
+                arguments(case, found)
+    return found
+
+
+def choices(nodes, found=None):
+    """{name: Choice} for the plural/select arguments in the parsed message."""
+    found = {} if found is None else found
+    for node in nodes:
+        if isinstance(node, Choice):
+            found.setdefault(node.name, node)
+            for case in node.cases.values():
+                choices(case, found)
+    return found
+
+
+def _check_cases(choice, template_choice):
+    problems = []
+    if choice.kind in ('plural', 'selectordinal'):
+        bad = [c for c in choice.cases if c not in PLURAL_CATEGORIES and not (c[0] == '=' and c[1:].isdigit())]
+        if bad:
+            problems.append(f"'{choice.name}' has invalid plural case(s): {', '.join(bad)}")
+    if 'other' not in choice.cases:
+        problems.append(f"'{choice.name}' has no 'other' case")
+    if template_choice is not None and choice.kind == 'select':
+        missing = [c for c in template_choice.cases if c not in choice.cases]
+        extra = [c for c in choice.cases if c not in template_choice.cases]
+        if missing:
+            problems.append(f"select '{choice.name}' is missing case(s): {', '.join(missing)}")
+        if extra:
+            problems.append(f"select '{choice.name}' has case(s) the template does not: {', '.join(extra)}")
+    return problems
+
+
+def validate_template(template):
+    """Issues in the template itself; returns (issues, {key: parsed nodes})."""
+    issues = []
+    parsed = {}
+    for key in messages(template):
+        value = template[key]
+        if not isinstance(value, str):
+            issues.append(Issue(TEMPLATE_LOCALE, key, 'error', 'value is not a string'))
+            continue
+        try:
+            nodes = parse_message(value)
+        except IcuError as e:
+            issues.append(Issue(TEMPLATE_LOCALE, key, 'error', str(e)))
+            continue
+        parsed[key] = nodes
+        declared = (template.get('@' + key) or {}).get('placeholders') or {}
+        used = arguments(nodes)
+        for name in used:
+            if name not in declared:
+                issues.append(Issue(TEMPLATE_LOCALE, key, 'warning',
+                                    f"placeholder '{name}' is not declared in @{key}"))
+        for name in declared:
+            if name not in used:
+                issues.append(Issue(TEMPLATE_LOCALE, key, 'warning',
+                                    f"declared placeholder '{name}' is not used"))
+        for name, choice in choices(nodes).items():
+            declared_type = (declared.get(name) or {}).get('type')
+            if choice.kind != 'select' and declared_type and declared_type not in NUMBER_TYPES:
+                issues.append(Issue(TEMPLATE_LOCALE, key, 'error',
+                                    f"plural argument '{name}' is declared as {declared_type}, not a number"))
+            issues += [Issue(TEMPLATE_LOCALE, key, 'error', p) for p in _check_cases(choice, None)]
+    return issues, parsed
+
+
+def validate_locale(locale, data, template, parsed_template):
+    """Issues in one translated locale, checked against the parsed template."""
+    issues = []
+    for key in messages(data):
+        if key not in parsed_template:
+            continue
+        value = data[key]
+        if not isinstance(value, str):
+            issues.append(Issue(locale, key, 'error', 'value is not a string'))
+            continue
+        try:
+            nodes = parse_message(value)
+        except IcuError as e:
+            issues.append(Issue(locale, key, 'error', str(e)))
+            continue
+        expected = arguments(parsed_template[key])
+        used = arguments(nodes)
+        missing = [n for n in expected if n not in used]
+        extra = [n for n in used if n not in expected]
+        if missing:
+            issues.append(Issue(locale, key, 'error', f"missing placeholder(s): {', '.join(missing)}"))
+        if extra:
+            issues.append(Issue(locale, key, 'error', f"unknown placeholder(s): {', '.join(extra)}"))
+        template_choices = choices(parsed_template[key])
+        for name, choice in choices(nodes).items():
+            template_choice = template_choices.get(name)
+            if template_choice is not None and template_choice.kind != choice.kind:
+                issues.append(Issue(locale, key, 'error',
+                                    f"'{name}' is a {choice.kind} here but a {template_choice.kind} in the template"))
+                continue
+            issues += [Issue(locale, key, 'error', p) for p in _check_cases(choice, template_choice)]
+    return issues
+
+
+def validate(locales=None):
+    """(issues, message count) for the template and the given locales (default: all)."""
+    template = load_template().data
+    issues, parsed = validate_template(template)
+    count = len(parsed)
+    for locale in locales or arb_locales():
+        if locale == TEMPLATE_LOCALE:
+            continue
+        data = load_arb(locale).data
+        issues += validate_locale(locale, data, template, parsed)
+        count += len(messages(data))
+    return issues, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate ICU placeholders and plural/select structure in the ARB files')
+    parser.add_argument('locales', nargs='*', help='Locales (default: all)')
+    parser.add_argument('--json', action='store_true', help='Print issues as JSON')
+    parser.add_argument('--warnings', action='store_true', help='Also fail on warnings')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    issues, count = validate(args.locales)
+    elapsed = time.perf_counter() - start
+    errors = [i for i in issues if i.severity == 'error']
+    warnings = [i for i in issues if i.severity == 'warning']
+
+    if args.json:
+        json.dump([i._asdict() for i in issues], sys.stdout, indent=1, ensure_ascii=False)
+        print()
+    else:
+        for issue in issues:
+            icon = '❌' if issue.severity == 'error' else '⚠️ '
+            print(f"{icon} app_{issue.locale}.arb {issue.key}: {issue.message}")
+        print(f"\n{count} messages checked in {elapsed * 1000:.0f} ms: "
+              f"{len(errors)} error(s), {len(warnings)} warning(s)")
+    return 1 if errors or (args.warnings and warnings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Merge translation packs into the Flutter ARB files (lib/l10n/app_*.arb).
+
+Usage:
+    python3 arb_merge.py status                     # keys missing/extra/duplicated per locale
+    python3 arb_merge.py diff de                    # what the de packs would change
+    python3 arb_merge.py apply de es pt             # apply every pack for these locales
+    python3 arb_merge.py apply de --pack new.json   # apply one pack file
+    python3 arb_merge.py apply de --missing-only    # never overwrite existing translations
+    python3 arb_merge.py normalize --prune          # template order, drop keys not in the template
+"""
+import argparse
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from arb_files import (TEMPLATE_LOCALE, arb_locales, arb_path, is_message, load_arb,
+                       load_template, messages, order_arb, parse_arb, write_arb)
+from script_loader import REPO_ROOT
+from site_txn import Transaction
+
+# A pack is an ARB fragment ({"@@locale": "de", "navTeam": "Team"}, optionally with
+# "@key" metadata); a locale's packs are applied in file-name order, later ones win.
+PACK_DIR = REPO_ROOT / 'scripts' / 'data' / 'arb-packs'
+
+Pack = namedtuple('Pack', 'path locale entries')
+PackDiff = namedtuple('PackDiff', 'added changed unchanged unknown')
+
+
+def load_pack(path, locale=None):
+    """A pack file; its locale comes from '@@locale', the directory name, or `locale`."""
+    path = Path(path)
+    arb = parse_arb(path.read_text(encoding='utf-8'))
+    pack_locale = arb.data.get('@@locale') or locale or path.parent.name
+    entries = {k: v for k, v in arb.data.items() if not k.startswith('@@')}
+    return Pack(path, pack_locale, entries)
+
+
+def pack_paths(locale):
+    """Pack files for a locale, in application order."""
+    directory = PACK_DIR / locale
+    return sorted(p for p in directory.glob('*') if p.suffix in ('.json', '.arb')) if directory.is_dir() else []
+
+
+def diff_pack(pack_entries, data, template):
+    """PackDiff of a pack's keys against a locale's current data."""
+    added, changed, unchanged, unknown = [], [], [], []
+    for key, value in pack_entries.items():
+        base = key if is_message(key) else key[1:]
+        if base not in template:
+            unknown.append(key)
+        elif key not in data:
+            added.append(key)
+        elif data[key] != value:
+            changed.append(key)
+        else:
+            unchanged.append(key)
+    return PackDiff(added, changed, unchanged, unknown)
+
+
+def merge(data, packs, template, missing_only=False):
+    """(merged data, [(pack, PackDiff)]) -- `data` is not modified.
+
+    With `missing_only`, packs only add keys the locale does not have yet.
+    """
+    merged = dict(data)
+    report = []
+    for pack in packs:
+        diff = diff_pack(pack.entries, merged, template)
+        keys = diff.added if missing_only else diff.added + diff.changed
+        for key in keys:
+            merged[key] = pack.entries[key]
+            meta = '@' + key
+            if is_message(key) and meta in template and meta not in merged:
+                merged[meta] = template[meta]
+        if missing_only:
+            diff = diff._replace(unchanged=diff.unchanged + diff.changed, changed=[])
+        report.append((pack, diff))
+    return merged, report
+
+
+def _print_diff(pack, diff, verbose):
+    name = pack.path.relative_to(REPO_ROOT) if pack.path.is_relative_to(REPO_ROOT) else pack.path
+    print(f"   {name}: {len(diff.added)} added, {len(diff.changed)} changed, "
+          f"{len(diff.unchanged)} unchanged, {len(diff.unknown)} not in template")
+    if verbose:
+        for label, keys in (('+', diff.added), ('~', diff.changed), ('?', diff.unknown)):
+            for key in keys:
+                print(f"      {label} {key}")
+
+
+def cmd_status(args, template):
+    template_keys = messages(template.data)
+    print(f"{TEMPLATE_LOCALE}: {len(template_keys)} keys (template)")
+    for locale in args.locales or arb_locales():
+        arb = load_arb(locale)
+        keys = set(messages(arb.data))
+        missing = [k for k in template_keys if k not in keys]
+        extra = [k for k in messages(arb.data) if k not in template.data]
+        ordered = list(order_arb(arb.data, template.data)) == list(arb.data)
+        if locale != TEMPLATE_LOCALE:
+            print(f"{locale}: {len(keys)} keys, {len(missing)} missing, {len(extra)} not in template")
+        for label, found in (('missing', missing), ('not in template', extra), ('duplicated', arb.duplicates)):
+            if found and args.verbose:
+                print(f"   {label}: {', '.join(found)}")
+        if arb.duplicates and not args.verbose:
+            print(f"   ⚠️  {len(arb.duplicates)} duplicated key(s)")
+        if not ordered:
+            print("   ⚠️  not in template order (run normalize)")
+    return 0
+
+
+def cmd_merge(args, template):
+    """diff / apply / normalize."""
+    write = args.command != 'diff' and not args.dry_run
+    changed_files = 0
+    with Transaction('arb_merge') as txn:
+        for locale in args.locales or [loc for loc in arb_locales() if loc != TEMPLATE_LOCALE]:
+            arb = load_arb(locale)
+            packs = []
+            if args.command != 'normalize':
+                packs = [load_pack(p, locale) for p in args.pack] if args.pack else \
+                        [load_pack(p, locale) for p in pack_paths(locale)]
+            wrong = [p for p in packs if p.locale != locale]
+            if wrong:
+                print(f"❌ {wrong[0].path} is a '{wrong[0].locale}' pack, not '{locale}'")
+                return 1
+            print(f"{locale}: {len(packs)} pack(s)" if args.command != 'normalize' else f"{locale}:")
+            merged, report = merge(arb.data, packs, template.data, args.missing_only)
+            for pack, diff in report:
+                _print_diff(pack, diff, args.verbose)
+            merged = order_arb(merged, template.data, prune=args.prune)
+            if args.prune:
+                for key in messages(arb.data):
+                    if key not in template.data:
+                        print(f"   - {key} (not in template)")
+            if not write:
+                continue
+            if write_arb(arb_path(locale), merged):
+                changed_files += 1
+                print(f"   📝 Updated {arb_path(locale).name}")
+            else:
+                print(f"   ✅ {arb_path(locale).name} unchanged")
+
+    if write:
+        print(f"\n{changed_files} file(s) written")
+        if txn.snapshot_id:
+            print(f"Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge translation packs into the ARB files')
+    sub = parser.add_subparsers(dest='command', required=True)
+    commands = {
+        'status': 'Keys missing, not in the template, or duplicated per locale',
+        'diff': 'Show what the packs would change',
+        'apply': 'Apply packs and write the changed ARB files',
+        'normalize': 'Rewrite ARB files in template order',
+    }
+    for name, help_text in commands.items():
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('locales', nargs='*', help='Locales (default: all but the template)')
+        p.add_argument('--verbose', '-v', action='store_true', help='List individual keys')
+        if name == 'status':
+            continue
+        if name != 'diff':
+            p.add_argument('--dry-run', action='store_true', help='Report without writing')
+        p.add_argument('--prune', action='store_true', help='Drop keys the template does not have')
+        if name == 'normalize':
+            p.set_defaults(pack=None, missing_only=False)
+            continue
+        p.add_argument('--pack', nargs='+', help='Pack files to apply (default: scripts/data/arb-packs/<locale>/)')
+        p.add_argument('--missing-only', action='store_true', help='Only add keys the locale does not have')
+    args = parser.parse_args()
+
+    template = load_template()
+    if args.command == 'status':
+        return cmd_status(args, template)
+    return cmd_merge(args, template)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
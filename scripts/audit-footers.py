@@ -2,12 +2,22 @@
 """
 Comprehensive footer audit for all HTML pages.
 Checks that all footers match the expected structure.
+For the full rule set (hreflang, canonical, JSON-LD, badges) with JSON/JUnit
+output, use site_audit.py.
+
+Usage:
+    python3 audit-footers.py                 # regex checks
+    python3 audit-footers.py --backend dom   # one parse per page (site_dom.py);
+                                             # footer-links with nested divs read correctly
 """
 
+import argparse
 import os
 import re
 import glob
 
+import site_dom
+
 BASE_PATH = "/Users/sscott/tbp"
 
 # Expected footer structure (should contain footer-logo, footer-links, currentYear)
@@ -18,6 +28,14 @@ REQUIRED_ELEMENTS = [
     r'<span id="currentYear">',
 ]
 
+# The same elements as CSS selectors for the DOM backend
+REQUIRED_SELECTORS = {
+    r'<footer class="footer">': 'footer.footer',
+    r'<div class="footer-logo">': 'div.footer-logo',
+    r'<div class="footer-links">': 'div.footer-links',
+    r'<span id="currentYear">': 'span#currentYear',
+}
+
 # Footer links that should exist in footer-links div
 FOOTER_LINKS = {
     "en": ["Pricing", "FAQ", "Books", "Recruiting Guides", "Contact", "Privacy Policy", "Terms of Service"],
@@ -26,11 +44,14 @@ FOOTER_LINKS = {
     "de": ["Preise", "Häufige Fragen", "Bücher", "Recruiting-Leitfäden", "Kontakt", "Datenschutzrichtlinie", "Nutzungsbedingungen"],
 }
 
-def audit_footer(file_path, lang):
+def audit_footer(file_path, lang, backend='regex'):
     """Audit a single file's footer."""
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
+    if backend == 'dom':
+        return audit_footer_dom(content, lang)
+
     issues = []
 
     # Check for required elements
@@ -55,7 +76,37 @@ def audit_footer(file_path, lang):
     return issues
 
 
+def audit_footer_dom(content, lang):
+    """audit_footer() against one parsed tree; footer-links text includes nested elements."""
+    doc = site_dom.parse(content)
+    issues = []
+
+    for element, selector in REQUIRED_SELECTORS.items():
+        if doc.select_one(selector) is None:
+            issues.append(f"Missing: {element}")
+
+    footer_links = doc.select_one('div.footer-links')
+    if footer_links is not None:
+        footer_links_text = footer_links.text
+        for link_text in FOOTER_LINKS.get(lang, []):
+            if link_text not in footer_links_text:
+                issues.append(f"Missing link: {link_text}")
+    else:
+        issues.append("footer-links div not found or malformed")
+
+    author_links = [a for a in doc.select('a[rel=author]') if 'stephenscott.us' in a.attrs.get('href', '')]
+    if author_links:
+        issues.append("Author credit still present")
+
+    return issues
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Audit footers on all HTML pages')
+    parser.add_argument('--backend', choices=['regex', 'dom'], default='regex',
+                        help='regex: pattern checks; dom: parse each page once (default: regex)')
+    args = parser.parse_args()
+
     directories = {
         "web": "en",
         "web-es": "es",
@@ -88,7 +139,7 @@ def main():
                     continue
 
                 total_files += 1
-                issues = audit_footer(html_file, lang)
+                issues = audit_footer(html_file, lang, args.backend)
 
                 if issues:
                     files_with_issues += 1
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Time every site pattern and transform on the company pages at growing sizes
+and flag those whose cost grows faster than linearly.
+
+Usage:
+    python3 bench-site-patterns.py                 # all patterns and transforms
+    python3 bench-site-patterns.py --pages 20      # quicker run on 20 pages
+    python3 bench-site-patterns.py --only HERO_CTA_ANCHOR company-hero-cta
+    python3 bench-site-patterns.py --scales 1 2 4 8 16 32 --threshold 1.2
+    python3 bench-site-patterns.py --strict        # exit 1 if any case is flagged
+"""
+import argparse
+import math
+import re
+import sys
+import time
+
+import site_patterns
+from script_loader import REPO_ROOT
+from site_transforms import TRANSFORMS, is_company_page
+
+COMPANIES_DIR = REPO_ROOT / 'web' / 'companies'
+WHITESPACE_RUN = re.compile(r'\s+')
+
+
+def pattern_cases():
+    """(name, func(text)) for every compiled pattern and span helper."""
+    cases = []
+    for name, value in vars(site_patterns).items():
+        if isinstance(value, re.Pattern):
+            cases.append((name, lambda text, p=value: sum(1 for _ in p.finditer(text))))
+        elif name == 'COMPANY_H1':
+            for i, p in enumerate(value):
+                cases.append((f"{name}[{i}]", lambda text, p=p: p.search(text)))
+    for name in ('find_header_block', 'find_footer_block', 'find_current_year_line'):
+        cases.append((name, getattr(site_patterns, name)))
+    return cases
+
+
+def transform_cases(sample_path):
+    return [(t.name, lambda text, t=t: t(text, sample_path))
+            for t in TRANSFORMS.values() if t.applies(sample_path)]
+
+
+def grow(content, mode, factor):
+    if factor == 1:
+        return content
+    if mode == 'repeat':
+        return content * factor
+    return WHITESPACE_RUN.sub(lambda m: m.group(0) * factor, content)
+
+
+def time_case(func, inputs, repeat):
+    """Best-of-`repeat` seconds to run func over every input."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in inputs:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loglog_slope(sizes, times):
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den if den else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark site patterns and transforms for super-linear cost')
+    parser.add_argument('--pages', type=int, default=0, help='Limit to the first N company pages (0 = all)')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 2, 4, 8, 16], help='Size factors')
+    parser.add_argument('--modes', nargs='+', choices=['repeat', 'whitespace'],
+                        default=['repeat', 'whitespace'])
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is kept)')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='Flag cases whose log-log slope exceeds this (default: 1.5)')
+    parser.add_argument('--min-ms', type=float, default=5.0,
+                        help='Ignore cases faster than this at the largest scale (default: 5)')
+    parser.add_argument('--confirm', type=int, default=2,
+                        help='Re-measure a case above the threshold this many times before flagging it (default: 2)')
+    parser.add_argument('--strict', action='store_true', help='Exit non-zero if any case is flagged')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='Only these patterns/transforms')
+    args = parser.parse_args()
+
+    pages = sorted(COMPANIES_DIR.glob('ai-recruiting-*.html'))
+    if args.pages:
+        pages = pages[:args.pages]
+    if not pages:
+        print(f"No company pages found in {COMPANIES_DIR}")
+        return 1
+    contents = [p.read_text(encoding='utf-8') for p in pages]
+    sample = pages[0]
+    assert is_company_page(sample)
+
+    cases = [('pattern', n, f) for n, f in pattern_cases()]
+    cases += [('transform', n, f) for n, f in transform_cases(sample)]
+    if args.only:
+        cases = [c for c in cases if c[1] in args.only]
+
+    print(f"Benchmarking {len(cases)} cases over {len(pages)} company pages, "
+          f"scales {args.scales}, modes {', '.join(args.modes)}\n")
+    header = f"{'kind':<10} {'name':<28} {'mode':<11}" + ''.join(f"{'x' + str(s):>10}" for s in args.scales) + f"{'slope':>8}"
+    print(header)
+    print('-' * len(header))
+
+    flagged = []
+    for mode in args.modes:
+        grown = {s: [grow(c, mode, s) for c in contents] for s in args.scales}
+        sizes = [sum(len(c) for c in grown[s]) for s in args.scales]
+        tail = len(sizes) // 2
+        for kind, name, func in cases:
+            times = [time_case(func, grown[s], args.repeat) for s in args.scales]
+            slope = loglog_slope(sizes[tail:], times[tail:])
+            for _ in range(args.confirm if slope > args.threshold else 0):
+                again = [time_case(func, grown[s], args.repeat) for s in args.scales]
+                again_slope = loglog_slope(sizes[tail:], again[tail:])
+                if again_slope < slope:
+                    times, slope = again, again_slope
+                if slope <= args.threshold:
+                    break
+            mark = ''
+            if slope > args.threshold and times[-1] * 1000 >= args.min_ms:
+                flagged.append((kind, name, mode, slope))
+                mark = '  <-- super-linear'
+            cells = ''.join(f"{t * 1000:>8.1f}ms" for t in times)
+            print(f"{kind:<10} {name:<28} {mode:<11}{cells}{slope:>8.2f}{mark}")
+
+    print()
+    if flagged:
+        print(f"⚠️  {len(flagged)} case(s) grow faster than size^{args.threshold}:")
+        for kind, name, mode, slope in flagged:
+            print(f"   {kind} {name} ({mode}): slope {slope:.2f}")
+        return 1 if args.strict else 0
+    print(f"✅ All cases scale at or below size^{args.threshold}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,16 @@ PreIntake.ai Lead Generation Pipeline - Email Extraction Only
 This script extracts emails from law firm websites in the directory CSV.
 Justia scraping is now done manually via parse-justia-html.py.
 
+Extraction results are cached per domain in preintake/domain-extraction-cache.json,
+so rows sharing a domain (or linking to the same hosting/aggregator site) are
+answered from the cache instead of re-crawling CONTACT_PATHS. Failed domains are
+retried with exponential backoff (FAILED_BACKOFF_BASE_DAYS doubling per failure,
+capped at FAILED_BACKOFF_MAX_DAYS); failures recorded on rows before the cache
+existed are retried after LEGACY_FAILED_RETRY_DAYS. Successful results are
+reused for SUCCESS_MAX_AGE_DAYS, then the domain is crawled again.
+
 Environment Variables:
-    EXTRACT_BATCH_SIZE - Number of email extractions to attempt (default: 100)
+    EXTRACT_BATCH_SIZE - Number of domains to crawl this run (default: 100)
 
 Usage:
     python scripts/build-preintake-leads.py
@@ -31,6 +39,15 @@ PREINTAKE_DIR = os.path.join(REPO_ROOT, 'preintake')
 DIRECTORY_CSV = os.path.join(PREINTAKE_DIR, 'law-firms-directory.csv')
 EMAILS_CSV = os.path.join(PREINTAKE_DIR, 'law-firms-directory-with-emails.csv')
 SUMMARY_JSON = os.path.join(SCRIPT_DIR, 'lead-gen-summary.json')
+DOMAIN_CACHE_JSON = os.path.join(PREINTAKE_DIR, 'domain-extraction-cache.json')
+
+# Failed domains are retried after BASE * 2^(failures-1) days, capped at MAX
+FAILED_BACKOFF_BASE_DAYS = 3
+FAILED_BACKOFF_MAX_DAYS = 90
+# Rows that failed before the cache existed were retried after this many days
+LEGACY_FAILED_RETRY_DAYS = 30
+# Successful results older than this are crawled again (sites change their contacts)
+SUCCESS_MAX_AGE_DAYS = 180
 
 # Email extraction config
 EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
@@ -66,7 +83,8 @@ session.headers.update({
 # ---------- Summary tracking ----------
 summary = {
     "run_date": datetime.now().isoformat(),
-    "extract": {"success": 0, "failed": 0, "skipped": 0, "total_pending": 0},
+    "extract": {"success": 0, "failed": 0, "skipped": 0, "cached": 0,
+                "total_pending": 0, "domains_crawled": 0},
     "total_firms": 0,
     "firms_with_emails": 0,
 }
@@ -151,78 +169,159 @@ def choose_best_email(emails, website_domain):
     return domain_emails[0] if domain_emails else emails[0]
 
 
-def process_firm_email(row):
-    """Extract email for a single firm."""
-    website = row.get("website", "")
-    domain = norm_domain(website)
-
+def process_domain_email(website):
+    """Crawl one firm website and return every valid email found on it."""
     try:
-        emails = extract_emails_from_site(website)
-        best = choose_best_email(emails, domain)
-        return {
-            "email": best,
-            "all_emails": "|".join(emails),
-            "status": "success" if best else "failed"
-        }
+        emails = sorted(extract_emails_from_site(website))
+        return {"emails": emails, "status": "success" if emails else "failed"}
     except Exception:
-        return {"email": "", "all_emails": "", "status": "failed"}
+        return {"emails": [], "status": "failed"}
+
+
+# ---------- Domain cache ----------
+def load_domain_cache():
+    """Load the domain -> extraction result cache."""
+    if not os.path.exists(DOMAIN_CACHE_JSON):
+        return {}
+    with open(DOMAIN_CACHE_JSON, 'r') as f:
+        return json.load(f)
+
+
+def save_domain_cache(cache):
+    """Write the cache with sorted keys so the committed file diffs cleanly."""
+    tmp = DOMAIN_CACHE_JSON + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, DOMAIN_CACHE_JSON)
+
+
+def backoff_days(failures):
+    """Days before a domain with `failures` consecutive failures is crawled again."""
+    return min(FAILED_BACKOFF_BASE_DAYS * 2 ** (max(1, failures) - 1), FAILED_BACKOFF_MAX_DAYS)
+
+
+def seed_domain_cache(cache, rows):
+    """Backfill failures recorded on rows before the cache existed.
+
+    They keep the old rule: retried LEGACY_FAILED_RETRY_DAYS after the attempt.
+    """
+    for row in rows:
+        domain = norm_domain(row.get("website", ""))
+        attempted = row.get("extraction_attempted", "")
+        if not domain or domain in cache or not attempted:
+            continue
+        if row.get("extraction_status") == "failed":
+            retry = datetime.strptime(attempted, "%Y-%m-%d") + timedelta(days=LEGACY_FAILED_RETRY_DAYS)
+            cache[domain] = {"emails": [], "status": "failed", "checked": attempted,
+                             "failures": 1, "retry_after": retry.strftime("%Y-%m-%d")}
+
+
+def recheck_after(entry):
+    """Date (YYYY-MM-DD) from which a cached domain is crawled again."""
+    if "retry_after" in entry:
+        return entry["retry_after"]
+    if entry["status"] == "success":
+        days = SUCCESS_MAX_AGE_DAYS
+    else:
+        days = backoff_days(entry.get("failures", 1))
+    checked = datetime.strptime(entry["checked"], "%Y-%m-%d")
+    return (checked + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def update_domain_cache(cache, domain, result, today):
+    """Record a crawl result; consecutive failures grow the backoff."""
+    previous = cache.get(domain, {})
+    failures = 0 if result["status"] == "success" else previous.get("failures", 0) + 1
+    cache[domain] = {"emails": result["emails"], "status": result["status"],
+                     "checked": today, "failures": failures}
+
+
+def apply_result(row, emails, status, today):
+    """Fill a directory row from a (possibly cached) domain result."""
+    best = choose_best_email(emails, norm_domain(row.get("website", "")))
+    row["email"] = best
+    row["all_emails"] = "|".join(emails)
+    row["extraction_attempted"] = today
+    row["extraction_status"] = "success" if best and status == "success" else "failed"
+    return row["extraction_status"]
 
 
 def extract_emails(rows):
-    """Extract emails from firms that need it."""
+    """Extract emails from firms that need it, crawling each domain at most once."""
     print("\n" + "="*60)
     print("Extracting emails from firm websites")
     print("="*60)
 
-    # Find rows that need email extraction
     today = datetime.now().strftime("%Y-%m-%d")
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    cache = load_domain_cache()
+    seed_domain_cache(cache, rows)
 
-    to_extract = []
+    # Group pending rows by domain; answer cached domains without fetching
+    to_crawl = {}  # domain -> (website, [row indexes])
     for i, row in enumerate(rows):
-        status = row.get("extraction_status", "pending")
-        attempted = row.get("extraction_attempted", "")
-
         # Skip if already successful
-        if status == "success":
+        if row.get("extraction_status", "pending") == "success":
+            continue
+
+        domain = norm_domain(row.get("website", ""))
+        if not domain:
+            continue
+
+        if domain in to_crawl:
+            to_crawl[domain][1].append(i)
             continue
 
-        # Skip if failed within last 30 days
-        if status == "failed" and attempted >= thirty_days_ago:
+        entry = cache.get(domain)
+        fresh = entry is not None and today < recheck_after(entry)
+        if fresh and entry["status"] == "success":
+            status = apply_result(row, entry["emails"], "success", today)
+            summary["extract"]["cached"] += 1
+            summary["extract"]["success" if status == "success" else "failed"] += 1
+            continue
+
+        # Skip failed domains until their backoff window has passed
+        if fresh and entry["status"] == "failed":
             summary["extract"]["skipped"] += 1
             continue
 
-        to_extract.append((i, row))
-        if len(to_extract) >= EXTRACT_BATCH_SIZE:
-            break
+        if len(to_crawl) >= EXTRACT_BATCH_SIZE:
+            continue
+        to_crawl[domain] = (row.get("website", ""), [i])
 
-    summary["extract"]["total_pending"] = len(to_extract)
-    print(f"Found {len(to_extract)} firms needing email extraction (batch limit: {EXTRACT_BATCH_SIZE})")
+    pending_rows = sum(len(idxs) for _, idxs in to_crawl.values())
+    summary["extract"]["total_pending"] = pending_rows
+    summary["extract"]["domains_crawled"] = len(to_crawl)
+    print(f"Answered from domain cache: {summary['extract']['cached']}")
+    print(f"Found {len(to_crawl)} domains ({pending_rows} firms) needing email extraction "
+          f"(batch limit: {EXTRACT_BATCH_SIZE})")
 
-    if not to_extract:
+    if not to_crawl:
         print("No firms to process.")
+        save_domain_cache(cache)
         return rows
 
     # Process with thread pool
     with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {executor.submit(process_firm_email, row): (i, row) for i, row in to_extract}
+        futures = {executor.submit(process_domain_email, website): domain
+                   for domain, (website, _) in to_crawl.items()}
 
         for future in as_completed(futures):
-            idx, row = futures[future]
+            domain = futures[future]
             result = future.result()
-
-            rows[idx]["email"] = result["email"]
-            rows[idx]["all_emails"] = result["all_emails"]
-            rows[idx]["extraction_attempted"] = today
-            rows[idx]["extraction_status"] = result["status"]
-
-            if result["status"] == "success":
-                summary["extract"]["success"] += 1
-                print(f"  [OK] {row['firm_name'][:40]} -> {result['email']}")
-            else:
-                summary["extract"]["failed"] += 1
-                print(f"  [--] {row['firm_name'][:40]} -> (no email found)")
-
+            update_domain_cache(cache, domain, result, today)
+
+            for idx in to_crawl[domain][1]:
+                row = rows[idx]
+                status = apply_result(row, result["emails"], result["status"], today)
+                if status == "success":
+                    summary["extract"]["success"] += 1
+                    print(f"  [OK] {row['firm_name'][:40]} -> {row['email']}")
+                else:
+                    summary["extract"]["failed"] += 1
+                    print(f"  [--] {row['firm_name'][:40]} -> (no email found)")
+
+    save_domain_cache(cache)
     return rows
 
 
@@ -284,8 +383,10 @@ def main():
     print("="*60)
     print(f"Total firms in directory: {summary['total_firms']}")
     print(f"Emails extracted this run: {summary['extract']['success']}")
+    print(f"Answered from domain cache: {summary['extract']['cached']}")
+    print(f"Domains crawled: {summary['extract']['domains_crawled']}")
     print(f"Failed extractions: {summary['extract']['failed']}")
-    print(f"Skipped (recently failed): {summary['extract']['skipped']}")
+    print(f"Skipped (domain in failure backoff): {summary['extract']['skipped']}")
     print(f"Total firms with emails: {summary['firms_with_emails']}")
     print(f"Total failed extractions: {summary['total_failed']}")
     total_attempted = summary['firms_with_emails'] + summary['total_failed']
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Cross-list email history: a Bloom filter pre-check in front of an exact
+SQLite store (email_history.bloom / email_history.db).
+
+Usage:
+    python3 email_bloom.py add google.csv yahoo.csv tbpleads.csv ~/tbp/leads/my_leads.csv
+    python3 email_bloom.py screen new_leads.csv --out new_leads_unseen.csv
+    python3 email_bloom.py stats
+"""
+
+import argparse
+import csv
+import hashlib
+import math
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path('/Users/sscott/tbp/emails')
+BLOOM_FILE = BASE_DIR / 'email_history.bloom'
+DB_FILE = BASE_DIR / 'email_history.db'
+
+DEFAULT_CAPACITY = 2_000_000
+DEFAULT_ERROR_RATE = 0.01
+BLOOM_MAGIC = b'TBPBLM2\n'
+EMAIL_COLUMNS = ('email', 'email_address', 'e-mail')
+
+
+def normalize_email(email):
+    """Lowercase and strip an address; return '' for anything without an @."""
+    email = (email or '').strip().lower()
+    return email if '@' in email else ''
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over one blake2b digest.
+
+    `rows` is the size of the exact store the filter was saved against.
+    """
+
+    def __init__(self, num_bits, num_hashes, bits=None, count=0, rows=0):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+        self.count = count
+        self.rows = rows
+
+    @classmethod
+    def for_capacity(cls, capacity, error_rate=DEFAULT_ERROR_RATE):
+        """Size the filter for `capacity` items at the given false-positive rate."""
+        capacity = max(1, capacity)
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Add an item; returns True if it was (probably) new."""
+        new = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def estimated_error_rate(self):
+        """False-positive rate for the current fill level."""
+        if not self.count:
+            return 0.0
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def save(self, path):
+        """Write the filter atomically (tmp file + rename)."""
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(BLOOM_MAGIC)
+            f.write(self.num_bits.to_bytes(8, 'little'))
+            f.write(self.num_hashes.to_bytes(4, 'little'))
+            f.write(self.count.to_bytes(8, 'little'))
+            f.write(self.rows.to_bytes(8, 'little'))
+            f.write(self.bits)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            if f.read(len(BLOOM_MAGIC)) != BLOOM_MAGIC:
+                raise ValueError(f"Not an email history Bloom file: {path}")
+            num_bits = int.from_bytes(f.read(8), 'little')
+            num_hashes = int.from_bytes(f.read(4), 'little')
+            count = int.from_bytes(f.read(8), 'little')
+            rows = int.from_bytes(f.read(8), 'little')
+            bits = bytearray(f.read())
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError(f"Truncated Bloom file: {path}")
+        return cls(num_bits, num_hashes, bits, count, rows)
+
+
+class EmailHistory:
+    """Bloom filter + SQLite exact store for every email we have already seen."""
+
+    def __init__(self, bloom_path=BLOOM_FILE, db_path=DB_FILE, capacity=DEFAULT_CAPACITY):
+        self.bloom_path = Path(bloom_path)
+        self.db_path = Path(db_path)
+        self.db = sqlite3.connect(str(self.db_path))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS emails (email TEXT PRIMARY KEY, source TEXT)"
+        )
+        stored = self.size()
+        self.bloom = None
+        if self.bloom_path.exists():
+            try:
+                self.bloom = BloomFilter.load(self.bloom_path)
+            except ValueError as e:
+                print(f"Warning: {e}; rebuilding it")
+        if self.bloom is None or self.bloom.rows != stored:
+            # Missing, old format or out of step with SQLite: rebuild from the exact store
+            self.bloom = BloomFilter.for_capacity(max(capacity, stored * 2))
+            for (email,) in self.db.execute("SELECT email FROM emails"):
+                self.bloom.add(email)
+            self.bloom.rows = stored
+
+    def close(self):
+        """Save the Bloom filter, then commit: a crash in between only forces a rebuild."""
+        self.bloom.rows = self.size()
+        self.bloom.save(self.bloom_path)
+        self.db.commit()
+        self.db.close()
+
+    def abort(self):
+        """Discard this session's additions; the files on disk stay as they were."""
+        self.db.rollback()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def might_contain(self, email):
+        """Bloom-only check: False means definitely unseen."""
+        return email in self.bloom
+
+    def contains(self, email):
+        """Exact check: Bloom pre-filter, then SQLite lookup for possible hits."""
+        email = normalize_email(email)
+        if not email or email not in self.bloom:
+            return False
+        row = self.db.execute("SELECT 1 FROM emails WHERE email = ?", (email,)).fetchone()
+        return row is not None
+
+    def add_many(self, emails, source=''):
+        """Insert addresses into both stores; returns the number newly added."""
+        added = 0
+        batch = []
+        for email in emails:
+            email = normalize_email(email)
+            if not email:
+                continue
+            self.bloom.add(email)
+            batch.append((email, source))
+            if len(batch) >= 10_000:
+                added += self._insert(batch)
+                batch = []
+        if batch:
+            added += self._insert(batch)
+        return added
+
+    def _insert(self, batch):
+        before = self.db.total_changes
+        self.db.executemany("INSERT OR IGNORE INTO emails (email, source) VALUES (?, ?)", batch)
+        return self.db.total_changes - before
+
+    def screen(self, emails):
+        """Split emails into (unseen, seen) using Bloom first, SQLite only on hits."""
+        unseen, seen = [], []
+        for email in emails:
+            key = normalize_email(email)
+            if key and self.contains(key):
+                seen.append(email)
+            else:
+                unseen.append(email)
+        return unseen, seen
+
+    def size(self):
+        return self.db.execute("SELECT COUNT(*) FROM emails").fetchone()[0]
+
+
+@contextmanager
+def open_csv_emails(file_path):
+    """Context manager yielding (header, rows) where rows yields (row, email) for each data row.
+
+    header is None for headerless first/last/email files (the
+    extract_gmail_yahoo.py input format), in which case the first line is data.
+    The file is closed when the block exits, whether or not rows was consumed.
+    """
+    with open(file_path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            yield None, iter(())
+            return
+
+        lowered = [h.strip().lower() for h in first]
+        email_idx = next((lowered.index(c) for c in EMAIL_COLUMNS if c in lowered), None)
+        header = first
+        if email_idx is None:
+            header = None
+            email_idx = 2
+
+        def rows():
+            if header is None and len(first) > email_idx:
+                yield first, first[email_idx]
+            for row in reader:
+                if len(row) > email_idx:
+                    yield row, row[email_idx]
+
+        yield header, rows()
+
+
+def cmd_add(args, history):
+    for file_path in args.files:
+        if not os.path.exists(file_path):
+            print(f"Warning: {file_path} not found")
+            continue
+        with open_csv_emails(file_path) as (_, rows):
+            added = history.add_many((email for _, email in rows),
+                                     source=os.path.basename(file_path))
+        print(f"{os.path.basename(file_path)}: {added} new emails")
+    print(f"History size: {history.size()}")
+
+
+def cmd_screen(args, history):
+    total = unseen = bloom_hits = 0
+    with open_csv_emails(args.file) as (header, rows):
+        out = open(args.out, 'w', newline='', encoding='utf-8') if args.out else None
+        writer = csv.writer(out) if out else None
+        if writer and header:
+            writer.writerow(header)
+
+        for row, email in rows:
+            total += 1
+            key = normalize_email(email)
+            if key and history.might_contain(key):
+                bloom_hits += 1
+                if history.contains(key):
+                    continue
+            unseen += 1
+            if writer:
+                writer.writerow(row)
+
+        if out:
+            out.close()
+
+    print(f"Screened: {total}")
+    print(f"Bloom possible hits: {bloom_hits} (exact-checked in SQLite)")
+    print(f"Already known: {total - unseen}")
+    print(f"Unseen: {unseen}")
+    if args.out:
+        print(f"Unseen rows saved to: {args.out}")
+
+
+def cmd_stats(args, history):
+    bloom = history.bloom
+    print(f"Emails in history: {history.size()}")
+    print(f"Bloom bits: {bloom.num_bits} ({bloom.num_bits / 8 / 1024 / 1024:.2f} MB), hashes: {bloom.num_hashes}")
+    print(f"Estimated false-positive rate: {bloom.estimated_error_rate() * 100:.3f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-list email history (Bloom + SQLite)")
+    parser.add_argument('--bloom', default=str(BLOOM_FILE), help="Bloom filter file")
+    parser.add_argument('--db', default=str(DB_FILE), help="SQLite exact store")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_add = sub.add_parser('add', help="Add every email in the given CSVs to the history")
+    p_add.add_argument('files', nargs='+')
+
+    p_screen = sub.add_parser('screen', help="Report/emit rows whose email is not in the history")
+    p_screen.add_argument('file')
+    p_screen.add_argument('--out', help="Write unseen rows to this CSV")
+
+    sub.add_parser('stats', help="Show history size and Bloom fill")
+
+    args = parser.parse_args()
+
+    with EmailHistory(args.bloom, args.db) as history:
+        {'add': cmd_add, 'screen': cmd_screen, 'stats': cmd_stats}[args.command](args, history)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,10 +9,8 @@ import csv
 import sys
 from pathlib import Path
 
-def extract_values_from_sql(sql_file):
-    """Extract (first_name, last_name, email) tuples from SQL INSERT statements."""
-    leads = []
-
+def iter_values_from_sql(sql_file):
+    """Yield (first_name, last_name, email) tuples from SQL INSERT statements."""
     # Pattern to match individual value tuples in INSERT statements
     # Handles: (id,NULL,'value','value',...) format
     value_pattern = re.compile(r"\(([^)]+)\)")
@@ -72,9 +70,12 @@ def extract_values_from_sql(sql_file):
                         '.' in email.split('@')[-1] and  # Domain must have a dot
                         not ' ' in email and  # No spaces in email
                         len(email) < 100):  # Reasonable length
-                        leads.append((first_name, last_name, email))
+                        yield (first_name, last_name, email)
 
-    return leads
+
+def extract_values_from_sql(sql_file):
+    """Extract (first_name, last_name, email) tuples from SQL INSERT statements."""
+    return list(iter_values_from_sql(sql_file))
 
 def main():
     sql_files = [
@@ -1,88 +1,183 @@
 #!/usr/bin/env python3
+"""
+Split raw email lists into per-provider CSVs in one streaming pass.
+
+Each row (first_name, last_name, email) with valid names is routed to the
+first bucket whose domain rule matches. Buckets are written through buffered
+CSV writers and only summary counters are printed, so large inputs are bound
+by disk speed rather than stdout.
+
+Usage:
+    python3 extract_gmail_yahoo.py
+    python3 extract_gmail_yahoo.py --inputs a.csv b.csv --buckets gmail yahoo outlook
+"""
+import argparse
 import csv
-import re
 import os
+import re
+from collections import Counter
+
+BASE_PATH = "/Users/sscott/tbp/emails"
+DEFAULT_INPUTS = ["email-list1.csv", "email-list2.csv"]
+HEADER = ['first_name', 'last_name', 'email']
+WRITE_BUFFER = 1024 * 1024
+
+VALID_NAME_RE = re.compile(r'[a-zA-Z\s]+')
+
+# Bucket rules are checked in order; a rule matches when the email domain is
+# in `domains` or starts with one of `prefixes` (e.g. gmail.co.uk).
+# `output` is the CSV file name written under BASE_PATH.
+BUCKET_RULES = [
+    {"name": "gmail", "output": "google.csv",
+     "domains": {"googlemail.com"}, "prefixes": ("gmail.",)},
+    {"name": "yahoo", "output": "yahoo.csv",
+     "domains": {"ymail.com", "rocketmail.com"}, "prefixes": ("yahoo.com",)},
+    {"name": "outlook", "output": "outlook.csv",
+     "domains": {"outlook.com", "hotmail.com", "live.com", "msn.com"},
+     "prefixes": ("hotmail.", "outlook.", "live.")},
+    {"name": "apple", "output": "apple.csv",
+     "domains": {"icloud.com", "me.com", "mac.com"}, "prefixes": ()},
+    {"name": "aol", "output": "aol.csv",
+     "domains": {"aol.com", "aim.com"}, "prefixes": ()},
+    {"name": "isp", "output": "isp.csv",
+     "domains": {"comcast.net", "att.net", "sbcglobal.net", "verizon.net",
+                 "cox.net", "charter.net", "bellsouth.net", "earthlink.net"},
+     "prefixes": ()},
+    # Catch-all: anything with a domain that no consumer rule claimed
+    {"name": "corporate", "output": "corporate.csv", "domains": None, "prefixes": ()},
+]
+DEFAULT_BUCKETS = ["gmail", "yahoo"]
+
 
 def is_valid_name(name):
     """Check if name contains only letters (a-z, A-Z) and is not empty"""
-    if not name or not name.strip():
-        return False
-    return re.match(r'^[a-zA-Z\s]+$', name.strip())
+    name = name.strip() if name else ""
+    return bool(name) and VALID_NAME_RE.fullmatch(name) is not None
 
-def process_csv_file(file_path, gmail_records, yahoo_records):
-    """Process a CSV file and extract Gmail and Yahoo records with valid names"""
-    if not os.path.exists(file_path):
-        print(f"Warning: {file_path} not found")
-        return
-    
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-        # Detect if first row has headers
-        first_line = file.readline().strip()
-        file.seek(0)
-        
+
+def classify_domain(domain, rules):
+    """Return the name of the first rule matching `domain`, or None."""
+    for rule in rules:
+        if rule["domains"] is None:
+            return rule["name"]
+        if domain in rule["domains"] or domain.startswith(rule["prefixes"]):
+            return rule["name"]
+    return None
+
+
+class BucketSplitter:
+    """Routes rows to buffered per-bucket CSV writers and keeps counters."""
+
+    def __init__(self, rules, base_path=BASE_PATH):
+        self.rules = rules
+        self.base_path = base_path
+        self.counts = Counter()
+        self.files = {}
+        self.writers = {}
+
+    def open(self):
+        for rule in self.rules:
+            path = os.path.join(self.base_path, rule["output"])
+            f = open(path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER)
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            self.files[rule["name"]] = f
+            self.writers[rule["name"]] = writer
+        return self
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def route(self, first_name, last_name, email):
+        """Write one row to its bucket; returns the bucket name or None."""
+        self.counts["rows"] += 1
+        if not (is_valid_name(first_name) and is_valid_name(last_name)):
+            self.counts["invalid_name"] += 1
+            return None
+        local, at, domain = email.rpartition('@')
+        domain = domain.lower()
+        if not (local and at and domain):
+            self.counts["invalid_email"] += 1
+            return None
+        # Classify against every rule so e.g. hotmail never lands in the
+        # corporate catch-all just because the outlook bucket wasn't requested
+        bucket = classify_domain(domain, BUCKET_RULES)
+        if bucket not in self.writers:
+            self.counts["unmatched"] += 1
+            return None
+        self.writers[bucket].writerow([first_name.strip(), last_name.strip(), email])
+        self.counts[bucket] += 1
+        return bucket
+
+
+def iter_rows(file_path):
+    """Yield (first_name, last_name, email) from a raw list, skipping any header."""
+    with open(file_path, 'r', encoding='utf-8', errors='ignore', newline='') as file:
         reader = csv.reader(file)
-        
+        first = next(reader, None)
+        if first is None:
+            return
+        first_line = ','.join(first).lower()
         # Skip header if it looks like headers
-        if 'first_name' in first_line.lower() or 'email' in first_line.lower():
-            next(reader, None)
-        
+        if not ('first_name' in first_line or 'email' in first_line):
+            if len(first) >= 3:
+                yield first[0], first[1], first[2].strip()
         for row in reader:
-            if len(row) < 3:
-                continue
-                
-            first_name = row[0].strip() if row[0] else ""
-            last_name = row[1].strip() if row[1] else ""
-            email = row[2].strip() if row[2] else ""
-            
-            # Check if names are valid (not empty and contain only letters)
-            if (is_valid_name(first_name) and is_valid_name(last_name)):
-                
-                # Check for Gmail
-                if '@gmail' in email.lower():
-                    gmail_records.append([first_name, last_name, email])
-                    print(f"Gmail Added: {first_name} {last_name} - {email}")
-                
-                # Check for Yahoo
-                elif '@yahoo.com' in email.lower():
-                    yahoo_records.append([first_name, last_name, email])
-                    print(f"Yahoo Added: {first_name} {last_name} - {email}")
+            if len(row) >= 3:
+                yield row[0], row[1], row[2].strip()
+
+
+def process_csv_file(file_path, splitter):
+    """Stream a CSV file through the splitter."""
+    if not os.path.exists(file_path):
+        print(f"Warning: {file_path} not found")
+        return
+    route = splitter.route
+    for first_name, last_name, email in iter_rows(file_path):
+        route(first_name, last_name, email)
+
+
+def select_rules(bucket_names):
+    """Pick rules by name, preserving BUCKET_RULES precedence order."""
+    unknown = set(bucket_names) - {r["name"] for r in BUCKET_RULES}
+    if unknown:
+        raise SystemExit(f"Unknown bucket(s): {', '.join(sorted(unknown))}")
+    return [r for r in BUCKET_RULES if r["name"] in bucket_names]
+
 
 def main():
-    base_path = "/Users/sscott/tbp/emails"
-    
-    # Lists to store all valid records
-    gmail_records = []
-    yahoo_records = []
-    
-    # Process both files
-    print("Processing email-list1.csv...")
-    process_csv_file(os.path.join(base_path, "email-list1.csv"), gmail_records, yahoo_records)
-    
-    print("Processing email-list2.csv...")  
-    process_csv_file(os.path.join(base_path, "email-list2.csv"), gmail_records, yahoo_records)
-    
-    # Write to google.csv
-    gmail_output_file = os.path.join(base_path, "google.csv")
-    with open(gmail_output_file, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        # Write header
-        writer.writerow(['first_name', 'last_name', 'email'])
-        # Write all Gmail records
-        writer.writerows(gmail_records)
-    
-    # Write to yahoo.csv
-    yahoo_output_file = os.path.join(base_path, "yahoo.csv")
-    with open(yahoo_output_file, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        # Write header
-        writer.writerow(['first_name', 'last_name', 'email'])
-        # Write all Yahoo records
-        writer.writerows(yahoo_records)
-    
-    print(f"\nTotal Gmail records extracted: {len(gmail_records)}")
-    print(f"Gmail results saved to: {gmail_output_file}")
-    print(f"\nTotal Yahoo records extracted: {len(yahoo_records)}")
-    print(f"Yahoo results saved to: {yahoo_output_file}")
+    parser = argparse.ArgumentParser(description="Split email lists into provider buckets")
+    parser.add_argument('--base-path', default=BASE_PATH)
+    parser.add_argument('--inputs', nargs='+', default=DEFAULT_INPUTS,
+                        help="Input CSVs (relative to --base-path)")
+    parser.add_argument('--buckets', nargs='+', default=DEFAULT_BUCKETS,
+                        choices=[r["name"] for r in BUCKET_RULES])
+    args = parser.parse_args()
+
+    rules = select_rules(args.buckets)
+
+    with BucketSplitter(rules, args.base_path) as splitter:
+        for name in args.inputs:
+            print(f"Processing {name}...")
+            process_csv_file(os.path.join(args.base_path, name), splitter)
+
+    counts = splitter.counts
+    print(f"\nRows read: {counts['rows']}")
+    print(f"Skipped (invalid name): {counts['invalid_name']}")
+    print(f"Skipped (invalid email): {counts['invalid_email']}")
+    print(f"Skipped (no bucket): {counts['unmatched']}")
+    for rule in rules:
+        path = os.path.join(args.base_path, rule["output"])
+        print(f"\nTotal {rule['name']} records extracted: {counts[rule['name']]}")
+        print(f"{rule['name'].capitalize()} results saved to: {path}")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
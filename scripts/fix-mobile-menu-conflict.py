@@ -14,6 +14,9 @@ import re
 import sys
 import argparse
 
+from site_parallel import add_jobs_argument, run_files
+from site_txn import Transaction, write_text
+
 # Directories to process
 DIRS_TO_PROCESS = [
     'web',
@@ -75,11 +78,14 @@ def process_file(filepath, dry_run=False):
         return None, []
 
     if not dry_run:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text(filepath, content)
 
     return content, ['Removed conflicting mobile menu handler']
 
+def process_file_changes(filepath, dry_run=False):
+    """process_file() without the page content, for cheap worker results."""
+    return process_file(filepath, dry_run=dry_run)[1]
+
 def find_html_files(base_dir, subdirs):
     """Find all HTML files in specified directories."""
     files = []
@@ -100,6 +106,7 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without modifying files')
     parser.add_argument('--file', type=str, help='Process a single file')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    add_jobs_argument(parser)
     args = parser.parse_args()
 
     # Determine base directory
@@ -117,11 +124,19 @@ def main():
     skipped = 0
     errors = 0
 
-    for filepath in sorted(files):
+    with Transaction('fix-mobile-menu-conflict') as txn:
+        results = run_files(process_file_changes, sorted(files), args.jobs,
+                            kwargs={'dry_run': args.dry_run})
+
+    for result in results:
+        filepath = result.item
         rel_path = os.path.relpath(filepath, base_dir)
 
-        try:
-            content, changes = process_file(filepath, dry_run=args.dry_run)
+        if result.error:
+            errors += 1
+            print(f"ERROR processing {rel_path}: {result.error}")
+        else:
+            changes = result.value
 
             if changes:
                 processed += 1
@@ -133,9 +148,6 @@ def main():
                 skipped += 1
                 if args.verbose:
                     print(f"Skipped: {rel_path}")
-        except Exception as e:
-            errors += 1
-            print(f"ERROR processing {rel_path}: {e}")
 
     print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Summary:")
     print(f"  Fixed: {processed}")
@@ -144,6 +156,8 @@ def main():
 
     if args.dry_run:
         print("\nRun without --dry-run to apply changes.")
+    elif txn.snapshot_id:
+        print(f"\nUndo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
 if __name__ == '__main__':
     main()
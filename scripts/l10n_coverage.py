@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Per-locale coverage of the app strings (ARB) and the site pages, written to
+build/l10n-coverage/coverage.json and index.html.
+
+Usage:
+    python3 l10n_coverage.py                     # update fingerprints, write the reports
+    python3 l10n_coverage.py update --no-record  # report without recording page fingerprints
+    python3 l10n_coverage.py update --json       # also print the JSON
+    python3 l10n_coverage.py touch de blog/foo.html   # reviewed against the current English
+"""
+import argparse
+import html
+import json
+import sys
+from pathlib import Path
+
+from arb_fingerprints import FingerprintStore
+from arb_files import TEMPLATE_LOCALE, arb_locales, load_template, messages
+from script_loader import REPO_ROOT
+from site_index import LOCALE_ORDER, PageIndex
+from site_pages import SITE_DIRS, SPECIAL_PAGES
+from site_txn import atomic_write
+
+REPORT_DIR = REPO_ROOT / 'build' / 'l10n-coverage'
+PAGE_FINGERPRINT_FILE = REPO_ROOT / 'scripts' / 'data' / 'page-fingerprints.json'
+PAGE_FINGERPRINT_VERSION = 1
+ROOT_PROGRESS_FILE = REPO_ROOT / 'translation_progress.json'
+COMPANY_PAGE = 'companies/ai-recruiting-{}.html'
+
+LOCALE_DIRS = {locale: site for site, locale in SITE_DIRS.items()}
+TRANSLATED_LOCALES = [loc for loc in LOCALE_ORDER if loc != 'en']
+
+
+def _coverage(done, total):
+    return round(done / total, 4) if total else 1.0
+
+
+def _section(slug):
+    return slug.split('/', 1)[0] if '/' in slug else '.'
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class PageFingerprints:
+    """locale -> slug -> {'source': English page hash, 'target': locale page hash}."""
+
+    def __init__(self, path=PAGE_FINGERPRINT_FILE):
+        self.path = path
+        self.locales = {}
+        self.dirty = False
+        if path.exists():
+            data = _read_json(path)
+            if data.get('version') == PAGE_FINGERPRINT_VERSION:
+                self.locales = data['locales']
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': PAGE_FINGERPRINT_VERSION, 'locales': self.locales}
+        atomic_write(self.path, (json.dumps(data, indent=1, sort_keys=True) + '\n').encode('utf-8'))
+        self.dirty = False
+
+    def stale(self, locale, slug, source, target, record=True):
+        """True if the English page changed since this locale copy was made or reviewed.
+
+        A locale copy seen for the first time, or changed since, is taken
+        to match the current English page (and recorded, with `record`).
+        """
+        entries = self.locales.setdefault(locale, {})
+        entry = entries.get(slug)
+        if entry is None or entry['target'] != target:
+            if record:
+                entries[slug] = {'source': source, 'target': target}
+                self.dirty = True
+            return False
+        return entry['source'] != source
+
+    def touch(self, locale, slug, source, target):
+        self.locales.setdefault(locale, {})[slug] = {'source': source, 'target': target}
+        self.dirty = True
+
+    def forget_missing(self, present):
+        """Drop entries for locale pages that no longer exist ({locale: set of slugs})."""
+        for locale, entries in self.locales.items():
+            for slug in [s for s in entries if s not in present.get(locale, ())]:
+                del entries[slug]
+                self.dirty = True
+
+
+def english_pages(index):
+    """{slug: PageEntry} of the English pages that locales are expected to have."""
+    pages = {}
+    for slug, by_locale in index.slugs.items():
+        entry = by_locale.get('en')
+        if entry and entry.indexable and Path(slug).name not in SPECIAL_PAGES:
+            pages[slug] = entry
+    return pages
+
+
+def page_coverage(index, fingerprints, record=True):
+    """{locale: page coverage} for the translated locales."""
+    english = english_pages(index)
+    present = {}
+    results = {}
+    for locale in TRANSLATED_LOCALES:
+        local = {slug: by_locale[locale] for slug, by_locale in index.slugs.items() if locale in by_locale}
+        present[locale] = set(local)
+        sections = {}
+        missing, stale = [], []
+        for slug in sorted(english):
+            counts = sections.setdefault(_section(slug), {'total': 0, 'present': 0, 'stale': 0, 'missing': 0})
+            counts['total'] += 1
+            if slug not in local:
+                counts['missing'] += 1
+                missing.append(slug)
+                continue
+            counts['present'] += 1
+            if fingerprints.stale(locale, slug, english[slug].sha256, local[slug].sha256, record):
+                counts['stale'] += 1
+                stale.append(slug)
+        for counts in sections.values():
+            counts['coverage'] = _coverage(counts['present'] - counts['stale'], counts['total'])
+        total = len(english)
+        results[locale] = {
+            'total': total,
+            'present': total - len(missing),
+            'stale': len(stale),
+            'missing': len(missing),
+            'extra': sorted(slug for slug in local if slug not in english),
+            'coverage': _coverage(total - len(missing) - len(stale), total),
+            'sections': dict(sorted(sections.items())),
+            'missing_pages': missing,
+            'stale_pages': stale,
+        }
+    if record:
+        fingerprints.forget_missing(present)
+    return results
+
+
+def arb_coverage(store, record=True):
+    """{locale: ARB coverage} for every locale but the template."""
+    total = len(messages(load_template().data))
+    locales = [loc for loc in arb_locales() if loc != TEMPLATE_LOCALE]
+    results = {}
+    for locale, status in store.refresh(locales, record=record).items():
+        counts = {state: len(keys) for state, keys in status._asdict().items()}
+        results[locale] = dict(counts, total=total,
+                               coverage=_coverage(counts['translated'] + counts['identical'], total),
+                               open_keys=status.missing + status.stale + status.untranslated)
+    return results
+
+
+def _drift(source, listed, present):
+    return {
+        'file': source,
+        'listed': len(listed),
+        'listed_missing': sorted(slug for slug in listed if slug not in present),
+        'unlisted': sorted(slug for slug in present if slug not in listed),
+    }
+
+
+def progress_drift(index):
+    """How the hand-kept translation_progress.json files differ from the trees."""
+    companies = {locale: {slug for slug, by_locale in index.slugs.items()
+                          if locale in by_locale and slug.startswith('companies/')}
+                 for locale in TRANSLATED_LOCALES}
+    drift = {}
+    if ROOT_PROGRESS_FILE.exists():
+        languages = _read_json(ROOT_PROGRESS_FILE).get('languages', {})
+        for locale in TRANSLATED_LOCALES:
+            listed = {COMPANY_PAGE.format(name) for name in languages.get(locale, {}).get('completed', [])}
+            drift.setdefault(locale, []).append(_drift(ROOT_PROGRESS_FILE.name, listed, companies[locale]))
+    for locale in TRANSLATED_LOCALES:
+        path = REPO_ROOT / LOCALE_DIRS[locale] / 'companies' / ROOT_PROGRESS_FILE.name
+        if path.exists():
+            listed = {f"companies/{name}" for name in _read_json(path).get('completed', [])}
+            drift.setdefault(locale, []).append(
+                _drift(f"{LOCALE_DIRS[locale]}/companies/{path.name}", listed, companies[locale]))
+    return drift
+
+
+def render_html(report):
+    """Static HTML report for coverage.json."""
+    esc = html.escape
+
+    def bar(value):
+        pct = value * 100
+        color = '#2e7d32' if pct >= 95 else '#f9a825' if pct >= 60 else '#c62828'
+        return (f'<div class="bar"><span style="width:{pct:.1f}%;background:{color}"></span></div>'
+                f'{pct:.1f}%')
+
+    def key_list(title, items):
+        if not items:
+            return ''
+        lis = ''.join(f'<li><code>{esc(item)}</code></li>' for item in items)
+        return f'<details><summary>{esc(title)} ({len(items)})</summary><ul>{lis}</ul></details>'
+
+    out = ['<!DOCTYPE html>', '<html lang="en">', '<head>', '<meta charset="UTF-8">',
+           '<meta name="robots" content="noindex">', '<title>Locale coverage - Team Build Pro</title>',
+           '<style>',
+           'body{font-family:-apple-system,BlinkMacSystemFont,"Segoe UI",sans-serif;margin:2rem;color:#222}',
+           'table{border-collapse:collapse;margin:1rem 0}th,td{border:1px solid #ddd;padding:.4rem .7rem;text-align:right}',
+           'th:first-child,td:first-child{text-align:left}th{background:#f5f5f5}',
+           '.bar{display:inline-block;width:8rem;height:.7rem;background:#eee;margin-right:.5rem}',
+           '.bar span{display:block;height:100%}details{margin:.3rem 0}code{font-size:.85rem}',
+           '</style>', '</head>', '<body>', '<h1>Locale coverage</h1>']
+
+    arb = report['arb']
+    out += ['<h2>App strings (lib/l10n)</h2>', '<table>',
+            '<tr><th>Locale</th><th>Coverage</th><th>Translated</th><th>Identical</th>'
+            '<th>Untranslated</th><th>Stale</th><th>Missing</th><th>Keys</th></tr>']
+    for locale, c in arb.items():
+        out.append(f'<tr><td>{esc(locale)}</td><td>{bar(c["coverage"])}</td><td>{c["translated"]}</td>'
+                   f'<td>{c["identical"]}</td><td>{c["untranslated"]}</td><td>{c["stale"]}</td>'
+                   f'<td>{c["missing"]}</td><td>{c["total"]}</td></tr>')
+    out.append('</table>')
+    for locale, c in arb.items():
+        out.append(key_list(f'{locale}: open keys', c['open_keys']))
+
+    pages = report['pages']
+    out += ['<h2>Site pages</h2>', '<table>',
+            '<tr><th>Locale</th><th>Section</th><th>Coverage</th><th>Present</th><th>Stale</th>'
+            '<th>Missing</th><th>English pages</th></tr>']
+    for locale, c in pages.items():
+        out.append(f'<tr><th>{esc(locale)}</th><th>all</th><th>{bar(c["coverage"])}</th><th>{c["present"]}</th>'
+                   f'<th>{c["stale"]}</th><th>{c["missing"]}</th><th>{c["total"]}</th></tr>')
+        for section, s in c['sections'].items():
+            out.append(f'<tr><td></td><td>{esc(section)}</td><td>{bar(s["coverage"])}</td><td>{s["present"]}</td>'
+                       f'<td>{s["stale"]}</td><td>{s["missing"]}</td><td>{s["total"]}</td></tr>')
+    out.append('</table>')
+    for locale, c in pages.items():
+        out.append(key_list(f'{locale}: missing pages', c['missing_pages']))
+        out.append(key_list(f'{locale}: stale pages', c['stale_pages']))
+        out.append(key_list(f'{locale}: pages without an English original', c['extra']))
+
+    out += ['<h2>translation_progress.json</h2>', '<table>',
+            '<tr><th>Locale</th><th>File</th><th>Listed</th><th>Listed, no page</th><th>Page, not listed</th></tr>']
+    for locale, files in report['progress'].items():
+        for d in files:
+            out.append(f'<tr><td>{esc(locale)}</td><td>{esc(d["file"])}</td><td>{d["listed"]}</td>'
+                       f'<td>{len(d["listed_missing"])}</td><td>{len(d["unlisted"])}</td></tr>')
+    out.append('</table>')
+    out += ['</body>', '</html>', '']
+    return '\n'.join(line for line in out if line)
+
+
+def _write_if_changed(path, text):
+    data = text.encode('utf-8')
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, data)
+    return True
+
+
+def build_report(record=True):
+    index = PageIndex.load()
+    store = FingerprintStore()
+    fingerprints = PageFingerprints()
+    report = {
+        'arb': arb_coverage(store, record),
+        'pages': page_coverage(index, fingerprints, record),
+        'progress': progress_drift(index),
+    }
+    if record:
+        store.save()
+        fingerprints.save()
+    return report
+
+
+def cmd_touch(args):
+    index = PageIndex.load()
+    fingerprints = PageFingerprints()
+    unknown = []
+    for slug in args.slugs:
+        english, local = index.get(slug, 'en'), index.get(slug, args.locale)
+        if english is None or local is None:
+            unknown.append(slug)
+            continue
+        fingerprints.touch(args.locale, slug, english.sha256, local.sha256)
+    fingerprints.save()
+    for slug in unknown:
+        print(f"⚠️  {slug}: not in both web/ and {LOCALE_DIRS[args.locale]}/")
+    print(f"✅ {len(args.slugs) - len(unknown)} page(s) marked for {args.locale}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-locale coverage of app strings and site pages')
+    sub = parser.add_subparsers(dest='command')
+    p_update = sub.add_parser('update', help='Write the coverage JSON and HTML report (default)')
+    p_update.add_argument('--no-record', action='store_true',
+                          help='Do not record new translations in the fingerprint stores')
+    p_update.add_argument('--out', default=str(REPORT_DIR), help='Report directory')
+    p_update.add_argument('--json', action='store_true', help='Also print the JSON report')
+    p_touch = sub.add_parser('touch', help='Mark locale pages as reviewed against the current English')
+    p_touch.add_argument('locale', choices=TRANSLATED_LOCALES)
+    p_touch.add_argument('slugs', nargs='+')
+    parser.set_defaults(command='update', no_record=False, out=str(REPORT_DIR), json=False)
+    args = parser.parse_args()
+
+    if args.command == 'touch':
+        return cmd_touch(args)
+
+    report = build_report(record=not args.no_record)
+    out = Path(args.out)
+    text = json.dumps(report, indent=1, ensure_ascii=False) + '\n'
+    written = [p.name for p, content in ((out / 'coverage.json', text), (out / 'index.html', render_html(report)))
+               if _write_if_changed(p, content)]
+
+    if args.json:
+        sys.stdout.write(text)
+        return 0
+    for locale, c in report['arb'].items():
+        p = report['pages'][locale]
+        print(f"{locale}: strings {c['coverage'] * 100:5.1f}% "
+              f"({c['untranslated']} untranslated, {c['stale']} stale, {c['missing']} missing) | "
+              f"pages {p['coverage'] * 100:5.1f}% ({p['stale']} stale, {p['missing']} missing)")
+    for locale, files in report['progress'].items():
+        for d in files:
+            if d['listed_missing'] or d['unlisted']:
+                print(f"⚠️  {d['file']} ({locale}): {len(d['listed_missing'])} listed without a page, "
+                      f"{len(d['unlisted'])} pages not listed")
+    print(f"\n📝 {', '.join(written) or 'no changes'} in {out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Streaming lead ingestion pipeline:
+parse -> normalize -> filter -> dedupe -> validate -> sink, with per-stage counts.
+
+Usage:
+    python3 lead_pipeline.py --sql ~/Downloads/kwphrase1.sql ~/Downloads/kwphrase2.sql
+    python3 lead_pipeline.py --csv email-list1.csv email-list2.csv --buckets gmail yahoo --split --no-validate
+    python3 lead_pipeline.py --csv new.csv --history --no-validate --out new_clean.csv
+"""
+import argparse
+import csv
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+
+from extract_gmail_yahoo import BUCKET_RULES, classify_domain, is_valid_name
+from script_loader import load_script
+
+BASE_DIR = Path('/Users/sscott/tbp/emails')
+FIELDNAMES = ['first_name', 'last_name', 'email']
+WRITE_BUFFER = 1024 * 1024
+
+# Column aliases accepted by the CSV parser (lowercased header -> field)
+COLUMN_ALIASES = {
+    'first_name': 'first_name', 'firstname': 'first_name', 'first': 'first_name',
+    'last_name': 'last_name', 'lastname': 'last_name', 'last': 'last_name',
+    'email': 'email', 'email_address': 'email', 'e-mail': 'email',
+}
+
+
+# ---------- Stage framework ----------
+class StageStats:
+    """Per-stage counters and timing."""
+
+    def __init__(self, name):
+        self.name = name
+        self.records_in = 0
+        self.records_out = 0
+        self.rejected = Counter()
+        self.elapsed = 0.0        # time inside this stage and everything upstream
+        self.upstream_time = 0.0  # time spent waiting on upstream stages
+
+    @property
+    def self_time(self):
+        return max(0.0, self.elapsed - self.upstream_time)
+
+    def throughput(self):
+        """Records processed per second of this stage's own time."""
+        count = self.records_in or self.records_out
+        return count / self.self_time if self.self_time > 0 else float('inf')
+
+
+class Stage(ABC):
+    """Base pipeline stage: subclasses implement process() as a generator."""
+
+    name = "stage"
+
+    def __init__(self):
+        self.stats = StageStats(self.name)
+
+    def reject(self, reason):
+        self.stats.rejected[reason] += 1
+
+    @abstractmethod
+    def process(self, records):
+        """Yield the records that pass this stage."""
+
+    def _pull(self, upstream):
+        stats = self.stats
+        it = iter(upstream)
+        while True:
+            t = time.perf_counter()
+            try:
+                record = next(it)
+            except StopIteration:
+                stats.upstream_time += time.perf_counter() - t
+                return
+            stats.upstream_time += time.perf_counter() - t
+            stats.records_in += 1
+            yield record
+
+    def __call__(self, upstream):
+        stats = self.stats
+        t = time.perf_counter()
+        for record in self.process(self._pull(upstream)):
+            stats.elapsed += time.perf_counter() - t
+            stats.records_out += 1
+            yield record
+            t = time.perf_counter()
+        stats.elapsed += time.perf_counter() - t
+
+
+class SourceStage(Stage):
+    """First stage: produces records, so it has no upstream."""
+
+    def __call__(self, upstream=None):
+        return super().__call__(())
+
+
+# ---------- Stages ----------
+class ParseStage(SourceStage):
+    """Read raw records from CSV lists and MySQL dumps."""
+
+    name = "parse"
+
+    def __init__(self, csv_files=(), sql_files=()):
+        super().__init__()
+        self.csv_files = [Path(p) for p in csv_files]
+        self.sql_files = [Path(p) for p in sql_files]
+
+    def process(self, _records):
+        for path in self.csv_files:
+            if not path.exists():
+                print(f"Warning: {path} not found")
+                continue
+            yield from self._parse_csv(path)
+
+        if self.sql_files:
+            sql_leads = load_script('extract-sql-leads.py')
+            for path in self.sql_files:
+                if not path.exists():
+                    print(f"Warning: {path} not found")
+                    continue
+                for first_name, last_name, email in sql_leads.iter_values_from_sql(path):
+                    yield {"first_name": first_name, "last_name": last_name,
+                           "email": email, "source": path.name}
+
+    def _parse_csv(self, path):
+        with open(path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+            reader = csv.reader(f)
+            first = next(reader, None)
+            if first is None:
+                return
+            mapping = {i: COLUMN_ALIASES[h.strip().lower()]
+                       for i, h in enumerate(first) if h.strip().lower() in COLUMN_ALIASES}
+            if 'email' not in mapping.values():
+                # Headerless first,last,email list: the first line is data
+                mapping = {0: 'first_name', 1: 'last_name', 2: 'email'}
+                rows = _chain_first(first, reader)
+            else:
+                rows = reader
+            width = max(mapping) + 1
+            for row in rows:
+                if len(row) < width:
+                    self.reject("short_row")
+                    continue
+                record = {field: row[i] for i, field in mapping.items()}
+                record.setdefault("first_name", "")
+                record.setdefault("last_name", "")
+                record["source"] = path.name
+                yield record
+
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
+
+
+class NormalizeStage(Stage):
+    """Trim names, lowercase emails, attach the email domain."""
+
+    name = "normalize"
+
+    def process(self, records):
+        for record in records:
+            record["first_name"] = (record.get("first_name") or "").strip()
+            record["last_name"] = (record.get("last_name") or "").strip()
+            email = (record.get("email") or "").strip().lower()
+            record["email"] = email
+            record["domain"] = email.rpartition('@')[2]
+            yield record
+
+
+class FilterStage(Stage):
+    """Drop bad names/emails and (optionally) domains outside the wanted buckets."""
+
+    name = "filter"
+
+    def __init__(self, buckets=None, require_last_name=True, max_email_length=100):
+        super().__init__()
+        self.buckets = set(buckets) if buckets else None
+        self.require_last_name = require_last_name
+        self.max_email_length = max_email_length
+
+    def process(self, records):
+        for record in records:
+            email = record["email"]
+            local, at, domain = email.rpartition('@')
+            if not (local and at and '.' in domain) or ' ' in email or len(email) >= self.max_email_length:
+                self.reject("invalid_email")
+                continue
+            if not is_valid_name(record["first_name"]):
+                self.reject("invalid_first_name")
+                continue
+            if self.require_last_name and not is_valid_name(record["last_name"]):
+                self.reject("invalid_last_name")
+                continue
+            record["bucket"] = classify_domain(domain, BUCKET_RULES)
+            if self.buckets is not None and record["bucket"] not in self.buckets:
+                self.reject("bucket_excluded")
+                continue
+            yield record
+
+
+class DedupeStage(Stage):
+    """Keep the first occurrence of each email; optionally screen against the
+    cross-list history from email_bloom.py."""
+
+    name = "dedupe"
+
+    def __init__(self, history=None):
+        super().__init__()
+        self.history = history
+        self.seen = set()
+
+    def process(self, records):
+        seen = self.seen
+        history = self.history
+        for record in records:
+            email = record["email"]
+            if email in seen:
+                self.reject("duplicate_in_run")
+                continue
+            seen.add(email)
+            if history is not None and history.contains(email):
+                self.reject("known_in_history")
+                continue
+            yield record
+
+
+class ValidateStage(Stage):
+    """Batch-validate emails through validate-emails.py's API client.
+
+    Records are held only until a batch of BATCH_SIZE fills, so memory stays
+    bounded by the batch, not the list.
+    """
+
+    name = "validate"
+
+    def __init__(self, batch_size=None, delay=None):
+        super().__init__()
+        self.api = load_script('validate-emails.py')
+        self.batch_size = batch_size or self.api.BATCH_SIZE
+        self.delay = self.api.DELAY_BETWEEN_BATCHES if delay is None else delay
+        self.unvalidated = 0
+
+    def process(self, records):
+        batch = []
+        first = True
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                if not first:
+                    time.sleep(self.delay)
+                first = False
+                yield from self._validate(batch)
+                batch = []
+        if batch:
+            if not first:
+                time.sleep(self.delay)
+            yield from self._validate(batch)
+
+    def _validate(self, batch):
+        results = self.api.validate_batch([r["email"] for r in batch])
+        if results is None:
+            # API failed - keep the batch to avoid data loss (same as validate-emails.py)
+            self.unvalidated += len(batch)
+            yield from batch
+            return
+        status_by_email = {
+            (r.get('email') or '').lower(): r.get('status', 'UNKNOWN')
+            for r in results.get('results', [])
+        }
+        for record in batch:
+            status = status_by_email.get(record["email"], 'UNKNOWN')
+            if status == 'VALID':
+                yield record
+            else:
+                self.reject(status.lower())
+
+
+class SinkStage(Stage):
+    """Write records to one CSV, or one CSV per bucket when split is set."""
+
+    name = "sink"
+
+    def __init__(self, output=None, split_dir=None, fieldnames=FIELDNAMES):
+        super().__init__()
+        self.output = Path(output) if output else None
+        self.split_dir = Path(split_dir) if split_dir else None
+        self.fieldnames = fieldnames
+        self.outputs = {}
+
+    def _writer(self, key, path):
+        if key not in self.outputs:
+            f = open(path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER)
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            self.outputs[key] = (f, writer, path)
+        return self.outputs[key][1]
+
+    def process(self, records):
+        outputs_by_bucket = {r["name"]: r["output"] for r in BUCKET_RULES}
+        try:
+            for record in records:
+                if self.split_dir is not None:
+                    bucket = record.get("bucket") or "corporate"
+                    writer = self._writer(bucket, self.split_dir / outputs_by_bucket[bucket])
+                else:
+                    writer = self._writer(None, self.output)
+                writer.writerow(record)
+                yield record
+        finally:
+            for f, _, _ in self.outputs.values():
+                f.close()
+
+
+# ---------- Runner ----------
+def run_pipeline(stages):
+    """Chain stages lazily and drain the last one; returns wall time in seconds."""
+    start = time.perf_counter()
+    stream = stages[0]()
+    for stage in stages[1:]:
+        stream = stage(stream)
+    for _ in stream:
+        pass
+    return time.perf_counter() - start
+
+
+def print_report(stages, wall):
+    print("\n" + "=" * 72)
+    print("PIPELINE SUMMARY")
+    print("=" * 72)
+    print(f"{'stage':<10} {'in':>9} {'out':>9} {'rejected':>9} {'self s':>8} {'rec/s':>11}")
+    for stage in stages:
+        s = stage.stats
+        rate = s.throughput()
+        rate_str = f"{rate:,.0f}" if rate != float('inf') else "-"
+        print(f"{s.name:<10} {s.records_in:>9} {s.records_out:>9} "
+              f"{sum(s.rejected.values()):>9} {s.self_time:>8.2f} {rate_str:>11}")
+        for reason, count in sorted(s.rejected.items(), key=lambda x: -x[1]):
+            print(f"{'':<10}   - {reason}: {count}")
+    print(f"\nWall time: {wall:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming lead ingestion pipeline")
+    parser.add_argument('--csv', nargs='*', default=[], help="CSV lead lists")
+    parser.add_argument('--sql', nargs='*', default=[], help="MySQL dump files")
+    parser.add_argument('--buckets', nargs='+', choices=[r["name"] for r in BUCKET_RULES],
+                        help="Keep only these domain buckets")
+    parser.add_argument('--allow-missing-last-name', action='store_true',
+                        help="Accept rows without a last name (SQL dumps often lack one)")
+    parser.add_argument('--history', action='store_true',
+                        help="Also drop emails already in the email_bloom.py history")
+    parser.add_argument('--no-validate', action='store_true', help="Skip the API validation stage")
+    parser.add_argument('--out', default=str(BASE_DIR / 'tbpleads_validated.csv'),
+                        help="Output CSV (ignored with --split)")
+    parser.add_argument('--split', metavar='DIR', nargs='?', const=str(BASE_DIR),
+                        help="Write one CSV per domain bucket into DIR")
+    args = parser.parse_args()
+
+    if not args.csv and not args.sql:
+        parser.error("give at least one --csv or --sql input")
+
+    history = None
+    if args.history:
+        from email_bloom import EmailHistory
+        history = EmailHistory()
+
+    stages = [
+        ParseStage(args.csv, args.sql),
+        NormalizeStage(),
+        FilterStage(args.buckets, require_last_name=not args.allow_missing_last_name),
+        DedupeStage(history),
+    ]
+    if not args.no_validate:
+        stages.append(ValidateStage())
+    stages.append(SinkStage(args.out, args.split))
+
+    try:
+        wall = run_pipeline(stages)
+    finally:
+        if history is not None:
+            history.close()
+
+    print_report(stages, wall)
+    if not args.no_validate and stages[-2].unvalidated:
+        print(f"Kept without validation (API failures): {stages[-2].unvalidated}")
+    sink = stages[-1]
+    for _, _, path in sink.outputs.values():
+        print(f"Written to: {path}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,6 +21,8 @@ import requests
 from google import genai
 from google.genai import types
 
+from lead_store import load_emails
+
 # ===== Config =====
 MODEL = os.getenv("GENAI_MODEL", "gemini-2.5-flash")
 PROMPT_TEMPLATE_FILENAME = "leads_prompt_template.txt"   # preferred (contains {{BASE_URLS}})
@@ -265,8 +267,9 @@ def append_outputs(verified_df: pd.DataFrame, audit_df: pd.DataFrame) -> None:
 
     # Cross-file dedupe by email
     if OUT_FILE.exists() and not verified_df.empty:
-        existing = pd.read_csv(OUT_FILE)
-        mask = ~verified_df["email"].str.lower().isin(existing["email"].astype(str).str.lower())
+        # Only the email column is loaded (from my_leads.parquet when present)
+        existing = load_emails(OUT_FILE)
+        mask = ~verified_df["email"].str.lower().isin(existing)
         verified_df = verified_df[mask].copy()
 
     if not verified_df.empty:
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Optional Parquet copies of lead CSVs, with column-selective readers.
+Without pyarrow every reader falls back to the CSV.
+
+Usage:
+    python3 lead_store.py to-parquet ~/tbp/leads/my_leads.csv ../preintake/law-firms-directory.csv
+    python3 lead_store.py to-csv ~/tbp/leads/my_leads.parquet
+    python3 lead_store.py emails ../preintake/law-firms-directory-with-emails.csv --where extraction_status=success
+"""
+import argparse
+import csv
+import os
+import sys
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # CSV-only mode
+    pa = pa_csv = pq = None
+
+# Known list schemas (column order as written by the producing script)
+SCHEMAS = {
+    "leads": ["first_name", "last_name", "email"],
+    "tbpleads": ["firstName", "lastName", "email"],
+    "my_leads": ["first_name last_name", "email", "source_url"],
+    "law_firms": ["firm_name", "website", "practice_area", "state",
+                  "scraped_date", "extraction_attempted", "extraction_status"],
+    "law_firms_emails": ["firm_name", "website", "practice_area", "state",
+                         "scraped_date", "extraction_attempted", "extraction_status",
+                         "email", "all_emails"],
+}
+
+PARQUET_COMPRESSION = "zstd"
+FILTER_OPS = {
+    "=": lambda v, x: v == x,
+    "==": lambda v, x: v == x,
+    "!=": lambda v, x: v != x,
+    "in": lambda v, x: v in x,
+    "not in": lambda v, x: v not in x,
+}
+
+
+def require_pyarrow():
+    if pq is None:
+        raise RuntimeError("pyarrow is required for Parquet storage (pip install pyarrow)")
+
+
+def parquet_path_for(path):
+    return Path(path).with_suffix(".parquet")
+
+
+def csv_path_for(path):
+    return Path(path).with_suffix(".csv")
+
+
+def resolve(path):
+    """Pick the fastest up-to-date representation of a list.
+
+    A .csv path is served from its sibling .parquet when pyarrow is installed
+    and the Parquet copy is at least as new as the CSV.
+    """
+    path = Path(path)
+    if path.suffix == ".csv" and pq is not None:
+        parquet = parquet_path_for(path)
+        if parquet.exists() and (not path.exists() or
+                                 parquet.stat().st_mtime >= path.stat().st_mtime):
+            return parquet
+    return path
+
+
+def _match(row, filters):
+    return all(FILTER_OPS[op](row.get(col, ""), value) for col, op, value in filters)
+
+
+def iter_rows(path, columns=None, filters=None):
+    """Yield dict rows, optionally projected to `columns` and filtered.
+
+    filters uses the pyarrow DNF-lite form: [(column, op, value), ...] with op
+    one of =, !=, in, not in. On Parquet they are pushed down into the reader.
+    """
+    path = resolve(path)
+    filters = list(filters or [])
+    if path.suffix == ".parquet":
+        require_pyarrow()
+        table = pq.read_table(path, columns=columns, filters=filters or None)
+        yield from table.to_pylist()
+        return
+
+    with open(path, "r", encoding="utf-8", errors="ignore", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            if filters and not _match(row, filters):
+                continue
+            yield {c: row.get(c, "") for c in columns} if columns else row
+
+
+def load_emails(path, column="email", filters=None):
+    """Return the set of lowercased emails in a list, reading only that column."""
+    path = resolve(path)
+    if not path.exists():
+        return set()
+    if path.suffix == ".parquet":
+        require_pyarrow()
+        table = pq.read_table(path, columns=[column], filters=filters or None)
+        return {e.strip().lower() for e in table.column(column).to_pylist() if e}
+    return {row[column].strip().lower()
+            for row in iter_rows(path, filters=filters) if row.get(column)}
+
+
+def write_rows(path, rows, fieldnames):
+    """Write rows to CSV or Parquet depending on the path suffix."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        require_pyarrow()
+        rows = list(rows)
+        schema = pa.schema([(name, pa.string()) for name in fieldnames])
+        table = pa.Table.from_pylist(
+            [{name: _as_str(row.get(name)) for name in fieldnames} for row in rows],
+            schema=schema,
+        )
+        pq.write_table(table, path, compression=PARQUET_COMPRESSION)
+        return len(rows)
+
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _as_str(value):
+    return "" if value is None else str(value)
+
+
+def csv_to_parquet(csv_path, parquet_path=None):
+    """Convert a CSV list to Parquet; every column is stored as a string."""
+    require_pyarrow()
+    csv_path = Path(csv_path)
+    parquet_path = Path(parquet_path) if parquet_path else parquet_path_for(csv_path)
+    with open(csv_path, "r", encoding="utf-8", errors="ignore", newline="") as f:
+        header = next(csv.reader(f), [])
+    table = pa_csv.read_csv(
+        csv_path,
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=False,
+        ),
+    )
+    pq.write_table(table, parquet_path, compression=PARQUET_COMPRESSION)
+    return parquet_path, table.num_rows
+
+
+def parquet_to_csv(parquet_path, csv_path=None):
+    """Convert a Parquet list back to CSV with the original column order."""
+    require_pyarrow()
+    parquet_path = Path(parquet_path)
+    csv_path = Path(csv_path) if csv_path else csv_path_for(parquet_path)
+    table = pq.read_table(parquet_path)
+    count = write_rows(csv_path, table.to_pylist(), table.column_names)
+    # Keep the Parquet copy authoritative for resolve()
+    os.utime(parquet_path)
+    return csv_path, count
+
+
+def parse_where(items):
+    filters = []
+    for item in items or []:
+        if "!=" in item:
+            col, value = item.split("!=", 1)
+            filters.append((col, "!=", value))
+        else:
+            col, value = item.split("=", 1)
+            filters.append((col, "=", value))
+    return filters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parquet storage for lead lists")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_pq = sub.add_parser("to-parquet", help="Write a .parquet copy next to each CSV")
+    p_pq.add_argument("files", nargs="+")
+
+    p_csv = sub.add_parser("to-csv", help="Write a .csv copy next to each Parquet file")
+    p_csv.add_argument("files", nargs="+")
+
+    p_emails = sub.add_parser("emails", help="Count unique emails (email column only)")
+    p_emails.add_argument("file")
+    p_emails.add_argument("--column", default="email")
+    p_emails.add_argument("--where", action="append", metavar="COL=VALUE",
+                          help="Filter rows (COL=VALUE or COL!=VALUE), repeatable")
+
+    args = parser.parse_args()
+
+    if args.command == "to-parquet":
+        for file_path in args.files:
+            out, rows = csv_to_parquet(file_path)
+            before = os.path.getsize(file_path)
+            print(f"{file_path} -> {out} ({rows} rows, {before:,} -> {out.stat().st_size:,} bytes)")
+    elif args.command == "to-csv":
+        for file_path in args.files:
+            out, rows = parquet_to_csv(file_path)
+            print(f"{file_path} -> {out} ({rows} rows)")
+    else:
+        source = resolve(args.file)
+        emails = load_emails(args.file, args.column, parse_where(args.where))
+        print(f"{len(emails)} unique emails in {source}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
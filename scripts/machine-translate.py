@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Machine-translate new app strings and new site pages through the translation memory.
+
+Usage:
+    python3 machine-translate.py arb de es pt --dry-run
+    python3 machine-translate.py arb de --apply
+    python3 machine-translate.py html ../web/blog/new-post.html --locales es pt de
+    python3 machine-translate.py html --subdir blog --dry-run
+"""
+import argparse
+import re
+import sys
+from datetime import date
+from pathlib import Path
+
+from arb_fingerprints import FingerprintStore
+from arb_files import TEMPLATE_LOCALE, arb_locales, arb_path, load_arb, load_template, order_arb, write_arb
+from arb_merge import PACK_DIR, Pack, merge
+from script_loader import REPO_ROOT
+from site_index import slug_url
+from site_pages import SITE_DIRS, find_pages, page_slug, rel_path
+from site_txn import Transaction, write_text
+import site_dom
+import site_text
+from translation_memory import (BACKENDS, DEFAULT_BATCH_SIZE, DEFAULT_WORKERS, TranslationMemory,
+                                get_backend, translate)
+
+LOCALE_DIRS = {locale: site for site, locale in SITE_DIRS.items()}
+HTML_LANG_RE = re.compile(r'(<html\b[^>]*\blang=")[^"]*(")')
+
+
+def cmd_arb(args, tm, backend):
+    template = load_template().data
+    locales = args.locales or [loc for loc in arb_locales() if loc != TEMPLATE_LOCALE]
+    status = FingerprintStore().refresh(locales, record=False)
+    with Transaction('machine-translate') as txn:
+        for locale in locales:
+            s = status[locale]
+            keys = s.missing + s.stale + s.untranslated
+            if not keys:
+                print(f"{locale}: nothing to translate")
+                continue
+            translated = translate(tm, [template[k] for k in keys], locale, backend,
+                                   args.batch_size, args.workers)
+            pack = {'@@locale': locale}
+            pack.update((k, translated[template[k]]) for k in keys if template[k] in translated)
+            if args.dry_run:
+                print(f"   would write a pack with {len(keys)} key(s), {len(pack) - 1} from memory")
+                continue
+            if len(pack) == 1:
+                continue
+            pack_file = PACK_DIR / locale / f"{date.today().isoformat()}-machine.json"
+            pack_file.parent.mkdir(parents=True, exist_ok=True)
+            write_arb(pack_file, order_arb(pack, template))
+            print(f"   📝 {rel_path(pack_file)}: {len(pack) - 1} key(s)")
+            if args.apply:
+                entries = {k: v for k, v in pack.items() if k != '@@locale'}
+                merged, _ = merge(load_arb(locale).data, [Pack(pack_file, locale, entries)], template)
+                if write_arb(arb_path(locale), order_arb(merged, template)):
+                    print(f"   ✅ Applied to {arb_path(locale).name}")
+    if txn.snapshot_id:
+        print(f"\nUndo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
+    return 0
+
+
+def localize_page(content, slug, locale, segments, translated):
+    """English page source -> the locale's copy."""
+    doc = site_dom.parse(content)
+    site_text.replace_segments(doc, {seg: translated[seg.text] for seg in segments if seg.text in translated})
+    page = doc.serialize()
+    page = HTML_LANG_RE.sub(lambda m: f"{m.group(1)}{locale}{m.group(2)}", page, count=1)
+    # The page's own URL (canonical, og:url, JSON-LD), but not the hreflang links
+    own_url = re.compile(r'<link rel="alternate" hreflang=[^>]*>|"' + re.escape(slug_url('en', slug)) + '"')
+    return own_url.sub(lambda m: m.group(0) if m.group(0).startswith('<') else f'"{slug_url(locale, slug)}"', page)
+
+
+def cmd_html(args, tm, backend):
+    if args.pages:
+        pages = [Path(p).resolve() for p in args.pages]
+    else:
+        pages = find_pages(REPO_ROOT, sites=['web'], subdir=args.subdir)
+    locales = args.locales or [loc for loc in LOCALE_DIRS if loc != 'en']
+
+    sources = {}
+    for page in pages:
+        content = page.read_text(encoding='utf-8')
+        sources[page] = (content, site_text.page_segments(content))
+
+    with Transaction('machine-translate') as txn:
+        for locale in locales:
+            todo = {}
+            for page, (content, segments) in sources.items():
+                slug = page_slug(page)
+                target = REPO_ROOT / LOCALE_DIRS[locale] / slug
+                if target.exists() and not args.force:
+                    continue
+                todo[page] = target
+            print(f"{locale}: {len(todo)} page(s) to create")
+            if not todo:
+                continue
+            texts = [seg.text for page in todo for seg in sources[page][1]]
+            translated = translate(tm, texts, locale, backend, args.batch_size, args.workers)
+            for page, target in todo.items():
+                content, segments = sources[page]
+                missing = sum(1 for seg in segments if seg.text not in translated)
+                if args.dry_run:
+                    print(f"   would create {rel_path(target)} ({missing} segment(s) not in memory)")
+                    continue
+                if missing:
+                    print(f"   ⚠️  {rel_path(page)}: {missing} segment(s) untranslated, skipped")
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                write_text(target, localize_page(content, page_slug(page), locale, segments, translated))
+                print(f"   📝 {rel_path(target)}")
+    if txn.snapshot_id:
+        print(f"\nUndo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Machine-translate ARB keys and site pages via the translation memory')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_arb = sub.add_parser('arb', help='Translate missing/stale/untranslated ARB keys into a pack')
+    p_arb.add_argument('locales', nargs='*', help='Locales (default: all but the template)')
+    p_arb.add_argument('--apply', action='store_true', help='Merge the pack into the ARB file')
+    p_html = sub.add_parser('html', help='Create locale copies of English pages')
+    p_html.add_argument('pages', nargs='*', help='English pages (default: all under web/, see --subdir)')
+    p_html.add_argument('--subdir', help="Only pages under this subdirectory of web/ (e.g. 'blog')")
+    p_html.add_argument('--locales', nargs='+', choices=[loc for loc in LOCALE_DIRS if loc != 'en'])
+    p_html.add_argument('--force', action='store_true', help='Replace existing locale pages too')
+    for p in (p_arb, p_html):
+        p.add_argument('--backend', choices=list(BACKENDS), default='anthropic')
+        p.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        p.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent backend requests')
+        p.add_argument('--dry-run', action='store_true',
+                       help='Count memory misses; call no backend and write no files')
+    args = parser.parse_args()
+    # Test backends ('stub') return placeholder text that must not reach packs or pages
+    if not args.dry_run and not BACKENDS[args.backend].persistent:
+        parser.error(f"--backend {args.backend} is for tests; use it with --dry-run only")
+
+    backend = None if args.dry_run else get_backend(args.backend)
+    with TranslationMemory() as tm:
+        if args.command == 'arb':
+            return cmd_arb(args, tm, backend)
+        return cmd_html(args, tm, backend)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
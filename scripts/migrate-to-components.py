@@ -12,6 +12,7 @@ Usage:
     python3 migrate-to-components.py --dry-run     # Preview changes
     python3 migrate-to-components.py               # Apply changes
     python3 migrate-to-components.py --file path   # Process single file
+    python3 migrate-to-components.py --backend dom # Parse each page once (site_dom.py)
 """
 
 import os
@@ -20,6 +21,11 @@ import sys
 import argparse
 from pathlib import Path
 
+from site_parallel import add_jobs_argument, run_files
+from site_txn import Transaction, write_text
+import site_dom
+import site_patterns as patterns
+
 # Directories to process (relative to project root)
 DIRS_TO_PROCESS = [
     'web',
@@ -41,19 +47,9 @@ SKIP_FILES = [
 # Pattern to find the components.js script tag
 COMPONENTS_SCRIPT = '<script src="/js/components.js"></script>'
 
-# Pattern to match header block (with variations)
-HEADER_PATTERNS = [
-    # Pattern for standard header with invite bar before it
-    r'(\s*<!-- Top Invite Bar.*?-->\s*<div id="top-invite-bar"[^>]*></div>\s*)?(\s*<!-- Header -->)?\s*<header class="header">.*?</header>',
-    # Pattern for header without invite bar
-    r'(\s*<!-- Header -->)?\s*<header class="header">.*?</header>',
-]
-
-# Pattern to match footer block
-FOOTER_PATTERN = r'(\s*<!-- Footer.*?-->)?\s*<footer class="footer">.*?</footer>'
-
-# Pattern to match currentYear script line
-CURRENT_YEAR_PATTERN = r"\s*document\.getElementById\('currentYear'\)\.textContent = new Date\(\)\.getFullYear\(\);"
+# The header/footer/currentYear blocks (with any leading invite bar, comment
+# and whitespace) are located by the anchored helpers in site_patterns.py:
+# find_header_block(), find_footer_block(), find_current_year_line()
 
 def add_components_script(content):
     """Add components.js script tag to head if not already present."""
@@ -98,42 +94,105 @@ def add_components_script(content):
 
 def replace_header(content):
     """Replace hardcoded header with placeholder div."""
-    # Try each pattern
-    for pattern in HEADER_PATTERNS:
-        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            replacement = '\n    <!-- Header (rendered by components.js) -->\n    <div id="tbp-header"></div>\n'
-            new_content = content[:match.start()] + replacement + content[match.end():]
-            return new_content, True
+    span = patterns.find_header_block(content)
+    if span:
+        replacement = '\n    <!-- Header (rendered by components.js) -->\n    <div id="tbp-header"></div>\n'
+        new_content = content[:span[0]] + replacement + content[span[1]:]
+        return new_content, True
 
     return content, False
 
 def replace_footer(content):
     """Replace hardcoded footer with placeholder div."""
-    match = re.search(FOOTER_PATTERN, content, re.DOTALL | re.IGNORECASE)
-    if match:
+    span = patterns.find_footer_block(content)
+    if span:
         replacement = '\n    <!-- Footer (rendered by components.js) -->\n    <div id="tbp-footer"></div>\n'
-        new_content = content[:match.start()] + replacement + content[match.end():]
+        new_content = content[:span[0]] + replacement + content[span[1]:]
         return new_content, True
 
     return content, False
 
 def remove_current_year_script(content):
     """Remove the currentYear script line since components.js handles it."""
-    match = re.search(CURRENT_YEAR_PATTERN, content)
-    if match:
+    span = patterns.find_current_year_line(content)
+    if span:
         # Remove the line
-        new_content = content[:match.start()] + content[match.end():]
+        new_content = content[:span[0]] + content[span[1]:]
         return new_content, True
 
     return content, False
 
-def process_file(filepath, dry_run=False):
-    """Process a single HTML file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        original_content = f.read()
+HEADER_PLACEHOLDER = '\n    <!-- Header (rendered by components.js) -->\n    <div id="tbp-header"></div>\n'
+FOOTER_PLACEHOLDER = '\n    <!-- Footer (rendered by components.js) -->\n    <div id="tbp-footer"></div>\n'
+CURRENT_YEAR_LINE = "document.getElementById('currentYear').textContent = new Date().getFullYear();"
+
+def _leading_block_start(doc, node, comment_prefix):
+    """Start of `node` widened over a directly preceding comment and whitespace."""
+    start = node.start
+    for sibling in node.previous_siblings():
+        if sibling.tag == '#text' and not sibling.data.strip():
+            continue
+        if sibling.tag == '#comment' and sibling.data.strip().lower().startswith(comment_prefix.lower()):
+            start = sibling.start
+        break
+    return patterns.extend_left(doc.source, start)
+
+def _header_span(doc, header):
+    """Header plus its <!-- Header --> comment and the top invite bar before it."""
+    start = _leading_block_start(doc, header, 'Header')
+    siblings = [n for n in header.previous_siblings()
+                if n.start < start and not (n.tag == '#text' and not n.data.strip())]
+    if (len(siblings) >= 2 and siblings[0].tag == 'div' and siblings[0].id == 'top-invite-bar'
+            and siblings[1].tag == '#comment' and siblings[1].data.strip().lower().startswith('top invite bar')):
+        start = patterns.extend_left(doc.source, siblings[1].start)
+    return start, header.end
+
+def migrate_dom(content):
+    """All migration steps against one parsed tree instead of one regex scan each."""
+    doc = site_dom.parse(content)
+    changes = []
+    removed = []
+
+    head = doc.select_one('head')
+    if COMPONENTS_SCRIPT not in content and head is not None and head.end > head.inner_end:
+        links = head.select('link[rel=stylesheet]')
+        if links:
+            doc.insert_after(links[-1], '\n\n    <!-- Shared Header/Footer Components -->\n    ' + COMPONENTS_SCRIPT)
+        else:
+            doc.replace_span(head.inner_end, head.inner_end,
+                             '\n    <!-- Shared Header/Footer Components -->\n    ' + COMPONENTS_SCRIPT + '\n')
+        changes.append('Added components.js script')
+
+    header = doc.select_one('header.header')
+    if header is not None:
+        start, end = _header_span(doc, header)
+        doc.replace_span(start, end, HEADER_PLACEHOLDER)
+        removed.append((start, end))
+        changes.append('Replaced header with placeholder')
+
+    footer = doc.select_one('footer.footer')
+    if footer is not None:
+        start = _leading_block_start(doc, footer, 'Footer')
+        doc.replace_span(start, footer.end, FOOTER_PLACEHOLDER)
+        removed.append((start, footer.end))
+        changes.append('Replaced footer with placeholder')
+
+    for script in doc.select('script'):
+        if any(start <= script.start < end for start, end in removed):
+            continue
+        index = content.find(CURRENT_YEAR_LINE, script.inner_start, script.inner_end)
+        if index != -1:
+            doc.replace_span(patterns.extend_left(content, index), index + len(CURRENT_YEAR_LINE), '')
+            changes.append('Removed currentYear script')
+            break
+
+    return doc.serialize(), changes
+
+def migrate_content(content, backend='regex'):
+    """Apply the migration steps to page content; returns (content, changes)."""
+    if backend == 'dom':
+        return migrate_dom(content)
 
-    content = original_content
     changes = []
 
     # Step 1: Add components.js script
@@ -156,15 +215,27 @@ def process_file(filepath, dry_run=False):
     if changed:
         changes.append('Removed currentYear script')
 
+    return content, changes
+
+def process_file(filepath, dry_run=False, backend='regex'):
+    """Process a single HTML file."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        original_content = f.read()
+
+    content, changes = migrate_content(original_content, backend)
+
     if not changes:
         return None, []
 
     if not dry_run:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text(filepath, content)
 
     return content, changes
 
+def process_file_changes(filepath, dry_run=False, backend='regex'):
+    """process_file() without the page content, for cheap worker results."""
+    return process_file(filepath, dry_run=dry_run, backend=backend)[1]
+
 def find_html_files(base_dir, subdirs):
     """Find all HTML files in specified directories."""
     files = []
@@ -186,6 +257,9 @@ def main():
     parser.add_argument('--file', type=str, help='Process a single file')
     parser.add_argument('--include-index', action='store_true', help='Include index.html files (normally skipped)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed output')
+    parser.add_argument('--backend', choices=['regex', 'dom'], default='regex',
+                        help='regex: one scan per step; dom: parse each page once (default: regex)')
+    add_jobs_argument(parser)
     args = parser.parse_args()
 
     # Determine base directory
@@ -214,11 +288,19 @@ def main():
     skipped = 0
     errors = 0
 
-    for filepath in sorted(files_to_process):
+    with Transaction('migrate-to-components') as txn:
+        results = run_files(process_file_changes, sorted(files_to_process), args.jobs,
+                            kwargs={'dry_run': args.dry_run, 'backend': args.backend})
+
+    for result in results:
+        filepath = result.item
         rel_path = os.path.relpath(filepath, base_dir)
 
-        try:
-            content, changes = process_file(filepath, dry_run=args.dry_run)
+        if result.error:
+            errors += 1
+            print(f"ERROR processing {rel_path}: {result.error}")
+        else:
+            changes = result.value
 
             if changes:
                 processed += 1
@@ -230,9 +312,6 @@ def main():
                 skipped += 1
                 if args.verbose:
                     print(f"Skipped (no changes needed): {rel_path}")
-        except Exception as e:
-            errors += 1
-            print(f"ERROR processing {rel_path}: {e}")
 
     print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Summary:")
     print(f"  Processed: {processed}")
@@ -241,6 +320,8 @@ def main():
 
     if args.dry_run:
         print("\nRun without --dry-run to apply changes.")
+    elif txn.snapshot_id:
+        print(f"\nUndo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
 if __name__ == '__main__':
     main()
@@ -7,6 +7,8 @@ import os
 import re
 import glob
 
+from site_txn import Transaction, write_text
+
 BASE_PATH = "/Users/sscott/tbp"
 
 # Patterns for different versions of the author credit line
@@ -32,8 +34,7 @@ def remove_author_credit(file_path):
         content = re.sub(pattern, '', content)
 
     if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_text(file_path, content)
         return True
     return False
 
@@ -49,24 +50,27 @@ def main():
 
     total_fixed = 0
 
-    for dir_name in directories:
-        dir_path = os.path.join(BASE_PATH, dir_name)
-        if not os.path.exists(dir_path):
-            print(f"Directory not found: {dir_path}")
-            continue
+    with Transaction('remove-author-credit') as txn:
+        for dir_name in directories:
+            dir_path = os.path.join(BASE_PATH, dir_name)
+            if not os.path.exists(dir_path):
+                print(f"Directory not found: {dir_path}")
+                continue
 
-        # Find all HTML files (including subdirectories like blog/)
-        html_files = glob.glob(os.path.join(dir_path, "**/*.html"), recursive=True)
-        print(f"\n{dir_name.upper()}: Found {len(html_files)} HTML files")
+            # Find all HTML files (including subdirectories like blog/)
+            html_files = glob.glob(os.path.join(dir_path, "**/*.html"), recursive=True)
+            print(f"\n{dir_name.upper()}: Found {len(html_files)} HTML files")
 
-        for html_file in html_files:
-            rel_path = os.path.relpath(html_file, BASE_PATH)
-            if remove_author_credit(html_file):
-                print(f"  Fixed: {rel_path}")
-                total_fixed += 1
+            for html_file in html_files:
+                rel_path = os.path.relpath(html_file, BASE_PATH)
+                if remove_author_credit(html_file):
+                    print(f"  Fixed: {rel_path}")
+                    total_fixed += 1
 
     print(f"\n{'='*50}")
     print(f"Total files fixed: {total_fixed}")
+    if txn.snapshot_id:
+        print(f"Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
 
 if __name__ == "__main__":
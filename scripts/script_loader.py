@@ -0,0 +1,32 @@
+"""
+Import helpers for the standalone scripts in this repo.
+
+Many scripts have hyphenated file names (validate-emails.py,
+migrate-to-components.py) or live in the repo root (update_company_pages.py),
+so they can't be imported with a plain import statement.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+
+def load_script(filename, directory=SCRIPT_DIR):
+    """Import a script file as a module (cached, so each file is loaded once)."""
+    path = Path(directory) / filename
+    name = path.stem.replace('-', '_')
+    module = sys.modules.get(name)
+    if module is not None and getattr(module, '__file__', None) == str(path):
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # A half-initialised module must not be returned by the next call
+        sys.modules.pop(name, None)
+        raise
+    return module
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Structural audit of every site page against scripts/data/site-audit-rules.json,
+with text, JSON and JUnit XML reports.
+
+Usage:
+    python3 site_audit.py                               # text report
+    python3 site_audit.py --jobs 0 --json audit.json --junit audit.xml
+    python3 site_audit.py --sites web-es --only canonical hreflang-self
+    python3 site_audit.py --list
+"""
+import argparse
+import fnmatch
+import json
+import re
+import sys
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import site_dom
+from script_loader import REPO_ROOT
+from site_pages import SITE_DIRS, find_pages, locale_of, page_slug, rel_path, site_of
+from site_parallel import add_jobs_argument, run_files
+
+RULES_FILE = REPO_ROOT / 'scripts' / 'data' / 'site-audit-rules.json'
+SEVERITIES = ('error', 'warning')
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+_config_cache = {}
+_combined_cache = {}
+
+
+def load_rules(rules_file=RULES_FILE):
+    """Parsed rule file (cached per process, so workers load it once).
+
+    A rule has an id, an optional description and severity, an optional
+    scope (pages / exclude globs, sites) and one of:
+
+        select + min/max          count of elements matching a CSS selector
+          attr + matches/one_of   each match's attribute fits a regex / value list
+          unique                  ... and no value repeats
+          json                    each match's text parses as JSON
+          text_contains           each match's text contains every string listed
+        when                      rule only applies if this selector matches
+        require_pattern           regex that must occur in the raw page
+        forbid_pattern            regex that must not occur
+
+    '{lang}', '{host}' and the other keys of the locale's entry in "locales"
+    are substituted in rule strings.
+    """
+    key = str(rules_file)
+    if key not in _config_cache:
+        with open(rules_file, encoding='utf-8') as f:
+            config = json.load(f)
+        ids = [r['id'] for r in config['rules']]
+        duplicates = {i for i in ids if ids.count(i) > 1}
+        if duplicates:
+            raise ValueError(f"Duplicate rule id(s): {', '.join(sorted(duplicates))}")
+        for rule in config['rules']:
+            if rule.get('severity', 'error') not in SEVERITIES:
+                raise ValueError(f"Rule {rule['id']}: severity must be one of {SEVERITIES}")
+        _config_cache[key] = config
+    return _config_cache[key]
+
+
+def _substitute(value, variables, regex=False):
+    """Fill {key} placeholders from the locale variables (regex-escaped in patterns)."""
+    if isinstance(value, list):
+        return [_substitute(v, variables, regex) for v in value]
+    if not isinstance(value, str):
+        return value
+    if _PLACEHOLDER_RE.fullmatch(value) and isinstance(variables.get(value[1:-1]), list):
+        return variables[value[1:-1]]
+
+    def fill(match):
+        if match.group(1) not in variables:
+            return match.group(0)
+        text = str(variables[match.group(1)])
+        return re.escape(text) if regex else text
+    return _PLACEHOLDER_RE.sub(fill, value)
+
+
+def rules_for_page(config, slug, locale, site, only=None):
+    """Rules applying to one page, with locale placeholders filled in."""
+    if any(fnmatch.fnmatch(slug, pattern) for pattern in config.get('exclude', [])):
+        return []
+    variables = dict(config.get('locales', {}).get(locale, {}), lang=locale)
+    rules = []
+    for rule in config['rules']:
+        if only and rule['id'] not in only:
+            continue
+        if 'sites' in rule and site not in rule['sites']:
+            continue
+        if 'pages' in rule and not any(fnmatch.fnmatch(slug, p) for p in rule['pages']):
+            continue
+        if any(fnmatch.fnmatch(slug, p) for p in rule.get('exclude', [])):
+            continue
+        rules.append({key: _substitute(value, variables, regex=key in ('matches', 'require_pattern',
+                                                                      'forbid_pattern'))
+                      for key, value in rule.items()})
+    return rules
+
+
+def _combined_pattern(patterns):
+    """One regex that reports, at each position, the first of `patterns` matching there."""
+    key = tuple(patterns)
+    if key not in _combined_cache:
+        alternation = '|'.join(f'(?P<p{i}>{p})' for i, p in enumerate(patterns))
+        _combined_cache[key] = (re.compile(f'(?=(?:{alternation}))', re.DOTALL),
+                                [re.compile(p, re.DOTALL) for p in patterns])
+    return _combined_cache[key]
+
+
+def scan_patterns(content, patterns):
+    """Set of indexes into `patterns` that occur in `content`, in one scan."""
+    if not patterns:
+        return set()
+    combined, singles = _combined_pattern(patterns)
+    found = set()
+    for match in combined.finditer(content):
+        pos = match.start()
+        found.add(int(match.lastgroup[1:]))
+        # The alternation reports one pattern per position; check the others here
+        for i, single in enumerate(singles):
+            if i not in found and single.match(content, pos):
+                found.add(i)
+        if len(found) == len(patterns):
+            break
+    return found
+
+
+def check_selector_rule(doc, rule):
+    """Failure messages for one select-based rule."""
+    if rule.get('when') and doc.select_one(rule['when']) is None:
+        return None  # not applicable
+    nodes = doc.select(rule['select'])
+    failures = []
+    if 'min' in rule and len(nodes) < rule['min']:
+        failures.append(f"expected at least {rule['min']} '{rule['select']}', found {len(nodes)}")
+    if 'max' in rule and len(nodes) > rule['max']:
+        failures.append(f"expected at most {rule['max']} '{rule['select']}', found {len(nodes)}")
+    attr = rule.get('attr')
+    if attr:
+        values = [n.attrs.get(attr, '') for n in nodes]
+        if 'matches' in rule:
+            pattern = re.compile(rule['matches'])
+            failures += [f"{attr}=\"{v}\" does not match {rule['matches']}"
+                         for v in values if not pattern.search(v)]
+        if 'one_of' in rule:
+            failures += [f"{attr}=\"{v}\" not one of {', '.join(rule['one_of'])}"
+                         for v in values if v not in rule['one_of']]
+        if rule.get('unique'):
+            repeated = sorted({v for v in values if values.count(v) > 1})
+            failures += [f"{attr}=\"{v}\" appears {values.count(v)} times" for v in repeated]
+    if rule.get('json'):
+        for n in nodes:
+            try:
+                json.loads(n.text)
+            except ValueError as e:
+                failures.append(f"invalid JSON at line {doc.source.count(chr(10), 0, n.start) + 1}: {e}")
+    for expected in rule.get('text_contains', []):
+        for n in nodes:
+            if expected not in n.text:
+                failures.append(f"missing text: {expected}")
+    return failures
+
+
+def audit_page(path, rules_file=RULES_FILE, only=None):
+    """Run every applicable rule on one page.
+
+    Returns {"path", "locale", "results": [{"rule", "severity", "passed",
+    "messages"}]}; rules that do not apply to the page are left out.
+    """
+    config = load_rules(rules_file)
+    locale = locale_of(path)
+    rules = rules_for_page(config, page_slug(path), locale, site_of(path), only)
+    report = {"path": rel_path(path), "locale": locale, "results": []}
+    if not rules:
+        return report
+
+    content = Path(path).read_text(encoding='utf-8')
+    doc = site_dom.parse(content) if any('select' in r for r in rules) else None
+    pattern_rules = [r for r in rules if 'require_pattern' in r or 'forbid_pattern' in r]
+    patterns = [r.get('require_pattern') or r['forbid_pattern'] for r in pattern_rules]
+    found = scan_patterns(content, patterns)
+
+    for rule in rules:
+        if 'select' in rule:
+            messages = check_selector_rule(doc, rule)
+            if messages is None:
+                continue
+        else:
+            present = pattern_rules.index(rule) in found
+            if 'require_pattern' in rule:
+                messages = [] if present else [f"pattern not found: {rule['require_pattern']}"]
+            else:
+                messages = [f"forbidden pattern present: {rule['forbid_pattern']}"] if present else []
+        report["results"].append({"rule": rule['id'], "severity": rule.get('severity', 'error'),
+                                  "passed": not messages, "messages": messages})
+    return report
+
+
+def write_junit(reports, path):
+    """One <testcase> per (page, rule); errors are failures, warnings go to system-out."""
+    suite = ET.Element('testsuite', name='site-audit')
+    tests = failures = 0
+    for report in reports:
+        for result in report['results']:
+            tests += 1
+            case = ET.SubElement(suite, 'testcase', classname=report['path'], name=result['rule'])
+            if result['passed']:
+                continue
+            if result['severity'] == 'error':
+                failures += 1
+                failure = ET.SubElement(case, 'failure', message=result['messages'][0], type=result['rule'])
+                failure.text = '\n'.join(result['messages'])
+            else:
+                ET.SubElement(case, 'system-out').text = 'WARNING: ' + '\n'.join(result['messages'])
+    suite.set('tests', str(tests))
+    suite.set('failures', str(failures))
+    suite.set('errors', '0')
+    ET.ElementTree(suite).write(path, encoding='utf-8', xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Audit site pages against structural rules')
+    parser.add_argument('--rules', default=str(RULES_FILE), help='Rule file (JSON)')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_DIRS), help='Limit to these site roots')
+    parser.add_argument('--file', nargs='+', help='Audit only these files')
+    parser.add_argument('--only', nargs='+', metavar='RULE', help='Run only these rules')
+    parser.add_argument('--json', metavar='PATH', help="Write results as JSON ('-' for stdout)")
+    parser.add_argument('--junit', metavar='PATH', help='Write results as JUnit XML')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Only print the summary')
+    parser.add_argument('--list', action='store_true', help='List rules and exit')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    config = load_rules(args.rules)
+    if args.list:
+        for rule in config['rules']:
+            print(f"{rule['id']:<22} {rule.get('severity', 'error'):<8} {rule.get('description', '')}")
+        return 0
+    if args.only:
+        unknown = set(args.only) - {r['id'] for r in config['rules']}
+        if unknown:
+            raise SystemExit(f"Unknown rule(s): {', '.join(sorted(unknown))}")
+
+    paths = [Path(f).resolve() for f in args.file] if args.file else find_pages(sites=args.sites)
+    results = run_files(audit_page, paths, args.jobs, args=(args.rules, args.only))
+
+    reports = []
+    errors = warnings = crashed = 0
+    pages_failing = 0
+    for item in results:
+        if item.error:
+            crashed += 1
+            print(f"ERROR processing {rel_path(item.item)}: {item.error}")
+            continue
+        report = item.value
+        reports.append(report)
+        failed = [r for r in report['results'] if not r['passed']]
+        errors += sum(1 for r in failed if r['severity'] == 'error')
+        warnings += sum(1 for r in failed if r['severity'] == 'warning')
+        if any(r['severity'] == 'error' for r in failed):
+            pages_failing += 1
+        if failed and not args.quiet:
+            marker = '❌' if any(r['severity'] == 'error' for r in failed) else '⚠️ '
+            print(f"{marker} {report['path']}")
+            for r in failed:
+                for message in r['messages']:
+                    print(f"   - [{r['rule']}] {message}")
+
+    checks = sum(len(r['results']) for r in reports)
+    print(f"\n{'=' * 60}")
+    print(f"Pages audited: {sum(1 for r in reports if r['results'])} "
+          f"({len(reports) - sum(1 for r in reports if r['results'])} excluded)")
+    print(f"Checks run: {checks}")
+    print(f"Pages with errors: {pages_failing}")
+    print(f"Failed checks: {errors} errors, {warnings} warnings")
+    if crashed:
+        print(f"Pages that could not be audited: {crashed}")
+
+    if args.json:
+        payload = {"rules": args.rules, "errors": errors, "warnings": warnings, "pages": reports}
+        if args.json == '-':
+            json.dump(payload, sys.stdout, indent=1, ensure_ascii=False)
+            print()
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=1, ensure_ascii=False)
+            print(f"JSON results: {args.json}")
+    if args.junit:
+        write_junit(reports, args.junit)
+        print(f"JUnit results: {args.junit}")
+
+    if errors or crashed:
+        print("\n⚠️  Audit failed")
+        return 1
+    print("\n✅ All error-level checks passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,373 @@
+"""
+Lightweight HTML tree with source offsets and CSS selectors; edits are
+applied as source spans, so bytes outside them are copied unchanged.
+"""
+import html
+import re
+
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+})
+
+
+class Node:
+    """An element, '#text', '#comment' or the '#document' root.
+
+    start/end are offsets of the whole node in the source; inner_start/
+    inner_end delimit an element's content (between its start and end tags).
+    Attributes and text are decoded from the source on first access.
+    """
+
+    __slots__ = ('tag', 'is_element', 'start', 'end', 'inner_start', 'inner_end',
+                 'parent', 'children', 'source', 'index', '_attrs')
+
+    def __init__(self, tag, source, start, end, parent=None, attrs=None):
+        self.tag = tag
+        self.is_element = tag[0] != '#'
+        self.source = source
+        self.start = start
+        self.end = end
+        self.inner_start = end
+        self.inner_end = end
+        self.parent = parent
+        self.children = []
+        self.index = None  # document root only: tag -> elements in document order
+        self._attrs = attrs
+
+    def __repr__(self):
+        attrs = ''.join(f' {k}="{v}"' for k, v in self.attrs.items())
+        return f"<Node {self.tag}{attrs} [{self.start}:{self.end}]>"
+
+    @property
+    def attrs(self):
+        if self._attrs is None:
+            self._attrs = {}
+            if self.is_element:
+                tag_text = self.source[self.start + 1 + len(self.tag):self.inner_start]
+                for m in _ATTR_RE.finditer(tag_text):
+                    value = m.group(2) if m.group(2) is not None else m.group(3)
+                    if value is None:
+                        value = m.group(4) or ''
+                    self._attrs.setdefault(m.group(1).lower(), html.unescape(value))
+        return self._attrs
+
+    @property
+    def classes(self):
+        return (self.attrs.get('class') or '').split()
+
+    @property
+    def id(self):
+        return self.attrs.get('id')
+
+    @property
+    def data(self):
+        """Decoded content of a text or comment node."""
+        if self.tag == '#comment':
+            return self.source[self.start + 4:self.end - 3]
+        if self.tag != '#text':
+            return ''
+        raw = self.source[self.start:self.end]
+        if self.parent is not None and self.parent.tag in RAW_TEXT_ELEMENTS:
+            return raw
+        return html.unescape(raw)
+
+    @property
+    def outer_html(self):
+        return self.source[self.start:self.end]
+
+    @property
+    def inner_html(self):
+        return self.source[self.inner_start:self.inner_end]
+
+    @property
+    def text(self):
+        """Concatenated, entity-decoded text of this node and its descendants."""
+        if self.tag == '#text':
+            return self.data
+        return ''.join(n.data for n in self.iter() if n.tag == '#text')
+
+    def iter(self):
+        """This node and all descendants in document order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def elements(self):
+        return (n for n in self.iter() if n.is_element and n is not self)
+
+    def previous_siblings(self):
+        """Siblings before this node, nearest first."""
+        if self.parent is None:
+            return []
+        siblings = self.parent.children
+        return siblings[:siblings.index(self)][::-1]
+
+    def next_siblings(self):
+        if self.parent is None:
+            return []
+        siblings = self.parent.children
+        return siblings[siblings.index(self) + 1:]
+
+    def _candidates(self, compiled):
+        """Elements that may match: from the tag index when every group names a tag."""
+        tags = {steps[-1][1] for steps in compiled}
+        if None in tags:
+            return self.elements()
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        if root.index is None:
+            return self.elements()
+        nodes = [n for tag in tags for n in root.index.get(tag, ())]
+        if len(tags) > 1:
+            nodes.sort(key=lambda n: n.start)
+        if self is root:
+            return nodes
+        return [n for n in nodes if self.inner_start <= n.start < self.inner_end]
+
+    def select(self, selector):
+        compiled = compile_selector(selector)
+        return [n for n in self._candidates(compiled) if _matches_compiled(n, compiled)]
+
+    def select_one(self, selector):
+        compiled = compile_selector(selector)
+        for n in self._candidates(compiled):
+            if _matches_compiled(n, compiled):
+                return n
+        return None
+
+
+# One scan tokenizes the page: comments, doctype/processing instructions,
+# end tags and start tags. Everything between tokens is text.
+_TOKEN_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<[!?][^>]*>'
+    r'|</(?P<end>[a-zA-Z][^\s/>]*)[^>]*>'
+    r'|<(?P<start>[a-zA-Z][^\s/>]*)(?:"[^"]*"|\'[^\']*\'|[^>"\'])*>',
+    re.DOTALL)
+_ATTR_RE = re.compile(r'([^\s/>"\'=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+RAW_TEXT_ELEMENTS = ('script', 'style')
+_RAW_TEXT_END = {tag: re.compile(r'</' + tag + r'\b', re.IGNORECASE) for tag in RAW_TEXT_ELEMENTS}
+
+
+def _build(source):
+    """Parse `source` into a '#document' Node tree."""
+    root = Node('#document', source, 0, len(source))
+    root.inner_start, root.inner_end = 0, len(source)
+    root.index = index = {}
+    stack = [root]
+    pos = 0
+    length = len(source)
+    token_re = _TOKEN_RE
+    while pos < length:
+        parent = stack[-1]
+        if parent.tag in RAW_TEXT_ELEMENTS:
+            # Raw text runs to the matching end tag, whatever it contains
+            close = _RAW_TEXT_END[parent.tag].search(source, pos)
+            text_end = close.start() if close else length
+            if text_end > pos:
+                parent.children.append(Node('#text', source, pos, text_end, parent))
+            pos = text_end
+            if not close:
+                break
+        match = token_re.search(source, pos)
+        if match is None:
+            parent.children.append(Node('#text', source, pos, length, parent))
+            break
+        start, end = match.span()
+        if start > pos:
+            parent.children.append(Node('#text', source, pos, start, parent))
+        pos = end
+        tag = match.group('start')
+        if tag is not None:
+            tag = tag.lower()
+            node = Node(tag, source, start, end, parent)
+            parent.children.append(node)
+            index.setdefault(tag, []).append(node)
+            if tag not in VOID_ELEMENTS and not match.group(0).endswith('/>'):
+                stack.append(node)
+            continue
+        tag = match.group('end')
+        if tag is not None:
+            tag = tag.lower()
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].tag == tag:
+                    break
+            else:
+                continue  # stray end tag
+            while len(stack) > depth:
+                node = stack.pop()
+                node.inner_end = start
+                node.end = end if node.tag == tag else start
+            continue
+        if match.group(0).startswith('<!--'):
+            parent.children.append(Node('#comment', source, start, end, parent))
+        # doctype / processing instructions are not kept as nodes
+    while len(stack) > 1:
+        node = stack.pop()
+        node.inner_end = node.end = length
+    return root
+
+
+# ---------- Selectors ----------
+_ATTR_SELECTOR = r'\[\s*([\w-]+)\s*(?:([\^$*]?=)\s*("[^"]*"|\'[^\']*\'|[^\]\s]*)\s*)?\]'
+_COMPOUND_RE = re.compile(r'(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:#[\w-]+|\.[\w-]+|' + _ATTR_SELECTOR + r')*)$')
+_PART_RE = re.compile(r'#([\w-]+)|\.([\w-]+)|' + _ATTR_SELECTOR)
+# A compound selector (brackets may hold spaces, commas and '>'), or a combinator
+_SELECTOR_TOKEN_RE = re.compile(r'\s*([>,])\s*|\s+|((?:[^\s>,\[]|\[(?:"[^"]*"|\'[^\']*\'|[^\]])*\])+)')
+_ATTR_OPERATORS = {
+    '=': lambda actual, v: actual == v,
+    '^=': lambda actual, v: actual.startswith(v),
+    '$=': lambda actual, v: actual.endswith(v),
+    '*=': lambda actual, v: v in actual,
+}
+_selector_cache = {}
+
+
+def _compile_compound(text):
+    match = _COMPOUND_RE.match(text)
+    if not match:
+        raise ValueError(f"Unsupported selector: {text!r}")
+    tag = match.group('tag')
+    tag = tag.lower() if tag and tag != '*' else None
+    tests = []
+    for id_, cls, attr, op, value in _PART_RE.findall(match.group('rest')):
+        if id_:
+            tests.append(lambda n, v=id_: n.attrs.get('id') == v)
+        elif cls:
+            tests.append(lambda n, v=cls: v in n.classes)
+        elif op:
+            if value[:1] in ('"', "'"):
+                value = value[1:-1]
+            test = _ATTR_OPERATORS[op]
+            tests.append(lambda n, a=attr.lower(), v=value, t=test:
+                         n.attrs.get(a) is not None and t(n.attrs[a], v))
+        else:
+            tests.append(lambda n, a=attr.lower(): a in n.attrs)
+    return tag, tests
+
+
+def compile_selector(selector):
+    """Compile 'a b > c, d' into [[(combinator, tag, tests), ...], ...] (rightmost last).
+
+    Attribute tests support [a], [a=v], [a^=v], [a$=v] and [a*=v]; quote
+    values that contain spaces, commas or '>'.
+    """
+    compiled = _selector_cache.get(selector)
+    if compiled is not None:
+        return compiled
+    compiled = []
+    steps = []
+    combinator = ' '
+    pos = 0
+    while pos < len(selector):
+        match = _SELECTOR_TOKEN_RE.match(selector, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Unsupported selector: {selector!r}")
+        pos = match.end()
+        separator, compound = match.groups()
+        if compound:
+            steps.append((combinator, *_compile_compound(compound)))
+            combinator = ' '
+        elif separator == '>':
+            combinator = '>'
+        elif separator == ',':
+            if not steps:
+                raise ValueError(f"Empty selector in {selector!r}")
+            compiled.append(steps)
+            steps = []
+    if not steps:
+        raise ValueError(f"Empty selector in {selector!r}")
+    compiled.append(steps)
+    _selector_cache[selector] = compiled
+    return compiled
+
+
+def _match_steps(node, steps, i):
+    combinator, tag, tests = steps[i]
+    if tag is not None and node.tag != tag:
+        return False
+    for test in tests:
+        if not test(node):
+            return False
+    if i == 0:
+        return True
+    parent = node.parent
+    while parent is not None and parent.is_element:
+        if _match_steps(parent, steps, i - 1):
+            return True
+        if combinator == '>':
+            return False
+        parent = parent.parent
+    return False
+
+
+def _matches_compiled(node, compiled):
+    return node.is_element and any(_match_steps(node, steps, len(steps) - 1) for steps in compiled)
+
+
+def matches(node, selector):
+    return _matches_compiled(node, compile_selector(selector))
+
+
+# ---------- Document ----------
+class Document:
+    """A parsed page plus pending edits; serialize() applies them byte-stably."""
+
+    def __init__(self, source):
+        self.source = source
+        self.root = _build(source)
+        self.edits = []
+
+    def select(self, selector):
+        return self.root.select(selector)
+
+    def select_one(self, selector):
+        return self.root.select_one(selector)
+
+    # ----- edits -----
+    def replace_span(self, start, end, text):
+        self.edits.append((start, end, text))
+
+    def replace(self, node, text):
+        self.replace_span(node.start, node.end, text)
+
+    def replace_inner(self, node, text):
+        self.replace_span(node.inner_start, node.inner_end, text)
+
+    def remove(self, node):
+        self.replace_span(node.start, node.end, '')
+
+    def insert_before(self, node, text):
+        self.replace_span(node.start, node.start, text)
+
+    def insert_after(self, node, text):
+        self.replace_span(node.end, node.end, text)
+
+    @property
+    def changed(self):
+        return any(self.source[s:e] != t for s, e, t in self.edits)
+
+    def serialize(self):
+        """Source with edits applied; untouched regions are copied verbatim."""
+        if not self.edits:
+            return self.source
+        # Stable sort keeps insertions at the same offset in call order
+        edits = sorted(self.edits, key=lambda e: (e[0], e[1]))
+        parts = []
+        pos = 0
+        for start, end, text in edits:
+            if start < pos:
+                raise ValueError(f"Overlapping edits at offset {start}")
+            parts.append(self.source[pos:start])
+            parts.append(text)
+            pos = end
+        parts.append(self.source[pos:])
+        return ''.join(parts)
+
+
+def parse(source):
+    return Document(source)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Cross-locale page metadata index (.site-cache/page-index.json): URL, title,
+canonical, hreflang, schema types, dates and hash for every site page.
+
+Usage:
+    python3 site_index.py update                    # refresh the index
+    python3 site_index.py show blog/foo.html        # one slug in every locale, with its cluster
+    python3 site_index.py list --locale de          # slug, title per page
+    python3 site_index.py list --missing-type Article --subdir blog
+    python3 site_index.py list --json > pages.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+from script_loader import REPO_ROOT
+from site_manifest import MANIFEST_FILE
+from site_pages import SITE_DIRS, SITE_HOSTS, find_pages, locale_of, page_slug, rel_path
+
+INDEX_FILE = REPO_ROOT / '.site-cache' / 'page-index.json'
+# Bump when extract_record() output changes; older indexes are rebuilt
+INDEX_VERSION = 1
+
+LOCALE_ORDER = list(SITE_DIRS.values())  # en, es, pt, de
+X_DEFAULT_LOCALE = 'en'
+
+TITLE_RE = re.compile(r'<title>([^<]*)</title>')
+DESCRIPTION_RE = re.compile(r'<meta name="description"\s+content="([^"]*)"')
+CANONICAL_RE = re.compile(r'<link rel="canonical" href="([^"]*)"')
+NOINDEX_RE = re.compile(r'<meta name="robots" content="[^"]*noindex', re.IGNORECASE)
+HREFLANG_RE = re.compile(r'<link rel="alternate" hreflang="([^"]+)" href="([^"]*)"')
+JSON_LD_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+
+FIELDS = ['path', 'locale', 'slug', 'url', 'title', 'description', 'canonical', 'noindex',
+          'hreflang', 'schema_types', 'first_seen', 'modified', 'sha256', 'indexable']
+PageEntry = namedtuple('PageEntry', FIELDS)
+
+
+def slug_url(locale, slug):
+    """Public URL of a slug on a locale's host ('index.html' -> '/')."""
+    path = slug[:-len('index.html')] if slug.endswith('index.html') else slug
+    return f"{SITE_HOSTS[locale]}/{path}"
+
+
+def _schema_types(content):
+    types = []
+    for block in JSON_LD_RE.findall(content):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            types.append('(invalid)')
+            continue
+        for item in data.get('@graph', [data]) if isinstance(data, dict) else data:
+            if isinstance(item, dict) and isinstance(item.get('@type'), str):
+                types.append(item['@type'])
+    return types
+
+
+def extract_record(content, locale, slug):
+    """Index fields parsed from a page's HTML."""
+    end = content.find('</head>')
+    head = content if end == -1 else content[:end]
+    title = TITLE_RE.search(head)
+    description = DESCRIPTION_RE.search(head)
+    canonical = CANONICAL_RE.search(head)
+    return {
+        'locale': locale,
+        'slug': slug,
+        'url': slug_url(locale, slug),
+        'title': title.group(1).strip() if title else None,
+        'description': description.group(1) if description else None,
+        'canonical': canonical.group(1) if canonical else None,
+        'noindex': bool(NOINDEX_RE.search(head)),
+        'hreflang': [list(tag) for tag in HREFLANG_RE.findall(head)],
+        'schema_types': _schema_types(content),
+    }
+
+
+def is_indexable(record):
+    """Indexable and canonical to itself."""
+    canonical = record['canonical']
+    if canonical is None or record['noindex']:
+        return False
+    return canonical.rstrip('/') in (record['url'].rstrip('/'),
+                                     f"{SITE_HOSTS[record['locale']]}/{record['slug']}")
+
+
+class PageIndex:
+    """slug -> {locale: PageEntry} for every page under the site roots."""
+
+    def __init__(self, records, base_dir=REPO_ROOT):
+        self.base_dir = Path(base_dir)
+        self.records = records
+        self.slugs = {}
+        for key, record in records.items():
+            entry = PageEntry(path=self.base_dir / key, indexable=is_indexable(record),
+                              **{f: record.get(f) for f in FIELDS if f not in ('path', 'indexable')})
+            self.slugs.setdefault(entry.slug, {})[entry.locale] = entry
+        self.reparsed = 0
+
+    @classmethod
+    def load(cls, base_dir=REPO_ROOT, index_file=INDEX_FILE, manifest_file=MANIFEST_FILE, save=True):
+        """The index for base_dir, refreshed for pages whose content changed since the last load."""
+        base_dir = Path(base_dir)
+        index_file = Path(index_file)
+        stored = {}
+        if index_file.exists():
+            with open(index_file, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                stored = data.get('pages', {})
+        # Read-only: only used for 'changed' dates of content it has already seen
+        manifest_files = {}
+        if Path(manifest_file).exists():
+            with open(manifest_file, encoding='utf-8') as f:
+                manifest_files = json.load(f).get('files', {})
+
+        records = {}
+        reparsed = 0
+        dirty = False
+        for path in find_pages(base_dir):
+            key = rel_path(path, base_dir)
+            st = os.stat(path)
+            stamp = [st.st_size, st.st_mtime_ns]
+            record = stored.get(key)
+            if record is None or record.get('stamp') != stamp:
+                data = Path(path).read_bytes()
+                digest = hashlib.sha256(data).hexdigest()
+                if record is None or record.get('sha256') != digest:
+                    locale, slug = locale_of(path, base_dir), page_slug(path, base_dir)
+                    record = extract_record(data.decode('utf-8'), locale, slug)
+                    record['sha256'] = digest
+                    reparsed += 1
+                record = dict(record, stamp=stamp)
+                dirty = True
+            manifest_entry = manifest_files.get(key)
+            if manifest_entry and manifest_entry.get('sha256') == record['sha256']:
+                dates = {'first_seen': manifest_entry['first_seen'], 'modified': manifest_entry['changed']}
+            else:
+                dates = {'first_seen': None, 'modified': None}
+            if any(record.get(k) != v for k, v in dates.items()):
+                record = dict(record, **dates)
+                dirty = True
+            records[key] = record
+
+        if save and (dirty or records.keys() != stored.keys()):
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'pages': records}, f, ensure_ascii=False)
+            os.replace(tmp, index_file)
+
+        index = cls(records, base_dir)
+        index.reparsed = reparsed
+        return index
+
+    def __len__(self):
+        return len(self.records)
+
+    def entries(self):
+        for slug in sorted(self.slugs):
+            for locale in LOCALE_ORDER:
+                if locale in self.slugs[slug]:
+                    yield self.slugs[slug][locale]
+
+    def get(self, slug, locale):
+        return self.slugs.get(slug, {}).get(locale)
+
+    def locales(self, slug, indexable_only=True):
+        """Locales a slug exists in, in LOCALE_ORDER."""
+        found = self.slugs.get(slug, {})
+        return [loc for loc in LOCALE_ORDER
+                if loc in found and (found[loc].indexable or not indexable_only)]
+
+    def cluster(self, slug):
+        """[(hreflang, url), ...] for a slug: each indexable locale, then x-default.
+
+        x-default points at the English page, or at the first locale the
+        slug exists in when there is no English version.
+        """
+        locales = self.locales(slug)
+        if not locales:
+            return []
+        entries = self.slugs[slug]
+        tags = [(loc, entries[loc].canonical) for loc in locales]
+        default = X_DEFAULT_LOCALE if X_DEFAULT_LOCALE in locales else locales[0]
+        tags.append(('x-default', entries[default].canonical))
+        return tags
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-locale page metadata index')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('update', help='Refresh the index')
+    p_show = sub.add_parser('show', help='Show one slug in every locale')
+    p_show.add_argument('slug')
+    p_list = sub.add_parser('list', help='List indexed pages')
+    p_list.add_argument('--locale', choices=LOCALE_ORDER)
+    p_list.add_argument('--subdir', help="Only slugs under this directory (e.g. 'blog')")
+    p_list.add_argument('--type', dest='schema_type', help='Only pages with this JSON-LD type')
+    p_list.add_argument('--missing-type', help='Only pages without this JSON-LD type')
+    p_list.add_argument('--indexable', action='store_true', help='Only indexable, self-canonical pages')
+    p_list.add_argument('--json', action='store_true', help='Print JSON records instead of a table')
+    args = parser.parse_args()
+
+    index = PageIndex.load()
+    if args.command == 'update':
+        print(f"Pages: {len(index)}, slugs: {len(index.slugs)}, re-parsed: {index.reparsed}")
+    elif args.command == 'show':
+        if args.slug not in index.slugs:
+            print(f"❌ Not in index: {args.slug}")
+            return 1
+        for loc in LOCALE_ORDER:
+            entry = index.get(args.slug, loc)
+            if entry:
+                print(f"{loc}: {rel_path(entry.path)}  modified {entry.modified or '?'}"
+                      f"{'' if entry.indexable else '  (not indexable)'}")
+                print(f"    title:     {entry.title}")
+                print(f"    canonical: {entry.canonical}")
+                print(f"    schema:    {', '.join(entry.schema_types) or '-'}")
+        print("cluster:")
+        for lang, url in index.cluster(args.slug):
+            print(f"    {lang:<10} {url}")
+    else:
+        entries = [e for e in index.entries()
+                   if (not args.locale or e.locale == args.locale)
+                   and (not args.subdir or e.slug.startswith(args.subdir.rstrip('/') + '/'))
+                   and (not args.schema_type or args.schema_type in e.schema_types)
+                   and (not args.missing_type or args.missing_type not in e.schema_types)
+                   and (not args.indexable or e.indexable)]
+        if args.json:
+            json.dump([dict(e._asdict(), path=rel_path(e.path)) for e in entries],
+                      sys.stdout, indent=1, ensure_ascii=False)
+            print()
+        else:
+            for e in entries:
+                print(f"{rel_path(e.path):<70} {e.title or ''}")
+            print(f"\n{len(entries)} pages")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
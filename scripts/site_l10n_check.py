@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Translation-completeness check for the locale copies of site pages.
+
+Usage:
+    python3 site_l10n_check.py --jobs 0                  # all locales, all pages
+    python3 site_l10n_check.py --locales de --subdir companies -v
+    python3 site_l10n_check.py --json report.json --threshold 0.2
+"""
+import argparse
+import json
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+import site_text
+from site_pages import SITE_DIRS, SPECIAL_PAGES, find_pages, page_slug, rel_path
+from site_parallel import add_jobs_argument, run_files
+
+LOCALE_DIRS = {locale: site for site, locale in SITE_DIRS.items()}
+DEFAULT_THRESHOLD = 0.3
+# Identical segments with fewer words than this are names and labels, not prose
+MIN_IDENTICAL_WORDS = 3
+# Names removed before a segment is judged, and labels that stay in English everywhere
+BRAND_NAMES = re.compile(r'Team Build Pro|Google Play|App Store')
+IDENTICAL_OK = frozenset({'Get it on Google Play', 'Download on the App Store', 'Download on App Store'})
+# Segments with fewer words than this are too short to identify a language
+MIN_LANGUAGE_WORDS = 4
+
+# Frequent function words. Words common to English and a target language
+# ('a', 'in', 'an', 'as', 'do', 'was', 'will', 'so', 'no') are left out of
+# both (test_site_l10n_check.py checks that the sets stay disjoint).
+STOP_WORDS = {
+    'en': {'the', 'and', 'of', 'to', 'is', 'you', 'your', 'that', 'for', 'it', 'with', 'are', 'on',
+           'this', 'be', 'can', 'how', 'what', 'who', 'from', 'at', 'or', 'by', 'not', 'have',
+           'more', 'their', 'they', 'our', 'we', 'all', 'when', 'get', 'if', 'about', 'without',
+           'into', 'than', 'them', 'has', 'which', 'most', 'just', 'out', 'up', 'these', 'why', 'every'},
+    'es': {'el', 'la', 'los', 'las', 'de', 'del', 'que', 'y', 'en', 'un', 'una', 'por', 'con', 'para',
+           'es', 'su', 'sus', 'se', 'al', 'lo', 'como', 'más', 'pero', 'sin', 'sobre', 'este', 'esta',
+           'tu', 'tus', 'usted', 'cómo', 'qué', 'puede', 'son', 'le', 'muy', 'también', 'cada', 'equipo'},
+    'pt': {'o', 'os', 'as', 'de', 'do', 'da', 'dos', 'das', 'que', 'e', 'em', 'um', 'uma', 'para', 'com',
+           'não', 'na', 'nos', 'se', 'por', 'mais', 'seu', 'sua', 'você', 'como', 'é', 'ao', 'pelo',
+           'pela', 'são', 'sem', 'isso', 'este', 'esta', 'seus', 'suas', 'também', 'cada', 'equipe'},
+    'de': {'der', 'die', 'das', 'und', 'ist', 'zu', 'den', 'mit', 'von', 'sie', 'ihr', 'ihre', 'ein',
+           'eine', 'nicht', 'für', 'auf', 'es', 'sich', 'dem', 'des', 'wie', 'auch', 'im', 'bei', 'oder',
+           'wenn', 'werden', 'mehr', 'kann', 'können', 'wir', 'ohne', 'aus', 'nach', 'sind', 'noch',
+           'über', 'ihren', 'ihrem', 'einen', 'einem'},
+}
+# Letters English text does not use
+NON_ENGLISH_LETTERS = re.compile(r'[ñ¿¡áéíóúãõçâêôàäöüß]', re.IGNORECASE)
+WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+
+Flag = namedtuple('Flag', 'reason path text')
+
+
+def words(text):
+    return WORD_RE.findall(text.lower())
+
+
+def reads_as_english(text):
+    """True if an identical segment has enough words, at least one an English stop word."""
+    tokens = words(BRAND_NAMES.sub('', text))
+    return len(tokens) >= MIN_IDENTICAL_WORDS and any(t in STOP_WORDS['en'] for t in tokens)
+
+
+def looks_english(text, locale):
+    """True if `text` scores as English rather than `locale` on stop words."""
+    tokens = words(BRAND_NAMES.sub('', text))
+    if len(tokens) < MIN_LANGUAGE_WORDS or NON_ENGLISH_LETTERS.search(text):
+        return False
+    english = sum(1 for t in tokens if t in STOP_WORDS['en'])
+    native = sum(1 for t in tokens if t in STOP_WORDS[locale])
+    return english >= max(2, len(tokens) * 0.15) and english > native * 2
+
+
+def check_page(english_text, local_text, locale):
+    """(segment count, [Flag]) for one locale page against its English original."""
+    english = {seg.path: seg for seg in site_text.page_segments(english_text)}
+    local = site_text.page_segments(local_text)
+    flags = []
+    for seg in local:
+        original = english.get(seg.path)
+        if original is not None and original.text == seg.text:
+            if seg.text not in IDENTICAL_OK and reads_as_english(seg.text):
+                flags.append(Flag('identical', seg.path, seg.text))
+        elif looks_english(seg.text, locale):
+            flags.append(Flag('english', seg.path, seg.text))
+    return len(local), flags
+
+
+def check_slug(english_path, local_paths):
+    """{locale: (segment count, [Flag])} for one slug; the English page is read once."""
+    english_text = Path(english_path).read_text(encoding='utf-8')
+    return {locale: check_page(english_text, Path(path).read_text(encoding='utf-8'), locale)
+            for locale, path in local_paths.items()}
+
+
+def collect(locales, subdir=None):
+    """[(English path, {locale: locale path})] for slugs that have at least one locale copy."""
+    local = {locale: {page_slug(p): p for p in find_pages(sites=[LOCALE_DIRS[locale]], subdir=subdir,
+                                                          skip=SPECIAL_PAGES)}
+             for locale in locales}
+    items = []
+    for path in find_pages(sites=['web'], subdir=subdir, skip=SPECIAL_PAGES):
+        slug = page_slug(path)
+        copies = {locale: pages[slug] for locale, pages in local.items() if slug in pages}
+        if copies:
+            items.append((path, copies))
+    return items
+
+
+def main():
+    translated = [loc for loc in LOCALE_DIRS if loc != 'en']
+    parser = argparse.ArgumentParser(description='Find English text left in the locale copies of site pages')
+    parser.add_argument('--locales', nargs='+', choices=translated, default=translated)
+    parser.add_argument('--subdir', help="Only pages under this subdirectory (e.g. 'blog')")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Share of flagged segments at which a page fails (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List the flagged segments')
+    parser.add_argument('--json', metavar='PATH', help="Write results as JSON ('-' for stdout)")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    items = collect(args.locales, args.subdir)
+    results = run_files(check_slug, items, args.jobs, star=True)
+
+    pages = []
+    crashed = 0
+    for result in results:
+        english_path, copies = result.item
+        if result.error:
+            crashed += 1
+            print(f"ERROR processing {rel_path(english_path)}: {result.error}")
+            continue
+        for locale, (count, flags) in result.value.items():
+            share = len(flags) / count if count else 0.0
+            pages.append({'path': rel_path(copies[locale]), 'locale': locale, 'segments': count,
+                          'flagged': len(flags), 'share': round(share, 3), 'failed': share >= args.threshold,
+                          'flags': [f._asdict() for f in flags]})
+
+    failed = [p for p in pages if p['failed']]
+    if args.json != '-':
+        for page in pages:
+            if not page['flags'] or not (page['failed'] or args.verbose):
+                continue
+            marker = '❌' if page['failed'] else '⚠️ '
+            print(f"{marker} {page['path']}: {page['flagged']}/{page['segments']} segments "
+                  f"({page['share'] * 100:.0f}%) identical or English")
+            if args.verbose:
+                for flag in page['flags']:
+                    print(f"   - [{flag['reason']}] {flag['text'][:90]}")
+        print(f"\n{'=' * 60}")
+        for locale in args.locales:
+            mine = [p for p in pages if p['locale'] == locale]
+            print(f"{locale}: {len(mine)} pages, {sum(p['segments'] for p in mine)} segments, "
+                  f"{sum(p['flagged'] for p in mine)} flagged, "
+                  f"{sum(1 for p in mine if p['failed'])} page(s) at or above {args.threshold:.0%}")
+        if crashed:
+            print(f"Pages that could not be checked: {crashed}")
+
+    if args.json:
+        payload = {'threshold': args.threshold, 'pages': pages}
+        if args.json == '-':
+            json.dump(payload, sys.stdout, indent=1, ensure_ascii=False)
+            print()
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=1, ensure_ascii=False)
+            print(f"JSON results: {args.json}")
+    return 1 if failed or crashed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest of the site pages (scripts/data/site-manifest.json):
+page hashes, first-seen and changed dates, and applied transforms.
+
+Usage:
+    python3 site_manifest.py update     # rescan and record hashes
+    python3 site_manifest.py changed    # list pages changed since last update
+    python3 site_manifest.py pending article-schema@1
+    python3 site_manifest.py seed       # recompute first-seen dates
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
+from script_loader import REPO_ROOT
+from site_pages import find_pages, rel_path
+
+MANIFEST_FILE = REPO_ROOT / 'scripts' / 'data' / 'site-manifest.json'
+STAT_CACHE_FILE = REPO_ROOT / '.site-cache' / 'stat-cache.json'
+MANIFEST_VERSION = 1
+SITE_ROOTS = ('web', 'web-es', 'web-pt', 'web-de')
+DATE_PUBLISHED_RE = re.compile(rb'"datePublished"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def published_date(data):
+    """First datePublished (YYYY-MM-DD) in a page's bytes, or None."""
+    m = DATE_PUBLISHED_RE.search(data)
+    return m.group(1).decode('ascii') if m else None
+
+
+def git_added_dates():
+    """{repo-relative path: date git first added it} for pages under web*/ ({} without git)."""
+    try:
+        out = subprocess.run(
+            ['git', 'log', '--diff-filter=A', '--format=%x00%as', '--name-only', '--', *SITE_ROOTS],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    added = {}
+    # Newest commit first, so the last date seen for a path is the oldest
+    for chunk in out.split('\0')[1:]:
+        day, _, names = chunk.partition('\n')
+        for name in names.split():
+            added[name] = day
+    return added
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp, path)
+
+
+class Manifest:
+    """Per-page content hashes and applied-transform records."""
+
+    def __init__(self, manifest_file=MANIFEST_FILE, stat_cache_file=STAT_CACHE_FILE):
+        self.manifest_file = Path(manifest_file)
+        self.stat_cache_file = Path(stat_cache_file)
+        self.files = {}
+        self.stat_cache = {}
+        self.dirty = False
+        self._git_added = None
+        if self.manifest_file.exists():
+            with open(self.manifest_file, encoding='utf-8') as f:
+                self.files = json.load(f).get('files', {})
+        if self.stat_cache_file.exists():
+            with open(self.stat_cache_file, encoding='utf-8') as f:
+                self.stat_cache = json.load(f)
+
+    def save(self):
+        if not self.dirty:
+            return
+        _write_json(self.manifest_file, {'version': MANIFEST_VERSION, 'files': self.files})
+        _write_json(self.stat_cache_file, self.stat_cache)
+        self.dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.save()
+
+    # ----- hashing -----
+    def current_hash(self, path):
+        """Hash of a page's current content, reading it only if its stat changed."""
+        key = rel_path(path)
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        entry = self.files.get(key)
+        if entry and self.stat_cache.get(key) == stamp:
+            return entry['sha256']
+        data = Path(path).read_bytes()
+        digest = content_hash(data)
+        self._observe(key, digest, stamp, data)
+        return digest
+
+    def seed_date(self, key, data):
+        """First-seen date of a new page: its datePublished, else the day git added it, else today."""
+        if self._git_added is None:
+            self._git_added = git_added_dates()
+        return published_date(data) or self._git_added.get(key) or date.today().isoformat()
+
+    def _observe(self, key, digest, stamp, data=None):
+        entry = self.files.get(key)
+        today = date.today().isoformat()
+        if entry is None:
+            if data is None:
+                data = (REPO_ROOT / key).read_bytes()
+            seen = self.seed_date(key, data)
+            self.files[key] = {'sha256': digest, 'first_seen': seen,
+                               'changed': seen, 'transforms': {}}
+            self.dirty = True
+        elif entry['sha256'] != digest:
+            entry['sha256'] = digest
+            entry['changed'] = today
+            self.dirty = True
+        if self.stat_cache.get(key) != stamp:
+            self.stat_cache[key] = stamp
+            self.dirty = True
+
+    def has_changed(self, path):
+        """True if the page is new or its content differs from the manifest."""
+        key = rel_path(path)
+        entry = self.files.get(key)
+        if entry is None:
+            self.current_hash(path)
+            return True
+        before = entry['sha256']
+        return self.current_hash(path) != before
+
+    # ----- transforms -----
+    def needs(self, path, transform):
+        """True unless `transform` was already applied to the page's current content."""
+        digest = self.current_hash(path)
+        return self.files[rel_path(path)]['transforms'].get(transform) != digest
+
+    def pending(self, paths, transforms):
+        """Pages with at least one of `transforms` still pending, in input order."""
+        pending = []
+        for p in paths:
+            digest = self.current_hash(p)
+            applied = self.files[rel_path(p)]['transforms']
+            if any(applied.get(t) != digest for t in transforms):
+                pending.append(p)
+        return pending
+
+    def record(self, path, transforms, digest=None):
+        """Mark transforms as applied to the page's content (after any write).
+
+        Pass the SHA-256 of the bytes just written as `digest` to skip
+        re-reading the file.
+        """
+        key = rel_path(path)
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        if digest is None:
+            digest = content_hash(Path(path).read_bytes())
+        self._observe(key, digest, stamp)
+        applied = self.files[key]['transforms']
+        for name in ([transforms] if isinstance(transforms, str) else transforms):
+            if applied.get(name) != digest:
+                applied[name] = digest
+                self.dirty = True
+
+    def applied(self, path, transform):
+        """Digest of the content `transform` was last applied to, or None if never."""
+        return self.files.get(rel_path(path), {}).get('transforms', {}).get(transform)
+
+    def changed_date(self, path):
+        """Date (YYYY-MM-DD) the page content last changed, per the manifest."""
+        self.current_hash(path)
+        return self.files[rel_path(path)]['changed']
+
+    def first_seen(self, path):
+        self.current_hash(path)
+        return self.files[rel_path(path)]['first_seen']
+
+    def forget_missing(self, existing_paths):
+        """Drop entries for pages that no longer exist."""
+        keep = {rel_path(p) for p in existing_paths}
+        for key in list(self.files):
+            if key not in keep:
+                del self.files[key]
+                self.stat_cache.pop(key, None)
+                self.dirty = True
+
+    def seed(self, paths):
+        """Recompute first-seen dates of pages in the manifest. Returns the number changed."""
+        changed = 0
+        for p in paths:
+            entry = self.files.get(rel_path(p))
+            if entry is None:
+                continue
+            seen = self.seed_date(rel_path(p), Path(p).read_bytes())
+            if entry['first_seen'] != seen:
+                entry['first_seen'] = seen
+                changed += 1
+                self.dirty = True
+        return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Site content-hash manifest')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('update', help='Rescan all pages and record hashes')
+    sub.add_parser('changed', help='List pages changed since the last update')
+    p_pending = sub.add_parser('pending', help='List pages with a transform pending')
+    p_pending.add_argument('transforms', nargs='+')
+    sub.add_parser('seed', help='Recompute first-seen dates from datePublished and git history')
+    args = parser.parse_args()
+
+    pages = find_pages()
+    manifest = Manifest()
+    if args.command == 'update':
+        changed = [p for p in pages if manifest.has_changed(p)]
+        manifest.forget_missing(pages)
+        manifest.save()
+        print(f"Pages: {len(pages)}, changed since last update: {len(changed)}")
+    elif args.command == 'seed':
+        changed = manifest.seed(pages)
+        manifest.save()
+        print(f"Pages: {len(pages)}, first-seen dates changed: {changed}")
+    elif args.command == 'changed':
+        # Read-only: the manifest is not saved, so this can be run repeatedly
+        for p in pages:
+            if manifest.has_changed(p):
+                print(rel_path(p))
+    else:
+        for p in manifest.pending(pages, args.transforms):
+            print(rel_path(p))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Shared page discovery for the static site trees (web, web-es, web-pt, web-de).
+
+Every HTML batch script used to walk the four site roots itself with its own
+glob/os.walk and skip list. Use find_pages() instead so all tools agree on
+which files make up the site.
+"""
+import os
+from pathlib import Path
+
+from script_loader import REPO_ROOT
+
+# Site root directory -> locale
+SITE_DIRS = {
+    'web': 'en',
+    'web-es': 'es',
+    'web-pt': 'pt',
+    'web-de': 'de',
+}
+
+# Public hostname for each locale
+SITE_HOSTS = {
+    'en': 'https://teambuildpro.com',
+    'es': 'https://es.teambuildpro.com',
+    'pt': 'https://pt.teambuildpro.com',
+    'de': 'https://de.teambuildpro.com',
+}
+
+# Admin tools and one-off pages with a different structure
+SPECIAL_PAGES = {
+    'delete-account.html',
+    'claim.html',
+    'claim-google.html',
+    'firestore-monitor.html',
+}
+
+# Directories under a site root that never contain site pages
+EXCLUDED_DIRS = {'assets', 'css', 'js', 'icons', 'images', 'backup_company_pages'}
+
+
+def find_pages(base_dir=REPO_ROOT, sites=None, subdir=None, skip=()):
+    """Return every .html page under the site roots, sorted by path.
+
+    sites   - iterable of site directory names (default: all of SITE_DIRS)
+    subdir  - only pages under this sub-directory of each root (e.g. 'blog')
+    skip    - file names to leave out
+    """
+    base_dir = Path(base_dir)
+    skip = set(skip)
+    pages = []
+    for site in sites or SITE_DIRS:
+        root = base_dir / site
+        if subdir:
+            root = root / subdir
+        if not root.is_dir():
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+            for filename in filenames:
+                if filename.endswith('.html') and filename not in skip:
+                    pages.append(Path(dirpath) / filename)
+    return sorted(pages)
+
+
+def site_of(path, base_dir=REPO_ROOT):
+    """Site directory name ('web', 'web-es', ...) a page belongs to, or None."""
+    try:
+        rel = Path(path).resolve().relative_to(Path(base_dir).resolve())
+    except ValueError:
+        return None
+    return rel.parts[0] if rel.parts and rel.parts[0] in SITE_DIRS else None
+
+
+def locale_of(path, base_dir=REPO_ROOT):
+    """Locale code ('en', 'es', 'pt', 'de') for a page, or None."""
+    return SITE_DIRS.get(site_of(path, base_dir))
+
+
+def page_slug(path, base_dir=REPO_ROOT):
+    """Path of a page relative to its site root, e.g. 'blog/foo.html'."""
+    path = Path(path).resolve()
+    site = site_of(path, base_dir)
+    if site is None:
+        return path.name
+    return path.relative_to((Path(base_dir) / site).resolve()).as_posix()
+
+
+def rel_path(path, base_dir=REPO_ROOT):
+    """Repo-relative POSIX path for reports and manifests."""
+    try:
+        return Path(path).resolve().relative_to(Path(base_dir).resolve()).as_posix()
+    except ValueError:
+        return str(path)
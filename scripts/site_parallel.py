@@ -0,0 +1,74 @@
+"""
+Process-pool runner for the per-file site scripts: results come back in
+input order, with each file's output captured and errors isolated.
+"""
+import contextlib
+import io
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from script_loader import load_script
+
+FileResult = namedtuple('FileResult', ['item', 'value', 'output', 'error'])
+
+
+def add_jobs_argument(parser):
+    """Add the common -j/--jobs option to an argparse parser."""
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help='Worker processes (0 = one per CPU, default: 1)')
+
+
+def job_count(jobs):
+    if not jobs or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def resolve_task(task):
+    if callable(task):
+        return task
+    filename, func_name, *directory = task
+    return getattr(load_script(filename, *directory), func_name)
+
+
+def _run_one(task, star, args, kwargs, item):
+    buf = io.StringIO()
+    try:
+        func = resolve_task(task)
+        with contextlib.redirect_stdout(buf):
+            call_args = tuple(item) if star else (item,)
+            value = func(*call_args, *args, **kwargs)
+        return FileResult(item, value, buf.getvalue(), None)
+    except Exception as e:
+        return FileResult(item, None, buf.getvalue(), f"{type(e).__name__}: {e}")
+
+
+def run_files(task, items, jobs=1, args=(), kwargs=None, star=False):
+    """Call task(item, *args, **kwargs) for every item; return FileResults in order.
+
+    star=True unpacks each item as positional arguments (for functions that
+    take e.g. (file_path, page_path)). jobs=1 runs in-process.
+    """
+    items = list(items)
+    kwargs = kwargs or {}
+    worker = partial(_run_one, task, star, tuple(args), kwargs)
+    jobs = min(job_count(jobs), max(1, len(items)))
+    if jobs == 1:
+        return [worker(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(worker, items, chunksize=chunksize))
+
+
+def print_results(results, label=str):
+    """Replay captured output in input order; report errors per file."""
+    errors = 0
+    for result in results:
+        if result.output:
+            print(result.output, end='')
+        if result.error:
+            errors += 1
+            print(f"ERROR processing {label(result.item)}: {result.error}")
+    return errors
@@ -0,0 +1,148 @@
+"""
+Precompiled regex patterns for the site HTML transforms. Each starts with a
+literal anchor and splits whitespace runs deterministically, so none
+backtracks super-linearly (checked by bench-site-patterns.py).
+"""
+import re
+
+# Horizontal whitespace, then newline, repeated: deterministic "\s*\n"
+NL = r'(?:[^\S\n]*\n)+'
+
+# ---------- update_company_pages.py / add_app_branding.py / fix_html_issues.py ----------
+COMPANY_H1 = [
+    re.compile(r'<h1>AI Recruiting for (.+?) Distributors</h1>'),
+    re.compile(r'<h1>AI Recruiting for (.+?) Independent Business Owners</h1>'),
+    re.compile(r'<h1>AI Recruiting for (.+?)</h1>'),
+]
+# (?<!\s): only try at the start of a whitespace run, not at every space in it
+COMPANY_NAME_SUFFIX = re.compile(
+    r'(?<!\s)\s+(Distributors|Representatives|Independent Business Owners|Consultants|Agents)$')
+
+# Hero CTA goes after the first </div> that is followed by a top-level <section>
+HERO_CTA_ANCHOR = re.compile(r'(</div>' + NL + r'[^\S\n]*?)(      <section>)')
+
+# Mid CTA goes between the Training section and the AI Recruiting Playbook
+MID_CTA_ANCHOR = re.compile(
+    r'(</section>' + NL + r'[^\S\n]*?)(      <section>[^\S\n]*\n\s*<h2>Your AI Recruiting Playbook)')
+
+PRIMARY_CTA_BUTTONS = re.compile(
+    r'        <p>[^\S\n]*\n\s*<a class="btn btn-primary"[^>]*>Try Team Build Pro Free for 30 Days</a>'
+    r'[^\S\n]*\n\s*&nbsp;[^\S\n]*\n\s*<a class="btn btn-outline"[^>]*>Download on iOS</a>'
+    r'[^\S\n]*\n\s*</p>')
+
+CHECKLIST_FIRST_LI = re.compile(r'(<ol class="checklist">)[^\S\n]*\n\s*(<li>)')
+# Body of each Getting Started list: from the line after the marker to </ol>
+GETTING_STARTED_LIST = re.compile(r'id="getting-started-list"[^\n]*\n(?P<items>.*?)</ol>', re.DOTALL)
+PLAIN_LI = re.compile(r'<li>')
+ROADMAP_BUTTON_ANCHOR = re.compile(
+    r'(</ol>' + NL + r')(      </section>[^\S\n]*\n\s*<section class="card">)')
+
+CURRENT_YEAR_SCRIPT_END = re.compile(
+    r"(document\.getElementById\('currentYear'\)\.textContent = new Date\(\)\.getFullYear\(\);)"
+    + NL + r'([^\S\n]*</script>)')
+
+# Related Companies: header through the grid opening, the cards, the grid close
+RELATED_COMPANIES = re.compile(
+    r'(<h3>Related Company Recruiting Guides</h3>.*?<div class="grid-2">)(.*?)(</div>\s*</section>)',
+    re.DOTALL)
+RELATED_CARD = re.compile(r'(<div class="card">.*?</div>)', re.DOTALL)
+
+CSS_CACHE_BUSTER_V6 = re.compile(r'style\.css\?v=6')
+
+HERO_SUBTITLE = re.compile(r'(using AI to recruit smarter and build faster)')
+MID_CTA_HEADLINE = re.compile(r'(Ready to Start Building Your [^\n]+? Team\?)')
+PRIMARY_CTA_INTRO = re.compile(r'<p><strong>Team Build Pro</strong> gives')
+
+OL_SYNTAX_ERROR = re.compile(r'<ol class="checklist">\s+id="getting-started-list">')
+TOGGLE_BUTTON_DIV = re.compile(r'(<div style="text-align: center; margin-top: 1\.5rem;">)')
+
+NOTE_BOX = re.compile(r'<div class="note">.*?</div>' + NL, re.DOTALL)
+
+# ---------- migrate-to-components.py ----------
+HEADER_BLOCK = re.compile(r'<header class="header">.*?</header>', re.DOTALL | re.IGNORECASE)
+FOOTER_BLOCK = re.compile(r'<footer class="footer">.*?</footer>', re.DOTALL | re.IGNORECASE)
+CURRENT_YEAR_LINE = re.compile(
+    r"document\.getElementById\('currentYear'\)\.textContent = new Date\(\)\.getFullYear\(\);")
+HEADER_COMMENT = '<!-- Header -->'
+INVITE_BAR_COMMENT = '<!-- Top Invite Bar'
+INVITE_BAR_DIV = re.compile(r'<div id="top-invite-bar"[^>]*></div>$')
+FOOTER_COMMENT = '<!-- Footer'
+
+
+def extend_left(content, start):
+    """Move `start` left over any whitespace (what a leading \\s* matched)."""
+    while start and content[start - 1].isspace():
+        start -= 1
+    return start
+
+
+def extract_company_name(content):
+    """Company name from the H1 title of a company page."""
+    # Try "Distributors" first, then "Independent Business Owners", then any other
+    distributors, owners, any_title = COMPANY_H1
+    for pattern in (distributors, owners):
+        match = pattern.search(content)
+        if match:
+            return match.group(1)
+
+    match = any_title.search(content)
+    if match:
+        # Remove trailing words like "Distributors", "Representatives", etc.
+        return COMPANY_NAME_SUFFIX.sub('', match.group(1))
+
+    return "Unknown Company"
+
+
+def preceding_comment(content, end, prefix):
+    """Start of an HTML comment beginning with `prefix` that ends at `end`, or None.
+
+    `end` is the index just past the comment's '-->' (after skipping
+    whitespace left of an anchor).
+    """
+    if not content.startswith('-->', end - 3):
+        return None
+    start = content.rfind('<!--', 0, end - 3)
+    if start == -1 or not content.startswith(prefix, start):
+        return None
+    return start
+
+
+def find_header_block(content):
+    """Span of the hardcoded header incl. leading invite bar/comments and whitespace.
+
+    Same span the old HEADER_PATTERNS matched, found by locating
+    <header class="header"> first and walking backwards.
+    """
+    match = HEADER_BLOCK.search(content)
+    if not match:
+        return None
+    start = extend_left(content, match.start())
+    if content[start - len(HEADER_COMMENT):start].lower() == HEADER_COMMENT.lower():
+        start = extend_left(content, start - len(HEADER_COMMENT))
+    # Optional invite bar: <!-- Top Invite Bar ... --> <div id="top-invite-bar" ...></div>
+    div_start = content.rfind('<div id="top-invite-bar"', 0, start)
+    if div_start != -1 and INVITE_BAR_DIV.match(content, div_start, start):
+        comment_start = preceding_comment(content, extend_left(content, div_start), INVITE_BAR_COMMENT)
+        if comment_start is not None:
+            start = extend_left(content, comment_start)
+    return start, match.end()
+
+
+def find_footer_block(content):
+    """Span of the hardcoded footer incl. a leading <!-- Footer ... --> comment."""
+    match = FOOTER_BLOCK.search(content)
+    if not match:
+        return None
+    start = extend_left(content, match.start())
+    comment_start = preceding_comment(content, start, FOOTER_COMMENT)
+    if comment_start is not None:
+        start = extend_left(content, comment_start)
+    return start, match.end()
+
+
+def find_current_year_line(content):
+    """Span of the currentYear script line including its leading whitespace."""
+    match = CURRENT_YEAR_LINE.search(content)
+    if not match:
+        return None
+    return extend_left(content, match.start()), match.end()
@@ -0,0 +1,218 @@
+"""
+JSON-LD structured data for the site pages: builds and updates the managed
+schema types in place, leaving hand-written fields and other blocks alone.
+"""
+import html
+import json
+import re
+
+from site_dom import parse
+from site_pages import SITE_HOSTS
+
+EN_HOST = SITE_HOSTS['en']
+LOGO_URL = f'{EN_HOST}/assets/icons/team-build-pro.png'
+APP_STORE_URL = 'https://apps.apple.com/us/app/id6751211622'
+PLAY_STORE_URL = 'https://play.google.com/store/apps/details?id=com.scott.ultimatefix'
+HEADLINE_MAX = 110  # Google truncates Article headlines beyond this
+
+JSON_LD_BLOCK = re.compile(
+    r'^([ \t]*)<script type="application/ld\+json">(.*?)</script>[ \t]*\n', re.DOTALL | re.MULTILINE)
+TITLE_RE = re.compile(r'<title>([^<]*)</title>')
+TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*Team Build Pro.*$')
+DESCRIPTION_RE = re.compile(r'<meta name="description"\s+content="([^"]*)"')
+CANONICAL_LINE = re.compile(r'^([ \t]*)<link rel="canonical" href="([^"]*)"', re.MULTILINE)
+
+PUBLISHER = {
+    "@type": "Organization",
+    "name": "Team Build Pro",
+    "logo": {"@type": "ImageObject", "url": LOGO_URL},
+}
+
+
+def managed_types(slug):
+    """Schema types maintained for a site-relative slug."""
+    if slug.startswith(('blog/', 'companies/')):
+        return ['Article']
+    if slug == 'index.html':
+        return ['MobileApplication', 'Organization']
+    if slug == 'faq.html':
+        return ['FAQPage']
+    return []
+
+
+class PageMeta:
+    """What the builders need to know about a page, read from its HTML."""
+
+    def __init__(self, content, locale, date_published=None, date_modified=None):
+        self.content = content
+        self.locale = locale
+        title = TITLE_RE.search(content)
+        self.title = html.unescape(TITLE_SUFFIX_RE.sub('', title.group(1)).strip()) if title else ''
+        description = DESCRIPTION_RE.search(content)
+        self.description = html.unescape(description.group(1)) if description else ''
+        canonical = CANONICAL_LINE.search(content)
+        self.canonical = canonical.group(2) if canonical else None
+        self.date_published = date_published
+        self.date_modified = date_modified
+
+    def faq_items(self):
+        """[(question, answer), ...] from the page's visible FAQ accordion."""
+        items = []
+        for item in parse(self.content).select('div.faq-item'):
+            question = item.select_one('.faq-question span')  # first span; the second is the +/- icon
+            answer = item.select_one('.faq-answer')
+            if question and answer:
+                items.append((_squash(question.text), _squash(answer.text)))
+        return items
+
+
+def _squash(text):
+    return ' '.join(text.split())
+
+
+# ---------- builders: (managed, defaults) ----------
+def article_fields(meta, existing):
+    published = existing.get('datePublished') or meta.date_published
+    managed = {}
+    if meta.canonical:
+        managed['mainEntityOfPage'] = {"@type": "WebPage", "@id": meta.canonical}
+    modified = meta.date_modified or existing.get('dateModified') or published
+    if modified and published:
+        managed['dateModified'] = max(modified, published)
+    defaults = {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": meta.title[:HEADLINE_MAX],
+        "description": meta.description,
+        "author": {"@type": "Organization", "name": "Team Build Pro"},
+        "publisher": PUBLISHER,
+        "datePublished": published,
+    }
+    return managed, defaults
+
+
+def app_fields(meta, existing):
+    managed = {
+        "name": "Team Build Pro",
+        "url": SITE_HOSTS[meta.locale],
+        "downloadUrl": [APP_STORE_URL, PLAY_STORE_URL],
+    }
+    defaults = {
+        "@context": "https://schema.org",
+        "@type": "MobileApplication",
+        "applicationCategory": ["BusinessApplication", "ProductivityApplication"],
+        "operatingSystem": "iOS, Android",
+        "description": meta.description,
+        "screenshot": LOGO_URL,
+        "publisher": {"@type": "Organization", "name": "Team Build Pro"},
+    }
+    return managed, defaults
+
+
+def organization_fields(meta, existing):
+    managed = {
+        "name": "Team Build Pro",
+        "logo": LOGO_URL,
+    }
+    defaults = {
+        "@context": "https://schema.org",
+        "@type": "Organization",
+        "url": EN_HOST,
+        "description": meta.description,
+        "sameAs": ["https://twitter.com/teambuildpro", APP_STORE_URL, PLAY_STORE_URL],
+    }
+    return managed, defaults
+
+
+def faq_fields(meta, existing):
+    defaults = {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+    }
+    if 'mainEntity' not in existing:
+        defaults['mainEntity'] = [
+            {"@type": "Question", "name": q,
+             "acceptedAnswer": {"@type": "Answer", "text": a}}
+            for q, a in meta.faq_items()
+        ]
+    return {}, defaults
+
+
+BUILDERS = {
+    'Article': article_fields,
+    'MobileApplication': app_fields,
+    'Organization': organization_fields,
+    'FAQPage': faq_fields,
+}
+# Existing blocks of these types count as the managed type
+TYPE_ALIASES = {'SoftwareApplication': 'MobileApplication', 'BlogPosting': 'Article'}
+
+
+def build(schema_type, meta, existing=None):
+    """Merged JSON-LD dict for one managed type (existing keys keep their order)."""
+    existing = existing or {}
+    managed, defaults = BUILDERS[schema_type](meta, existing)
+    data = dict(existing)
+    for key, value in defaults.items():
+        if key not in data and value not in (None, '', []):
+            data[key] = value
+    data.update(managed)
+    return data
+
+
+# ---------- blocks ----------
+def find_blocks(content):
+    """[(start, end, indent, data or None), ...] for every JSON-LD block (None if invalid JSON)."""
+    blocks = []
+    for m in JSON_LD_BLOCK.finditer(content):
+        try:
+            data = json.loads(m.group(2))
+        except ValueError:
+            data = None
+        blocks.append((m.start(), m.end(), m.group(1), data))
+    return blocks
+
+
+def block_type(data):
+    schema_type = data.get('@type') if isinstance(data, dict) else None
+    return TYPE_ALIASES.get(schema_type, schema_type) if isinstance(schema_type, str) else None
+
+
+def render_block(data, indent):
+    body = json.dumps(data, indent=2, ensure_ascii=False)
+    body = '\n'.join(indent + line for line in body.split('\n'))
+    return f'{indent}<script type="application/ld+json">\n{body}\n{indent}</script>\n'
+
+
+def update_content(content, meta, types):
+    """Content with every type in `types` present and current, or None if nothing changed."""
+    blocks = find_blocks(content)
+    edits = []
+    seen = set()
+    for start, end, indent, data in blocks:
+        schema_type = block_type(data)
+        if schema_type not in types or schema_type in seen:
+            continue
+        seen.add(schema_type)
+        merged = build(schema_type, meta, data)
+        if merged != data:
+            edits.append((start, end, render_block(merged, indent)))
+
+    missing = [t for t in types if t not in seen]
+    if missing:
+        if blocks:
+            at, indent = blocks[-1][1], blocks[-1][2]
+        else:
+            at = content.find('</head>')
+            if at == -1:
+                return None
+            at = content.rfind('\n', 0, at) + 1
+            canonical = CANONICAL_LINE.search(content)
+            indent = canonical.group(1) if canonical else '  '
+        edits.append((at, at, ''.join(render_block(build(t, meta), indent) for t in missing)))
+
+    if not edits:
+        return None
+    for start, end, text in sorted(edits, reverse=True):
+        content = content[:start] + text + content[end:]
+    return content
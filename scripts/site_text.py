@@ -0,0 +1,88 @@
+"""
+Visible, translatable text of a site page, as segments with source spans.
+"""
+import html
+import re
+from collections import namedtuple
+
+import site_dom
+
+# path: structural position ('html/body/main/section[2]/p[0]/#text[0]', indexes counted
+# per tag among siblings) to find the same segment in another locale's copy;
+# start/end: span of the raw text in the source, for replace_segments()
+Segment = namedtuple('Segment', 'kind path text start end')
+
+SKIP_ELEMENTS = frozenset({'script', 'style', 'noscript', 'svg', 'template', 'code', 'pre', 'kbd', 'samp'})
+TRANSLATABLE_ATTRS = ('alt', 'title', 'placeholder', 'aria-label')
+META_NAMES = re.compile(r'^(?:description|og:title|og:description|twitter:title|twitter:description)$')
+HAS_LETTER = re.compile(r'[^\W\d_]')
+_ATTR_SPAN_RE = re.compile(r'\s([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+
+def _skipped(node):
+    attrs = node.attrs
+    return (node.tag in SKIP_ELEMENTS or attrs.get('translate') == 'no'
+            or 'notranslate' in node.classes)
+
+
+def _attr_spans(node):
+    """{name: (start, end)} of quoted attribute values in an element's start tag."""
+    tag_text = node.source[node.start:node.inner_start]
+    spans = {}
+    for m in _ATTR_SPAN_RE.finditer(tag_text):
+        group = 2 if m.group(2) is not None else 3
+        spans.setdefault(m.group(1).lower(), (node.start + m.start(group), node.start + m.end(group)))
+    return spans
+
+
+def _element_attrs(node, path):
+    names = [a for a in TRANSLATABLE_ATTRS if node.attrs.get(a)]
+    if node.tag == 'meta' and META_NAMES.match(node.attrs.get('name') or node.attrs.get('property') or ''):
+        names.append('content')
+    if not names:
+        return
+    spans = _attr_spans(node)
+    for name in names:
+        value = ' '.join(node.attrs[name].split())
+        if name in spans and HAS_LETTER.search(value):
+            start, end = spans[name]
+            yield Segment('attr', f"{path}/@{name}", value, start, end)
+
+
+def segments(doc):
+    """Translatable segments of a parsed page (site_dom.Document), in document order."""
+    found = []
+
+    def walk(node, path):
+        counts = {}
+        for child in node.children:
+            if child.tag == '#comment':
+                continue
+            index = counts.get(child.tag, 0)
+            counts[child.tag] = index + 1
+            child_path = f"{path}/{child.tag}[{index}]" if path else f"{child.tag}[{index}]"
+            if child.tag == '#text':
+                raw = child.source[child.start:child.end]
+                text = ' '.join(html.unescape(raw).split())
+                if HAS_LETTER.search(text):
+                    lead = len(raw) - len(raw.lstrip())
+                    trail = len(raw) - len(raw.rstrip())
+                    found.append(Segment('text', child_path, text, child.start + lead, child.end - trail))
+            elif child.is_element and not _skipped(child):
+                found.extend(_element_attrs(child, child_path))
+                walk(child, child_path)
+
+    walk(doc.root, '')
+    return found
+
+
+def page_segments(content):
+    """segments() of HTML source."""
+    return segments(site_dom.parse(content))
+
+
+def replace_segments(doc, replacements):
+    """Queue replacements ({Segment: new text}) as edits on `doc`; call doc.serialize() after."""
+    for segment, text in replacements.items():
+        doc.replace_span(segment.start, segment.end, html.escape(text, quote=segment.kind == 'attr'))
+    return doc
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Single-pass transform engine for site-wide HTML rewrites: each page is read
+once and every registered transform that applies to it runs in memory.
+
+Usage:
+    python3 site_transforms.py --list
+    python3 site_transforms.py --dry-run --jobs 0
+    python3 site_transforms.py --only remove-author-credit fix-mobile-menu
+    python3 site_transforms.py --file web/companies/ai-recruiting-amway.html -v
+"""
+import argparse
+import hashlib
+import sys
+from collections import Counter
+from pathlib import Path
+
+from script_loader import REPO_ROOT, load_script
+from site_pages import SITE_DIRS, find_pages, page_slug, rel_path, site_of
+from site_manifest import Manifest
+from site_parallel import add_jobs_argument, run_files
+from site_txn import Transaction, write_bytes
+import site_patterns as patterns
+
+TRANSFORMS = {}
+
+
+class Transform:
+    """A registered rewrite: func(content, path) -> content, limited by scope."""
+
+    def __init__(self, name, func, scope=None, description='', version=1):
+        self.name = name
+        self.func = func
+        self.scope = scope
+        self.description = description
+        self.version = version
+
+    @property
+    def key(self):
+        """Manifest key; bump `version` when the transform's output changes."""
+        return f"{self.name}@{self.version}"
+
+    def applies(self, path):
+        return self.scope is None or self.scope(path)
+
+    def __call__(self, content, path):
+        return self.func(content, path)
+
+
+def transform(name, scope=None, description='', version=1):
+    """Decorator registering a transform plugin under `name`."""
+    def register(func):
+        if name in TRANSFORMS:
+            raise ValueError(f"Transform already registered: {name}")
+        TRANSFORMS[name] = Transform(name, func, scope,
+                                     description or (func.__doc__ or '').strip(), version)
+        return func
+    return register
+
+
+def select_transforms(only=None, skip=None):
+    """Registered transforms filtered by name, in registration order."""
+    names = list(TRANSFORMS)
+    unknown = (set(only or ()) | set(skip or ())) - set(names)
+    if unknown:
+        raise SystemExit(f"Unknown transform(s): {', '.join(sorted(unknown))}")
+    if only:
+        names = [n for n in names if n in only]
+    if skip:
+        names = [n for n in names if n not in skip]
+    return [TRANSFORMS[n] for n in names]
+
+
+# ---------- Engine ----------
+def apply_transforms(content, path, transforms):
+    """Run transforms over in-memory content; returns (content, changed names)."""
+    changed = []
+    for t in transforms:
+        if not t.applies(path):
+            continue
+        new_content = t(content, path)
+        if new_content != content:
+            changed.append(t.name)
+            content = new_content
+    return content, changed
+
+
+def process_page(path, transforms, dry_run=False):
+    """Read one page, apply every transform, write only if the bytes changed."""
+    path = Path(path)
+    original = path.read_bytes()
+    content, changed = apply_transforms(original.decode('utf-8'), path, transforms)
+    new_bytes = content.encode('utf-8')
+    written = False
+    if new_bytes != original and not dry_run:
+        write_bytes(path, new_bytes)
+        written = True
+    return {"path": rel_path(path), "changed": changed, "written": written,
+            "sha256": hashlib.sha256(new_bytes).hexdigest()}
+
+
+def process_page_named(path, names, dry_run=False):
+    """process_page() taking transform names, so it can run in a worker process."""
+    return process_page(path, [TRANSFORMS[n] for n in names], dry_run)
+
+
+def run(paths, transforms, dry_run=False, verbose=False, jobs=1, manifest=None):
+    """Process pages (optionally in parallel) and print a per-transform change report.
+
+    With a manifest, pages whose current content already had every selected
+    transform applied are skipped without being opened by the workers.
+    """
+    per_transform = Counter()
+    modified = errors = 0
+    scanned = len(paths)
+
+    keys = [t.key for t in transforms]
+    if manifest is not None:
+        paths = manifest.pending(paths, keys)
+
+    names = [t.name for t in transforms]
+    # Pages are only replaced once every worker has finished; the manifest is
+    # recorded afterwards, against the committed files
+    with Transaction('site_transforms') as txn:
+        results = run_files(process_page_named, paths, jobs, args=(names, dry_run))
+    for item in results:
+        if item.error:
+            errors += 1
+            print(f"ERROR processing {rel_path(item.item)}: {item.error}")
+            continue
+        result = item.value
+        if manifest is not None and not dry_run:
+            manifest.record(item.item, keys, result["sha256"])
+        if result["changed"]:
+            modified += 1
+            per_transform.update(result["changed"])
+            print(f"{'[DRY RUN] ' if dry_run else ''}Modified: {result['path']}")
+            if verbose:
+                for name in result["changed"]:
+                    print(f"  - {name}")
+
+    print(f"\n{'[DRY RUN] ' if dry_run else ''}Summary:")
+    print(f"  Pages in scope: {scanned}")
+    print(f"  Pages opened: {len(paths)}")
+    print(f"  Pages {'to modify' if dry_run else 'modified'}: {modified}")
+    print(f"  Errors: {errors}")
+    if txn.snapshot_id:
+        print(f"  Snapshot: {txn.snapshot_id} (undo with site_txn.py rollback)")
+    print("\nChanges per transform:")
+    for t in transforms:
+        print(f"  {t.name:<28} {per_transform[t.name]}")
+    return per_transform
+
+
+# ---------- Scopes ----------
+def is_company_page(path):
+    return site_of(path) == 'web' and page_slug(path).startswith('companies/ai-recruiting-')
+
+
+def migrate_scope(path):
+    migrate = load_script('migrate-to-components.py')
+    return Path(path).name not in migrate.SKIP_FILES
+
+
+# ---------- Built-in transforms ----------
+# Company page CTA optimization (update_company_pages.py). The original
+# script inserted blocks unconditionally, so each step is guarded to keep
+# reruns idempotent.
+def _company_pages():
+    return load_script('update_company_pages.py', REPO_ROOT)
+
+
+@transform('company-hero-cta', is_company_page, "Hero CTA section with app store badges")
+def company_hero_cta(content, path):
+    pages = _company_pages()
+    if 'hero-cta-section' in content:
+        return content
+    return pages.add_hero_cta(content, patterns.extract_company_name(content))
+
+
+@transform('company-mid-cta', is_company_page, "Mid-content CTA interrupt")
+def company_mid_cta(content, path):
+    pages = _company_pages()
+    if 'Mid-Content CTA Interrupt' in content:
+        return content
+    return pages.add_mid_cta(content, patterns.extract_company_name(content))
+
+
+@transform('company-primary-badges', is_company_page, "Primary CTA buttons -> app badges")
+def company_primary_badges(content, path):
+    return _company_pages().replace_primary_cta_buttons(content)
+
+
+@transform('company-roadmap-collapse', is_company_page, "Read More collapse on Getting Started")
+def company_roadmap_collapse(content, path):
+    if 'toggle-roadmap-btn' in content:
+        return content
+    return _company_pages().add_collapse_to_getting_started(content)
+
+
+@transform('company-collapse-script', is_company_page, "Collapse toggle JavaScript")
+def company_collapse_script(content, path):
+    if "getElementById('toggle-roadmap-btn')" in content:
+        return content
+    return _company_pages().add_collapse_script(content)
+
+
+@transform('company-related-3', is_company_page, "Related Companies reduced to 3 cards")
+def company_related_3(content, path):
+    return _company_pages().reduce_related_companies(content)
+
+
+@transform('company-cache-buster', is_company_page, "Drop style.css?v=6 cache buster")
+def company_cache_buster(content, path):
+    return _company_pages().update_cache_buster(content)
+
+
+@transform('company-branding', is_company_page, "Team Build Pro app branding in CTAs (add_app_branding.py)")
+def company_branding(content, path):
+    branding = load_script('add_app_branding.py', REPO_ROOT)
+    content = branding.update_hero_cta(content)
+    content = branding.update_midcontent_cta(content)
+    return branding.update_primary_cta(content)
+
+
+@transform('company-fix-html', is_company_page, "<ol> syntax and toggle spacing fixes (fix_html_issues.py)")
+def company_fix_html(content, path):
+    fixes = load_script('fix_html_issues.py', REPO_ROOT)
+    return fixes.fix_button_spacing(fixes.fix_ol_syntax_error(content))
+
+
+@transform('company-remove-note-box', is_company_page, "Remove redundant note boxes (remove_note_boxes.py)")
+def company_remove_note_box(content, path):
+    if '<div class="note">' not in content:
+        return content
+    return load_script('remove_note_boxes.py', REPO_ROOT).remove_note_box(content)
+
+
+# Site-wide transforms
+@transform('migrate-components', migrate_scope, "Shared header/footer via components.js (migrate-to-components.py)")
+def migrate_components(content, path):
+    migrate = load_script('migrate-to-components.py')
+    content, _ = migrate.add_components_script(content)
+    content, _ = migrate.replace_header(content)
+    content, _ = migrate.replace_footer(content)
+    content, _ = migrate.remove_current_year_script(content)
+    return content
+
+
+@transform('remove-author-credit', None, "Remove footer author credit (remove-author-credit.py)")
+def remove_author_credit(content, path):
+    credit = load_script('remove-author-credit.py')
+    if 'stephenscott.us' not in content:
+        return content
+    for pattern in credit.PATTERNS:
+        content = credit.re.sub(pattern, '', content)
+    return content
+
+
+@transform('fix-mobile-menu', None, "Remove conflicting mobile menu handler (fix-mobile-menu-conflict.py)")
+def fix_mobile_menu(content, path):
+    if "mobileMenu.classList.toggle('active')" not in content:
+        return content
+    content, _ = load_script('fix-mobile-menu-conflict.py').remove_conflicting_menu_handler(content)
+    return content
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply registered HTML transforms in one pass')
+    parser.add_argument('--list', action='store_true', help='List registered transforms')
+    parser.add_argument('--only', nargs='+', metavar='NAME', help='Run only these transforms')
+    parser.add_argument('--skip', nargs='+', metavar='NAME', help='Skip these transforms')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_DIRS), help='Limit to these site roots')
+    parser.add_argument('--file', nargs='+', help='Process only these files')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    parser.add_argument('--all', action='store_true',
+                        help='Ignore the manifest and open every page')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show transforms applied per page')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    if args.list:
+        for t in TRANSFORMS.values():
+            print(f"{t.name:<28} {t.description}")
+        return 0
+
+    transforms = select_transforms(args.only, args.skip)
+    paths = [Path(f).resolve() for f in args.file] if args.file else find_pages(sites=args.sites)
+
+    print(f"{'[DRY RUN] ' if args.dry_run else ''}Applying {len(transforms)} transforms "
+          f"to {len(paths)} pages...\n")
+    manifest = None if args.all else Manifest()
+    run(paths, transforms, args.dry_run, args.verbose, args.jobs, manifest)
+    if manifest is not None:
+        manifest.save()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Stage site script writes in a transaction, snapshot the files they replace,
+and roll runs back. Outside a transaction write_text() is an atomic write.
+
+Usage:
+    python3 site_txn.py list                  # recent snapshots
+    python3 site_txn.py show 20260101-120000-update_company_pages
+    python3 site_txn.py rollback              # undo the most recent run
+    python3 site_txn.py rollback ID --force   # even if files changed since
+    python3 site_txn.py recover               # roll back interrupted runs
+    python3 site_txn.py gc --keep 10
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from script_loader import REPO_ROOT
+
+TXN_DIR = REPO_ROOT / '.site-cache' / 'txn'
+SNAPSHOT_DIR = REPO_ROOT / '.site-cache' / 'snapshots'
+KEEP_SNAPSHOTS = 20
+
+# Stage directory of the active transaction; inherited by worker processes
+STAGE_ENV = 'SITE_TXN_STAGE'
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def atomic_write(path, data):
+    """Write bytes via a temp file in the same directory and os.replace()."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    if path.exists():
+        shutil.copymode(path, tmp)
+    os.replace(tmp, path)
+
+
+def write_bytes(path, data):
+    """Stage `data` for `path` in the active transaction, or write it atomically."""
+    stage = os.environ.get(STAGE_ENV)
+    if not stage:
+        atomic_write(path, data)
+        return
+    staged = _staged_path(Path(stage), _repo_key(path))
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    with open(staged, 'wb') as f:
+        f.write(data)
+
+
+def write_text(path, text, encoding='utf-8'):
+    write_bytes(path, text.encode(encoding))
+
+
+def _repo_key(path):
+    """Repo-relative key of a file a transaction may change; ValueError outside the repo."""
+    try:
+        return Path(path).resolve().relative_to(REPO_ROOT.resolve()).as_posix()
+    except ValueError:
+        raise ValueError(f"{path} is outside the repository; transactions only write under {REPO_ROOT}")
+
+
+def _staged_path(stage, key):
+    return stage / 'repo' / key
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _owner_alive(txn_id):
+    """True if the process that started transaction `txn_id` is still running."""
+    parts = txn_id.split('-', 3)
+    if len(parts) < 4 or not parts[2].isdigit():
+        return False
+    return _pid_alive(int(parts[2]))
+
+
+# ---------- snapshot store ----------
+def _object_path(digest, snapshot_dir=SNAPSHOT_DIR):
+    return Path(snapshot_dir) / 'objects' / digest[:2] / f"{digest}.gz"
+
+
+def store_object(data, snapshot_dir=SNAPSHOT_DIR):
+    """Store bytes once under their hash; returns the hash."""
+    digest = _sha(data)
+    obj = _object_path(digest, snapshot_dir)
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(obj, gzip.compress(data, mtime=0))
+    return digest
+
+
+def load_object(digest, snapshot_dir=SNAPSHOT_DIR):
+    return gzip.decompress(_object_path(digest, snapshot_dir).read_bytes())
+
+
+def _journal_path(txn_id, snapshot_dir=SNAPSHOT_DIR):
+    return Path(snapshot_dir) / f"{txn_id}.json"
+
+
+def _write_journal(journal, snapshot_dir=SNAPSHOT_DIR):
+    path = _journal_path(journal['id'], snapshot_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, (json.dumps(journal, indent=1, sort_keys=True) + '\n').encode('utf-8'))
+
+
+def journals(snapshot_dir=SNAPSHOT_DIR):
+    """All journals, oldest first."""
+    found = []
+    for path in sorted(Path(snapshot_dir).glob('*.json')):
+        with open(path, encoding='utf-8') as f:
+            found.append(json.load(f))
+    return found
+
+
+class Transaction:
+    """Stage every write made inside the block; commit them together on exit.
+
+        with Transaction('update_company_pages') as txn:
+            results = run_files(process_file, files, jobs)
+        print(txn.snapshot_id)
+    """
+
+    def __init__(self, label, snapshot_dir=SNAPSHOT_DIR, txn_dir=TXN_DIR):
+        self.label = label
+        self.snapshot_dir = Path(snapshot_dir)
+        self.txn_dir = Path(txn_dir)
+        self.id = f"{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}-{label}"
+        self.stage = self.txn_dir / self.id
+        self.deletes = set()
+        self.snapshot_id = None
+        self.files = {}
+
+    def __enter__(self):
+        if os.environ.get(STAGE_ENV):
+            raise RuntimeError("A site transaction is already active")
+        recover(self.snapshot_dir, self.txn_dir)
+        self.stage.mkdir(parents=True)
+        os.environ[STAGE_ENV] = str(self.stage)
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        os.environ.pop(STAGE_ENV, None)
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+            print(f"⚠️  {self.label}: error, no files were changed")
+
+    def delete(self, path):
+        """Remove `path` as part of this transaction."""
+        self.deletes.add(_repo_key(path))
+
+    def staged(self):
+        """Repo-relative keys of the files staged so far."""
+        return sorted(p.relative_to(self.stage / 'repo').as_posix()
+                      for p in (self.stage / 'repo').rglob('*') if p.is_file())
+
+    def abort(self):
+        shutil.rmtree(self.stage, ignore_errors=True)
+
+    def commit(self):
+        """Snapshot the files about to change, then move staged files into place."""
+        files = {}
+        for rel in self.staged():
+            staged = _staged_path(self.stage, rel)
+            target = REPO_ROOT / rel
+            after = _sha(staged.read_bytes())
+            current = target.read_bytes() if target.exists() else None
+            if current is not None and _sha(current) == after:
+                continue
+            files[rel] = {'before': None if current is None else store_object(current, self.snapshot_dir),
+                          'after': after}
+        for rel in sorted(self.deletes):
+            target = REPO_ROOT / rel
+            if target.exists() and rel not in files:
+                files[rel] = {'before': store_object(target.read_bytes(), self.snapshot_dir), 'after': None}
+        if not files:
+            self.abort()
+            return None
+
+        journal = {'id': self.id, 'label': self.label, 'created': datetime.now().isoformat(timespec='seconds'),
+                   'state': 'pending', 'files': files}
+        _write_journal(journal, self.snapshot_dir)
+        for rel, change in files.items():
+            target = REPO_ROOT / rel
+            if change['after'] is None:
+                target.unlink()
+                continue
+            staged = _staged_path(self.stage, rel)
+            if target.exists():
+                shutil.copymode(target, staged)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staged, target)
+        journal['state'] = 'committed'
+        _write_journal(journal, self.snapshot_dir)
+        self.abort()
+        prune(KEEP_SNAPSHOTS, self.snapshot_dir)
+        self.snapshot_id = self.id
+        self.files = files
+        return self.id
+
+
+def _conflicts(journal):
+    """Files whose content is neither the journal's 'before' nor its 'after'."""
+    conflicts = []
+    for rel, change in journal['files'].items():
+        target = REPO_ROOT / rel
+        current = _sha(target.read_bytes()) if target.exists() else None
+        if current not in (change['after'], change['before']):
+            conflicts.append(rel)
+    return conflicts
+
+
+def _restore_file(target, before, snapshot_dir):
+    if before is None:
+        if target.exists():
+            target.unlink()
+    else:
+        atomic_write(target, load_object(before, snapshot_dir))
+
+
+def recover(snapshot_dir=SNAPSHOT_DIR, txn_dir=TXN_DIR):
+    """Roll back runs that were interrupted while committing; drop abandoned stages.
+
+    Journals and stages of processes that are still running are left alone.
+    """
+    recovered = []
+    for journal in journals(snapshot_dir):
+        if journal['state'] != 'pending' or _owner_alive(journal['id']):
+            continue
+        print(f"⚠️  Rolling back interrupted run {journal['id']}")
+        for rel, change in journal['files'].items():
+            _restore_file(REPO_ROOT / rel, change['before'], snapshot_dir)
+        journal['state'] = 'rolled-back'
+        _write_journal(journal, snapshot_dir)
+        recovered.append(journal['id'])
+    if Path(txn_dir).exists():
+        for stage in Path(txn_dir).iterdir():
+            if stage.is_dir() and not _owner_alive(stage.name):
+                shutil.rmtree(stage, ignore_errors=True)
+    return recovered
+
+
+def rollback(txn_id=None, snapshot_dir=SNAPSHOT_DIR, force=False):
+    """Undo a committed run (default: the most recent one). Returns conflicting paths, if any."""
+    committed = [j for j in journals(snapshot_dir) if j['state'] == 'committed']
+    if txn_id:
+        committed = [j for j in committed if j['id'] == txn_id]
+    if not committed:
+        raise SystemExit(f"No committed snapshot{' ' + txn_id if txn_id else ''} to roll back")
+    journal = committed[-1]
+    conflicts = _conflicts(journal)
+    if conflicts and not force:
+        return journal, conflicts
+
+    # The rollback is a transaction too, so it can itself be rolled back
+    with Transaction(f"rollback-{journal['label']}", snapshot_dir) as txn:
+        for rel, change in journal['files'].items():
+            if change['before'] is None:
+                txn.delete(REPO_ROOT / rel)
+            else:
+                write_bytes(REPO_ROOT / rel, load_object(change['before'], snapshot_dir))
+    journal['state'] = 'rolled-back'
+    _write_journal(journal, snapshot_dir)
+    return journal, []
+
+
+def prune(keep=KEEP_SNAPSHOTS, snapshot_dir=SNAPSHOT_DIR):
+    """Keep the newest `keep` journals and delete objects no journal refers to."""
+    snapshot_dir = Path(snapshot_dir)
+    all_journals = journals(snapshot_dir)
+    finished = [j for j in all_journals if j['state'] != 'pending']
+    for journal in finished[:max(0, len(finished) - keep)]:
+        _journal_path(journal['id'], snapshot_dir).unlink()
+        all_journals.remove(journal)
+    referenced = {c['before'] for j in all_journals for c in j['files'].values() if c['before']}
+    removed = 0
+    for obj in (snapshot_dir / 'objects').glob('*/*.gz'):
+        if obj.name[:-3] not in referenced:
+            obj.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Site write snapshots and rollback')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='List snapshots')
+    p_show = sub.add_parser('show', help='Files changed by one run')
+    p_show.add_argument('id')
+    p_rollback = sub.add_parser('rollback', help='Undo a run (default: the most recent)')
+    p_rollback.add_argument('id', nargs='?')
+    p_rollback.add_argument('--force', action='store_true', help='Restore even files changed since the run')
+    sub.add_parser('recover', help='Roll back interrupted runs')
+    p_gc = sub.add_parser('gc', help='Drop old snapshots and unreferenced objects')
+    p_gc.add_argument('--keep', type=int, default=KEEP_SNAPSHOTS)
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        found = journals()
+        for j in found:
+            print(f"{j['id']:<60} {j['state']:<12} {len(j['files']):>4} files")
+        if not found:
+            print("No snapshots")
+    elif args.command == 'show':
+        matches = [j for j in journals() if j['id'] == args.id]
+        if not matches:
+            print(f"❌ No snapshot {args.id}")
+            return 1
+        for rel, change in sorted(matches[0]['files'].items()):
+            action = 'created' if change['before'] is None else 'deleted' if change['after'] is None else 'modified'
+            print(f"{action:<9} {rel}")
+    elif args.command == 'rollback':
+        journal, conflicts = rollback(args.id, force=args.force)
+        if conflicts:
+            print(f"❌ {len(conflicts)} file(s) changed since {journal['id']}; use --force to overwrite:")
+            for rel in conflicts:
+                print(f"   {rel}")
+            return 1
+        print(f"✅ Rolled back {journal['id']} ({len(journal['files'])} files)")
+    elif args.command == 'recover':
+        recovered = recover()
+        print(f"✅ Recovered {len(recovered)} interrupted run(s)")
+    else:
+        removed = prune(args.keep)
+        print(f"✅ Removed {removed} unreferenced object(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,15 @@
+"""
+Tests for site_l10n_check.py.
+
+Usage:
+    python3 -m pytest scripts/test_site_l10n_check.py -q
+"""
+import pytest
+
+from site_l10n_check import STOP_WORDS
+
+
+@pytest.mark.parametrize('locale', [loc for loc in STOP_WORDS if loc != 'en'])
+def test_english_stop_words_are_not_target_stop_words(locale):
+    assert not STOP_WORDS['en'] & STOP_WORDS[locale]
+
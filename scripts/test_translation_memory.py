@@ -0,0 +1,73 @@
+"""
+Tests for translation_memory.py, run against StubBackend.
+
+Usage:
+    python3 -m pytest scripts/test_translation_memory.py -q
+"""
+import pytest
+
+from translation_memory import StubBackend, TranslationMemory, translate
+
+
+class RecordingBackend(StubBackend):
+    """StubBackend whose results are stored, recording every string it is sent."""
+
+    name = 'recording'
+    persistent = True
+
+    def __init__(self):
+        self.sent = []
+
+    def translate_batch(self, texts, target_locale, references=()):
+        self.sent.extend(texts)
+        return super().translate_batch(texts, target_locale, references)
+
+
+class PlaceholderDroppingBackend(RecordingBackend):
+    def translate_batch(self, texts, target_locale, references=()):
+        self.sent.extend(texts)
+        return [text.replace('{name}', 'Name') for text in texts]
+
+
+@pytest.fixture
+def tm(tmp_path):
+    with TranslationMemory(tmp_path / 'tm.db') as memory:
+        yield memory
+
+
+def _quiet(message):
+    pass
+
+
+def test_repeated_strings_are_sent_once_then_answered_from_memory(tm):
+    texts = ['Cancel', 'Save', 'Cancel', '  Cancel ', 'Save']
+    backend = RecordingBackend()
+    first = translate(tm, texts, 'de', backend, batch_size=1, log=_quiet)
+    assert sorted(backend.sent) == ['Cancel', 'Save']
+    assert first['  Cancel '] == '[de] Cancel'
+
+    again = RecordingBackend()
+    assert translate(tm, texts, 'de', again, log=_quiet) == first
+    assert again.sent == []
+
+
+def test_changed_placeholders_are_rejected_and_not_stored(tm):
+    texts = ['Hello {name}', 'Welcome']
+    backend = PlaceholderDroppingBackend()
+    result = translate(tm, texts, 'de', backend, log=_quiet)
+    assert result == {'Welcome': 'Welcome'}
+    assert tm.get('Hello {name}', 'de') is None
+    assert tm.get('Welcome', 'de') == 'Welcome'
+
+
+def test_stub_output_is_never_stored(tm):
+    result = translate(tm, ['Hello {name}', 'Cancel'], 'pt', StubBackend(), log=_quiet)
+    assert result == {'Hello {name}': '[pt] Hello {name}', 'Cancel': '[pt] Cancel'}
+    assert tm.get('Hello {name}', 'pt') is None
+    assert tm.get('Cancel', 'pt') is None
+    assert tm.stats() == []
+
+
+def test_without_a_backend_only_the_memory_is_asked(tm):
+    tm.put_many([('Cancel', 'Abbrechen')], 'de', 'arb')
+    assert translate(tm, ['Cancel', 'Save'], 'de', None, log=_quiet) == {'Cancel': 'Abbrechen'}
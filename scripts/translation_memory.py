@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Translation memory and batch machine translation for app strings and pages.
+
+Usage:
+    python3 translation_memory.py seed                  # learn en -> de/es/pt pairs from the ARB files
+    python3 translation_memory.py lookup de "Cancel"    # exact and fuzzy matches
+    python3 translation_memory.py stats
+"""
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+
+from arb_files import TEMPLATE_LOCALE, arb_locales, load_arb, load_template, messages
+from arb_icu import IcuError, arguments, parse_message
+from script_loader import REPO_ROOT
+
+TM_FILE = REPO_ROOT / '.site-cache' / 'translation-memory.db'
+DEFAULT_BATCH_SIZE = 40
+DEFAULT_WORKERS = 4
+FUZZY_THRESHOLD = 0.75
+# Fuzzy candidates must be within this fraction of the source length
+FUZZY_LENGTH_WINDOW = 0.3
+# Word overlap (Jaccard) may be this much below the threshold and still be scored
+FUZZY_WORD_SLACK = 0.25
+
+LANGUAGE_NAMES = {'en': 'English', 'es': 'Spanish', 'pt': 'Brazilian Portuguese', 'de': 'German (formal Sie)'}
+
+
+def normalize(text):
+    return ' '.join(text.split())
+
+
+def source_hash(text):
+    return hashlib.sha256(normalize(text).encode('utf-8')).hexdigest()
+
+
+def placeholders(text):
+    """Placeholder names of an ICU message, or None if it does not parse."""
+    try:
+        return set(arguments(parse_message(text)))
+    except IcuError:
+        return None
+
+
+class TranslationMemory:
+    """(source hash, locale) -> target, in SQLite."""
+
+    def __init__(self, path=TM_FILE):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # check_same_thread=False: backend workers return to the main thread, which does all writes
+        self.db = sqlite3.connect(str(path), check_same_thread=False)
+        self.db.execute('''CREATE TABLE IF NOT EXISTS segments (
+            source_hash TEXT NOT NULL, locale TEXT NOT NULL, source TEXT NOT NULL,
+            target TEXT NOT NULL, length INTEGER NOT NULL, origin TEXT, created TEXT,
+            PRIMARY KEY (source_hash, locale))''')
+        self.db.execute('CREATE INDEX IF NOT EXISTS segments_length ON segments (locale, length)')
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, text, locale):
+        row = self.db.execute('SELECT target FROM segments WHERE source_hash = ? AND locale = ?',
+                              (source_hash(text), locale)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, pairs, locale, origin, replace=False):
+        """Store (source, target) pairs; existing entries win unless `replace`."""
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT OR IGNORE'
+        today = date.today().isoformat()
+        cursor = self.db.executemany(
+            f'{verb} INTO segments VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(source_hash(s), locale, normalize(s), t, len(normalize(s)), origin, today) for s, t in pairs])
+        self.db.commit()
+        return cursor.rowcount
+
+    def fuzzy(self, text, locale, threshold=FUZZY_THRESHOLD, limit=3):
+        """[(score, source, target)] best first, for sources similar to `text`."""
+        text = normalize(text)
+        window = max(3, int(len(text) * FUZZY_LENGTH_WINDOW))
+        rows = self.db.execute(
+            'SELECT source, target FROM segments WHERE locale = ? AND length BETWEEN ? AND ? AND source_hash != ?',
+            (locale, len(text) - window, len(text) + window, source_hash(text)))
+        matcher = difflib.SequenceMatcher(None, b=text, autojunk=False)
+        words = set(text.lower().split())
+        scored = []
+        for source, target in rows:
+            # Cheap word-overlap screen before the character-level ratio
+            other = set(source.lower().split())
+            if len(words & other) < (len(words | other)) * (threshold - FUZZY_WORD_SLACK):
+                continue
+            matcher.set_seq1(source)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                scored.append((score, source, target))
+        return sorted(scored, reverse=True)[:limit]
+
+    def stats(self):
+        return self.db.execute('SELECT locale, origin, COUNT(*) FROM segments GROUP BY locale, origin '
+                               'ORDER BY locale, origin').fetchall()
+
+
+# ---------- backends ----------
+class StubBackend:
+    """Deterministic local backend: '[de] text'. Placeholders are kept, so results validate.
+
+    Its output is never stored in the memory.
+    """
+
+    name = 'stub'
+    persistent = False
+
+    def translate_batch(self, texts, target_locale, references=()):
+        return [f"[{target_locale}] {text}" for text in texts]
+
+
+class AnthropicBackend:
+    """Messages API, one request per batch; the reply is a JSON array of translations."""
+
+    name = 'anthropic'
+    persistent = True
+    url = 'https://api.anthropic.com/v1/messages'
+
+    def __init__(self, model=None):
+        self.api_key = os.environ.get('ANTHROPIC_API_KEY')
+        if not self.api_key:
+            raise RuntimeError('ANTHROPIC_API_KEY environment variable is not set')
+        self.model = model or os.environ.get('TRANSLATE_MODEL', 'claude-3-haiku-20240307')
+
+    def translate_batch(self, texts, target_locale, references=()):
+        language = LANGUAGE_NAMES.get(target_locale, target_locale)
+        prompt = (
+            f"Translate each string in the JSON array below from English to {language} for the "
+            "Team Build Pro app and website. Keep every ICU placeholder and plural/select "
+            "structure ({name}, {count, plural, ...}) exactly as written; translate only the "
+            "text. Keep 'Team Build Pro' untranslated.\n")
+        if references:
+            prompt += ("Existing translations of similar strings, for consistent terminology:\n"
+                       + json.dumps([{'en': s, target_locale: t} for s, t in references], ensure_ascii=False)
+                       + "\n")
+        prompt += ("Return ONLY a JSON array of the translations, in the same order, nothing else.\n"
+                   + json.dumps(texts, ensure_ascii=False))
+        body = json.dumps({'model': self.model, 'max_tokens': 8192,
+                           'messages': [{'role': 'user', 'content': prompt}]}).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={
+            'Content-Type': 'application/json', 'x-api-key': self.api_key, 'anthropic-version': '2023-06-01'})
+        with urllib.request.urlopen(request, timeout=120) as response:
+            reply = json.load(response)
+        text = reply['content'][0]['text'].strip()
+        result = json.loads(text[text.find('['):text.rfind(']') + 1])
+        if len(result) != len(texts):
+            raise ValueError(f"backend returned {len(result)} translations for {len(texts)} strings")
+        return result
+
+
+BACKENDS = {'stub': StubBackend, 'anthropic': AnthropicBackend}
+
+
+def get_backend(name):
+    if name not in BACKENDS:
+        raise SystemExit(f"Unknown backend {name}; choose from {', '.join(BACKENDS)}")
+    return BACKENDS[name]()
+
+
+def translate(tm, texts, locale, backend, batch_size=DEFAULT_BATCH_SIZE, workers=DEFAULT_WORKERS,
+              use_fuzzy=True, log=print):
+    """{text: translation} for every text the memory has or the backend translated validly.
+
+    Each distinct normalised string goes to the backend at most once, and
+    only if the memory has no exact entry for it. With `backend` None only
+    the memory is asked (dry runs): misses are counted, not translated.
+    """
+    unique = {}
+    for text in texts:
+        unique.setdefault(source_hash(text), text)
+    found = {}
+    misses = []
+    for digest, text in unique.items():
+        target = tm.get(text, locale)
+        if target is None:
+            misses.append(text)
+        else:
+            found[digest] = target
+    log(f"   {locale}: {len(unique)} distinct strings, {len(found)} from memory, {len(misses)} to translate")
+
+    rejected = []
+    if misses and backend is not None:
+        batches = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+
+        def references(batch):
+            if not use_fuzzy:
+                return []
+            refs = {}
+            for text in batch:
+                for _, source, target in tm.fuzzy(text, locale, limit=1):
+                    refs[source] = target
+            return list(refs.items())
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(backend.translate_batch, batch, locale, references(batch)): batch
+                       for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    log(f"   ❌ batch of {len(batch)} failed: {e}")
+                    continue
+                good = []
+                for text, target in zip(batch, results):
+                    if placeholders(target) != placeholders(text):
+                        rejected.append(text)
+                        continue
+                    good.append((text, target))
+                    found[source_hash(text)] = target
+                if backend.persistent:
+                    tm.put_many(good, locale, backend.name)
+    for text in rejected:
+        log(f"   ⚠️  rejected (placeholders changed): {text[:70]}")
+    return {text: found[source_hash(text)] for text in texts if source_hash(text) in found}
+
+
+def seed_from_arb(tm):
+    """Learn template -> locale pairs from the ARB files (translated, non-identical values)."""
+    template = load_template().data
+    added = {}
+    for locale in arb_locales():
+        if locale == TEMPLATE_LOCALE:
+            continue
+        data = load_arb(locale).data
+        pairs = [(template[k], data[k]) for k in messages(template)
+                 if isinstance(data.get(k), str) and data[k] != template[k]]
+        added[locale] = tm.put_many(pairs, locale, 'arb')
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Translation memory')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('seed', help='Add translated pairs from the ARB files')
+    p_lookup = sub.add_parser('lookup', help='Exact and fuzzy matches for a string')
+    p_lookup.add_argument('locale')
+    p_lookup.add_argument('text')
+    p_lookup.add_argument('--threshold', type=float, default=FUZZY_THRESHOLD)
+    sub.add_parser('stats', help='Entries per locale and origin')
+    args = parser.parse_args()
+
+    with TranslationMemory() as tm:
+        if args.command == 'seed':
+            for locale, count in seed_from_arb(tm).items():
+                print(f"{locale}: {count} new entries")
+        elif args.command == 'lookup':
+            exact = tm.get(args.text, args.locale)
+            print(f"exact: {exact if exact is not None else '-'}")
+            for score, source, target in tm.fuzzy(args.text, args.locale, args.threshold, limit=5):
+                print(f"{score:.2f}  {source}\n      -> {target}")
+        else:
+            for locale, origin, count in tm.stats():
+                print(f"{locale}  {origin:<10} {count}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
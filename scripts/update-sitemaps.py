@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Bring web*/sitemap.xml in line with the page index (site_index.py), editing
+the files in place.
+
+Usage:
+    python3 update-sitemaps.py                # update all four sitemaps
+    python3 update-sitemaps.py --dry-run      # report what would change
+    python3 update-sitemaps.py --sites web-de
+"""
+
+import argparse
+import re
+import sys
+from datetime import date
+
+from script_loader import REPO_ROOT
+from site_index import PageIndex
+from site_pages import SITE_DIRS
+from site_txn import Transaction, write_text
+
+# <url> entry with an optional section comment directly above it
+ENTRY_RE = re.compile(
+    r'(?:^  <!-- (?P<comment>[^\n]*?) -->\n)?^  <url>\n(?P<body>(?:    [^\n]*\n)*?)  </url>\n', re.MULTILINE)
+LOC_RE = re.compile(r'<loc>([^<]*)</loc>')
+LASTMOD_RE = re.compile(r'<lastmod>([^<]*)</lastmod>')
+ALTERNATE_LINE = re.compile(r'^    <xhtml:link rel="alternate" hreflang="([^"]+)" href="([^"]*)" />\n', re.MULTILINE)
+
+# From generate-sitemaps.js
+PAGE_METADATA = {
+    'index.html': (1.0, 'weekly'),
+    'faq.html': (0.9, 'monthly'),
+    'blog.html': (0.8, 'weekly'),
+    'companies.html': (0.8, 'weekly'),
+    'contact_us.html': (0.7, 'monthly'),
+    'privacy_policy.html': (0.5, 'yearly'),
+    'terms_of_service.html': (0.5, 'yearly'),
+    'books/index.html': (0.7, 'monthly'),
+}
+SECTION_METADATA = {
+    'blog': ('Blog Posts', 0.7, 'monthly'),
+    'companies': ('Company Recruiting Guides', 0.6, 'monthly'),
+}
+DEFAULT_METADATA = ('Other Pages', 0.5, 'monthly')
+# Never listed, as in generate-sitemaps.js
+EXCLUDE = {'firestore-monitor.html', 'claim-google.html'}
+
+
+def section_of(slug):
+    return slug.split('/', 1)[0] if '/' in slug else None
+
+
+def page_metadata(slug):
+    """(section comment, priority, changefreq) for a new entry."""
+    section = section_of(slug)
+    if section in SECTION_METADATA:
+        return SECTION_METADATA[section]
+    comment, priority, changefreq = DEFAULT_METADATA
+    if slug in PAGE_METADATA:
+        priority, changefreq = PAGE_METADATA[slug]
+    return comment, priority, changefreq
+
+
+def in_sitemap(entry):
+    """Exists, not noindex, and canonical to itself (or has no canonical)."""
+    if entry.slug in EXCLUDE or entry.noindex:
+        return False
+    return entry.canonical is None or entry.indexable
+
+
+def render_entry(url, lastmod, priority, changefreq, comment, alternates):
+    lines = [f'  <!-- {comment} -->', '  <url>', f'    <loc>{url}</loc>', f'    <lastmod>{lastmod}</lastmod>',
+             f'    <changefreq>{changefreq}</changefreq>', f'    <priority>{priority:.1f}</priority>']
+    lines += [f'    <xhtml:link rel="alternate" hreflang="{lang}" href="{href}" />' for lang, href in alternates]
+    lines.append('  </url>')
+    return '\n'.join(lines) + '\n'
+
+
+def update_sitemap(content, index, locale, today):
+    """(new content, [change descriptions]) for one locale's sitemap."""
+    pages = {e.url: e for e in index.entries() if e.locale == locale and in_sitemap(e)}
+    edits = []
+    changes = []
+    seen = set()
+    section_end = {}
+    for m in ENTRY_RE.finditer(content):
+        body = m.group('body')
+        loc = LOC_RE.search(body)
+        url = loc.group(1) if loc else None
+        entry = pages.get(url)
+        if entry is None or url in seen:
+            # Take the blank line after it too, if there is one
+            end = m.end() + 1 if content.startswith('\n', m.end()) else m.end()
+            edits.append((m.start(), end, ''))
+            changes.append(f"removed {url}")
+            continue
+        seen.add(url)
+        section_end[section_of(entry.slug)] = m.end()
+
+        new_body = body
+        lastmod = LASTMOD_RE.search(body)
+        if (entry.modified and entry.modified != entry.first_seen and lastmod
+                and entry.modified > lastmod.group(1)):
+            new_body = new_body.replace(lastmod.group(0), f'<lastmod>{entry.modified}</lastmod>', 1)
+            changes.append(f"lastmod {url} {lastmod.group(1)} -> {entry.modified}")
+        alternates = ALTERNATE_LINE.findall(new_body)
+        cluster = [tag for tag in index.cluster(entry.slug) if tag[0] != 'x-default']
+        if alternates and set(alternates) != set(cluster):
+            lines = [m2 for m2 in ALTERNATE_LINE.finditer(new_body)]
+            new_body = (new_body[:lines[0].start()]
+                        + ''.join(f'    <xhtml:link rel="alternate" hreflang="{lang}" href="{href}" />\n'
+                                  for lang, href in cluster)
+                        + new_body[lines[-1].end():])
+            changes.append(f"alternates {url}")
+        if new_body != body:
+            edits.append((m.start('body'), m.end('body'), new_body))
+
+    inserts = {}
+    urlset_end = content.rfind('</urlset>')
+    for url, entry in pages.items():
+        if url in seen:
+            continue
+        comment, priority, changefreq = page_metadata(entry.slug)
+        text = render_entry(url, entry.modified or today, priority, changefreq, comment, [])
+        at = section_end.get(section_of(entry.slug), urlset_end)
+        inserts.setdefault(at, []).append(text + '\n' if at == urlset_end else '\n' + text)
+        changes.append(f"added {url}")
+    edits += [(at, at, ''.join(texts)) for at, texts in inserts.items()]
+
+    for start, end, text in sorted(edits, key=lambda e: (e[0], e[1]), reverse=True):
+        content = content[:start] + text + content[end:]
+    return content, changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Update the site sitemaps from the page index')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_DIRS), help='Site directories (default: all)')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing')
+    args = parser.parse_args()
+
+    index = PageIndex.load()
+    today = date.today().isoformat()
+    total = 0
+    with Transaction('update-sitemaps') as txn:
+        for site in args.sites or SITE_DIRS:
+            path = REPO_ROOT / site / 'sitemap.xml'
+            if not path.exists():
+                print(f"⚠️  {path.relative_to(REPO_ROOT)} not found")
+                continue
+            content = path.read_text(encoding='utf-8')
+            new_content, changes = update_sitemap(content, index, SITE_DIRS[site], today)
+            if not changes:
+                print(f"✅ {site}/sitemap.xml up to date")
+                continue
+            total += len(changes)
+            print(f"{'📝 Would update' if args.dry_run else '📝 Updated'} {site}/sitemap.xml:")
+            for change in changes:
+                print(f"   {change}")
+            if not args.dry_run:
+                write_text(path, new_content)
+
+    print(f"\n{total} change(s)")
+    if txn.snapshot_id:
+        print(f"Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Maintain JSON-LD structured data (Article, MobileApplication, Organization,
+FAQPage) on every TBP page across all four locales.
+
+Usage:
+    python3 update-structured-data.py                    # all sites, incremental
+    python3 update-structured-data.py --dry-run          # report pages that would change
+    python3 update-structured-data.py --sites web-es --subdir blog
+    python3 update-structured-data.py --types Article --all --jobs 4
+"""
+
+import argparse
+import sys
+
+from script_loader import REPO_ROOT
+from site_manifest import Manifest
+from site_pages import SITE_DIRS, find_pages, locale_of, page_slug, rel_path
+from site_parallel import add_jobs_argument, print_results, run_files
+from site_txn import Transaction, write_text
+import site_schema
+
+# Manifest key for this script; bump the version when site_schema's managed fields change
+MANIFEST_KEY = 'structured-data@1'
+
+
+def update_page(file_path, types, locale, date_published, date_modified, dry_run=False):
+    """Bring a page's managed JSON-LD blocks up to date. Returns True if changed."""
+    content = file_path.read_text(encoding='utf-8')
+    meta = site_schema.PageMeta(content, locale, date_published, date_modified)
+    new_content = site_schema.update_content(content, meta, types)
+    if new_content is None:
+        return False
+    if not dry_run:
+        write_text(file_path, new_content)
+    print(f"  {'Would update' if dry_run else 'Updated'}: {rel_path(file_path)}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Maintain JSON-LD structured data on all site pages')
+    parser.add_argument('--sites', nargs='+', choices=list(SITE_DIRS), help='Site directories (default: all)')
+    parser.add_argument('--subdir', help="Only pages under this subdirectory of each site (e.g. 'blog')")
+    parser.add_argument('--types', nargs='+', choices=list(site_schema.BUILDERS),
+                        help='Only maintain these schema types')
+    parser.add_argument('--all', action='store_true', help='Recheck every page, ignoring the manifest')
+    parser.add_argument('--dry-run', action='store_true', help='Report pages that would change without writing')
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+
+    manifest = Manifest()
+    items = []
+    total_unchanged = 0
+    for path in find_pages(REPO_ROOT, sites=args.sites, subdir=args.subdir):
+        types = site_schema.managed_types(page_slug(path))
+        if args.types:
+            types = [t for t in types if t in args.types]
+        if not types:
+            continue
+        if not (args.all or manifest.needs(path, MANIFEST_KEY)):
+            total_unchanged += 1
+            continue
+        # Only a change seen after our last run counts as a modification
+        edited = manifest.applied(path, MANIFEST_KEY) not in (None, manifest.current_hash(path))
+        date_modified = manifest.changed_date(path) if edited else None
+        items.append((path, types, locale_of(path), manifest.first_seen(path), date_modified, args.dry_run))
+
+    print(f"Checking {len(items)} pages ({total_unchanged} unchanged since last run)")
+    with Transaction('update-structured-data') as txn:
+        results = run_files(update_page, items, args.jobs, star=True)
+    print_results(results, label=lambda item: item[0])
+    total_updated = sum(1 for r in results if r.value)
+    # Recorded against the committed pages
+    if not args.dry_run:
+        for r in results:
+            if not r.error:
+                manifest.record(r.item[0], MANIFEST_KEY)
+        manifest.save()
+
+    print(f"\n=== Summary ===")
+    print(f"Pages {'to update' if args.dry_run else 'updated'}: {total_updated}")
+    print(f"Unchanged since last run (not opened): {total_unchanged}")
+    if txn.snapshot_id:
+        print(f"Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
+    errors = sum(1 for r in results if r.error)
+    if errors:
+        print(f"Errors: {errors}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,19 +13,23 @@ This script updates all company pages with:
 Usage:
     python3 update_company_pages.py --dry-run  # Preview changes
     python3 update_company_pages.py            # Apply changes
+    python3 update_company_pages.py --jobs 0   # Apply changes on every CPU
 """
 
 import os
-import re
 import sys
 import glob
-import shutil
+import argparse
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from site_parallel import add_jobs_argument, print_results, run_files
+from site_txn import Transaction, write_text
+import site_patterns as patterns
+
 # Directories
 WEB_DIR = Path("/Users/sscott/tbp/web")
 COMPANIES_DIR = WEB_DIR / "companies"
-BACKUP_DIR = WEB_DIR / "backup_company_pages"
 
 # Hero CTA Template (will replace {COMPANY_NAME})
 HERO_CTA_TEMPLATE = '''
@@ -108,54 +112,12 @@ COLLAPSE_SCRIPT = '''
     }'''
 
 
-def extract_company_name(content):
-    """Extract company name from H1 title"""
-    # Try "Distributors" first
-    match = re.search(r'<h1>AI Recruiting for (.+?) Distributors</h1>', content)
-    if match:
-        return match.group(1)
-
-    # Try "Independent Business Owners"
-    match = re.search(r'<h1>AI Recruiting for (.+?) Independent Business Owners</h1>', content)
-    if match:
-        return match.group(1)
-
-    # Try any other pattern
-    match = re.search(r'<h1>AI Recruiting for (.+?)</h1>', content)
-    if match:
-        # Remove trailing words like "Distributors", "Representatives", etc.
-        name = match.group(1)
-        name = re.sub(r'\s+(Distributors|Representatives|Independent Business Owners|Consultants|Agents)$', '', name)
-        return name
-
-    return "Unknown Company"
-
-
-def backup_files():
-    """Create backup of all company pages"""
-    if not BACKUP_DIR.exists():
-        BACKUP_DIR.mkdir(parents=True)
-        print(f"✅ Created backup directory: {BACKUP_DIR}")
-
-    company_files = list(COMPANIES_DIR.glob("ai-recruiting-*.html"))
-    for file in company_files:
-        backup_file = BACKUP_DIR / file.name
-        shutil.copy2(file, backup_file)
-
-    print(f"✅ Backed up {len(company_files)} company pages to {BACKUP_DIR}")
-
-
 def add_hero_cta(content, company_name):
     """Add Hero CTA section after intro note"""
     hero_cta = HERO_CTA_TEMPLATE.replace('{COMPANY_NAME}', company_name)
 
-    # Find the note box and insert Hero CTA after it
-    pattern = r'(</div>\s*\n\s*)(      <section>)'
-    replacement = r'\1' + hero_cta + r'\n\2'
-
-    # Only replace the first occurrence (after intro note)
-    content = re.sub(pattern, replacement, content, count=1)
-    return content
+    # Find the note box and insert Hero CTA after it (first occurrence only)
+    return patterns.HERO_CTA_ANCHOR.sub(lambda m: m.group(1) + hero_cta + '\n' + m.group(2), content, count=1)
 
 
 def add_mid_cta(content, company_name):
@@ -163,49 +125,41 @@ def add_mid_cta(content, company_name):
     mid_cta = MID_CTA_TEMPLATE.replace('{COMPANY_NAME}', company_name)
 
     # Find Training section end and insert Mid CTA after it
-    pattern = r'(</section>\s*\n\s*)(      <section>\s*\n\s*<h2>Your AI Recruiting Playbook)'
-    replacement = r'\1' + mid_cta + r'\n\2'
-
-    content = re.sub(pattern, replacement, content)
-    return content
+    return patterns.MID_CTA_ANCHOR.sub(lambda m: m.group(1) + mid_cta + '\n' + m.group(2), content)
 
 
 def replace_primary_cta_buttons(content):
     """Replace primary CTA text buttons with app store badges"""
     # Match the paragraph with both btn-primary and btn-outline buttons
-    old_pattern = r'        <p>\s*\n\s*<a class="btn btn-primary"[^>]*>Try Team Build Pro Free for 30 Days</a>\s*\n\s*&nbsp;\s*\n\s*<a class="btn btn-outline"[^>]*>Download on iOS</a>\s*\n\s*</p>'
-
-    content = re.sub(old_pattern, PRIMARY_CTA_BADGES, content, flags=re.DOTALL)
-    return content
+    return patterns.PRIMARY_CTA_BUTTONS.sub(lambda m: PRIMARY_CTA_BADGES, content)
 
 
 def add_collapse_to_getting_started(content):
     """Add collapse functionality to Getting Started section"""
     # Add classes to list items
-    content = re.sub(
-        r'(<ol class="checklist">)\s*\n\s*(<li>)',
-        r'\1 id="getting-started-list">\n          <li class="always-visible">',
-        content
-    )
-
-    # Mark first 3 items as always-visible, rest as collapsible
-    lines = content.split('\n')
+    content = patterns.CHECKLIST_FIRST_LI.sub(
+        r'\1 id="getting-started-list">\n          <li class="always-visible">', content)
+
+    # Mark first 3 items as always-visible, rest as collapsible. Only the
+    # list bodies are rewritten instead of splitting the whole page into lines.
     li_count = 0
-    in_getting_started = False
-
-    for i, line in enumerate(lines):
-        if 'id="getting-started-list"' in line:
-            in_getting_started = True
-        elif in_getting_started and '<li>' in line:
-            li_count += 1
-            if li_count > 3:
-                lines[i] = line.replace('<li>', '<li class="collapsible-item" style="display: none;">')
-            elif li_count <= 3 and 'class="always-visible"' not in line:
-                lines[i] = line.replace('<li>', '<li class="always-visible">')
-        elif in_getting_started and '</ol>' in line:
-            in_getting_started = False
-
-    content = '\n'.join(lines)
+
+    def mark_item(match):
+        nonlocal li_count
+        li_count += 1
+        if li_count > 3:
+            return '<li class="collapsible-item" style="display: none;">'
+        return '<li class="always-visible">'
+
+    parts = []
+    pos = 0
+    for match in patterns.GETTING_STARTED_LIST.finditer(content):
+        start, end = match.span('items')
+        parts.append(content[pos:start])
+        parts.append(patterns.PLAIN_LI.sub(mark_item, content[start:end]))
+        pos = end
+    parts.append(content[pos:])
+    content = ''.join(parts)
 
     # Add toggle button after the list
     button_html = '''        <div style="text-align: center; margin-top: 1.5rem;">
@@ -215,36 +169,24 @@ def add_collapse_to_getting_started(content):
         </div>'''
 
     # Insert button after Getting Started list's closing </ol>
-    pattern = r'(</ol>\s*\n)(      </section>\s*\n\s*<section class="card">)'
-    replacement = r'\1' + button_html + r'\n\2'
-    content = re.sub(pattern, replacement, content)
-
-    return content
+    return patterns.ROADMAP_BUTTON_ANCHOR.sub(lambda m: m.group(1) + button_html + '\n' + m.group(2), content)
 
 
 def add_collapse_script(content):
     """Add JavaScript for collapse functionality"""
     # Find the existing script section and add collapse code before closing
-    pattern = r'(document\.getElementById\(\'currentYear\'\)\.textContent = new Date\(\)\.getFullYear\(\);)\s*\n(\s*</script>)'
-    replacement = r'\1\n' + COLLAPSE_SCRIPT + r'\n\2'
-
-    content = re.sub(pattern, replacement, content)
-    return content
+    return patterns.CURRENT_YEAR_SCRIPT_END.sub(
+        lambda m: m.group(1) + '\n' + COLLAPSE_SCRIPT + '\n' + m.group(2), content)
 
 
 def reduce_related_companies(content):
     """Reduce Related Companies section to 3 cards"""
     # Find the Related Companies section and keep only first 3 cards
-    pattern = r'(<h3>Related Company Recruiting Guides</h3>.*?<div class="grid-2">)(.*?)(</div>\s*</section>)'
-
     def keep_first_3_cards(match):
-        header = match.group(1)
-        cards_section = match.group(2)
-        footer = match.group(3)
+        header, cards_section, footer = match.groups()
 
         # Extract all card divs
-        card_pattern = r'(<div class="card">.*?</div>)'
-        cards = re.findall(card_pattern, cards_section, flags=re.DOTALL)
+        cards = patterns.RELATED_CARD.findall(cards_section)
 
         if len(cards) > 3:
             # Keep only first 3 cards
@@ -253,14 +195,12 @@ def reduce_related_companies(content):
 
         return match.group(0)
 
-    content = re.sub(pattern, keep_first_3_cards, content, flags=re.DOTALL)
-    return content
+    return patterns.RELATED_COMPANIES.sub(keep_first_3_cards, content)
 
 
 def update_cache_buster(content):
     """Update CSS cache buster from v=6 to v=8"""
-    content = re.sub(r'style\.css\?v=6', 'style.css', content)
-    return content
+    return patterns.CSS_CACHE_BUSTER_V6.sub('style.css', content)
 
 
 def process_file(file_path, dry_run=False):
@@ -269,7 +209,7 @@ def process_file(file_path, dry_run=False):
         content = f.read()
 
     # Extract company name
-    company_name = extract_company_name(content)
+    company_name = patterns.extract_company_name(content)
 
     print(f"\n📄 Processing: {file_path.name}")
     print(f"   Company: {company_name}")
@@ -301,9 +241,8 @@ def process_file(file_path, dry_run=False):
         for change in changes:
             print(f"   {change}")
     else:
-        # Write changes
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Staged; applied when the run's transaction commits
+        write_text(file_path, content)
         print(f"   ✅ Updated successfully")
 
     return True
@@ -311,7 +250,11 @@ def process_file(file_path, dry_run=False):
 
 def main():
     """Main execution function"""
-    dry_run = '--dry-run' in sys.argv
+    parser = argparse.ArgumentParser(description="Company Pages CTA Optimization")
+    parser.add_argument('--dry-run', action='store_true', help="Preview changes")
+    add_jobs_argument(parser)
+    args = parser.parse_args()
+    dry_run = args.dry_run
 
     print("=" * 60)
     print("Company Pages CTA Optimization Script")
@@ -321,29 +264,26 @@ def main():
         print("\n🔍 DRY RUN MODE - No files will be modified\n")
     else:
         print("\n⚠️  LIVE MODE - Files will be modified\n")
-        # Create backups
-        backup_files()
 
     # Find all company pages
     company_files = sorted(COMPANIES_DIR.glob("ai-recruiting-*.html"))
     print(f"\n📊 Found {len(company_files)} company pages")
 
-    # Process all files
-    success_count = 0
-    for file_path in company_files:
-        try:
-            if process_file(file_path, dry_run):
-                success_count += 1
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+    # Process all files (results and output come back in file order). Writes
+    # are staged and applied together, after a snapshot of the pages they replace.
+    with Transaction('update_company_pages') as txn:
+        results = run_files(process_file, company_files, args.jobs, args=(dry_run,))
+    print_results(results, label=lambda p: p.name)
+    success_count = sum(1 for r in results if r.value)
 
     print("\n" + "=" * 60)
     print(f"✅ Successfully processed {success_count}/{len(company_files)} files")
 
     if dry_run:
         print("\n💡 Run without --dry-run to apply changes")
-    else:
-        print(f"\n💾 Backups saved to: {BACKUP_DIR}")
+    elif txn.snapshot_id:
+        print(f"\n💾 Snapshot: {txn.snapshot_id}")
+        print(f"   Undo with: python3 scripts/site_txn.py rollback {txn.snapshot_id}")
 
     print("=" * 60)
 